@@ -20,6 +20,9 @@ Features:
 - Progress tracking và logging
 - Rollback capabilities
 - Production-safe defaults
+- Bulk import mode: stream JSON-lines/CSV files or synthetic Tension/Event/WIN
+  data into Neo4j with batched UNWIND transactions, or write neo4j-admin import CSVs
+  (không cần API server)
 """
 
 import requests
@@ -37,6 +40,9 @@ import argparse
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from trm_api.db.session import get_driver
+from trm_api.db.bulk_import import (
+    AdminImportWriter, BulkGraphImporter, SyntheticGraphGenerator, read_records
+)
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
@@ -401,6 +407,59 @@ class UnifiedSeeder:
             console.print(f"❌ [bold red]Neo4j verification failed: {str(e)}[/bold red]")
             return False
     
+    def run_bulk_import(self, input_files: Optional[List[str]] = None, synthetic: Optional[Dict[str, int]] = None,
+                        batch_size: int = 5000, workers: int = 4, admin_import_dir: Optional[str] = None,
+                        seed: Optional[int] = None, clear_db: bool = False) -> bool:
+        """Bulk import từ file JSON-lines/CSV và/hoặc dữ liệu synthetic"""
+        console.rule("[bold cyan]📦 TRM-OS Bulk Graph Import 📦[/bold cyan]")
+        start_time = time.time()
+        
+        def records():
+            for path in input_files or []:
+                console.print(f"📄 Reading {path}")
+                yield from read_records(path)
+            if synthetic and any(synthetic.values()):
+                console.print(f"🧪 Generating synthetic data: {synthetic}")
+                yield from SyntheticGraphGenerator(**synthetic, seed=seed)
+        
+        if admin_import_dir:
+            writer = AdminImportWriter(admin_import_dir)
+            count = writer.write(records())
+            result = SeedResult(True, "Bulk Import (neo4j-admin CSV)", count, [], [], time.time() - start_time)
+            self.results.append(result)
+            self.total_entities_created += count
+            console.print(f"✅ [bold green]Wrote {count} records to {admin_import_dir}[/bold green]")
+            if writer.dropped_properties:
+                console.print(f"⚠️ [yellow]{writer.dropped_properties} properties not in the file headers were dropped[/yellow]")
+            console.print(f"▶️ Load offline with:\n   {writer.command()}")
+            return True
+        
+        if clear_db and not self.clear_database():
+            return False
+        
+        importer = BulkGraphImporter(get_driver(), batch_size=batch_size, workers=workers)
+        labels = ["Tension", "WIN", "Event"] if synthetic else []
+        if labels:
+            importer.ensure_constraints(labels)
+        stats = importer.import_records(records())
+        
+        result = SeedResult(
+            success=stats.failed_batches == 0,
+            entity_type="Bulk Import",
+            count=stats.nodes + stats.relationships,
+            created_ids=[],
+            errors=stats.errors,
+            execution_time=stats.elapsed_seconds
+        )
+        self.results.append(result)
+        self.total_entities_created += stats.nodes
+        console.print(
+            f"✅ [bold green]{stats.nodes} nodes, {stats.relationships} relationships "
+            f"({stats.records_per_second:.0f} records/s)[/bold green]"
+        )
+        self.display_results(self.verify_neo4j_data())
+        return result.success
+    
     def run_unified_seed(self, clear_db: bool = False) -> bool:
         """Chạy toàn bộ quy trình seed"""
         console.rule("[bold cyan]🚀 TRM-OS Unified Production Seeding 🚀[/bold cyan]")
@@ -542,11 +601,40 @@ def main():
     parser.add_argument("--clear-db", action="store_true", 
                        help="Clear database before seeding (development only)")
     
+    bulk = parser.add_argument_group("bulk import", "Load large datasets directly into Neo4j (no API server needed)")
+    bulk.add_argument("--bulk-input", nargs="+", metavar="FILE",
+                      help="JSON-lines (.jsonl) or CSV files of nodes/relationships to import")
+    bulk.add_argument("--synthetic-tensions", type=int, default=0, help="Number of synthetic Tension nodes")
+    bulk.add_argument("--synthetic-wins", type=int, default=0, help="Number of synthetic WIN nodes")
+    bulk.add_argument("--synthetic-events", type=int, default=0, help="Number of synthetic Event nodes")
+    bulk.add_argument("--synthetic-seed", type=int, help="Random seed for reproducible synthetic data")
+    bulk.add_argument("--batch-size", type=int, default=5000, help="Rows per UNWIND transaction")
+    bulk.add_argument("--workers", type=int, default=4, help="Parallel write sessions")
+    bulk.add_argument("--admin-import-dir", metavar="DIR",
+                      help="Write neo4j-admin import CSVs to DIR instead of writing to Neo4j")
+    
     args = parser.parse_args()
     
     # Create seeder instance
     seeder = UnifiedSeeder(base_url=args.base_url, environment=args.environment)
     
+    synthetic = {
+        "tensions": args.synthetic_tensions,
+        "wins": args.synthetic_wins,
+        "events": args.synthetic_events
+    }
+    if args.bulk_input or any(synthetic.values()):
+        success = seeder.run_bulk_import(
+            input_files=args.bulk_input,
+            synthetic=synthetic,
+            batch_size=args.batch_size,
+            workers=args.workers,
+            admin_import_dir=args.admin_import_dir,
+            seed=args.synthetic_seed,
+            clear_db=args.clear_db
+        )
+        sys.exit(0 if success else 1)
+    
     # Run seeding
     success = seeder.run_unified_seed(clear_db=args.clear_db)
     
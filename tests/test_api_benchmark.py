@@ -0,0 +1,119 @@
+import pytest
+import os
+import sys
+import json
+
+import httpx
+from fastapi import FastAPI, HTTPException
+
+# Đường dẫn tuyệt đối đến thư mục gốc của project
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from tools.api_benchmark import (
+    BenchmarkRunner, Scenario, compare_to_baseline, percentile, select_scenarios, main
+)
+
+
+def build_app():
+    app = FastAPI()
+    items = {}
+
+    @app.post("/items/", status_code=201)
+    async def create_item(payload: dict):
+        uid = f"item-{len(items)}"
+        items[uid] = payload
+        return {"uid": uid, **payload}
+
+    @app.get("/items/{uid}")
+    async def get_item(uid: str):
+        if uid not in items:
+            raise HTTPException(status_code=404)
+        return items[uid]
+
+    @app.get("/broken")
+    async def broken():
+        raise HTTPException(status_code=500)
+
+    return app
+
+
+SCENARIOS = [
+    Scenario("item.create", "POST", "/items/", {"name": "bench {run_id}-{n}"}, captures={"item_id": "uid"}),
+    Scenario("item.get", "GET", "/items/{item_id}"),
+    Scenario("broken", "GET", "/broken"),
+    Scenario("missing.route", "GET", "/not-mounted"),
+    Scenario("missing.id", "GET", "/items/{other_id}"),
+]
+
+
+async def run(scenarios=SCENARIOS, **kwargs):
+    app = build_app()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        runner = BenchmarkRunner(client, scenarios, app=app, **kwargs)
+        return await runner.run()
+
+
+class TestApiBenchmark:
+    @pytest.mark.asyncio
+    async def test_run_measures_each_scenario(self):
+        """Kiểm tra report có latency, throughput và allocation cho từng scenario."""
+        report = await run(concurrency=4, requests_per_scenario=40, warmup_requests=2, allocation_samples=3)
+        results = report["results"]
+
+        get = results["item.get"]
+        assert get["requests"] == 40
+        assert get["errors"] == 0
+        assert 0 < get["p50_ms"] <= get["p95_ms"] <= get["p99_ms"]
+        assert get["throughput_rps"] > 0
+        assert get["alloc_bytes_per_request"] > 0
+        assert get["status_codes"] == {"200": 40}
+
+        assert results["broken"]["errors"] == 40
+        assert results["missing.route"]["skipped"] == "route not mounted"
+        assert results["missing.id"]["skipped"] == "missing ids: other_id"
+        assert report["meta"]["concurrency"] == 4
+
+    def test_percentile_nearest_rank(self):
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 95) == 95
+        assert percentile(values, 99) == 99
+        assert percentile([], 50) == 0.0
+
+    def test_compare_to_baseline(self):
+        """Kiểm tra regression được phát hiện khi vượt tolerance."""
+        base = {"results": {"a": {"requests": 100, "errors": 0, "p50_ms": 10.0, "p95_ms": 20.0, "p99_ms": 30.0,
+                                  "throughput_rps": 100.0, "alloc_bytes_per_request": 1000.0, "skipped": None}}}
+        same = json.loads(json.dumps(base))
+        assert compare_to_baseline(same, base, tolerance=0.2) == []
+
+        slower = json.loads(json.dumps(base))
+        slower["results"]["a"].update({"p95_ms": 30.0, "throughput_rps": 50.0, "errors": 5})
+        regressions = compare_to_baseline(slower, base, tolerance=0.2)
+        assert any("p95_ms" in r for r in regressions)
+        assert any("throughput_rps" in r for r in regressions)
+        assert any("error rate" in r for r in regressions)
+
+        assert compare_to_baseline({"results": {}}, base) == ["a: not measured (missing)"]
+
+    def test_select_scenarios(self):
+        names = [s.name for s in select_scenarios(["win.*", "reasoning.analyze"])]
+        assert names == ["win.create", "win.list", "win.get", "reasoning.analyze"]
+        assert len(select_scenarios(None)) > len(names)
+
+    def test_cli_fails_on_regression(self, tmp_path, monkeypatch):
+        """Kiểm tra CLI trả về 1 khi có regression so với baseline."""
+        import tools.api_benchmark as api_benchmark
+        monkeypatch.setattr(api_benchmark, "DEFAULT_SCENARIOS", SCENARIOS[:2])
+        monkeypatch.setitem(sys.modules, "benchmark_test_app", type(sys)("benchmark_test_app"))
+        sys.modules["benchmark_test_app"].app = build_app()
+
+        baseline_path = tmp_path / "baseline.json"
+        args = ["--app", "benchmark_test_app:app", "--requests", "10", "--warmup", "0", "--allocation-samples", "0"]
+        assert main(args + ["--save-baseline", str(baseline_path)]) == 0
+
+        baseline = json.loads(baseline_path.read_text())
+        baseline["results"]["item.get"]["p99_ms"] = 1e-6
+        baseline_path.write_text(json.dumps(baseline))
+        assert main(args + ["--baseline", str(baseline_path)]) == 1
@@ -0,0 +1,123 @@
+import pytest
+import os
+import sys
+import json
+import time
+
+# Đường dẫn tuyệt đối đến thư mục gốc của project
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from tools.engine_benchmarks import (
+    Benchmark, EngineBenchmarkRunner, compare_to_baseline, fit_exponent,
+    select_benchmarks, stub_commercial_ai, main
+)
+
+
+def sleep_benchmark(name, exponent):
+    def setup(size, rng):
+        return lambda: time.sleep(1e-4 * size ** exponent)
+    return Benchmark(name, "items", setup)
+
+
+def test_fit_exponent():
+    assert fit_exponent([10, 100, 1000], [1.0, 10.0, 100.0]) == pytest.approx(1.0)
+    assert fit_exponent([10, 100], [1.0, 100.0]) == pytest.approx(2.0)
+    assert fit_exponent([10], [1.0]) is None
+
+
+def test_flags_super_linear_scaling():
+    runner = EngineBenchmarkRunner(sizes=[4, 16, 64], min_time=0, max_repeats=1)
+    try:
+        quadratic = runner.run_benchmark(sleep_benchmark("quadratic", 2))
+        constant = runner.run_benchmark(sleep_benchmark("constant", 0))
+    finally:
+        runner.close()
+
+    assert quadratic.super_linear is True
+    assert quadratic.exponent > 1.5
+    assert set(quadratic.segment_exponents) == {"4->16", "16->64"}
+    assert constant.super_linear is False
+
+
+def test_budget_skips_larger_sizes():
+    # 0.1ms, then 100ms against a 50ms budget
+    runner = EngineBenchmarkRunner(sizes=[1, 1000, 5000], min_time=0, max_repeats=1, budget_seconds=0.05)
+    try:
+        result = runner.run_benchmark(sleep_benchmark("slow", 1))
+    finally:
+        runner.close()
+
+    assert set(result.seconds) == {"1", "1000"}
+    assert result.skipped_sizes == [5000]
+
+
+def test_unavailable_engine_is_reported():
+    def setup(size, rng):
+        raise ImportError("No module named 'docker'")
+
+    runner = EngineBenchmarkRunner(sizes=[10, 100], min_time=0, max_repeats=1)
+    try:
+        result = runner.run_benchmark(Benchmark("missing", "items", setup))
+    finally:
+        runner.close()
+
+    assert "docker" in result.unavailable
+    assert result.seconds == {}
+
+
+def test_engine_benchmarks_smoke():
+    runner = EngineBenchmarkRunner(sizes=[5, 20], min_time=0, max_repeats=1)
+    try:
+        report = runner.run(select_benchmarks(["reasoning.*", "nlp.*", "learning.*"]))
+    finally:
+        runner.close()
+
+    assert len(report["results"]) == 5
+    for name, result in report["results"].items():
+        assert result["unavailable"] is None, name
+        assert set(result["seconds"]) == {"5", "20"}
+
+
+@pytest.mark.asyncio
+async def test_stub_commercial_ai_restores_coordinator():
+    from trm_api.core import commercial_ai_coordinator as coordinator_module
+    previous = coordinator_module._coordinator_instance
+
+    with stub_commercial_ai() as stub:
+        assert await coordinator_module.get_commercial_ai_coordinator() is stub
+        assert (await stub.analyze_data({})).model_used == "benchmark-stub"
+
+    assert coordinator_module._coordinator_instance is previous
+
+
+def test_compare_to_baseline():
+    baseline = {"results": {
+        "a": {"seconds": {"10": 0.010}, "exponent": 1.0, "super_linear": False, "unavailable": None},
+        "b": {"seconds": {"10": 0.010}, "exponent": 1.0, "super_linear": False, "unavailable": None},
+        "c": {"seconds": {}, "exponent": None, "super_linear": False, "unavailable": "ImportError"},
+    }}
+    report = {"results": {
+        "a": {"seconds": {"10": 0.011}, "exponent": 1.05, "super_linear": False, "unavailable": None},
+        "b": {"seconds": {"10": 0.020}, "exponent": 1.3, "super_linear": True, "unavailable": None},
+    }}
+
+    regressions = compare_to_baseline(report, baseline, tolerance=0.25)
+
+    assert not any(r.startswith("a:") for r in regressions)
+    assert len([r for r in regressions if r.startswith("b:")]) == 3
+
+
+def test_main_writes_baseline_and_detects_regression(tmp_path):
+    baseline_path = tmp_path / "baseline.json"
+    args = ["--benchmarks", "reasoning.tension_analyzer.*", "--sizes", "5", "20",
+            "--min-time", "0", "--max-repeats", "1"]
+
+    assert main(args + ["--save-baseline", str(baseline_path)]) == 0
+
+    baseline = json.loads(baseline_path.read_text())
+    for result in baseline["results"].values():
+        result["seconds"] = {size: seconds / 1000 for size, seconds in result["seconds"].items()}
+    baseline_path.write_text(json.dumps(baseline))
+
+    assert main(args + ["--baseline", str(baseline_path)]) == 1
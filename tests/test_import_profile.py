@@ -0,0 +1,45 @@
+import pytest
+import os
+import sys
+
+# Đường dẫn tuyệt đối đến thư mục gốc của project
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from tools.import_profile import build_report, package_totals, parse_importtime, profile_import
+
+SAMPLE = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     numpy._core
+import time:      3000 |       3120 |   numpy
+import time:       500 |        500 |   trm_api.core.config
+some unrelated stderr line
+import time:       800 |       4420 | trm_api.main
+"""
+
+
+def test_parse_importtime():
+    records = parse_importtime(SAMPLE)
+
+    assert [r.module for r in records] == ["numpy._core", "numpy", "trm_api.core.config", "trm_api.main"]
+    assert [r.depth for r in records] == [2, 1, 1, 0]
+    assert records[1].self_us == 3000
+    assert records[1].cumulative_us == 3120
+
+
+def test_package_totals_and_report():
+    records = parse_importtime(SAMPLE)
+
+    assert package_totals(records) == {"numpy": 3120, "trm_api": 1300}
+
+    report = build_report("trm_api.main", records, top=2)
+    assert report["total_seconds"] == pytest.approx(0.00442)
+    assert report["modules_imported"] == 4
+    assert [r["module"] for r in report["slowest_self"]] == ["numpy", "trm_api.main"]
+
+
+def test_profile_import_runs_subprocess():
+    records = profile_import("json")
+    assert any(r.module == "json" for r in records)
+
+    with pytest.raises(RuntimeError, match="no_such_module"):
+        profile_import("no_such_module")
@@ -10,7 +10,7 @@ ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, ROOT_DIR)
 
 # Import trực tiếp từ module
-from tools.ontology_migration import OntologyMigrationTool
+from tools.ontology_migration import OntologyMigrationTool, MigrationCheckpoint
 
 # Để tránh conflict với pytest import thông thường
 class StubEntityType:
@@ -121,7 +121,7 @@ class TestOntologyMigration:
         
         with patch.object(migration_tool, 'get_all_entities') as mock_get_entities, \
              patch.object(migration_tool, 'migrate_entity') as mock_migrate, \
-             patch.object(migration_tool, 'update_node') as mock_update:
+             patch.object(migration_tool, 'update_nodes') as mock_update:
             
             # Setup mocks
             mock_get_entities.return_value = [mock_entity]
@@ -148,7 +148,7 @@ class TestOntologyMigration:
         
         with patch.object(migration_tool, 'get_all_entities') as mock_get_entities, \
              patch.object(migration_tool, 'migrate_entity') as mock_migrate, \
-             patch.object(migration_tool, 'update_node') as mock_update:
+             patch.object(migration_tool, 'update_nodes') as mock_update:
             
             # Setup mocks
             mock_get_entities.return_value = [mock_entity]
@@ -157,8 +157,9 @@ class TestOntologyMigration:
             # Chạy trong normal mode (không phải dry run)
             migration_tool.process_entity_batch(StubEntityType.WIN, dry_run=False)
             
-            # Kiểm tra update_node được gọi
+            # Kiểm tra cả batch được ghi bằng một lần gọi update_nodes
             mock_update.assert_called_once()
+            assert mock_update.call_args[0][0] == [{'node_id': 1, 'properties': {'win_type': 'PERSONAL'}}]
             
             # Kiểm tra stats được cập nhật
             assert migration_tool.migration_stats['total'] == 1
@@ -177,3 +178,93 @@ class TestOntologyMigration:
             # Kiểm tra thứ tự các cuộc gọi
             mock_process.assert_any_call(StubEntityType.WIN, True, 100)
             mock_process.assert_any_call(StubEntityType.TASK, True, 100)
+    
+    def test_get_all_entities_keyset(self, migration_tool, mock_driver):
+        """Kiểm tra phân trang keyset theo id(n) và chia stripe cho worker."""
+        mock_session = mock_driver.return_value.session.return_value.__enter__.return_value
+        mock_session.run.return_value.data.return_value = []
+        
+        migration_tool.get_all_entities(StubEntityType.WIN, limit=10, after_id=42, stripe=(1, 4))
+        
+        query_arg, params = mock_session.run.call_args[0]
+        assert 'id(n) > $after_id' in query_arg
+        assert 'id(n) % $stripes = $stripe' in query_arg
+        assert 'ORDER BY node_id' in query_arg
+        assert 'SKIP' not in query_arg
+        assert params == {'after_id': 42, 'stripe': 1, 'stripes': 4}
+    
+    def test_process_entity_batch_pages_by_last_id(self, migration_tool):
+        """Kiểm tra các batch tiếp theo bắt đầu sau id(n) cuối của batch trước."""
+        pages = [
+            [{'n': {'uid': str(i), 'win_type': 'personal'}, 'node_id': i} for i in (1, 2)],
+            [{'n': {'uid': '3', 'win_type': 'personal'}, 'node_id': 3}],
+        ]
+        
+        with patch.object(migration_tool, 'get_all_entities', side_effect=pages) as mock_get_entities, \
+             patch.object(migration_tool, 'migrate_entity', return_value={'win_type': 'PERSONAL'}), \
+             patch.object(migration_tool, 'update_nodes') as mock_update:
+            
+            count = migration_tool.process_entity_batch(StubEntityType.WIN, dry_run=False, batch_size=2)
+        
+        assert count == 3
+        assert [c.kwargs['after_id'] for c in mock_get_entities.call_args_list] == [-1, 2]
+        assert mock_update.call_count == 2
+        assert migration_tool.migration_stats['success'] == 3
+    
+    def test_parallel_workers_cover_all_stripes(self, migration_tool):
+        """Kiểm tra mỗi worker xử lý một stripe riêng."""
+        migration_tool.workers = 3
+        
+        with patch.object(migration_tool, 'get_all_entities', return_value=[]) as mock_get_entities:
+            migration_tool.process_entity_batch(StubEntityType.WIN, dry_run=True)
+        
+        stripes = sorted(c.kwargs['stripe'] for c in mock_get_entities.call_args_list)
+        assert stripes == [(0, 3), (1, 3), (2, 3)]
+    
+    def test_checkpoint_resumes_migration(self, migration_tool, tmp_path):
+        """Kiểm tra migration tiếp tục từ checkpoint và bỏ qua label đã hoàn thành."""
+        checkpoint_path = str(tmp_path / "migration.json")
+        checkpoint = MigrationCheckpoint(checkpoint_path)
+        checkpoint.advance('Win', 0, 1, 7)
+        
+        migration_tool.checkpoint = MigrationCheckpoint(checkpoint_path)
+        entity = {'n': {'uid': '8', 'win_type': 'personal'}, 'node_id': 8}
+        
+        with patch.object(migration_tool, 'get_all_entities', return_value=[entity]) as mock_get_entities, \
+             patch.object(migration_tool, 'migrate_entity', return_value={'win_type': 'PERSONAL'}), \
+             patch.object(migration_tool, 'update_nodes'):
+            
+            migration_tool.run_migration(entity_types=[StubEntityType.WIN], dry_run=False)
+            assert mock_get_entities.call_args.kwargs['after_id'] == 7
+            
+            resumed = MigrationCheckpoint(checkpoint_path)
+            assert resumed.position('Win', 0, 1) == 8
+            assert resumed.is_complete('Win')
+            
+            # Số worker thay đổi: tiếp tục từ vị trí nhỏ nhất
+            assert resumed.position('Win', 1, 2) == 8
+            
+            mock_get_entities.reset_mock()
+            migration_tool.run_migration(entity_types=[StubEntityType.WIN], dry_run=False)
+            mock_get_entities.assert_not_called()
+    
+    def test_failed_write_does_not_advance_checkpoint(self, migration_tool, tmp_path):
+        """Kiểm tra batch ghi lỗi không tiến checkpoint, lần chạy lại bắt đầu từ id thành công cuối."""
+        checkpoint_path = str(tmp_path / "migration.json")
+        migration_tool.checkpoint = MigrationCheckpoint(checkpoint_path)
+        pages = [
+            [{'n': {'uid': str(i), 'win_type': 'personal'}, 'node_id': i} for i in (1, 2)],
+            [{'n': {'uid': str(i), 'win_type': 'personal'}, 'node_id': i} for i in (3, 4)],
+        ]
+        
+        with patch.object(migration_tool, 'get_all_entities', side_effect=pages), \
+             patch.object(migration_tool, 'migrate_entity', return_value={'win_type': 'PERSONAL'}), \
+             patch.object(migration_tool, 'update_nodes', side_effect=[2, RuntimeError("write failed")]):
+            
+            with pytest.raises(RuntimeError):
+                migration_tool.run_migration(entity_types=[StubEntityType.WIN], dry_run=False, batch_size=2)
+        
+        resumed = MigrationCheckpoint(checkpoint_path)
+        assert resumed.position('Win', 0, 1) == 2
+        assert not resumed.is_complete('Win')
+        assert migration_tool.migration_stats['failed'] == 2
@@ -0,0 +1,160 @@
+"""
+Tests for indexed rule matching and conflict detection in AdaptationEngine
+"""
+
+import random
+from unittest.mock import patch
+
+import pytest
+
+from trm_api.learning.adaptation_engine import AdaptationEngine
+from trm_api.learning.adaptation_matcher import (
+    ActiveAdaptationIndex, RuleIndex, conditions_match, context_fingerprint
+)
+from trm_api.learning.learning_types import AdaptationRule, AdaptationType
+
+
+def make_rule(conditions, actions=None, adaptation_type=AdaptationType.STRATEGY_CHANGE, **kwargs):
+    return AdaptationRule(
+        adaptation_type=adaptation_type, agent_id="agent-1", name="rule", description="rule",
+        trigger_conditions=conditions, adaptation_actions=actions or {"action": "prefer_context"}, **kwargs
+    )
+
+
+def random_conditions(rng):
+    choices = [
+        ("experience_type", rng.choice(["a", "b", "c"])),
+        ("action_selection", rng.choice([True, False])),
+        ("min_confidence", rng.choice([0.3, 0.5, 0.8])),
+        ("task_importance", rng.choice([["high"], ["high", "medium"]])),
+        ("metric_focus", None),
+    ]
+    return dict(rng.sample(choices, rng.randint(0, 3)))
+
+
+def random_context(rng):
+    context = {
+        "experience_type": rng.choice(["a", "b", "c", "d"]),
+        "action_selection": rng.choice([True, False]),
+        "min_confidence": rng.choice([0.2, 0.5, 0.9, "high"]),
+        "task_importance": rng.choice(["high", "medium", "low"]),
+        "metric_focus": "efficiency",
+    }
+    return {k: v for k, v in context.items() if rng.random() < 0.8}
+
+
+class TestRuleIndex:
+    """Test that indexed matching agrees with direct condition checks"""
+
+    def test_matches_equal_linear_scan(self):
+        rng = random.Random(7)
+        index = RuleIndex()
+        rules = [make_rule(random_conditions(rng)) for _ in range(200)]
+        for rule in rules:
+            index[rule.rule_id] = rule
+        for rule in rules[::5]:
+            del index[rule.rule_id]
+        remaining = [rule for i, rule in enumerate(rules) if i % 5]
+
+        for _ in range(100):
+            context = random_context(rng)
+            expected = [rule for rule in remaining if conditions_match(rule.trigger_conditions, context)]
+            assert index.match(context) == expected
+
+    def test_matches_are_memoized_per_context(self):
+        index = RuleIndex()
+        rule = make_rule({"experience_type": "a"})
+        index[rule.rule_id] = rule
+
+        assert index.match({"experience_type": "a"}) == [rule]
+        assert index.match({"experience_type": "a"}) == [rule]
+        assert (index.cache_hits, index.cache_misses) == (1, 1)
+
+        other = make_rule({"experience_type": "a", "min_confidence": 0.5})
+        index[other.rule_id] = other  # Invalidates memoized matches
+        assert index.match({"experience_type": "a", "min_confidence": 0.7}) == [rule, other]
+
+    def test_unfingerprintable_context_still_matches(self):
+        index = RuleIndex()
+        rule = make_rule({"learning_cycle": True})
+        index[rule.rule_id] = rule
+
+        assert index.match({"learning_cycle": True, "current_performance": {AdaptationType.STRATEGY_CHANGE: 1}}) == [rule]
+
+
+class TestActiveAdaptationIndex:
+    """Test conflict detection by target"""
+
+    def test_conflicts_by_type_and_action_key(self):
+        active = ActiveAdaptationIndex()
+        active["x"] = {"rule_id": "r1", "adaptation_type": "strategy_change",
+                       "actions": {"action": "prefer_context", "context_key": "team"}}
+
+        assert active.has_rule("r1")
+        assert active.conflicts(make_rule({}, {"action": "prefer_context", "context_key": "size"}))
+        assert not active.conflicts(make_rule({}, {"action": "prefer_context", "context_key": "team"}))
+        assert not active.conflicts(make_rule({}, {"action": "avoid_context"}, AdaptationType.PARAMETER_ADJUSTMENT))
+
+        del active["x"]
+        assert not active.has_rule("r1")
+        assert not active.conflicts(make_rule({}, {"action": "prefer_context", "context_key": "size"}))
+
+    def test_conflicts_compare_values_not_types(self):
+        active = ActiveAdaptationIndex()
+        active["x"] = {"rule_id": "r1", "adaptation_type": "strategy_change",
+                       "actions": {"action": "tune", "weight": 1, "enabled": True, "limits": {"max": 2}}}
+
+        assert not active.conflicts(make_rule({}, {"action": "tune", "weight": 1.0}))
+        assert not active.conflicts(make_rule({}, {"action": "tune", "enabled": 1}))
+        assert not active.conflicts(make_rule({}, {"action": "tune", "limits": {"max": 2.0}}))
+        assert active.conflicts(make_rule({}, {"action": "tune", "weight": "1"}))
+        assert active.conflicts(make_rule({}, {"action": "tune", "limits": {"2": "max"}}))
+
+        del active["x"]
+        assert not active.conflicts(make_rule({}, {"action": "tune", "weight": "1"}))
+
+    def test_context_fingerprint_keeps_key_types(self):
+        assert context_fingerprint({1: "x"}) != context_fingerprint({"1": "x"})
+        assert context_fingerprint({"a": 1, "b": [1]}) == context_fingerprint({"b": [1.0], "a": True})
+        assert context_fingerprint({"a": [1]}) != context_fingerprint({"a": "[1]"})
+
+        index = RuleIndex()
+        rule = make_rule({"1": "x"})
+        index[rule.rule_id] = rule
+        assert index.match({"1": "x"}) == [rule]
+        assert index.match({1: "x"}) == []
+
+
+class TestAdaptationEngineMatching:
+    """Test AdaptationEngine on top of the indexes"""
+
+    @pytest.mark.asyncio
+    async def test_apply_only_evaluates_matching_rules(self):
+        engine = AdaptationEngine("agent-1")
+        for i in range(500):
+            rule = make_rule({"pattern_match": f"sig-{i}", "action_selection": True},
+                             {"action": "increase_pattern_usage", "action_signature": f"sig-{i}"})
+            engine.adaptation_rules[rule.rule_id] = rule
+
+        with patch("trm_api.learning.adaptation_engine.publish_event"), \
+                patch.object(engine, "_is_rule_ready", wraps=engine._is_rule_ready) as ready:
+            applied = await engine.apply_adaptations({"pattern_match": "sig-42", "action_selection": True})
+
+        assert ready.call_count == 1
+        assert [a["actions"]["action_signature"] for a in applied] == ["sig-42"]
+
+    @pytest.mark.asyncio
+    async def test_conflicting_and_repeated_rules_are_skipped(self):
+        engine = AdaptationEngine("agent-1")
+        engine.adaptation_cooldown = 0
+        first = make_rule({"context_selection": True}, {"action": "prefer_context", "context_key": "team"}, priority=9)
+        clash = make_rule({"context_selection": True}, {"action": "prefer_context", "context_key": "size"})
+        for rule in (first, clash):
+            engine.adaptation_rules[rule.rule_id] = rule
+
+        with patch("trm_api.learning.adaptation_engine.publish_event"):
+            applied = await engine.apply_adaptations({"context_selection": True})
+            again = await engine.apply_adaptations({"context_selection": True})
+
+        assert [a["rule_id"] for a in applied] == [first.rule_id]
+        assert again == []
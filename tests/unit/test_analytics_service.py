@@ -0,0 +1,155 @@
+"""
+Test suite for incrementally maintained graph analytics counters
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from trm_api.eventbus.system_event_bus import SystemEventBus, SystemEvent, EventType
+from trm_api.services.analytics_service import GraphAnalyticsService
+
+
+def cypher_results(query, params=None):
+    """Fake aggregation results for a graph with three Event nodes"""
+    if "count(n)" in query:
+        return [[3]], ["count(n)"]
+    if "n.event_type" in query:
+        return [["meeting", 2], ["launch", 1]], ["value", "count"]
+    if "n.status" in query:
+        return [["completed", 1], ["planned", 2]], ["value", "count"]
+    return [["high", 3]], ["value", "count"]
+
+
+class TestGraphAnalyticsService:
+    """Tests for cold-start aggregation and incremental updates"""
+
+    @pytest.fixture
+    def analytics(self):
+        analytics = GraphAnalyticsService()
+        with patch("trm_api.services.analytics_service.db.cypher_query", side_effect=cypher_results):
+            analytics.get_distributions("Event")
+        return analytics
+
+    def test_cold_start_uses_cypher_aggregation(self):
+        """The first read aggregates in the database; later reads do not query"""
+        analytics = GraphAnalyticsService()
+        with patch("trm_api.services.analytics_service.db.cypher_query", side_effect=cypher_results) as query:
+            snapshot = analytics.get_distributions("Event")
+            analytics.get_distributions("Event")
+
+        assert query.call_count == 4
+        assert all("count(" in call.args[0] for call in query.call_args_list)
+        assert snapshot == {
+            "total": 3,
+            "distributions": {
+                "event_type": {"meeting": 2, "launch": 1},
+                "status": {"completed": 1, "planned": 2},
+                "strategic_priority": {"high": 3}
+            }
+        }
+
+    def test_incremental_create_update_delete(self, analytics):
+        """Lifecycle updates adjust counts without re-aggregating"""
+        analytics.record_created("Event", "e1", {"event_type": "launch", "status": "planned",
+                                                 "strategic_priority": "low"})
+        analytics.record_updated("Event", "e1", {"status": "completed"})
+
+        with patch("trm_api.services.analytics_service.db.cypher_query") as query:
+            snapshot = analytics.get_distributions("Event")
+            query.assert_not_called()
+
+        assert snapshot["total"] == 4
+        assert snapshot["distributions"]["status"] == {"completed": 2, "planned": 2}
+        assert snapshot["distributions"]["strategic_priority"] == {"high": 3, "low": 1}
+
+        analytics.record_deleted("Event", "e1")
+        snapshot = analytics.get_distributions("Event")
+        assert snapshot["total"] == 3
+        assert snapshot["distributions"]["status"] == {"completed": 1, "planned": 2}
+
+    def test_duplicate_create_is_idempotent(self, analytics):
+        """A creation seen through both the service and the event bus counts once"""
+        data = {"event_type": "launch", "status": "planned", "strategic_priority": "high"}
+        analytics.record_created("Event", "e2", data)
+        analytics.record_created("Event", "e2", data)
+
+        assert analytics.get_distributions("Event")["total"] == 4
+
+    def test_known_entities_are_bounded(self, analytics):
+        """Only the most recently seen entities keep their values; older ones fall back to previous values"""
+        counter = analytics.counters["Event"]
+        counter.max_known = 2
+        data = {"event_type": "launch", "status": "planned", "strategic_priority": "high"}
+        for entity_id in ("e1", "e2", "e3"):
+            analytics.record_created("Event", entity_id, data)
+        analytics.record_updated("Event", "e2", {"status": "completed"})
+
+        assert list(counter._known) == ["e3", "e2"]
+        analytics.record_deleted("Event", "e1", previous=data)
+        assert not counter.stale
+        assert analytics.get_distributions("Event")["total"] == 5
+
+    def test_unknown_previous_values_mark_stale(self, analytics):
+        """Updates to entities with unknown previous values trigger re-aggregation"""
+        analytics.record_updated("Event", "cold_start_event", {"status": "completed"})
+        assert analytics.counters["Event"].stale
+
+        analytics.record_updated("Event", "other", {"status": "completed"}, previous={"status": "planned"})
+        with patch("trm_api.services.analytics_service.db.cypher_query", side_effect=cypher_results) as query:
+            analytics.get_distributions("Event")
+        assert query.called
+        assert not analytics.counters["Event"].stale
+
+    def test_updates_ignored_before_cold_start(self):
+        """Counters that were never loaded are not updated incrementally"""
+        analytics = GraphAnalyticsService()
+        analytics.record_created("WIN", "w1", {"status": "draft"})
+        assert analytics.counters["WIN"].total == 0
+
+    @pytest.mark.asyncio
+    async def test_system_events_update_counters(self, analytics):
+        """TENSION/WIN/EVENT system events drive the counters"""
+        bus = SystemEventBus()
+        analytics.subscribe_to_event_bus(bus)
+        try:
+            await bus.publish(SystemEvent(event_type=EventType.EVENT_CREATED, entity_id="e3",
+                                          data={"event_type": "review", "status": "planned"}))
+            await bus.publish(SystemEvent(event_type=EventType.EVENT_UPDATED, entity_id="e3",
+                                          data={"status": "completed"}))
+        finally:
+            analytics.unsubscribe_from_event_bus()
+
+        snapshot = analytics.get_distributions("Event")
+        assert snapshot["total"] == 4
+        assert snapshot["distributions"]["event_type"]["review"] == 1
+        assert snapshot["distributions"]["status"] == {"completed": 2, "planned": 2}
+
+        resolved = analytics.counters["Tension"]
+        resolved.loaded = True
+        resolved.created("t1", {"status": "Open", "priority": 1})
+        await analytics._handle_system_event(SystemEvent(event_type=EventType.TENSION_RESOLVED, entity_id="t1"))
+        assert resolved.snapshot()["distributions"]["status"] == {"Resolved": 1}
+
+    @pytest.mark.asyncio
+    async def test_event_data_and_entity_type(self, analytics):
+        """Persisted values in event data win over implied ones; other entity kinds are skipped"""
+        tensions = analytics.counters["Tension"]
+        tensions.loaded = True
+        tensions.created("t1", {"status": "Open"})
+        await analytics._handle_system_event(SystemEvent(
+            event_type=EventType.TENSION_RESOLVED, entity_id="t1", entity_type="tension",
+            data={"status": "resolved", "previous": {"status": "Open"}}
+        ))
+        assert tensions.snapshot()["distributions"]["status"] == {"resolved": 1}
+
+        wins = analytics.counters["WIN"]
+        wins.loaded = True
+        await analytics._handle_system_event(SystemEvent(
+            event_type=EventType.WIN_CREATED, entity_id="t1", entity_type="tension",
+            data={"impact": "positive"}
+        ))
+        await analytics._handle_system_event(SystemEvent(
+            event_type=EventType.WIN_CREATED, entity_id="w1", entity_type="WIN", data={"status": "draft"}
+        ))
+        assert wins.snapshot()["total"] == 1
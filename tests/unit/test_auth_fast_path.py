@@ -0,0 +1,111 @@
+"""
+Tests for the verified-token cache, session indexes and the login attempt ring
+"""
+
+from datetime import datetime, timedelta
+
+import jwt
+import pytest
+
+from trm_api.security.authentication import (
+    AuthenticationManager, JWTManager, SessionManager, VerifiedTokenCache
+)
+
+
+class TestVerifiedTokenCache:
+    """Test the token claims cache"""
+
+    def test_second_verify_skips_decode(self, monkeypatch):
+        manager = JWTManager()
+        token = manager.create_access_token("u1", ["read"])
+        calls = []
+        real_decode = jwt.decode
+        monkeypatch.setattr(jwt, "decode", lambda *a, **k: calls.append(1) or real_decode(*a, **k))
+
+        first = manager.verify_token(token)
+        first["permissions"] = ["admin"]
+        second = manager.verify_token(token)
+
+        assert len(calls) == 1
+        assert second["sub"] == "u1" and second["permissions"] == ["read"]
+        assert manager.token_cache.get_stats()["hits"] == 1
+
+    def test_cached_token_honors_exp(self):
+        manager = JWTManager()
+        token = manager.create_access_token("u1")
+        claims = manager.verify_token(token)
+        # Same token, cached with an exp that has passed
+        manager.token_cache.put(token, {**claims, "exp": datetime.utcnow().timestamp() - 1})
+
+        assert manager.token_cache.get(token) is None
+        assert manager.token_cache.get_stats()["size"] == 0
+
+    def test_invalid_token_not_cached(self):
+        manager = JWTManager()
+
+        assert manager.verify_token("not.a.token") is None
+        assert manager.token_cache.get_stats()["size"] == 0
+
+    def test_bounded_lru(self):
+        cache = VerifiedTokenCache(max_size=2)
+        cache.put("a", {"sub": "a"})
+        cache.put("b", {"sub": "b"})
+        cache.get("a")
+        cache.put("c", {"sub": "c"})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"sub": "a"}
+        assert cache.get("c") == {"sub": "c"}
+
+
+class TestIndexedSessionManager:
+    """Test per-user session index and expiry sweeping"""
+
+    def test_user_index_and_limit(self):
+        manager = SessionManager()
+        manager.max_sessions_per_user = 2
+        first = manager.create_session("u1", "", "")
+        second = manager.create_session("u1", "", "")
+        third = manager.create_session("u1", "", "")
+        manager.create_session("u2", "", "")
+
+        assert list(manager.user_sessions["u1"]) == [second.session_id, third.session_id]
+        assert first.session_id not in manager.sessions
+
+        assert manager.invalidate_user_sessions("u1") == 2
+        assert "u1" not in manager.user_sessions
+        assert len(manager.sessions) == 1
+
+    def test_sweep_removes_only_expired(self):
+        manager = SessionManager()
+        stale = manager.create_session("u1", "", "")
+        active = manager.create_session("u2", "", "")
+        # Activity extended `active` past its original heap entry
+        active.expires_at = datetime.utcnow() + timedelta(hours=2)
+
+        removed = manager.sweep_expired(datetime.utcnow() + timedelta(hours=1))
+
+        assert removed == 1
+        assert stale.session_id not in manager.sessions and not stale.is_active
+        assert active.session_id in manager.sessions
+        assert manager._expiry_heap[0] == (active.expires_at, active.session_id)
+
+
+class TestLoginAttemptRing:
+    """Test the fixed-size failed-attempt ring"""
+
+    @pytest.mark.asyncio
+    async def test_limit_and_window(self):
+        manager = AuthenticationManager()
+        for _ in range(manager.max_attempts - 1):
+            await manager._record_failed_attempt("u1")
+        assert not await manager._is_rate_limited("u1")
+
+        await manager._record_failed_attempt("u1")
+        await manager._record_failed_attempt("u1")
+        assert len(manager.login_attempts["u1"]) == manager.max_attempts
+        assert await manager._is_rate_limited("u1")
+
+        # Oldest failure in the ring leaves the lockout window
+        manager.login_attempts["u1"][0] -= timedelta(minutes=manager.lockout_duration_minutes + 1)
+        assert not await manager._is_rate_limited("u1")
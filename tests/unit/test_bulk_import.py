@@ -0,0 +1,178 @@
+"""
+Tests for the bulk graph import pipeline
+"""
+
+import csv
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from trm_api.db.bulk_import import (
+    AdminImportWriter, BulkGraphImporter, NodeRecord, RelationshipRecord,
+    SyntheticGraphGenerator, read_csv, read_jsonl, read_records
+)
+
+
+class FakeDriver:
+    """Records every UNWIND batch written through execute_write"""
+
+    def __init__(self, fail_on=None):
+        self.batches = []
+        self.fail_on = fail_on
+        self.lock = threading.Lock()
+
+    def session(self, **kwargs):
+        driver = self
+        session = MagicMock()
+
+        def execute_write(fn):
+            tx = MagicMock()
+
+            def run(query, rows):
+                if driver.fail_on and driver.fail_on in query:
+                    raise RuntimeError("write failed")
+                with driver.lock:
+                    driver.batches.append((query, list(rows)))
+                return MagicMock()
+
+            tx.run.side_effect = run
+            return fn(tx)
+
+        session.execute_write.side_effect = execute_write
+        session.__enter__.return_value = session
+        return session
+
+
+class TestSources:
+    """Test JSON-lines, CSV and synthetic sources"""
+
+    def test_read_jsonl(self, tmp_path):
+        path = tmp_path / "graph.jsonl"
+        path.write_text("\n".join([
+            json.dumps({"label": "Tension", "properties": {"uid": "t1", "title": "A"}}),
+            "",
+            json.dumps({"label": "WIN", "uid": "w1", "name": "B"}),
+            json.dumps({"type": "LEADS_TO_WIN", "start_label": "Tension", "start_uid": "t1",
+                        "end_label": "WIN", "end_uid": "w1"}),
+        ]))
+
+        records = list(read_records(str(path)))
+
+        assert records[0] == NodeRecord("Tension", {"uid": "t1", "title": "A"})
+        assert records[1] == NodeRecord("WIN", {"uid": "w1", "name": "B"})
+        assert records[2] == RelationshipRecord("LEADS_TO_WIN", "Tension", "t1", "WIN", "w1")
+
+    def test_read_jsonl_reports_line(self, tmp_path):
+        path = tmp_path / "graph.jsonl"
+        path.write_text(json.dumps({"label": "Tension", "properties": {"title": "no uid"}}))
+
+        with pytest.raises(ValueError, match="graph.jsonl:1"):
+            list(read_jsonl(str(path)))
+
+    def test_read_csv_typed_header(self, tmp_path):
+        path = tmp_path / "tensions.csv"
+        path.write_text("uid,title,priority:int,tags:string[],urgent:boolean\nt1,Title,2,a;b,true\nt2,Other,,,false\n")
+
+        records = list(read_csv(str(path), label="Tension"))
+
+        assert records[0].properties == {"uid": "t1", "title": "Title", "priority": 2, "tags": ["a", "b"], "urgent": True}
+        assert records[1].properties == {"uid": "t2", "title": "Other", "urgent": False}
+
+    def test_synthetic_generator_emits_nodes_before_relationships(self):
+        records = list(SyntheticGraphGenerator(tensions=20, wins=10, events=30, seed=1))
+
+        seen = set()
+        for record in records:
+            if isinstance(record, NodeRecord):
+                seen.add(record.properties["uid"])
+            else:
+                assert record.start_uid in seen and record.end_uid in seen
+
+        labels = [r.label for r in records if isinstance(r, NodeRecord)]
+        assert labels.count("Tension") == 20
+        assert labels.count("WIN") == 10
+        assert labels.count("Event") == 30
+
+    def test_synthetic_generator_is_reproducible(self):
+        first = list(SyntheticGraphGenerator(tensions=5, seed=7))
+        second = list(SyntheticGraphGenerator(tensions=5, seed=7))
+        assert [r.properties["uid"] for r in first] == [r.properties["uid"] for r in second]
+
+
+class TestBulkGraphImporter:
+    """Test batched UNWIND writes"""
+
+    def test_batches_nodes_and_relationships(self):
+        driver = FakeDriver()
+        importer = BulkGraphImporter(driver, batch_size=4, workers=3)
+
+        stats = importer.import_records(SyntheticGraphGenerator(tensions=10, wins=6, events=3, seed=2))
+
+        assert stats.nodes == 19
+        assert stats.relationships == 9
+        assert stats.failed_batches == 0
+        assert all(len(rows) <= 4 for _, rows in driver.batches)
+        assert all(query.startswith("UNWIND $rows AS row") for query, _ in driver.batches)
+
+    def test_relationships_written_after_their_nodes(self):
+        driver = FakeDriver()
+        importer = BulkGraphImporter(driver, batch_size=3, workers=4)
+
+        importer.import_records(SyntheticGraphGenerator(tensions=12, wins=12, seed=3))
+
+        written = set()
+        for query, rows in driver.batches:
+            if "MATCH (a:" in query:
+                assert all(row["start_uid"] in written and row["end_uid"] in written for row in rows)
+            else:
+                written.update(row["uid"] for row in rows)
+
+    def test_merge_and_create_queries(self):
+        assert "MERGE (n:Tension {uid: row.uid})" in BulkGraphImporter(None).node_query("Tension")
+        assert "CREATE (n:Tension)" in BulkGraphImporter(None, merge=False).node_query("Tension")
+        with pytest.raises(ValueError):
+            BulkGraphImporter(None).node_query("Tension) DETACH DELETE (x")
+
+    def test_failed_batches_are_counted(self):
+        driver = FakeDriver(fail_on=":WIN")
+        importer = BulkGraphImporter(driver, batch_size=5, workers=2)
+
+        stats = importer.import_records([NodeRecord("WIN", {"uid": str(i)}) for i in range(7)]
+                                        + [NodeRecord("Event", {"uid": "e"})])
+
+        assert stats.nodes == 1
+        assert stats.failed_batches == 2
+        assert stats.failed_records == 7
+
+
+class TestAdminImportWriter:
+    """Test neo4j-admin CSV output"""
+
+    def test_writes_typed_csv_files(self, tmp_path):
+        writer = AdminImportWriter(str(tmp_path))
+
+        count = writer.write([
+            NodeRecord("Tension", {"uid": "t1", "title": "A, quoted", "priority": 2, "tags": ["x", "y"]}),
+            NodeRecord("Tension", {"uid": "t2", "title": "B", "priority": 0, "tags": [], "extra": 1}),
+            NodeRecord("WIN", {"uid": "w1", "impact_level": 3}),
+            RelationshipRecord("LEADS_TO_WIN", "Tension", "t1", "WIN", "w1", {"weight": 0.5}),
+        ])
+
+        assert count == 4
+        assert writer.dropped_properties == 1
+        with open(writer.node_files["Tension"], newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == ["uid:ID(Tension)", "title:string", "priority:long", "tags:string[]", ":LABEL"]
+        assert rows[1] == ["t1", "A, quoted", "2", "x;y", "Tension"]
+
+        with open(writer.relationship_files[("LEADS_TO_WIN", "Tension", "WIN")], newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == [":START_ID(Tension)", ":END_ID(WIN)", "weight:double", ":TYPE"]
+        assert rows[1] == ["t1", "w1", "0.5", "LEADS_TO_WIN"]
+
+        command = writer.command("staging")
+        assert command.startswith("neo4j-admin database import full")
+        assert "--nodes=Tension=" in command and "--relationships=LEADS_TO_WIN=" in command
+        assert command.endswith(" staging")
@@ -0,0 +1,139 @@
+"""
+Test suite for CausalAnalyzer incremental causal chain mining
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+from trm_api.reasoning.advanced_reasoning_engine import AdvancedReasoningEngine
+from trm_api.reasoning.causal_analyzer import CausalAnalyzer, get_causal_analyzer
+from trm_api.reasoning.reasoning_types import ReasoningContext, ReasoningResult, ReasoningType
+from trm_api.eventbus.system_event_bus import SystemEventBus, SystemEvent, EventType
+
+
+def _event(event_id, event_type, timestamp, entity_id=None):
+    return {
+        "event_id": event_id,
+        "event_type": event_type,
+        "timestamp": timestamp,
+        "entity_id": entity_id,
+        "data": {}
+    }
+
+
+class TestCausalAnalyzerStreaming:
+    """Tests for sliding-window causal analysis"""
+
+    @pytest.fixture
+    def analyzer(self):
+        return CausalAnalyzer()
+
+    @pytest.fixture
+    def events(self):
+        start = datetime(2025, 1, 1, 9, 0)
+        return [
+            _event("e1", "TENSION_CREATED", start, "tension_1"),
+            _event("e2", "TASK_CREATED", start + timedelta(minutes=2), "task_1"),
+            _event("e3", "TASK_UPDATED", start + timedelta(minutes=4), "task_1"),
+            _event("e4", "TASK_COMPLETED", start + timedelta(minutes=30), "task_1"),
+            _event("e5", "TENSION_RESOLVED", start + timedelta(hours=1), "tension_1"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_batch_matches_incremental(self, analyzer, events):
+        """Batch analysis and event-by-event ingestion find the same chains"""
+        batch_chains = await analyzer.analyze_event_sequences(list(reversed(events)))
+
+        for event in events:
+            await analyzer.ingest_event(event)
+        streamed_chains = analyzer.get_streaming_chains()
+
+        batch_keys = {(c.root_cause, c.final_effect) for c in batch_chains}
+        streamed_keys = {(c.root_cause, c.final_effect) for c in streamed_chains}
+        assert batch_keys
+        assert batch_keys <= streamed_keys
+
+    @pytest.mark.asyncio
+    async def test_event_scored_only_against_window(self, analyzer, events):
+        """A new event is compared with at most the lookahead window plus its entity window"""
+        for event in events:
+            await analyzer.ingest_event(event)
+
+        late = _event("e6", "TASK_CREATED", events[-1]["timestamp"] + timedelta(minutes=1), "task_2")
+        new_chains = await analyzer.ingest_event(late)
+        roots = {c.root_cause for c in new_chains}
+        assert "event_TENSION_CREATED_e1" not in roots
+        assert len(analyzer.stream_state.recent_events) == analyzer.lookahead
+
+    @pytest.mark.asyncio
+    async def test_running_aggregates(self, analyzer):
+        """Repeated relationships update one aggregate instead of adding duplicates"""
+        start = datetime(2025, 1, 1)
+        for i in range(3):
+            base = start + timedelta(days=i)
+            await analyzer.ingest_event(_event("a", "TASK_UPDATED", base, "task_9"))
+            await analyzer.ingest_event(_event("b", "TASK_COMPLETED", base + timedelta(minutes=1), "task_9"))
+
+        key = ("event_TASK_UPDATED_a", "event_TASK_COMPLETED_b")
+        aggregate = analyzer.stream_state.chains[key]
+        assert aggregate.occurrences == 3
+        assert aggregate.max_confidence == pytest.approx(0.81)
+        assert "task_9" in aggregate.entity_ids
+
+        chains = analyzer.get_streaming_chains(entity_ids=["task_9"])
+        assert chains[0].evidence[-1]["occurrences"] == 3
+
+    @pytest.mark.asyncio
+    async def test_recurring_pattern_from_running_intervals(self, analyzer):
+        """Regular same-type events produce a recurring pattern chain"""
+        start = datetime(2025, 1, 1)
+        events = [_event(f"h{i}", "AGENT_ACTIVATED", start + timedelta(hours=i)) for i in range(5)]
+
+        chains = await analyzer.analyze_event_sequences(events)
+        assert any(c.root_cause == "pattern_AGENT_ACTIVATED_recurring" for c in chains)
+
+    @pytest.mark.asyncio
+    async def test_subscribes_to_event_bus(self, analyzer):
+        """Events published on the system event bus update the streaming state"""
+        bus = SystemEventBus()
+        analyzer.subscribe_to_event_bus(bus)
+        try:
+            now = datetime.now()
+            await bus.publish(SystemEvent(event_type=EventType.TASK_UPDATED, event_id="s1",
+                                          timestamp=now, entity_id="task_bus"))
+            await bus.publish(SystemEvent(event_type=EventType.TASK_COMPLETED, event_id="s2",
+                                          timestamp=now + timedelta(minutes=1), entity_id="task_bus"))
+        finally:
+            analyzer.unsubscribe_from_event_bus()
+
+        assert analyzer.stream_state.events_ingested == 2
+        assert ("event_TASK_UPDATED_s1", "event_TASK_COMPLETED_s2") in analyzer.stream_state.chains
+        assert not analyzer.is_streaming
+
+    @pytest.mark.asyncio
+    async def test_engines_merge_shared_streamed_chains(self, analyzer):
+        """Engines default to the shared analyzer and merge streamed chains for their context"""
+        assert AdvancedReasoningEngine("agent_a").causal_analyzer is get_causal_analyzer()
+
+        bus = SystemEventBus()
+        engine = AdvancedReasoningEngine("agent_b", causal_analyzer=analyzer)
+        analyzer.subscribe_to_event_bus(bus)
+        try:
+            now = datetime.now()
+            await bus.publish(SystemEvent(event_type=EventType.TASK_UPDATED, event_id="m1",
+                                          timestamp=now, entity_id="task_ctx"))
+            await bus.publish(SystemEvent(event_type=EventType.TASK_COMPLETED, event_id="m2",
+                                          timestamp=now + timedelta(minutes=1), entity_id="task_ctx"))
+
+            context = ReasoningContext(task_ids=["task_ctx"], historical_events=[
+                _event("h1", "TENSION_CREATED", now - timedelta(days=3), "tension_other")
+            ])
+            result = ReasoningResult(result_id="r1", reasoning_type=ReasoningType.CAUSAL, context=context)
+            await engine._perform_causal_analysis(result)
+        finally:
+            analyzer.unsubscribe_from_event_bus()
+
+        assert ("event_TASK_UPDATED_m1", "event_TASK_COMPLETED_m2") in {
+            (c.root_cause, c.final_effect) for c in result.causal_chains
+        }
+        assert result.steps[-1].output_data["streamed_chains_merged"] == 1
@@ -0,0 +1,240 @@
+"""
+Tests for subscription-driven dashboard streaming (ring buffers, deltas, downsampling)
+"""
+
+import asyncio
+import math
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from trm_api.monitoring.dashboard_engine import (
+    DashboardEngine, ChartConfig, ChartType, TimeRange,
+    TimeSeriesBuffer, lttb_downsample, minmax_downsample
+)
+
+
+def make_points(count, start=None, step_minutes=1):
+    start = start or datetime.utcnow() - timedelta(minutes=count * step_minutes)
+    return [
+        (start + timedelta(minutes=i * step_minutes), math.sin(i / 5.0) * 10)
+        for i in range(count)
+    ]
+
+
+class TestDownsampling:
+    """Test LTTB and min/max downsampling"""
+
+    def test_lttb_keeps_endpoints_and_threshold(self):
+        points = make_points(1000)
+        sampled = lttb_downsample(points, 100)
+
+        assert len(sampled) == 100
+        assert sampled[0] == points[0]
+        assert sampled[-1] == points[-1]
+        assert [p[0] for p in sampled] == sorted(p[0] for p in sampled)
+
+    def test_lttb_keeps_spike(self):
+        points = make_points(500)
+        points[250] = (points[250][0], 1000.0)
+
+        sampled = lttb_downsample(points, 50)
+
+        assert points[250] in sampled
+
+    def test_small_series_unchanged(self):
+        points = make_points(10)
+        assert lttb_downsample(points, 100) == points
+        assert minmax_downsample(points, 100) == points
+
+    def test_minmax_keeps_extremes(self):
+        points = make_points(1000)
+        sampled = minmax_downsample(points, 100)
+
+        assert len(sampled) <= 100
+        assert max(p[1] for p in sampled) == max(p[1] for p in points)
+        assert min(p[1] for p in sampled) == min(p[1] for p in points)
+
+
+class TestTimeSeriesBuffer:
+    """Test ring buffer behaviour"""
+
+    def test_append_only_accepts_newer_points(self):
+        buffer = TimeSeriesBuffer(capacity=5)
+        points = make_points(3)
+
+        assert buffer.append(points) == points
+        assert buffer.append(points[1:]) == []
+        assert buffer.last_timestamp == points[-1][0]
+
+    def test_capacity_evicts_oldest(self):
+        buffer = TimeSeriesBuffer(capacity=5)
+        points = make_points(8)
+        buffer.append(points)
+
+        assert list(buffer.points) == points[-5:]
+
+    def test_retention_evicts_points_older_than_range(self):
+        buffer = TimeSeriesBuffer(capacity=100, retention=timedelta(minutes=10))
+        points = make_points(30)
+        buffer.append(points)
+
+        assert list(buffer.points) == points[-11:]
+
+
+class TestDashboardStreaming:
+    """Test subscription-driven refresh and websocket deltas"""
+
+    @pytest.fixture
+    def engine(self):
+        engine = DashboardEngine()
+        engine.max_data_points = 5000
+        return engine
+
+    @pytest.fixture
+    def websocket(self):
+        ws = AsyncMock()
+        ws.send_json = AsyncMock()
+        return ws
+
+    def add_custom_chart(self, engine, fetch, **kwargs):
+        chart = ChartConfig(
+            id="custom_chart",
+            title="Custom",
+            chart_type=ChartType.LINE,
+            data_source="custom",
+            time_range=TimeRange.LAST_24_HOURS,
+            **kwargs
+        )
+        engine.chart_configs[chart.id] = chart
+        engine.register_data_source("custom", fetch)
+        return chart
+
+    @pytest.mark.asyncio
+    async def test_snapshot_is_downsampled_to_pixel_width(self, engine, websocket):
+        points = make_points(2000, step_minutes=0.5)
+
+        async def fetch(chart_config, start_time, end_time):
+            return {
+                'labels': [t.isoformat() for t, _ in points],
+                'datasets': [{'label': 'value', 'data': [v for _, v in points], 'borderColor': '#000'}]
+            }
+
+        self.add_custom_chart(engine, fetch, pixel_width=200)
+
+        assert await engine.subscribe("custom_chart", websocket) is True
+
+        message = websocket.send_json.call_args[0][0]
+        assert message['type'] == 'chart_snapshot'
+        assert len(message['data']['labels']) == 200
+        assert message['data']['datasets'][0]['borderColor'] == '#000'
+
+    @pytest.mark.asyncio
+    async def test_subscribers_receive_only_new_points(self, engine, websocket):
+        points = make_points(20)
+        fetch = AsyncMock(return_value={
+            'labels': [t.isoformat() for t, _ in points],
+            'datasets': [{'label': 'value', 'data': [v for _, v in points]}]
+        })
+        self.add_custom_chart(engine, fetch)
+        await engine.subscribe("custom_chart", websocket)
+
+        new_point = (points[-1][0] + timedelta(minutes=1), 42.0)
+        accepted = await engine.publish_points("custom", "value", [points[-1], new_point])
+
+        assert accepted == 1
+        message = websocket.send_json.call_args[0][0]
+        assert message['type'] == 'chart_delta'
+        assert message['labels'] == [new_point[0].isoformat()]
+        assert message['datasets'][0]['data'] == [42.0]
+
+    @pytest.mark.asyncio
+    async def test_incremental_pull_fetches_from_last_point(self, engine, websocket):
+        points = make_points(20)
+        fetch = AsyncMock(return_value={
+            'labels': [t.isoformat() for t, _ in points],
+            'datasets': [{'label': 'value', 'data': [v for _, v in points]}]
+        })
+        chart = self.add_custom_chart(engine, fetch)
+        await engine.subscribe("custom_chart", websocket)
+        websocket.send_json.reset_mock()
+
+        # Nothing new: no message is sent
+        await engine._refresh_chart_data(chart, force=True)
+        assert fetch.call_args[0][1] == points[-1][0]
+        websocket.send_json.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_categorical_chart_sent_only_when_changed(self, engine, websocket):
+        fetch = AsyncMock(return_value={'labels': ['a', 'b'], 'datasets': [{'data': [1, 2]}]})
+        chart = self.add_custom_chart(engine, fetch)
+        chart.chart_type = ChartType.BAR
+        await engine.subscribe("custom_chart", websocket)
+
+        await engine._refresh_chart_data(chart, force=True)
+        assert websocket.send_json.call_count == 1  # snapshot only
+
+        fetch.return_value = {'labels': ['a', 'b'], 'datasets': [{'data': [1, 3]}]}
+        await engine._refresh_chart_data(chart, force=True)
+        assert websocket.send_json.call_args[0][0]['type'] == 'chart_data'
+
+    @pytest.mark.asyncio
+    async def test_failed_connection_is_unsubscribed(self, engine, websocket):
+        await engine.subscribe("cpu_usage", websocket)
+        websocket.send_json.side_effect = RuntimeError("closed")
+
+        await engine._broadcast_updates("cpu_usage", {'type': 'chart_data'})
+
+        assert "cpu_usage" not in engine.websocket_connections
+
+    @pytest.mark.asyncio
+    async def test_refresh_loop_idles_without_subscribers(self, engine, websocket):
+        engine._refresh_chart_data = AsyncMock()
+        engine.is_running = True
+        loop_task = asyncio.create_task(engine._data_refresh_loop())
+
+        await asyncio.sleep(0.05)
+        engine._refresh_chart_data.assert_not_called()
+
+        engine.websocket_connections["cpu_usage"] = [websocket]
+        engine._wakeup.set()
+        await asyncio.sleep(0.05)
+        engine._refresh_chart_data.assert_called_once_with(engine.chart_configs["cpu_usage"], force=True)
+
+        await engine.stop()
+        await asyncio.wait_for(loop_task, 1)
+
+    @pytest.mark.asyncio
+    async def test_cache_age_uses_total_seconds(self, engine):
+        chart = engine.chart_configs["cpu_usage"]
+        engine.data_cache[f"{chart.id}_{chart.data_source}"] = {
+            'timestamp': datetime.utcnow() - timedelta(days=1, seconds=5),
+            'data': {'stale': True}
+        }
+
+        data = await engine.get_chart_data("cpu_usage")
+
+        assert data != {'stale': True}
+
+    @pytest.mark.asyncio
+    async def test_long_range_chart_keeps_whole_range(self):
+        engine = DashboardEngine()
+        points = make_points(30 * 24 * 12, step_minutes=5)  # 30 days at the collection interval
+
+        async def fetch(chart_config, start_time, end_time):
+            window = [(t, v) for t, v in points if start_time <= t <= end_time]
+            return {
+                'labels': [t.isoformat() for t, _ in window],
+                'datasets': [{'label': 'value', 'data': [v for _, v in window]}]
+            }
+
+        engine.chart_configs["monthly"] = ChartConfig(
+            id="monthly", title="Monthly", chart_type=ChartType.LINE,
+            data_source="custom", time_range=TimeRange.LAST_30_DAYS
+        )
+        engine.register_data_source("custom", fetch)
+        await engine.get_chart_data("monthly", refresh=True)
+
+        buffer = engine.series_buffers[("custom", "value")]
+        assert buffer.points[-1][0] - buffer.points[0][0] >= timedelta(days=29, hours=23)
@@ -0,0 +1,136 @@
+"""
+Tests for the bounded, indexed experience store
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from trm_api.learning.experience_collector import ExperienceCollector
+from trm_api.learning.experience_store import ExperienceStore, SQLiteExperienceSpill
+from trm_api.learning.learning_types import ExperienceType, LearningExperience
+
+
+def make_experience(experience_type=ExperienceType.TENSION_RESOLUTION, success=True,
+                    agent_id="agent-1", hours_ago=0.0):
+    return LearningExperience(
+        experience_type=experience_type,
+        agent_id=agent_id,
+        success=success,
+        timestamp=datetime.now() - timedelta(hours=hours_ago)
+    )
+
+
+def fill(store, experiences):
+    for experience in experiences:
+        store[experience.experience_id] = experience
+    return experiences
+
+
+class TestExperienceStore:
+    """Test eviction and indexes"""
+
+    def test_fifo_eviction_by_insertion_order(self):
+        store = ExperienceStore(max_items=3)
+        experiences = fill(store, [make_experience() for _ in range(5)])
+
+        assert list(store) == [e.experience_id for e in experiences[2:]]
+        assert store.evicted == 2
+        assert len(store.by_success(True)) == 3
+
+    def test_secondary_indexes(self):
+        store = ExperienceStore()
+        fill(store, [
+            make_experience(ExperienceType.TENSION_RESOLUTION, True, "a"),
+            make_experience(ExperienceType.PATTERN_RECOGNITION, False, "a"),
+            make_experience(ExperienceType.PATTERN_RECOGNITION, True, "b"),
+        ])
+
+        assert len(store.by_type(ExperienceType.PATTERN_RECOGNITION)) == 2
+        assert len(store.by_type("tension_resolution")) == 1
+        assert len(store.by_success(False)) == 1
+        assert len(store.by_agent("a")) == 2
+
+        first = next(iter(store))
+        del store[first]
+        assert len(store.by_agent("a")) == 1
+        assert store.by_type(ExperienceType.TENSION_RESOLUTION) == []
+
+    def test_recency_uses_time_buckets(self):
+        store = ExperienceStore(bucket_seconds=3600)
+        old, recent, newest = fill(store, [
+            make_experience(hours_ago=48), make_experience(hours_ago=2.5), make_experience(hours_ago=0.1)
+        ])
+
+        assert store.since(datetime.now() - timedelta(hours=3)) == [recent, newest]
+        assert store.since(datetime.now() - timedelta(hours=1)) == [newest]
+
+        del store[old.experience_id]
+        assert len(store._bucket_keys) == 2
+
+    def test_replacing_an_experience_reindexes(self):
+        store = ExperienceStore()
+        experience = make_experience(success=True)
+        store[experience.experience_id] = experience
+        store[experience.experience_id] = experience.model_copy(update={"success": False})
+
+        assert store.by_success(True) == []
+        assert len(store.by_success(False)) == 1
+
+    def test_added_since_cursor(self):
+        store = ExperienceStore()
+        first = fill(store, [make_experience() for _ in range(3)])
+        added, cursor = store.added_since(0)
+        assert added == first
+
+        second = fill(store, [make_experience() for _ in range(2)])
+        store[first[0].experience_id] = first[0]  # Replaced: counts as new again
+
+        added, cursor = store.added_since(cursor)
+        assert added == second + [first[0]]
+        assert store.added_since(cursor) == ([], cursor)
+
+
+class TestExperienceSpill:
+    """Test the SQLite spill for evicted experiences"""
+
+    def test_evicted_experiences_stay_queryable(self, tmp_path):
+        spill = SQLiteExperienceSpill(str(tmp_path / "experiences.db"), batch_size=2)
+        store = ExperienceStore(max_items=2, spill=spill)
+        experiences = fill(store, [
+            make_experience(ExperienceType.PATTERN_RECOGNITION, success=i % 2 == 0, hours_ago=5 - i)
+            for i in range(5)
+        ])
+
+        assert len(store) == 2
+        assert spill.count() == 3
+        assert store.get_spilled(experiences[0].experience_id).experience_id == experiences[0].experience_id
+        assert len(store.by_type(ExperienceType.PATTERN_RECOGNITION, include_spilled=True)) == 5
+        assert len(store.by_success(False, include_spilled=True)) == 2
+        assert [e.experience_id for e in store.since(datetime.now() - timedelta(hours=10), include_spilled=True)] == [
+            e.experience_id for e in experiences
+        ]
+
+        store.clear()
+        assert spill.count() == 0
+
+
+class TestExperienceCollectorStore:
+    """Test ExperienceCollector on top of the store"""
+
+    @pytest.mark.asyncio
+    async def test_collector_bounded_and_indexed(self):
+        collector = ExperienceCollector("agent-1", max_experiences_stored=3)
+        for i in range(5):
+            await collector.collect_task_experience(f"task-{i}", {}, {}, success=i < 3)
+
+        assert len(collector.experiences) == 3
+        assert len(collector.get_experiences_by_success(False)) == 2
+        assert len(collector.get_experiences_by_type(ExperienceType.PERFORMANCE_OPTIMIZATION)) == 3
+        assert len(collector.get_experiences_by_agent("agent-1")) == 3
+        assert len(collector.get_recent_experiences(hours=1)) == 3
+        assert collector.get_statistics()["experiences_evicted"] == 2
+
+        collector.max_experiences_stored = 1
+        await collector.collect_task_experience("task-5", {}, {}, success=True)
+        assert len(collector.experiences) == 1
@@ -0,0 +1,185 @@
+"""
+Test suite for the shared, indexed KnowledgeStore
+"""
+
+import pytest
+
+from trm_api.core.config import settings
+from trm_api.reasoning import knowledge_store
+from trm_api.reasoning.advanced_reasoning_engine import AdvancedReasoningEngine
+from trm_api.reasoning.knowledge_store import KnowledgeStore, SQLiteKnowledgePersistence
+from trm_api.reasoning.reasoning_types import KnowledgeNode, ReasoningContext, ReasoningGoal
+
+
+def make_node(content, node_type="fact", confidence=0.5, **kwargs):
+    return KnowledgeNode(node_type=node_type, content=content, confidence=confidence,
+                         source="test", **kwargs)
+
+
+class TestKnowledgeStore:
+    """Tests for indexed knowledge queries"""
+
+    @pytest.fixture
+    def store(self):
+        store = KnowledgeStore()
+        store.add(make_node("Tensions of type 'system_issue' take 3-5 days", confidence=0.8))
+        store.add(make_node("Database outages cause tension", node_type="pattern", confidence=0.9))
+        store.add(make_node("Deploy on Fridays is risky", node_type="rule", confidence=0.4,
+                            related_entities=["project_1"], metadata={"tags": ["Deploy"]}))
+        return store
+
+    @pytest.mark.parametrize("query,node_types", [
+        ("tension", None),
+        ("tension", ["fact"]),
+        ("SIONS OF TY", None),
+        ("ays", ["rule", "fact"]),
+        ("", None),
+        ("'system_issue'", None),
+        ("missing", None),
+    ])
+    def test_query_matches_linear_scan(self, store, query, node_types):
+        """Indexed queries return the same nodes as a substring scan"""
+        expected = sorted(
+            (node for node in store.values()
+             if (not node_types or node.node_type in node_types) and query.lower() in node.content.lower()),
+            key=lambda k: k.confidence, reverse=True
+        )
+        assert store.query(query, node_types) == expected
+
+    def test_tags_and_removal(self, store):
+        """Tags come from metadata and related entities; removal updates the indexes"""
+        tagged = store.find_by_tags(["project_1"])
+        assert [n.content for n in tagged] == ["Deploy on Fridays is risky"]
+        assert store.query("fridays", tags=["deploy"]) == tagged
+
+        assert store.remove(tagged[0].node_id)
+        assert store.find_by_tags(["project_1"]) == []
+        assert store.query("fridays") == []
+        assert not store.remove(tagged[0].node_id)
+
+    def test_query_after_posting_changes(self):
+        """Cached fragment lookups see nodes added or removed under existing terms"""
+        store = KnowledgeStore()
+        first = make_node("data outage", confidence=0.9)
+        second = make_node("data outage again", confidence=0.5)
+
+        store.add(first)
+        assert store.query("data") == [first]
+        store.add(second)
+        assert store.query("data") == [first, second]
+
+        assert store.remove(second.node_id)
+        assert store.query("outa") == [first]
+        assert store.query("data") == [first]
+
+    def test_vector_similarity(self):
+        """Semantic queries rank nodes by cosine similarity"""
+        store = KnowledgeStore()
+        near = make_node("near")
+        far = make_node("far")
+        store.add(near, [1.0, 0.1])
+        store.add(far, [0.0, 1.0])
+        store.add(make_node("no embedding"))
+
+        ranked = store.similar([1.0, 0.0], top_k=2)
+        assert [node for node, _ in ranked] == [near, far]
+        assert ranked[0][1] > ranked[1][1]
+
+    def test_copy_on_write_views(self, store):
+        """Forked views share the base store and keep writes local until commit"""
+        view_a, view_b = store.fork(), store.fork()
+        base_count = len(store)
+
+        extra = make_node("Agent local tension insight", confidence=0.95)
+        view_a.add(extra)
+        view_a.remove(store.query("database")[0].node_id)
+
+        assert view_a.query("tension")[0] == extra
+        assert view_a.query("database") == []
+        assert len(view_b.query("tension")) == 2
+        assert len(store) == base_count
+
+        assert view_a.commit() == 2
+        assert len(view_b.query("tension")) == 2
+        assert view_b.query("insight") == [extra]
+
+    def test_sqlite_persistence(self, tmp_path):
+        """Nodes and embeddings survive reopening the SQLite file"""
+        path = str(tmp_path / "knowledge.db")
+        store = KnowledgeStore(persistence=SQLiteKnowledgePersistence(path))
+        node = make_node("persisted tension", related_entities=["tension_1"])
+        store.add(node, [0.5, 0.5])
+        store.add(make_node("removed"))
+        store.remove(store.query("removed")[0].node_id)
+        store.persistence.close()
+
+        reopened = KnowledgeStore(persistence=SQLiteKnowledgePersistence(path))
+        assert list(reopened.values()) == [node]
+        assert reopened.find_by_tags(["tension_1"]) == [node]
+        assert reopened.similar([1.0, 1.0])[0][0] == node
+
+
+    def test_shared_store_persists_at_configured_path(self, tmp_path, monkeypatch):
+        """KNOWLEDGE_STORE_PATH backs the shared store; configuring the same path keeps it"""
+        path = str(tmp_path / "shared.db")
+        monkeypatch.setattr(settings, "KNOWLEDGE_STORE_PATH", path)
+        monkeypatch.setattr(knowledge_store, "_shared_store", None)
+
+        shared = knowledge_store.get_shared_knowledge_store()
+        shared.add(make_node("survives restart"))
+        assert knowledge_store.configure_shared_knowledge_store(path) is shared
+        shared.persistence.close()
+
+        # A restarted process loads the nodes back
+        monkeypatch.setattr(knowledge_store, "_shared_store", None)
+        restarted = knowledge_store.configure_shared_knowledge_store(path)
+        assert [node.content for node in restarted.values()] == ["survives restart"]
+        restarted.persistence.close()
+
+
+class TestEngineKnowledgeStore:
+    """Tests for AdvancedReasoningEngine knowledge integration"""
+
+    @pytest.mark.asyncio
+    async def test_engines_share_published_knowledge(self):
+        """Engines on the same store see each other's knowledge only once published"""
+        shared = KnowledgeStore()
+        engine_a = AdvancedReasoningEngine("agent_a", knowledge_store=shared)
+        engine_b = AdvancedReasoningEngine("agent_b", knowledge_store=shared)
+
+        await engine_a.add_knowledge(make_node("Tension backlog grows weekly"))
+        assert await engine_b.query_knowledge("backlog") == []
+
+        await engine_a.publish_knowledge()
+        assert len(await engine_b.query_knowledge("backlog")) == 1
+
+    @pytest.mark.asyncio
+    async def test_reasoning_run_publishes_knowledge(self, tmp_path):
+        """Finishing a reasoning run publishes the agent's knowledge to the shared store"""
+        shared = KnowledgeStore(persistence=SQLiteKnowledgePersistence(str(tmp_path / "k.db")))
+        engine_a = AdvancedReasoningEngine("agent_a", knowledge_store=shared)
+        engine_b = AdvancedReasoningEngine("agent_b", knowledge_store=shared)
+
+        await engine_a.add_knowledge(make_node("Release freeze reduces incidents"))
+        await engine_a.reason(
+            ReasoningGoal(goal_type="recommendation", description="Plan release"),
+            ReasoningContext(tension_id="tension_7")
+        )
+
+        assert len(await engine_b.query_knowledge("release freeze")) == 1
+        shared.persistence.close()
+        reopened = KnowledgeStore(persistence=SQLiteKnowledgePersistence(str(tmp_path / "k.db")))
+        assert [node.content for node in reopened.values()] == ["Release freeze reduces incidents"]
+        reopened.persistence.close()
+
+    @pytest.mark.asyncio
+    async def test_context_entity_lookup(self):
+        """Context preparation uses the tag index for the context's entities"""
+        engine = AdvancedReasoningEngine("agent_c", knowledge_store=KnowledgeStore())
+        node = make_node("Known issue for this tension", related_entities=["tension_42"])
+        await engine.add_knowledge(node)
+        await engine.add_knowledge(make_node("Unrelated"))
+
+        context = ReasoningContext(tension_id="tension_42", related_entities={"task": ["task_1"]})
+        assert engine._context_entity_ids(context) == ["tension_42", "task_1"]
+        assert engine.knowledge_base.find_by_tags(engine._context_entity_ids(context)) == [node]
@@ -0,0 +1,136 @@
+"""
+Tests for lazy router registration and the startup DB connectivity check
+"""
+
+import sys
+import time
+import types
+
+import httpx
+import pytest
+from fastapi import APIRouter, FastAPI
+
+from trm_api.db import session
+from trm_api.middleware.lazy_routers import LazyRouterMiddleware, LazyRouterRegistry
+
+
+@pytest.fixture
+def router_module(monkeypatch):
+    """A fake router module that records when it is imported"""
+    imports = []
+    router = APIRouter()
+
+    @router.get("/items")
+    async def items():
+        return ["a"]
+
+    module = types.ModuleType("fake_routes")
+    module.router = router
+
+    class Loader(types.ModuleType):
+        def __getattr__(self, name):
+            imports.append(name)
+            return getattr(module, name)
+
+    monkeypatch.setitem(sys.modules, "fake_routes", Loader("fake_routes"))
+    return imports
+
+
+def build_app(lazy):
+    app = FastAPI()
+    registry = LazyRouterRegistry(app, lazy=lazy)
+    app.add_middleware(LazyRouterMiddleware, registry=registry)
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    registry.add("fake_routes:router", prefix="/api/v1")
+    return app, registry
+
+
+def client_for(app):
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+class TestLazyRouterRegistry:
+    """Test eager and lazy router registration"""
+
+    def test_eager_mode_includes_router_immediately(self, router_module):
+        app, registry = build_app(lazy=False)
+
+        assert router_module == ["router"]
+        assert registry.pending == []
+        assert "/api/v1/items" in [route.path for route in app.routes]
+
+    @pytest.mark.asyncio
+    async def test_lazy_router_loaded_on_first_matching_request(self, router_module):
+        app, registry = build_app(lazy=True)
+
+        async with client_for(app) as client:
+            assert (await client.get("/health")).status_code == 200
+            assert router_module == []
+
+            response = await client.get("/api/v1/items")
+            assert response.status_code == 200
+            assert response.json() == ["a"]
+
+        assert router_module == ["router"]
+        assert registry.routers[0].load_seconds is not None
+
+    @pytest.mark.asyncio
+    async def test_openapi_request_loads_all_routers(self, router_module):
+        app, registry = build_app(lazy=True)
+
+        async with client_for(app) as client:
+            schema = (await client.get("/openapi.json")).json()
+
+        assert "/api/v1/items" in schema["paths"]
+        assert registry.pending == []
+
+    @pytest.mark.asyncio
+    async def test_warmup_loads_pending_routers(self, router_module):
+        app, registry = build_app(lazy=True)
+
+        await registry.load_all()
+
+        assert registry.pending == []
+        assert "/api/v1/items" in [route.path for route in app.routes]
+
+    def test_lazy_router_requires_trigger(self):
+        registry = LazyRouterRegistry(FastAPI(), lazy=True)
+
+        with pytest.raises(ValueError):
+            registry.add("fake_routes:router")
+
+
+class TestVerifyDbConnection:
+    """Test the lifespan connectivity check"""
+
+    @pytest.mark.asyncio
+    async def test_success(self, monkeypatch):
+        monkeypatch.setattr(session.db, "cypher_query", lambda query, params: ([[1]], ["test"]))
+
+        assert await session.verify_db_connection(timeout=1) is True
+        assert session.neo4j_available is True
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises(self, monkeypatch):
+        monkeypatch.delenv("RAILWAY_ENVIRONMENT", raising=False)
+        monkeypatch.delenv("RAILWAY_PROJECT_ID", raising=False)
+        monkeypatch.setattr(session.db, "cypher_query", lambda query, params: time.sleep(0.5))
+
+        with pytest.raises(TimeoutError):
+            await session.verify_db_connection(timeout=0.05)
+        assert session.neo4j_available is False
+
+    @pytest.mark.asyncio
+    async def test_railway_degrades_gracefully(self, monkeypatch):
+        monkeypatch.setenv("RAILWAY_ENVIRONMENT", "production")
+
+        def fail(query, params):
+            raise ConnectionError("unreachable")
+
+        monkeypatch.setattr(session.db, "cypher_query", fail)
+
+        assert await session.verify_db_connection(timeout=1) is False
@@ -0,0 +1,172 @@
+"""
+Tests for the shared learning runtime
+"""
+
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from trm_api.learning.adaptive_learning_system import AdaptiveLearningSystem
+from trm_api.learning.learning_runtime import LearningRuntime
+from trm_api.learning.learning_types import ExperienceType, LearningExperience
+from trm_api.learning.pattern_recognizer import PatternRecognizer
+
+
+class StubSystem:
+    """Minimal learning system whose cycles just take some time"""
+
+    running = 0
+    peak = 0
+
+    def __init__(self, agent_id, pending=0, interval_hours=24.0):
+        self.agent_id = agent_id
+        self.learning_enabled = True
+        self.learning_frequency_hours = interval_hours
+        self.experiences_per_cycle = 1
+        self.pending = pending
+        self.cycles = 0
+
+    def pending_experiences(self):
+        return self.pending
+
+    def has_learning_work(self):
+        return self.pending > 0
+
+    async def run_learning_cycle(self):
+        StubSystem.running += 1
+        StubSystem.peak = max(StubSystem.peak, StubSystem.running)
+        await asyncio.sleep(0.01)
+        StubSystem.running -= 1
+        self.pending = 0
+        self.cycles += 1
+        return {"success": True}
+
+
+async def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        await asyncio.sleep(0.005)
+
+
+class TestLearningRuntime:
+    """Test scheduling, bounded execution and backpressure"""
+
+    @pytest.mark.asyncio
+    async def test_first_cycles_are_staggered(self):
+        runtime = LearningRuntime()
+        systems = [StubSystem(f"agent-{i}") for i in range(50)]
+        start = time.monotonic()
+        for system in systems:
+            runtime.register(system)
+
+        due = sorted(t for t, _, _ in runtime._timers)
+        assert all(start <= t <= start + 24 * 3600 + 1 for t in due)
+        assert due[-1] - due[0] > 3600  # Spread out, not one burst
+        await runtime.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cycles_run_on_bounded_pool(self):
+        StubSystem.running = StubSystem.peak = 0
+        runtime = LearningRuntime(max_workers=2)
+        systems = [StubSystem(f"agent-{i}", pending=1) for i in range(6)]
+        for system in systems:
+            runtime.register(system)
+            assert runtime.notify_experience(system)
+
+        await wait_for(lambda: all(s.cycles == 1 for s in systems))
+
+        assert StubSystem.peak == 2
+        assert runtime.get_metrics()["experience_triggers"] == 6
+        await runtime.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_backpressure_defers_and_coalesces(self):
+        runtime = LearningRuntime(max_workers=1, max_pending=1)
+        first, second = StubSystem("a", pending=1), StubSystem("b", pending=1)
+        runtime.register(first)
+        runtime.register(second)
+
+        assert runtime.notify_experience(first) is True
+        assert runtime.notify_experience(first) is True  # Already queued
+        assert runtime.notify_experience(second) is False
+
+        metrics = runtime.get_metrics()
+        assert (metrics["coalesced"], metrics["deferred"], metrics["queue_depth"]) == (1, 1, 1)
+        await runtime.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_interval_fallback_only_with_work(self):
+        runtime = LearningRuntime(jitter=0.0)
+        idle, busy = StubSystem("idle", interval_hours=0.01 / 3600), StubSystem("busy", 1, 0.01 / 3600)
+        runtime.register(idle)
+        runtime.register(busy)
+
+        await wait_for(lambda: busy.cycles == 1)
+        await asyncio.sleep(0.05)
+
+        assert idle.cycles == 0
+        assert runtime.get_metrics()["interval_triggers"] == 1
+        await runtime.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_unregistered_systems_are_not_run(self):
+        runtime = LearningRuntime()
+        system = StubSystem("a", pending=1)
+        runtime.register(system)
+        runtime.unregister(system)
+
+        assert runtime.notify_experience(system) is False
+        assert runtime._scheduler is None
+
+
+class TestAdaptiveLearningSystemOnRuntime:
+    """Test AdaptiveLearningSystem integration"""
+
+    @pytest.mark.asyncio
+    async def test_experience_count_triggers_cycle(self):
+        runtime = LearningRuntime()
+        system = AdaptiveLearningSystem("agent-1", runtime=runtime)
+        system.experiences_per_cycle = 3
+        system.min_experiences_for_learning = 3
+
+        with patch("trm_api.learning.adaptive_learning_system.publish_event"), \
+                patch("trm_api.learning.experience_collector.publish_event"), \
+                patch("trm_api.learning.pattern_recognizer.publish_event"):
+            await system.initialize()
+            assert system.get_learning_status()["scheduled"] is True
+
+            for i in range(3):
+                await system.learn_from_experience(
+                    ExperienceType.AGENT_CREATION, {"task_id": f"t{i}"}, {"approach": "a"}, {"ok": True}, True
+                )
+
+            await wait_for(lambda: system.system_stats["total_learning_cycles"] == 1)
+            assert system.pending_experiences() == 0
+
+            await system.cleanup()
+        assert runtime.is_registered(system) is False
+
+    @pytest.mark.asyncio
+    async def test_mining_in_process_pool_matches_in_loop(self):
+        experiences = [
+            LearningExperience(
+                experience_type=ExperienceType.AGENT_CREATION, agent_id="agent-1",
+                action_taken={"approach": "methodical"}, success=i % 4 != 0,
+                context={"project_type": "analysis"}
+            )
+            for i in range(12)
+        ]
+
+        with patch("trm_api.learning.pattern_recognizer.publish_event"):
+            in_loop, pooled = PatternRecognizer("agent-1"), PatternRecognizer("agent-1")
+            await in_loop.analyze_experiences(experiences)
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                await pooled.analyze_experiences(experiences, executor=executor)
+
+        assert pooled.statistics == in_loop.statistics
+        assert sorted(p.description for p in pooled.discovered_patterns.values()) == \
+            sorted(p.description for p in in_loop.discovered_patterns.values())
@@ -0,0 +1,154 @@
+"""
+Tests for streaming metric statistics and the PerformanceTracker built on them
+"""
+
+import statistics
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from trm_api.learning.learning_types import AdaptationRule, AdaptationType, MetricType
+from trm_api.learning.metric_statistics import (
+    MetricRingBuffer, RunningStats, SlidingRegression, TimeBucketRollup
+)
+from trm_api.learning.performance_tracker import PerformanceTracker
+
+
+VALUES = [0.5, 0.62, 0.58, 0.71, 0.69, 0.8, 0.77, 0.9, 0.85, 0.95, 0.4, 0.3]
+
+
+class TestStreamingStatistics:
+    """Test the constant-cost statistics against direct computation"""
+
+    def test_running_stats_match_statistics_module(self):
+        stats = RunningStats()
+        for value in VALUES:
+            stats.add(value)
+
+        assert stats.mean == pytest.approx(statistics.mean(VALUES))
+        assert stats.stdev == pytest.approx(statistics.stdev(VALUES))
+        assert (stats.min, stats.max) == (min(VALUES), max(VALUES))
+
+    def test_running_stats_merge(self):
+        left, right, merged = RunningStats(), RunningStats(), RunningStats()
+        for value in VALUES[:5]:
+            left.add(value)
+        for value in VALUES[5:]:
+            right.add(value)
+        merged.merge(left)
+        merged.merge(right)
+
+        assert merged.count == len(VALUES)
+        assert merged.variance == pytest.approx(statistics.variance(VALUES))
+
+    def test_sliding_regression_matches_least_squares(self):
+        regression = SlidingRegression(window=5, resync_every=7)
+        for i, value in enumerate(VALUES):
+            regression.add(value)
+            window = VALUES[max(0, i - 4):i + 1]
+            if len(window) >= 2:
+                expected = np.polyfit(range(len(window)), window, 1)[0]
+                assert regression.slope == pytest.approx(expected)
+        assert (regression.first, regression.last) == (VALUES[-5], VALUES[-1])
+
+    def test_ring_buffer_wraps_in_order(self):
+        buffer = MetricRingBuffer(capacity=4)
+        start = datetime(2025, 1, 1)
+        for i, value in enumerate(VALUES[:6]):
+            buffer.append(start + timedelta(minutes=i), value, {"i": i})
+
+        timestamps, values = buffer.arrays()
+        assert list(values) == VALUES[2:6]
+        assert list(np.diff(timestamps)) == [60.0] * 3
+        assert buffer.index_at(start + timedelta(minutes=4)) == 2
+        assert [item["context"]["i"] for item in buffer.items(1)] == [3, 4, 5]
+        assert buffer.last_value == VALUES[5]
+
+    def test_rollup_range_queries_and_retention(self):
+        rollup = TimeBucketRollup(bucket_seconds=3600, retention_seconds=2 * 3600)
+        base = datetime(2025, 1, 1).timestamp()
+        for hour, value in enumerate([1.0, 2.0, 3.0, 4.0]):
+            rollup.add(base + hour * 3600, value)
+
+        assert len(rollup.buckets) == 3  # Hour 0 pruned
+        assert rollup.query(base + 2 * 3600).mean == pytest.approx(3.5)
+        assert rollup.query(base, base + 3600).count == 1
+
+
+@pytest.fixture
+def tracker():
+    with patch("trm_api.learning.performance_tracker.publish_event"):
+        yield PerformanceTracker("agent-1")
+
+
+class TestPerformanceTrackerStreaming:
+    """Test PerformanceTracker on top of the streaming statistics"""
+
+    @pytest.mark.asyncio
+    async def test_trend_and_baseline(self, tracker):
+        for i in range(10):
+            await tracker.record_performance_metric(MetricType.EFFICIENCY, 0.5 + 0.05 * i)
+
+        metric = list(tracker.performance_metrics.values())[-1]
+        assert metric.trend_direction == "improving"
+        assert tracker.baseline_established[MetricType.EFFICIENCY]
+        assert tracker.baseline_metrics[MetricType.EFFICIENCY] == pytest.approx(0.725)
+        assert metric.baseline == pytest.approx(0.725)
+
+    @pytest.mark.asyncio
+    async def test_significant_changes_detected(self, tracker):
+        for _ in range(10):
+            await tracker.record_performance_metric(MetricType.ACCURACY, 0.5)
+        await tracker.record_performance_metric(MetricType.ACCURACY, 0.8)
+        await tracker.record_performance_metric(MetricType.ACCURACY, 0.2)
+
+        stats = tracker.get_statistics()
+        assert stats["improvements_detected"] == 1
+        assert stats["deteriorations_detected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_trend_analysis_and_history(self, tracker):
+        for value in VALUES:
+            await tracker.record_performance_metric(MetricType.QUALITY, value, context={"v": value})
+
+        trends = await tracker.analyze_performance_trends([MetricType.QUALITY])
+
+        quality = trends[MetricType.QUALITY]
+        assert quality["sample_count"] == len(VALUES)
+        assert quality["average_value"] == pytest.approx(statistics.mean(VALUES))
+        assert quality["volatility"] == pytest.approx(statistics.stdev(VALUES))
+        assert [item["value"] for item in tracker.get_metric_history(MetricType.QUALITY)] == VALUES
+        assert tracker.get_current_performance()[MetricType.QUALITY] == VALUES[-1]
+
+        rollup = tracker.get_metric_rollup(MetricType.QUALITY, datetime.now() - timedelta(hours=1))
+        assert rollup["count"] == len(VALUES)
+        assert rollup["mean"] == pytest.approx(statistics.mean(VALUES))
+
+    @pytest.mark.asyncio
+    async def test_adaptation_impact_splits_at_application_time(self, tracker):
+        for value in [0.5, 0.5, 0.5]:
+            await tracker.record_performance_metric(MetricType.EFFICIENCY, value)
+        rule = AdaptationRule(
+            adaptation_type=AdaptationType.PARAMETER_ADJUSTMENT, agent_id="agent-1",
+            name="rule", description="rule", last_applied=datetime.now()
+        )
+        for value in [0.6, 0.6, 0.6]:
+            await tracker.record_performance_metric(MetricType.EFFICIENCY, value)
+
+        impact = await tracker.evaluate_adaptation_impact([rule])
+
+        change = impact[rule.rule_id]["performance_changes"]["efficiency"]
+        assert change["before_average"] == pytest.approx(0.5)
+        assert change["after_average"] == pytest.approx(0.6)
+        assert change["improvement"] is True
+
+    @pytest.mark.asyncio
+    async def test_stored_metrics_are_bounded(self, tracker):
+        tracker.max_metrics_stored = 5
+        for value in VALUES:
+            await tracker.record_performance_metric(MetricType.CONFIDENCE, value)
+
+        assert len(tracker.performance_metrics) == 5
+        assert tracker.get_statistics()["total_measurements"] == len(VALUES)
@@ -0,0 +1,155 @@
+"""
+Tests for the off-loop password hashing service and its use in AuthenticationManager
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from trm_api.security.authentication import AuthenticationManager, PasswordManager, UserCredentials
+from trm_api.security.password_hashing import (
+    Argon2Hasher, BcryptHasher, CredentialHashingService, HashingOverloadedError, create_password_hasher
+)
+
+PASSWORD = "SecurePass123!"
+
+
+class SlowHasher(BcryptHasher):
+    """bcrypt at minimum cost that also records the threads it ran on"""
+
+    def __init__(self, delay: float = 0.0, rounds: int = 4):
+        super().__init__(rounds)
+        self.delay = delay
+        self.threads = set()
+
+    def verify(self, password, hashed_password):
+        self.threads.add(threading.get_ident())
+        time.sleep(self.delay)
+        return super().verify(password, hashed_password)
+
+
+@pytest.fixture
+def service():
+    service = CredentialHashingService(SlowHasher(), max_concurrency=2)
+    yield service
+    service.shutdown()
+
+
+class TestCredentialHashingService:
+    """Test hashing in the bounded pool"""
+
+    @pytest.mark.asyncio
+    async def test_hash_and_verify_off_loop(self, service):
+        hashed = await service.hash_password(PASSWORD)
+
+        assert await service.verify_password(PASSWORD, hashed) is True
+        assert await service.verify_password("wrong", hashed) is False
+        assert threading.get_ident() not in service.hasher.threads
+        assert service.get_metrics()["completed"] == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_and_queue_metrics(self, service):
+        hashed = service.hasher.hash(PASSWORD)
+        service.hasher.delay = 0.05
+
+        results = await asyncio.gather(*[service.verify_password(PASSWORD, hashed) for _ in range(6)])
+
+        metrics = service.get_metrics()
+        assert all(results)
+        assert metrics["peak_queue_depth"] == 4
+        assert metrics["queue_depth"] == 0 and metrics["in_flight"] == 0
+        assert metrics["avg_wait_ms"] > 0
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects(self, service):
+        service.max_queue = 1
+        hashed = service.hasher.hash(PASSWORD)
+        service.hasher.delay = 0.05
+
+        results = await asyncio.gather(
+            *[service.verify_password(PASSWORD, hashed) for _ in range(4)], return_exceptions=True
+        )
+
+        assert sum(isinstance(r, HashingOverloadedError) for r in results) == 1
+        assert service.get_metrics()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rehash_when_cost_changes(self, service):
+        old_hash = BcryptHasher(rounds=5).hash(PASSWORD)
+
+        assert await service.verify_and_update("wrong", old_hash) == (False, None)
+        is_valid, new_hash = await service.verify_and_update(PASSWORD, old_hash)
+
+        assert is_valid and new_hash.startswith("$2b$04$")
+        assert await service.verify_and_update(PASSWORD, new_hash) == (True, None)
+        assert service.metrics["rehashed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_dummy_verify_hashes_once(self, service):
+        await service.dummy_verify("anything")
+        dummy_hash = service._dummy_hash
+        await service.dummy_verify("anything else")
+
+        assert service._dummy_hash == dummy_hash
+        assert len(service.hasher.threads) >= 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_scheme_does_not_verify(self, service):
+        assert await service.verify_password(PASSWORD, "plaintext") is False
+
+    def test_create_password_hasher(self):
+        assert create_password_hasher("bcrypt", 10).rounds == 10
+        assert isinstance(create_password_hasher("argon2"), Argon2Hasher)
+        with pytest.raises(ValueError):
+            create_password_hasher("md5")
+
+    def test_argon2_service_still_verifies_bcrypt(self):
+        service = CredentialHashingService(Argon2Hasher())
+
+        assert service.hasher_for(BcryptHasher(4).hash(PASSWORD)) is service.legacy_hashers[0]
+        assert service.needs_rehash("$2b$04$abc") is True
+
+
+class TestAuthenticationHashing:
+    """Test AuthenticationManager with the hashing service"""
+
+    @pytest.fixture
+    def auth_manager(self, service):
+        manager = AuthenticationManager()
+        manager.password_manager = PasswordManager(service)
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_register_and_login(self, auth_manager):
+        credentials = UserCredentials(username="alice", password=PASSWORD)
+
+        assert (await auth_manager.register_user(credentials)).success
+        assert (await auth_manager.authenticate_user(credentials)).success
+        assert not (await auth_manager.authenticate_user(
+            UserCredentials(username="alice", password="WrongPass123!")
+        )).success
+
+    @pytest.mark.asyncio
+    async def test_unknown_user_runs_dummy_verify(self, auth_manager, service):
+        result = await auth_manager.authenticate_user(UserCredentials(username="nobody", password=PASSWORD))
+
+        assert not result.success
+        assert service._dummy_hash is not None
+
+    @pytest.mark.asyncio
+    async def test_login_upgrades_outdated_hash(self, auth_manager):
+        credentials = UserCredentials(username="alice", password=PASSWORD)
+        await auth_manager.register_user(credentials)
+        auth_manager.users["alice"]["password_hash"] = BcryptHasher(rounds=5).hash(PASSWORD)
+
+        assert (await auth_manager.authenticate_user(credentials)).success
+        assert auth_manager.users["alice"]["password_hash"].startswith("$2b$04$")
+
+    def test_sync_methods_still_work(self, service):
+        manager = PasswordManager(service)
+        hashed = manager.hash_password(PASSWORD)
+
+        assert manager.verify_password(PASSWORD, hashed) is True
+        assert manager.verify_password(PASSWORD, "not-a-hash") is False
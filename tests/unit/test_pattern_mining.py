@@ -0,0 +1,124 @@
+"""
+Tests for incremental pattern mining in PatternRecognizer
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from trm_api.learning.learning_types import ExperienceType, LearningExperience, LearningPattern
+from trm_api.learning.pattern_recognizer import PatternRecognizer, PatternStore, pattern_signature
+
+
+def make_experiences(count, success=True, context=None, improvement=None):
+    return [
+        LearningExperience(
+            experience_type=ExperienceType.AGENT_CREATION,
+            agent_id="agent-1",
+            action_taken={"approach": "methodical"},
+            success=success,
+            confidence_level=0.8,
+            context=context if context is not None else {"project_type": "analysis"},
+            improvement=improvement or {}
+        )
+        for _ in range(count)
+    ]
+
+
+@pytest.fixture
+def recognizer():
+    with patch("trm_api.learning.pattern_recognizer.publish_event"):
+        yield PatternRecognizer("agent-1")
+
+
+class TestIncrementalMining:
+    """Test statistics-driven, deduplicated pattern mining"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_cycles_do_not_duplicate(self, recognizer):
+        experiences = make_experiences(5)
+
+        first = await recognizer.analyze_experiences(experiences)
+        count = len(recognizer.discovered_patterns)
+        again = await recognizer.analyze_experiences(experiences)
+
+        assert first and again == []
+        assert len(recognizer.discovered_patterns) == count
+        assert recognizer.statistics.experiences == 5
+
+    @pytest.mark.asyncio
+    async def test_patterns_updated_in_place(self, recognizer):
+        await recognizer.analyze_experiences(make_experiences(5))
+        pattern = recognizer.get_patterns_by_type("context_correlation")[0]
+        pattern_id = pattern.pattern_id
+
+        await recognizer.analyze_experiences(make_experiences(5))
+
+        updated = recognizer.get_patterns_by_type("context_correlation")
+        assert [p.pattern_id for p in updated] == [pattern_id]
+        assert updated[0].frequency == 10
+        assert recognizer.get_statistics()["patterns_by_type"]["context_correlation"] == 1
+
+    @pytest.mark.asyncio
+    async def test_pattern_removed_when_statistics_no_longer_support_it(self, recognizer):
+        await recognizer.analyze_experiences(make_experiences(4, success=True))
+        assert recognizer.get_patterns_by_type("success_rate")
+
+        await recognizer.analyze_experiences(make_experiences(4, success=False))
+
+        assert recognizer.get_patterns_by_type("success_rate") == []
+
+    @pytest.mark.asyncio
+    async def test_only_new_experiences_are_absorbed(self, recognizer):
+        experiences = make_experiences(5)
+        await recognizer.analyze_experiences(experiences)
+
+        with patch.object(recognizer, "_absorb", wraps=recognizer._absorb) as absorb:
+            await recognizer.analyze_experiences(experiences + make_experiences(2))
+
+        assert absorb.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_performance_improvement_pattern(self, recognizer):
+        await recognizer.analyze_experiences(make_experiences(3, improvement={"efficiency": 0.3}))
+
+        pattern = recognizer.get_patterns_by_type("performance_improvement")[0]
+        assert pattern.conditions == {"experience_type": "agent_creation", "metric": "efficiency"}
+        assert pattern.outcomes["expected_improvement"] == pytest.approx(0.3)
+
+    @pytest.mark.asyncio
+    async def test_derive_patterns_matches_stored(self, recognizer):
+        await recognizer.analyze_experiences(make_experiences(6))
+
+        derived = {pattern_signature(p) for p in recognizer.derive_patterns()}
+        stored = {pattern_signature(p) for p in recognizer.discovered_patterns.values()}
+        assert stored <= derived
+
+
+class TestApplicabilityIndex:
+    """Test the context-key inverted index"""
+
+    @pytest.mark.asyncio
+    async def test_applicable_patterns_use_context_index(self, recognizer):
+        await recognizer.analyze_experiences(make_experiences(5, context={"project_type": "analysis", "size": 3}))
+
+        matching = recognizer.get_applicable_patterns({"project_type": "analysis", "size": 3})
+        other = recognizer.get_applicable_patterns({"project_type": "design"})
+
+        context_patterns = [p for p in matching if p.pattern_type == "context_correlation"]
+        assert {p.conditions["context_key"] for p in context_patterns} == {"project_type", "size"}
+        assert all(p.pattern_type != "context_correlation" for p in other)
+        assert matching == sorted(matching, key=lambda p: p.confidence, reverse=True)
+
+    def test_store_dedupes_directly_inserted_patterns(self):
+        store = PatternStore()
+        first = LearningPattern(pattern_type="action_outcome", agent_id="a", description="x",
+                                conditions={"action_signature": "s"})
+        second = first.model_copy(update={"pattern_id": "other"})
+
+        store[first.pattern_id] = first
+        store[second.pattern_id] = second
+
+        assert list(store) == ["other"]
+        assert store.by_type("action_outcome") == [second]
+        assert store.candidates({}) == [second]
@@ -0,0 +1,82 @@
+"""
+Test suite for PriorityCalculator batch (vectorized) scoring
+"""
+
+import pytest
+
+from trm_api.reasoning.tension_analyzer import TensionAnalyzer
+from trm_api.reasoning.priority_calculator import PriorityCalculator, PriorityDimension
+
+
+METHODS = ["weighted_average", "eisenhower_matrix", "rice_framework", "value_complexity", "risk_adjusted"]
+
+
+class TestPriorityBatchScoring:
+    """Tests for matrix-based priority calculation"""
+
+    @pytest.fixture
+    def calculator(self):
+        return PriorityCalculator()
+
+    @pytest.fixture
+    def tensions(self):
+        analyzer = TensionAnalyzer()
+        samples = [
+            ("Security breach", "Customer data leak detected in production, urgent", {"deadline": "asap"}),
+            ("Improve onboarding", "We could improve the process for new team members", None),
+            ("Compliance audit", "Legal regulation requires an audit of the workflow", {"dependencies": ["a", "b"]}),
+            ("Innovation idea", "New experiment for growth and revenue in the market",
+             {"strategic_initiative": True, "team_capacity": "high"}),
+            ("Slow API", "Latency on the api server", {"budget_available": False, "stakeholder_count": 5}),
+        ]
+        return [
+            {
+                "id": f"tension_{i}",
+                "tension_analysis": analyzer.analyze_tension(title, description),
+                "title": title,
+                "description": description,
+                "context": context
+            }
+            for i, (title, description, context) in enumerate(samples)
+        ]
+
+    @pytest.mark.parametrize("method", METHODS)
+    def test_batch_matches_single(self, calculator, tensions, method):
+        """Batch results are identical to per-tension calculate_priority"""
+        batch = calculator.calculate_priority_batch(tensions, method)
+        single = [
+            calculator.calculate_priority(t["tension_analysis"], t["title"], t["description"], t["context"], method)
+            for t in tensions
+        ]
+
+        assert batch == single
+
+    def test_factor_matrix_shape(self, calculator, tensions):
+        """Factor extraction produces one row per tension"""
+        matrix = calculator.extract_factor_matrix(tensions)
+
+        assert matrix.raw.shape == (len(tensions), 10)
+        assert matrix.adjusted.shape == matrix.raw.shape
+        assert matrix.ids == [t["id"] for t in tensions]
+        assert (matrix.adjusted <= 1.0).all()
+
+    def test_rerank_with_new_weights(self, calculator, tensions):
+        """Re-ranking with changed weights reuses the extracted matrix"""
+        matrix = calculator.extract_factor_matrix(tensions)
+        default_ranking = calculator.rerank(matrix)
+
+        assert [score for _, score in default_ranking] == sorted(
+            (score for _, score in default_ranking), reverse=True
+        )
+
+        calculator.default_weights[PriorityDimension.COMPLEXITY] = 0.0
+        expected = calculator.rerank(matrix)
+        calculator.default_weights[PriorityDimension.COMPLEXITY] = 0.15
+
+        assert calculator.rerank(matrix, weights={PriorityDimension.COMPLEXITY: 0.0}) == expected
+        assert len(calculator.rerank(matrix, top_k=2)) == 2
+
+    def test_empty_batch(self, calculator):
+        """Empty input yields empty results"""
+        assert calculator.calculate_priority_batch([]) == []
+        assert calculator.rerank(calculator.extract_factor_matrix([])) == []
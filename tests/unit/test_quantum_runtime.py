@@ -0,0 +1,200 @@
+"""
+Tests for the shared, vectorized quantum runtime tick
+"""
+
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+
+from trm_api.quantum.quantum_runtime import QuantumRuntime, QuantumStateArrays, measure_systems
+from trm_api.quantum.quantum_types import QuantumState, QuantumStateType, QuantumSystem
+
+
+def make_system(rng, size, system_id):
+    states = {}
+    for i in range(size):
+        amplitude = complex(rng.random(), rng.random() * 0.3)
+        state = QuantumState(
+            state_id=f"{system_id}-{i}", state_type=rng.choice(list(QuantumStateType)),
+            amplitude=amplitude, phase=0.0, probability=0.0,
+            decoherence_rate=rng.choice([0.0, 0.001, 0.05]),
+            created_at=datetime.now() - timedelta(seconds=rng.randint(0, 120))
+        )
+        if rng.random() < 0.2:
+            state.collapse_to_classical(rng.random() < 0.5)
+        states[state.state_id] = state
+    network = {state_id: [] for state_id in list(states)[:2]}
+    if len(states) > 1:
+        network[next(iter(states))] = [list(states)[1]]
+    return QuantumSystem(system_id=system_id, quantum_states=states, entanglement_network=network)
+
+
+class TestVectorizedMeasurement:
+    """Test that one vectorized pass matches the per-system Python calculations"""
+
+    def test_matches_per_system_calculations(self):
+        rng = random.Random(5)
+        systems = [make_system(rng, size, f"sys{size}") for size in (0, 1, 7, 40)]
+        measurements = QuantumStateArrays(systems).measure()
+
+        for system, measurement in zip(systems, measurements):
+            states = list(system.quantum_states.values())
+            wins = [s.probability for s in states if s.state_type == QuantumStateType.WIN]
+            assert measurement.state_count == len(states)
+            assert measurement.coherence == pytest.approx(system.calculate_system_coherence(), rel=1e-4)
+            assert measurement.mean_probability == pytest.approx(np.mean([s.probability for s in states]) if states else 0.0)
+            assert measurement.win_probability == pytest.approx(np.mean(wins) if wins else 0.0)
+            assert measurement.entanglement_count == sum(len(v) for v in system.entanglement_network.values())
+
+    def test_shared_systems_are_measured_once(self):
+        system = make_system(random.Random(1), 5, "shared")
+        system.total_coherence = 0.0
+        measured = measure_systems({"a": system, "b": system})
+
+        assert measured["a"] is measured["b"]
+        assert system.total_coherence == measured["a"].coherence
+
+
+class TestQuantumRuntime:
+    """Test fan-out of one tick to consumers with their own intervals"""
+
+    @pytest.mark.asyncio
+    async def test_one_tick_feeds_all_due_consumers(self):
+        rng = random.Random(2)
+        systems = {f"s{i}": make_system(rng, 10, f"s{i}") for i in range(3)}
+        fast_calls, slow_calls = [], []
+
+        async def fast(measurements):
+            fast_calls.append(measurements)
+
+        async def slow(measurements):
+            slow_calls.append(measurements)
+
+        runtime = QuantumRuntime()
+        try:
+            runtime.register("fast", fast, 0.0, systems)
+            runtime.register("slow", slow, 3600, {"s0": systems["s0"]})
+            assert await runtime.tick() == 2
+            assert await runtime.tick() == 1
+
+            assert len(fast_calls) == 2 and len(slow_calls) == 1
+            assert set(fast_calls[0]) == {"s0", "s1", "s2"}
+            assert slow_calls[0]["s0"] is fast_calls[0]["s0"]
+            assert runtime.get_metrics()["ticks"] == 2
+            assert runtime.get_metrics()["systems_measured"] == 6
+        finally:
+            await runtime.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_running_consumer_is_skipped_and_failures_isolated(self):
+        release = asyncio.Event()
+
+        async def blocking(measurements):
+            await release.wait()
+
+        async def failing(measurements):
+            raise RuntimeError("boom")
+
+        runtime = QuantumRuntime()
+        try:
+            runtime.register("blocking", blocking, 3600, {})
+            runtime.register("failing", failing, 3600, {})
+            # Run the first tick here; the scheduler finds nothing due afterwards
+            blocking_task, failing_task = runtime._run_tick(time.monotonic())
+            await failing_task
+
+            assert await runtime.tick(force=True) == 1
+            assert not blocking_task.done()
+            assert runtime.metrics["skipped_running"] == 1
+            assert runtime.metrics["consumer_failures"] == 2
+        finally:
+            release.set()
+            await runtime.shutdown()
+
+
+    @pytest.mark.asyncio
+    async def test_scheduler_survives_failed_tick(self):
+        calls = []
+
+        async def consumer(measurements):
+            calls.append(measurements)
+
+        runtime = QuantumRuntime()
+        try:
+            with patch("trm_api.quantum.quantum_runtime._measure_unique",
+                       side_effect=[RuntimeError("bad state"), {}]):
+                runtime.register("zero", consumer, 0.0, {})
+                for _ in range(100):
+                    await asyncio.sleep(0.01)
+                    if calls:
+                        break
+
+            assert runtime.metrics["tick_failures"] == 1
+            assert calls == [{}]
+            assert not runtime._scheduler.done()
+        finally:
+            await runtime.shutdown()
+
+
+class TestQuantumConsumers:
+    """Test the manager and coherence monitor as runtime consumers"""
+
+    @pytest.mark.asyncio
+    async def test_manager_background_processes(self):
+        from trm_api.learning.adaptive_learning_system import AdaptiveLearningSystem
+        from trm_api.quantum.quantum_system_manager import QuantumSystemManager, QuantumSystemStatus
+
+        runtime = QuantumRuntime()
+        manager = QuantumSystemManager(AdaptiveLearningSystem("agent-1"), runtime=runtime)
+        system = make_system(random.Random(3), 6, "degraded")
+        for state in system.quantum_states.values():
+            state.measured = True  # No unmeasured states: coherence 0
+        manager.quantum_systems[system.system_id] = system
+        manager.optimize_quantum_system = AsyncMock()
+        publish = AsyncMock()
+
+        with patch("trm_api.quantum.quantum_system_manager.publish_event", new=publish):
+            await manager.start_background_processes()
+            try:
+                assert len(runtime.get_metrics()["consumers"]) == 3
+                await runtime.tick(force=True)
+            finally:
+                await runtime.shutdown()
+                await manager.stop_background_processes()
+
+        assert runtime.get_metrics()["consumers"] == {}
+        assert runtime.metrics["systems_measured"] == 1
+        assert len(manager.metrics_history) == 1
+        assert manager.status == QuantumSystemStatus.COHERENCE_DEGRADED
+        manager.optimize_quantum_system.assert_awaited_once_with("degraded")
+        assert {call.kwargs["entity_type"] for call in publish.await_args_list} == {"quantum_metrics", "coherence_alert"}
+
+    @pytest.mark.asyncio
+    async def test_coherence_monitor_consumes_ticks(self):
+        from trm_api.learning.adaptive_learning_system import AdaptiveLearningSystem
+        from trm_api.quantum.quantum_coherence_monitor import CoherenceMetricType, QuantumCoherenceMonitor
+
+        runtime = QuantumRuntime()
+        monitor = QuantumCoherenceMonitor(AdaptiveLearningSystem("agent-1"), runtime=runtime)
+        system = make_system(random.Random(4), 8, "monitored")
+
+        with patch("trm_api.quantum.quantum_coherence_monitor.publish_event", new=AsyncMock()):
+            await monitor.initialize()
+            try:
+                await monitor.add_system_to_monitor(system)
+                await runtime.tick(force=True)
+            finally:
+                await runtime.shutdown()
+                await monitor.stop_monitoring()
+
+        values = {m.metric_type: m.current_value for m in monitor.coherence_metrics["monitored"].values()}
+        expected = measure_systems({"monitored": system})["monitored"]
+        assert values[CoherenceMetricType.SYSTEM_COHERENCE] == pytest.approx(expected.coherence, rel=1e-4)
+        assert values[CoherenceMetricType.STATE_STABILITY] == pytest.approx(expected.mean_probability)
+        assert values[CoherenceMetricType.ENTANGLEMENT_STRENGTH] == pytest.approx(1 / 56)
+        assert not runtime.is_registered(monitor.consumer_name)
@@ -0,0 +1,85 @@
+"""
+Test suite for the staged batch reasoning pipeline
+"""
+
+import pytest
+
+from trm_api.reasoning.reasoning_coordinator import ReasoningCoordinator, ReasoningRequest
+from trm_api.reasoning.batch_pipeline import BatchPipelineConfig
+
+
+class TestBatchReasoningPipeline:
+    """Tests for ReasoningCoordinator batch processing"""
+
+    @pytest.fixture
+    def coordinator(self):
+        coordinator = ReasoningCoordinator()
+        # Skip heavy learning/quantum initialization; commercial AI coordination is local
+        coordinator._commercial_ai_initialized = True
+        return coordinator
+
+    @pytest.fixture
+    def requests(self):
+        return [
+            ReasoningRequest(
+                tension_id=f"tension_{i}",
+                title=f"Database error {i}",
+                description="Critical security bug causing slow performance for customers"
+            )
+            for i in range(40)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_batch_preserves_order(self, coordinator, requests):
+        """process_batch_tensions returns one result per request in request order"""
+        config = BatchPipelineConfig(queue_size=4, commercial_ai_batch_size=8)
+        results = await coordinator.process_batch_tensions(requests, config)
+
+        assert [r.tension_id for r in results] == [r.tension_id for r in requests]
+        assert all(r.success for r in results)
+        assert all(r.analysis and r.priority_calculation for r in results)
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_all_results(self, coordinator, requests):
+        """stream_batch_tensions yields every result with its request index"""
+        seen = {}
+        async for index, result in coordinator.stream_batch_tensions(iter(requests)):
+            seen[index] = result.tension_id
+
+        assert seen == {i: r.tension_id for i, r in enumerate(requests)}
+
+    @pytest.mark.asyncio
+    async def test_commercial_ai_micro_batched(self, coordinator, requests):
+        """Commercial AI calls are grouped into micro-batches"""
+        config = BatchPipelineConfig(commercial_ai_batch_size=10, commercial_ai_batch_timeout=0.5)
+        results = await coordinator.process_batch_tensions(requests, config)
+
+        assert all(r.commercial_ai_result["micro_batch"]["size"] <= 10 for r in results)
+        stages = coordinator.get_performance_stats()["pipeline_stages"]
+        assert stages["commercial_ai"]["count"] == len(requests)
+        assert stages["commercial_ai"]["batches"] < len(requests)
+
+    @pytest.mark.asyncio
+    async def test_stage_timings_reported(self, coordinator, requests):
+        """Per-stage timings and queue depths are exposed through get_performance_stats"""
+        config = BatchPipelineConfig(queue_size=2)
+        await coordinator.process_batch_tensions(requests, config)
+
+        stages = coordinator.get_performance_stats()["pipeline_stages"]
+        for stage in ["analysis", "rules", "solutions", "priority"]:
+            assert stages[stage]["count"] == len(requests)
+            assert stages[stage]["average_time"] > 0
+            assert stages[stage]["max_queue_depth"] <= 2
+
+    @pytest.mark.asyncio
+    async def test_failed_analysis_skips_later_stages(self, coordinator, requests):
+        """A tension whose analysis fails is reported without running later stages"""
+        def broken_analysis(**kwargs):
+            raise ValueError("boom")
+
+        coordinator.tension_analyzer.analyze_tension = broken_analysis
+        results = await coordinator.process_batch_tensions(requests[:3])
+
+        assert all(not r.success for r in results)
+        assert all("Failed to analyze tension" in r.errors for r in results)
+        assert all(r.priority_calculation is None for r in results)
@@ -0,0 +1,83 @@
+"""
+Test suite for database-side pagination in graph repositories
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from trm_api.repositories.win_repository import WINRepository
+from trm_api.repositories.tension_repository import TensionRepository
+
+
+class TestGraphRepositoryPagination:
+    """Tests for GraphRepositoryBase query construction"""
+
+    @pytest.fixture
+    def repo(self):
+        return WINRepository()
+
+    def test_skip_limit_pushed_into_cypher(self, repo):
+        """ORDER BY / SKIP / LIMIT run in the database and nodes are inflated"""
+        with patch("trm_api.repositories.base_repository.db.cypher_query",
+                   return_value=([], ["n"])) as query:
+            assert repo.list_wins(skip=25, limit=25) == []
+
+        cypher, params = query.call_args[0]
+        assert cypher.startswith("MATCH (n:WIN) RETURN n ")
+        assert "ORDER BY n.created_at ASC, n.uid ASC SKIP $skip LIMIT $limit" in cypher
+        assert params == {"skip": 25, "limit": 25}
+
+    def test_projection_returns_dict_rows(self, repo):
+        """Requested fields are projected in Cypher and inflated to Python values"""
+        created = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        rows = [["w1", "First", created.timestamp()]]
+        with patch("trm_api.repositories.base_repository.db.cypher_query",
+                   return_value=(rows, ["uid", "name", "created_at"])) as query:
+            result = repo.list_wins(fields=["uid", "name", "created_at"], order_by="name", descending=True)
+
+        cypher = query.call_args[0][0]
+        assert "RETURN n.uid AS uid, n.name AS name, n.created_at AS created_at" in cypher
+        assert "ORDER BY n.name DESC, n.uid DESC" in cypher
+        assert result == [{"uid": "w1", "name": "First", "created_at": created}]
+
+    def test_unhydrated_rows_project_all_properties(self, repo):
+        """hydrate=False returns dict rows without building neomodel objects"""
+        with patch("trm_api.repositories.base_repository.db.cypher_query",
+                   return_value=([], [])) as query:
+            repo.list_nodes(hydrate=False)
+
+        cypher = query.call_args[0][0]
+        assert "n.narrative AS narrative" in cypher and "RETURN n " not in cypher
+
+    def test_keyset_cursor(self, repo):
+        """A keyset cursor replaces SKIP with a predicate on (order field, uid)"""
+        created = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        cursor = repo.cursor_for({"uid": "w9", "created_at": created})
+        assert cursor == (created.timestamp(), "w9")
+
+        with patch("trm_api.repositories.base_repository.db.cypher_query",
+                   return_value=([], [])) as query:
+            repo.list_wins(skip=50, limit=10, after=cursor)
+
+        cypher, params = query.call_args[0]
+        assert "WHERE (n.created_at > $after_value OR (n.created_at = $after_value AND n.uid > $after_uid))" in cypher
+        assert params == {"skip": 0, "limit": 10, "after_value": created.timestamp(), "after_uid": "w9"}
+
+    def test_unknown_field_rejected(self):
+        """Field names are validated before being placed into Cypher"""
+        repo = TensionRepository()
+        with pytest.raises(ValueError):
+            repo.list_nodes(order_by="title) DETACH DELETE n //")
+        assert repo.list_tensions(fields=["not_a_property"]) == []
+
+    def test_count_with_filters(self, repo):
+        """Counts are computed by the database"""
+        with patch("trm_api.repositories.base_repository.db.cypher_query",
+                   return_value=([[7]], ["count(n)"])) as query:
+            assert repo.count_nodes({"status": "published"}) == 7
+
+        cypher, params = query.call_args[0]
+        assert cypher == "MATCH (n:WIN) WHERE n.status = $filter_0 RETURN count(n)"
+        assert params == {"filter_0": "published"}
@@ -0,0 +1,149 @@
+"""
+Tests for the request hygiene middleware (body limits and sanitization)
+"""
+
+import json
+from typing import List
+
+import httpx
+import pytest
+from fastapi import Body, FastAPI
+from pydantic import BaseModel, Field
+
+from trm_api.middleware.request_hygiene import (
+    RequestHygieneMiddleware, RequestSanitizer, model_constrains_strings
+)
+from trm_api.security.middleware import RequestValidator
+
+
+class FreeText(BaseModel):
+    title: str
+    tags: List[str] = []
+
+
+class Constrained(BaseModel):
+    code: str = Field(pattern=r"^[A-Z]+$")
+    count: int = 0
+
+
+def build_app(**kwargs):
+    app = FastAPI()
+
+    @app.post("/free")
+    async def free(payload: dict = Body(...)):
+        return payload
+
+    @app.post("/constrained")
+    async def constrained(payload: Constrained):
+        return payload
+
+    @app.post("/upload")
+    async def upload(payload: dict = Body(...)):
+        return {"size": len(json.dumps(payload))}
+
+    middleware = RequestHygieneMiddleware(app, **kwargs)
+    return middleware
+
+
+def client_for(app):
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+class TestRequestSanitizer:
+    """Test compiled-rule sanitization"""
+
+    def test_clean_body_is_not_parsed(self):
+        sanitizer = RequestSanitizer()
+        body = json.dumps({"a": "plain", "b": [1, 2, {"c": "text"}]}).encode()
+
+        sanitized, changed = sanitizer.sanitize_body(body, "application/json")
+
+        assert sanitized is body and changed == 0
+
+    def test_nested_and_escaped_values(self):
+        sanitizer = RequestSanitizer()
+        body = json.dumps({"a": {"b": ["<script>", "ok"]}, "c": "it's", "d": "<b>"}).encode()
+
+        sanitized, changed = sanitizer.sanitize_body(body, "application/json")
+
+        assert json.loads(sanitized) == {"a": {"b": ["script", "ok"]}, "c": "its", "d": "b"}
+        assert changed == 3
+
+    def test_escaped_quote_detected(self):
+        sanitizer = RequestSanitizer()
+        sanitized, changed = sanitizer.sanitize_body(b'{"q": "say \\"hi\\""}', "application/json")
+
+        assert json.loads(sanitized) == {"q": "say hi"} and changed == 1
+
+    def test_unhandled_content_type_untouched(self):
+        sanitizer = RequestSanitizer()
+        assert sanitizer.sanitize_body(b"<x>", "application/octet-stream") == (b"<x>", 0)
+
+    def test_model_constrains_strings(self):
+        assert model_constrains_strings(Constrained) is True
+        assert model_constrains_strings(FreeText) is False
+
+    @pytest.mark.asyncio
+    async def test_request_validator_sanitizes_nested(self):
+        result = await RequestValidator().validate_request({"name": "<b>", "meta": {"note": "'x'"}, "n": 1})
+
+        assert result["sanitized_data"] == {"name": "b", "meta": {"note": "x"}, "n": 1}
+
+
+class TestRequestHygieneMiddleware:
+    """Test the ASGI middleware"""
+
+    @pytest.mark.asyncio
+    async def test_sanitizes_free_text_route(self):
+        app = build_app()
+        async with client_for(app) as client:
+            response = await client.post("/free", json={"title": "<img>", "nested": {"x": "a\"b"}})
+
+        assert response.json() == {"title": "img", "nested": {"x": "ab"}}
+        assert app.stats["fields_sanitized"] == 2
+
+    @pytest.mark.asyncio
+    async def test_skips_constrained_route(self):
+        app = build_app()
+        async with client_for(app) as client:
+            response = await client.post("/constrained", json={"code": "<A>"})
+
+        # The model's pattern rejects the value instead of it being silently altered
+        assert response.status_code == 422
+        assert app.stats["skipped_constrained"] == 1
+        assert app.stats["bodies_sanitized"] == 0
+
+    @pytest.mark.asyncio
+    async def test_content_length_over_limit(self):
+        app = build_app(max_body_bytes=100)
+        async with client_for(app) as client:
+            response = await client.post("/upload", json={"data": "x" * 200})
+
+        assert response.status_code == 413
+        assert app.stats["rejected_too_large"] == 1
+
+    @pytest.mark.asyncio
+    async def test_streamed_body_over_limit(self):
+        app = build_app(max_body_bytes=100, sanitize=False)
+        chunks_sent = []
+
+        async def body():
+            for i in range(10):
+                chunks_sent.append(i)
+                yield b"x" * 40
+
+        async with client_for(app) as client:
+            response = await client.post("/upload", content=body(), headers={"content-type": "application/json"})
+
+        assert response.status_code == 413
+        assert len(chunks_sent) < 10
+
+    @pytest.mark.asyncio
+    async def test_per_content_type_limit(self):
+        app = build_app(max_body_bytes=10_000, content_type_limits={"text/plain": 10})
+        async with client_for(app) as client:
+            response = await client.post("/upload", content=b"y" * 50, headers={"content-type": "text/plain"})
+            ok = await client.post("/upload", json={"data": "y" * 50})
+
+        assert response.status_code == 413
+        assert ok.status_code == 200
@@ -0,0 +1,208 @@
+"""
+Tests for the shared state backend and the singletons that write through to it
+"""
+
+import asyncio
+import threading
+from datetime import datetime
+
+import pytest
+
+from trm_api.core import state_backend
+from trm_api.core.state_backend import (
+    InMemoryStateBackend, RateLimiter, RedisStateBackend, SQLiteStateBackend,
+    create_state_backend, set_state_backend
+)
+from trm_api.eventbus.system_event_bus import EventType, SystemEvent, SystemEventBus
+from trm_api.monitoring.performance_analyzer import PerformanceAnalyzer
+from trm_api.protocols.mcp_connectors.mcp_connector_registry import MCPConnectorRegistry
+from trm_api.security.authentication import AuthenticationManager
+from trm_api.security.authorization import AccessRequest, ActionType, AuthorizationEngine, ResourceType
+from trm_api.security.middleware import RateLimiter as RequestRateLimiter
+from trm_api.v2.conversation.nlp_processor import IntentType, ParsedIntent, SystemAction
+from trm_api.v2.conversation.session_manager import ConversationSessionManager
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryStateBackend()
+    return SQLiteStateBackend(str(tmp_path / "state.db"))
+
+
+@pytest.fixture
+def shared_backend(tmp_path):
+    """Process-wide SQLite backend, as configured by STATE_BACKEND_URL=sqlite:///..."""
+    backend = SQLiteStateBackend(str(tmp_path / "shared.db"))
+    set_state_backend(backend)
+    yield backend
+    set_state_backend(None)
+
+
+class TestStateBackends:
+    """Test the operations every backend provides"""
+
+    @pytest.mark.asyncio
+    async def test_values_and_ttl(self, backend):
+        await backend.set("a", {"x": [1, 2]})
+        await backend.set("short", 1, ttl=0.01)
+
+        assert await backend.get("a") == {"x": [1, 2]}
+        await asyncio.sleep(0.05)
+        assert await backend.get("short") is None
+
+        await backend.delete("a")
+        assert await backend.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_counters(self, backend):
+        assert await backend.incr("n") == 1
+        assert await backend.incr("n", 2.5) == 3.5
+
+    @pytest.mark.asyncio
+    async def test_bounded_lists(self, backend):
+        for i in range(5):
+            await backend.append("items", {"i": i}, max_length=3)
+
+        assert await backend.get_list("items") == [{"i": 2}, {"i": 3}, {"i": 4}]
+        assert await backend.get_list("items", limit=2) == [{"i": 3}, {"i": 4}]
+        assert await backend.get_list("missing") == []
+
+    def test_sqlite_counter_is_atomic_across_connections(self, tmp_path):
+        path = str(tmp_path / "state.db")
+        workers = [SQLiteStateBackend(path) for _ in range(4)]
+
+        def hammer(backend):
+            for _ in range(25):
+                backend._incr("hits", 1, None)
+
+        threads = [threading.Thread(target=hammer, args=(w,)) for w in workers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert workers[0]._get("hits") == 100
+
+    def test_create_from_url(self, tmp_path):
+        assert type(create_state_backend(None)) is InMemoryStateBackend
+        assert type(create_state_backend("memory")) is InMemoryStateBackend
+        assert isinstance(create_state_backend("redis://localhost:6379/0"), RedisStateBackend)
+        sqlite = create_state_backend(f"sqlite:///{tmp_path}/state.db")
+        assert isinstance(sqlite, SQLiteStateBackend) and sqlite.shared
+        with pytest.raises(ValueError):
+            create_state_backend("memcached://localhost")
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter(self, backend):
+        limiter = RateLimiter("test", limit=2, window_seconds=60, backend=backend)
+
+        assert [await limiter.allow("k") for _ in range(3)] == [True, True, False]
+        assert await limiter.allow("other") is True
+
+
+class TestSharedSingletons:
+    """Two instances over one backend behave like two workers"""
+
+    def intent(self):
+        return ParsedIntent(IntentType.CREATE_PROJECT, 0.9, {"project_name": ["Alpha"]}, {}, "tạo dự án Alpha", "vi")
+
+    @pytest.mark.asyncio
+    async def test_sessions_visible_across_workers(self, shared_backend):
+        worker_a = ConversationSessionManager()
+        worker_b = ConversationSessionManager()
+
+        session = await worker_a.create_conversation_session("user-1", {"channel": "web"})
+        await worker_b.maintain_conversation_context(session.session_id, "tạo dự án Alpha", self.intent())
+        action = SystemAction("create_project", {"name": "Alpha"}, "/api/v1/projects", "POST", 0.9)
+        await worker_b.add_conversation_turn(session.session_id, "tạo dự án Alpha", self.intent(), [action], "OK", 0.1)
+
+        seen_by_a = await worker_a.get_session(session.session_id)
+        assert seen_by_a.context.turn_count == 1
+        assert seen_by_a.context.last_intent.intent_type == IntentType.CREATE_PROJECT
+        assert seen_by_a.turns[0].system_actions[0] == action
+        assert isinstance(seen_by_a.turns[0].timestamp, datetime)
+
+        assert await worker_a.end_conversation_session(session.session_id) is True
+        assert await worker_b.get_session(session.session_id) is None
+
+    @pytest.mark.asyncio
+    async def test_event_history_shared(self, shared_backend):
+        bus = SystemEventBus()
+        await bus.publish(SystemEvent(event_type=EventType.TENSION_CREATED, entity_id="t1"))
+        # An event published by another worker
+        other = SystemEvent(event_type=EventType.WIN_CREATED, entity_id="w1")
+        await shared_backend.append("eventbus:history", other.model_dump(mode="json"))
+
+        history = await bus.load_event_history()
+
+        assert [e.entity_id for e in history[:2]] == ["w1", "t1"]
+        assert [e.entity_id for e in await bus.load_event_history(event_type=EventType.WIN_CREATED)] == ["w1"]
+
+    @pytest.mark.asyncio
+    async def test_access_history_shared(self, shared_backend):
+        worker_a, worker_b = AuthorizationEngine(), AuthorizationEngine()
+
+        await worker_a.authorize(AccessRequest(user_id="u1", resource_type=ResourceType.TENSION, action=ActionType.READ))
+
+        history = await worker_b.load_access_history(user_id="u1")
+        assert len(history) == 1
+        assert history[0].resource_type == ResourceType.TENSION
+
+    @pytest.mark.asyncio
+    async def test_request_metrics_shared(self, shared_backend):
+        worker_a, worker_b = PerformanceAnalyzer(), PerformanceAnalyzer()
+
+        await worker_a.record_request("/api/v1/tensions", "GET", 120.0, 200)
+        await worker_b.record_request("/api/v1/tensions", "GET", 80.0, 500)
+
+        stats = await worker_a.get_endpoint_performance("/api/v1/tensions")
+        assert stats["/api/v1/tensions"]["total_requests"] == 2
+        assert stats["/api/v1/tensions"]["error_rate"] == 50.0
+
+    @pytest.mark.asyncio
+    async def test_mcp_request_metrics_shared(self, shared_backend):
+        worker_a, worker_b = MCPConnectorRegistry(), MCPConnectorRegistry()
+
+        await worker_a._record_request(True, 10.0)
+        await worker_b._record_request(False)
+
+        metrics = await worker_a.get_request_metrics()
+        assert metrics["total_requests"] == 2
+        assert metrics["failed_requests"] == 1
+        assert metrics["avg_response_time_ms"] == 10.0
+
+    @pytest.mark.asyncio
+    async def test_request_rate_limit_shared(self, shared_backend):
+        worker_a, worker_b = RequestRateLimiter(), RequestRateLimiter()
+        worker_a.max_requests = worker_b.max_requests = 3
+
+        allowed = [await worker.check_rate_limit("10.0.0.1") for worker in (worker_a, worker_b, worker_a, worker_b)]
+
+        assert allowed == [True, True, True, False]
+        assert worker_a.requests == {}
+
+    @pytest.mark.asyncio
+    async def test_login_lockout_shared(self, shared_backend):
+        worker_a, worker_b = AuthenticationManager(), AuthenticationManager()
+
+        for worker in [worker_a, worker_b] * 2:
+            await worker._record_failed_attempt("u1")
+        assert not await worker_a._is_rate_limited("u1")
+
+        await worker_b._record_failed_attempt("u1")
+        assert await worker_a._is_rate_limited("u1")
+        assert worker_a.login_attempts == {} and worker_b.login_attempts == {}
+
+        await worker_a._clear_failed_attempts("u1")
+        assert not await worker_b._is_rate_limited("u1")
+
+    @pytest.mark.asyncio
+    async def test_single_worker_does_not_write_through(self):
+        set_state_backend(InMemoryStateBackend())
+        try:
+            analyzer = PerformanceAnalyzer()
+            await analyzer.record_request("/health", "GET", 1.0, 200)
+            assert await state_backend.get_state_backend().get_list("performance:requests") == []
+        finally:
+            set_state_backend(None)
@@ -0,0 +1,83 @@
+"""
+Test suite for TensionAnalyzer single-pass keyword matching
+"""
+
+import re
+import pytest
+
+from trm_api.reasoning.tension_analyzer import (
+    TensionAnalyzer, TensionType, ImpactLevel, UrgencyLevel
+)
+
+
+class TestTensionKeywordMatcher:
+    """Tests for the compiled TensionAnalyzer matcher"""
+
+    @pytest.fixture
+    def analyzer(self):
+        return TensionAnalyzer()
+
+    def _findall_count(self, text, patterns):
+        return sum(len(re.findall(pattern, text, re.IGNORECASE)) for pattern in patterns)
+
+    @pytest.mark.parametrize("text", [
+        "có thể dẫn đến lỗi nếu không sửa, có thể mất dữ liệu",
+        "performance degradation is a risk and a threat; could cause a clash",
+        "we could try to improve; propose a recommendation to recommend growth",
+        "if not fixed this might lead to failure_mode or not working at all",
+        "",
+    ])
+    def test_counts_match_findall(self, analyzer, text):
+        """Single-pass counts equal per-pattern re.findall counts"""
+        hits = analyzer.scan_text(text)
+
+        assert hits.pattern_counts["type:Problem"] == self._findall_count(text, analyzer.problem_patterns)
+        assert hits.pattern_counts["type:Risk"] == self._findall_count(text, analyzer.risk_patterns)
+        assert hits.pattern_counts["type:Opportunity"] == self._findall_count(text, analyzer.opportunity_patterns)
+        assert hits.pattern_counts["type:Idea"] == self._findall_count(text, analyzer.idea_patterns)
+
+    def test_keywords_use_substring_presence(self, analyzer):
+        """Keyword sets keep substring semantics, including shared prefixes"""
+        hits = analyzer.scan_text("database download caused data loss")
+
+        assert {"data", "data loss"} <= hits.keywords["high_impact"] | hits.keywords["critical"]
+        assert "down" in hits.keywords["critical"]
+
+    def test_analyze_tension(self, analyzer):
+        """Full analysis uses the single-pass hits"""
+        analysis = analyzer.analyze_tension(
+            "Database server crash",
+            "Customer data breach, urgent security bug in production"
+        )
+
+        assert analysis.tension_type == TensionType.PROBLEM
+        assert analysis.impact_level == ImpactLevel.CRITICAL
+        assert analysis.urgency_level == UrgencyLevel.CRITICAL
+        assert analysis.key_themes == ["Technology", "Business", "Security"]
+
+    def test_batch_matches_single(self, analyzer):
+        """Batch API returns the same analyses as per-tension calls"""
+        tensions = [
+            {"title": "Slow API", "description": "Latency is hurting customers"},
+            {"title": "New idea", "description": "We could try a proposal for the team"},
+            {"title": "", "description": ""},
+        ]
+
+        batch = analyzer.analyze_tensions_batch(tensions)
+        single = [analyzer.analyze_tension(t["title"], t["description"]) for t in tensions]
+        assert batch == single
+
+    def test_matcher_shared_and_refreshed(self, analyzer):
+        """Instances share a compiled matcher until their pattern sets change"""
+        other = TensionAnalyzer()
+        assert analyzer._get_keyword_matcher() is other._get_keyword_matcher()
+
+        other.conflict_patterns.append(r'\b(standoff)\b')
+        assert other.scan_text("a standoff").pattern_counts["type:Conflict"] == 1
+        assert analyzer.scan_text("a standoff").pattern_counts["type:Conflict"] == 0
+
+    def test_complex_pattern_falls_back_to_regex(self, analyzer):
+        """Patterns that are not simple alternations still count via findall"""
+        analyzer.risk_patterns.append(r'\bcve-\d+\b')
+        hits = analyzer.scan_text("found cve-2024 and cve-2025")
+        assert hits.pattern_counts["type:Risk"] == 2
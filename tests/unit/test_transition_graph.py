@@ -0,0 +1,306 @@
+"""
+Tests for the sparse transition graph and its path search
+"""
+
+import itertools
+import math
+import random
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from trm_api.quantum.quantum_types import QuantumState, QuantumStateType, QuantumSystem, StateTransition
+from trm_api.quantum.transition_graph import (
+    TransitionGraph, TransitionRules, default_transition_rules, rule_transition_id, transition_graph
+)
+
+
+def make_states(types):
+    return {
+        f"s{i}": QuantumState(state_id=f"s{i}", state_type=state_type, amplitude=complex(0.5, 0.0),
+                              phase=0.0, probability=0.25)
+        for i, state_type in enumerate(types)
+    }
+
+
+def make_transition(from_state, to_state, probability, transition_id=None):
+    return StateTransition(
+        transition_id=transition_id or f"t-{from_state}-{to_state}",
+        from_state=from_state, to_state=to_state, transition_probability=probability
+    )
+
+
+def all_pairs_probability(states, from_id, to_id):
+    """The old materialize-every-pair rule from QuantumSystemManager"""
+    from_type, to_type = states[from_id].state_type, states[to_id].state_type
+    if from_type == QuantumStateType.WIN and to_type == QuantumStateType.WIN:
+        return 0.3
+    if from_type == QuantumStateType.SUPERPOSITION:
+        return 0.7
+    return 0.5
+
+
+def brute_force_best(graph, start, target, max_steps):
+    """Highest path probability over all walks of at most max_steps transitions"""
+    best = 0.0
+    walks = [(start, 1.0)]
+    for _ in range(max_steps):
+        next_walks = []
+        for state_id, probability in walks:
+            for to_id, p in graph.neighbors(state_id):
+                if to_id == target:
+                    best = max(best, probability * p)
+                next_walks.append((to_id, probability * p))
+        walks = next_walks
+    return best
+
+
+def path_probability(path):
+    return math.prod(probability for _, _, probability in path)
+
+
+class TestTransitionGraphMapping:
+    """Test the dict interface over explicit and rule transitions"""
+
+    def test_rule_transitions_match_all_pairs(self):
+        types = [QuantumStateType.WIN, QuantumStateType.WIN, QuantumStateType.SUPERPOSITION,
+                 QuantumStateType.COHERENCE, QuantumStateType.MEASUREMENT]
+        states = make_states(types)
+        graph = TransitionGraph(states, rules=default_transition_rules())
+
+        assert len(graph) == len(states) * (len(states) - 1)
+        assert graph._transitions == {}  # Nothing created up front
+
+        transitions = dict(graph.items())
+        assert len(transitions) == len(graph)
+        assert len(list(graph.values())) == len(graph)
+        assert graph._transitions == {}  # Full iteration yields temporary rule transitions
+        for from_id, to_id in itertools.permutations(states, 2):
+            transition = transitions[rule_transition_id(from_id, to_id)]
+            assert transition.transition_probability == all_pairs_probability(states, from_id, to_id)
+            assert transition.trigger_conditions == {"coherence_threshold": 0.5}
+
+    def test_rules_can_leave_pairs_out(self):
+        states = make_states([QuantumStateType.WIN, QuantumStateType.COHERENCE, QuantumStateType.COHERENCE])
+        rules = TransitionRules(default_probability=None,
+                                pair_probability={(QuantumStateType.WIN, QuantumStateType.COHERENCE): 0.4})
+        graph = TransitionGraph(states, rules=rules)
+
+        assert sorted(graph) == ["s0->s1", "s0->s2"]
+        assert len(graph) == 2
+        assert graph.get_transition("s1", "s0") is None
+        assert "s1->s0" not in graph
+
+    def test_explicit_transitions_override_and_delete(self):
+        states = make_states([QuantumStateType.COHERENCE] * 3)
+        graph = TransitionGraph(states, rules=default_transition_rules())
+        graph["custom"] = make_transition("s0", "s1", 0.9)
+
+        assert len(graph) == 6
+        assert graph.get_transition("s0", "s1").transition_probability == 0.9
+        assert "s0->s1" not in graph
+
+        del graph["s1->s2"]
+        assert len(graph) == 5
+        assert graph.get_transition("s1", "s2") is None
+        with pytest.raises(KeyError):
+            graph["s1->s2"]
+
+        # A created rule transition stays deleted too
+        graph["s2->s0"]
+        del graph["s2->s0"]
+        assert graph.get_transition("s2", "s0") is None
+        assert len(graph) == 4
+
+    def test_adjacency_follows_added_states(self):
+        system = QuantumSystem(quantum_states=make_states([QuantumStateType.COHERENCE] * 2))
+        graph = TransitionGraph(system.quantum_states, rules=default_transition_rules())
+        assert len(graph) == 2
+
+        system.add_quantum_state(QuantumState(state_id="new", state_type=QuantumStateType.SUPERPOSITION,
+                                              amplitude=complex(0.5, 0.0), phase=0.0, probability=0.25))
+        assert len(graph) == 6
+        assert sorted(to_id for to_id, _ in graph.neighbors("new")) == ["s0", "s1"]
+        assert [t.to_state for t in graph.outgoing("s0")] == ["s1", "new"]
+
+    def test_plain_dict_is_converted_in_place(self):
+        system = QuantumSystem(quantum_states=make_states([QuantumStateType.COHERENCE] * 2),
+                               state_transitions={"t": make_transition("s0", "s1", 0.6)})
+        graph = transition_graph(system)
+
+        assert system.state_transitions is graph
+        assert transition_graph(system) is graph
+        assert list(graph) == ["t"]
+        assert graph.get_transition("s0", "s1").transition_id == "t-s0-s1"
+
+
+class TestTransitionGraphPaths:
+    """Test the A* search against exhaustive enumeration"""
+
+    def test_prefers_more_probable_multi_step_path(self):
+        states = make_states([QuantumStateType.COHERENCE] * 3)
+        graph = TransitionGraph(states, transitions={
+            "direct": make_transition("s0", "s2", 0.3),
+            "a": make_transition("s0", "s1", 0.7),
+            "b": make_transition("s1", "s2", 0.7),
+        })
+
+        assert graph.find_path("s0", "s2") == [("s0", "s1", 0.7), ("s1", "s2", 0.7)]
+        assert graph.find_path("s0", "s2", max_steps=1) == [("s0", "s2", 0.3)]
+        assert graph.find_path("s2", "s0") == []
+        assert graph.find_path("s0", "s0") == []
+
+    def test_matches_brute_force(self):
+        rng = random.Random(11)
+        for _ in range(30):
+            states = make_states([QuantumStateType.COHERENCE] * 7)
+            graph = TransitionGraph(states)
+            for from_id, to_id in itertools.permutations(states, 2):
+                if rng.random() < 0.35:
+                    graph[f"{from_id}:{to_id}"] = make_transition(from_id, to_id, rng.choice([0.1, 0.4, 0.8, 1.0]))
+
+            for start, target in [("s0", "s6"), ("s3", "s1")]:
+                max_steps = rng.randint(1, 4)
+                path = graph.find_path(start, target, max_steps)
+                expected = brute_force_best(graph, start, target, max_steps)
+                if expected == 0.0:
+                    assert path == []
+                else:
+                    assert len(path) <= max_steps
+                    assert path[0][0] == start and path[-1][1] == target
+                    assert all(path[i][1] == path[i + 1][0] for i in range(len(path) - 1))
+                    assert path_probability(path) == pytest.approx(expected)
+
+    def test_rule_graph_with_many_states(self):
+        types = [QuantumStateType.SUPERPOSITION] + [QuantumStateType.COHERENCE] * 498 + [QuantumStateType.WIN] * 2
+        graph = TransitionGraph(make_states(types), rules=default_transition_rules())
+
+        assert graph.find_path("s1", "s500") == [("s1", "s500", 0.5)]
+        # Via the superposition state: 0.5 * 0.7 > 0.3
+        assert graph.find_path("s499", "s500") == [("s499", "s0", 0.5), ("s0", "s500", 0.7)]
+        assert graph._transitions == {}
+
+    def test_path_cache_invalidated_by_probability_changes(self):
+        states = make_states([QuantumStateType.COHERENCE] * 3)
+        graph = TransitionGraph(states, rules=default_transition_rules())
+
+        assert graph.find_path("s0", "s2") == [("s0", "s2", 0.5)]
+        assert graph.find_path("s0", "s2") == [("s0", "s2", 0.5)]
+        assert (graph.cache_hits, graph.cache_misses) == (1, 1)
+
+        graph.set_probability("s0", "s1", 1.0)
+        graph.set_probability("s1", "s2", 0.9)
+        assert graph.find_path("s0", "s2") == [("s0", "s1", 1.0), ("s1", "s2", 0.9)]
+        assert graph.cache_misses == 2
+
+        graph.get_transition("s1", "s2").transition_probability = 0.1
+        graph.invalidate()
+        assert graph.find_path("s0", "s2") == [("s0", "s2", 0.5)]
+
+    def test_bounded_frontier_still_finds_a_path(self):
+        rng = random.Random(3)
+        graph = TransitionGraph(make_states([QuantumStateType.COHERENCE] * 60))
+        for i in range(59):
+            graph[f"chain{i}"] = make_transition(f"s{i}", f"s{i + 1}", 0.9)
+        for _ in range(300):
+            a, b = rng.sample(range(60), 2)
+            graph[f"noise{a}:{b}"] = make_transition(f"s{a}", f"s{b}", 0.05)
+
+        path = graph.find_path("s0", "s5", max_steps=5, max_frontier=8)
+        assert [step[1] for step in path] == ["s1", "s2", "s3", "s4", "s5"]
+
+
+    def test_copy_over_other_states(self):
+        states = make_states([QuantumStateType.COHERENCE] * 2)
+        graph = TransitionGraph(states, rules=default_transition_rules())
+        graph.set_probability("s0", "s1", 0.9)
+
+        copied_states = dict(states)
+        copied = graph.copy(states=copied_states)
+        copied_states.update(make_states([QuantumStateType.COHERENCE] * 3))
+
+        assert copied.get_transition("s0", "s1").transition_probability == 0.9
+        assert len(copied) == 6 and len(graph) == 2
+
+
+class TestStateTransitionEngineGraph:
+    """Test the engine and manager on top of the graph"""
+
+    @pytest.mark.asyncio
+    async def test_manager_creates_rule_graph(self):
+        from trm_api.learning.adaptive_learning_system import AdaptiveLearningSystem
+        from trm_api.quantum.quantum_system_manager import QuantumSystemManager
+        from trm_api.quantum.state_transition_engine import StateTransitionEngine
+
+        manager = QuantumSystemManager(AdaptiveLearningSystem("agent-1"))
+        with patch("trm_api.quantum.quantum_system_manager.publish_event", new=AsyncMock()):
+            system = await manager.create_quantum_system("test", initial_states=list(make_states(
+                [QuantumStateType.SUPERPOSITION, QuantumStateType.WIN, QuantumStateType.WIN]
+            ).values()))
+
+        assert isinstance(system.state_transitions, TransitionGraph)
+        assert len(system.state_transitions) == 6
+
+        engine = StateTransitionEngine(manager.learning_system)
+        path = await engine.predict_optimal_transition_path(system, "s1", "s2")
+        assert path == [("s1", "s0", 0.5), ("s0", "s2", 0.7)]
+
+        with patch("trm_api.quantum.state_transition_engine.publish_event", new=AsyncMock()):
+            result = await engine.execute_transition(system, "s1", "s2")
+        assert result.success
+        assert result.confidence == 0.3
+
+    def test_optimizer_copies_keep_the_graph_sparse(self):
+        from trm_api.quantum.optimization_engine import QuantumOptimizationEngine
+
+        types = [QuantumStateType.COHERENCE] * 200
+        system = QuantumSystem(system_id="big", quantum_states=make_states(types))
+        system.state_transitions = TransitionGraph(system.quantum_states, rules=default_transition_rules())
+        system.state_transitions.set_probability("s0", "s1", 0.9)
+
+        engine = QuantumOptimizationEngine.__new__(QuantumOptimizationEngine)
+        copied = engine._copy_system(system, "big_copy")
+
+        assert isinstance(copied.state_transitions, TransitionGraph)
+        assert copied.state_transitions.states is copied.quantum_states
+        assert copied.state_transitions.stored_transitions() == system.state_transitions.stored_transitions()
+        assert len(copied.state_transitions) == 200 * 199
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("predictor", [None, "initialized"])
+    async def test_evaluation_scores_rule_groups_once(self, predictor):
+        from trm_api.learning.adaptive_learning_system import AdaptiveLearningSystem
+        from trm_api.quantum.state_transition_engine import (
+            StateTransitionEngine, TransitionCondition, TransitionTriggerType
+        )
+
+        rng = random.Random(7)
+        types = [rng.choice(list(QuantumStateType)) for _ in range(60)]
+        system = QuantumSystem(system_id="eval", quantum_states=make_states(types))
+        system.state_transitions = TransitionGraph(system.quantum_states, rules=default_transition_rules())
+        graph = system.state_transitions
+        graph["explicit"] = make_transition("s1", "s2", 0.95)
+        del graph[rule_transition_id("s3", "s4")]
+
+        engine = StateTransitionEngine(AdaptiveLearningSystem("agent-1"))
+        engine.transition_success_predictor = predictor
+        engine.prediction_confidence_threshold = 0.6
+        for transition_id, threshold in ((rule_transition_id("s5", "s6"), 0.5), (rule_transition_id("s7", "s8"), 0.9)):
+            await engine.add_transition_condition(transition_id, TransitionCondition(
+                condition_id=transition_id, trigger_type=TransitionTriggerType.PERFORMANCE_METRIC,
+                threshold_value=threshold, metric_name="system_coherence"
+            ))
+        metrics = {"system_coherence": 0.8, "learning_progress": 0.6}
+
+        # Reference: score every transition of the mapping one by one
+        expected = []
+        for transition_id, transition in list(graph.items()):
+            confidence = await engine._transition_confidence(transition_id, transition, metrics)
+            if confidence >= engine.prediction_confidence_threshold:
+                expected.append((transition.from_state, transition.to_state, confidence))
+
+        with patch.object(engine, "_transition_confidence", wraps=engine._transition_confidence) as scored:
+            result = await engine.evaluate_transition_conditions(system, metrics)
+
+        assert sorted(result) == sorted(expected)
+        assert scored.call_count < len(types) * 2
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Real-time WebSocket Fan-out
+==========================================
+
+Tests cho per-connection send queues, slow-consumer policies,
+reverse indexes và cross-worker backplane relay.
+"""
+
+import asyncio
+
+import pytest
+
+from trm_api.v2.realtime import (
+    ConnectionManager,
+    FanoutConfig,
+    InMemoryBackplane,
+    SlowConsumerPolicy
+)
+
+
+class FakeWebSocket:
+    """Minimal WebSocket double recording sent text"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.sent = []
+        self.accepted = False
+        self.close_code = None
+
+    async def accept(self):
+        self.accepted = True
+
+    async def close(self, code=1000):
+        self.close_code = code
+
+    async def send_text(self, text):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(text)
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestConnectionManagerFanout:
+    """Test cases cho ConnectionManager fan-out"""
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_block_broadcast(self):
+        """A slow connection only backs up its own queue"""
+        manager = ConnectionManager()
+        fast, slow = FakeWebSocket(), FakeWebSocket(delay=10)
+        await manager.connect(fast, "fast", "user_fast")
+        await manager.connect(slow, "slow", "user_slow")
+        manager.join_session("fast", "s1")
+        manager.join_session("slow", "s1")
+
+        delivered = await asyncio.wait_for(
+            manager.broadcast_json_to_session({"type": "update", "value": "ổn"}, "s1"), 0.5
+        )
+        await settle()
+
+        assert delivered == 2
+        assert fast.sent == ['{"type":"update","value":"ổn"}']
+        assert slow.sent == []
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_policy(self):
+        """Full queues drop the oldest queued message"""
+        manager = ConnectionManager(FanoutConfig(queue_size=2))
+        slow = FakeWebSocket(delay=10)
+        await manager.connect(slow, "c1", "u1")
+        await settle()  # writer takes the first message and blocks on it
+
+        for i in range(4):
+            await manager.send_personal_message(str(i), "c1")
+
+        writer = manager.writers["c1"]
+        assert writer.dropped_messages == 2
+        assert list(writer.queue._queue) == ["2", "3"]
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_policy(self):
+        """A slow consumer is disconnected and removed from all indexes"""
+        manager = ConnectionManager(FanoutConfig(queue_size=1, slow_consumer_policy=SlowConsumerPolicy.DISCONNECT))
+        slow = FakeWebSocket(delay=10)
+        await manager.connect(slow, "c1", "u1")
+        manager.join_session("c1", "s1")
+        await settle()
+
+        for i in range(3):
+            await manager.broadcast_to_session(str(i), "s1")
+        await settle()
+
+        assert slow.close_code == 1013
+        assert "c1" not in manager.active_connections
+        assert "u1" not in manager.user_sessions
+        assert "s1" not in manager.session_connections
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_uses_reverse_indexes(self):
+        """Disconnect keeps the user's newer connection"""
+        manager = ConnectionManager()
+        await manager.connect(FakeWebSocket(), "old", "u1")
+        await manager.connect(FakeWebSocket(), "new", "u1")
+        manager.join_session("old", "s1")
+
+        manager.disconnect("old")
+
+        assert manager.user_sessions == {"u1": "new"}
+        assert manager.session_connections == {}
+        assert manager.connection_session_ids == {}
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_backplane_relays_between_workers(self):
+        """Broadcasts reach session members connected to other workers exactly once"""
+        hub = []
+        worker_a = ConnectionManager(backplane=InMemoryBackplane(hub))
+        worker_b = ConnectionManager(backplane=InMemoryBackplane(hub))
+        ws_a, ws_b = FakeWebSocket(), FakeWebSocket()
+        await worker_a.connect(ws_a, "a", "ua")
+        await worker_b.connect(ws_b, "b", "ub")
+        worker_a.join_session("a", "shared")
+        worker_b.join_session("b", "shared")
+
+        await worker_a.broadcast_to_session("hello", "shared")
+        await settle()
+
+        assert ws_a.sent == ["hello"]
+        assert ws_b.sent == ["hello"]
+
+        await worker_a.close()
+        await worker_b.close()
+        assert hub == []
+
+    @pytest.mark.asyncio
+    async def test_failed_backplane_subscribe_is_retried(self):
+        """A connect after a failed subscribe subscribes again"""
+        backplane = InMemoryBackplane([])
+        subscribe = backplane.subscribe
+        attempts = []
+
+        async def flaky_subscribe(handler):
+            attempts.append(handler)
+            if len(attempts) == 1:
+                raise ConnectionError("backplane down")
+            await subscribe(handler)
+
+        backplane.subscribe = flaky_subscribe
+        manager = ConnectionManager(backplane=backplane)
+        await manager.connect(FakeWebSocket(), "c1", "u1")
+        assert manager._backplane_started is False
+
+        await manager.connect(FakeWebSocket(), "c2", "u2")
+        await manager.connect(FakeWebSocket(), "c3", "u3")
+        assert manager._backplane_started is True
+        assert len(attempts) == 2
+        await manager.close()
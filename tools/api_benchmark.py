@@ -0,0 +1,431 @@
+"""
+Synthetic-load benchmark for the TRM-OS API hot paths
+
+Drives concurrent workloads against the FastAPI app in-process (ASGI transport,
+no network) or against a running server (--base-url), and records per endpoint:
+p50/p95/p99 latency, throughput, error rate and bytes allocated per request
+(tracemalloc, in-process only). Results can be saved as a baseline JSON and
+later runs compared against it; regressions beyond the tolerance exit non-zero.
+
+The in-process app uses whatever Neo4j the settings point at, so run it against
+a local instance (docker-compose) for reproducible numbers.
+
+Usage:
+    python tools/api_benchmark.py --concurrency 20 --requests 500 --save-baseline benchmarks/baseline.json
+    python tools/api_benchmark.py --baseline benchmarks/baseline.json --tolerance 0.15
+    python tools/api_benchmark.py --scenarios win.list win.get reasoning.analyze
+"""
+
+import argparse
+import asyncio
+import fnmatch
+import importlib
+import json
+import logging
+import math
+import os
+import platform
+import re
+import sys
+import time
+import tracemalloc
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+# Thêm thư mục gốc của project vào sys.path để có thể import các module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logger = logging.getLogger("api_benchmark")
+
+_PLACEHOLDER = re.compile(r"\{(\w+)\}")
+
+
+@dataclass
+class Scenario:
+    """One request type to benchmark"""
+    name: str
+    method: str
+    path: str  # May contain {placeholders} filled from captured ids, {n} and {run_id}
+    body: Optional[Dict[str, Any]] = None
+    expected_status: Tuple[int, ...] = (200, 201)
+    # Context key -> response JSON field, captured from the first successful response
+    captures: Dict[str, str] = field(default_factory=dict)
+
+    def required_keys(self) -> List[str]:
+        text = self.path + json.dumps(self.body or {})
+        return [key for key in _PLACEHOLDER.findall(text) if key not in ("n", "run_id")]
+
+
+def _fill(value: Any, context: Dict[str, Any]) -> Any:
+    if isinstance(value, str):
+        return _PLACEHOLDER.sub(lambda m: str(context.get(m.group(1), m.group(0))), value)
+    if isinstance(value, dict):
+        return {k: _fill(v, context) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_fill(v, context) for v in value]
+    return value
+
+
+V1 = "/api/v1"
+
+DEFAULT_SCENARIOS: List[Scenario] = [
+    # Creates run first once (setup) to capture ids for the get/relationship scenarios
+    Scenario("tension.create", "POST", f"{V1}/tensions/", {
+        "title": "Benchmark tension {run_id}-{n}",
+        "description": "Synthetic tension created by the API benchmark",
+        "projectId": "benchmark-project",
+        "tensionType": "Problem"
+    }, captures={"tension_id": "tensionId"}),
+    Scenario("win.create", "POST", f"{V1}/strategic/wins/", {
+        "summary": "Benchmark WIN {run_id}-{n}",
+        "description": "Synthetic WIN created by the API benchmark",
+        "win_type": "process_optimization",
+        "impact_level": 3
+    }, captures={"win_id": "uid"}),
+    Scenario("event.create", "POST", f"{V1}/strategic/events/", {
+        "name": "BENCHMARK_EVENT",
+        "description": "Synthetic event {run_id}-{n}",
+        "actor_uid": "benchmark-agent"
+    }, captures={"event_id": "uid"}),
+
+    Scenario("tension.list", "GET", f"{V1}/tensions/?skip=0&limit=20"),
+    Scenario("tension.get", "GET", f"{V1}/tensions/{{tension_id}}"),
+    Scenario("win.list", "GET", f"{V1}/strategic/wins/?skip=0&limit=20"),
+    Scenario("win.get", "GET", f"{V1}/strategic/wins/{{win_id}}"),
+    Scenario("event.list", "GET", f"{V1}/strategic/events/?skip=0&limit=20"),
+    Scenario("event.get", "GET", f"{V1}/strategic/events/{{event_id}}"),
+
+    Scenario("relationship.tension_leads_to_win", "POST",
+             f"{V1}/tensions/{{tension_id}}/leads-to-win/{{win_id}}"),
+    Scenario("relationship.tension_with_relationships", "GET",
+             f"{V1}/tensions/{{tension_id}}/with-relationships"),
+    Scenario("relationship.win_sources", "GET", f"{V1}/strategic/wins/{{win_id}}/sources"),
+
+    Scenario("reasoning.analyze", "POST", f"{V1}/intelligence/reasoning/analyze", {
+        "title": "Checkout latency spikes during peak hours",
+        "description": "Customers report slow checkout; p95 latency doubled after the last release.",
+        "current_status": "Open"
+    }),
+    Scenario("v2.conversation.analyze", "POST", "/v2/conversations/analyze", {
+        "message": "Tạo tension mới về hiệu suất API chậm trong giờ cao điểm",
+        "language": "vi",
+        "user_identifier": "benchmark-{run_id}"
+    }),
+]
+
+
+@dataclass
+class ScenarioResult:
+    """Measurements for one scenario"""
+    name: str
+    requests: int = 0
+    errors: int = 0
+    p50_ms: float = 0.0
+    p95_ms: float = 0.0
+    p99_ms: float = 0.0
+    mean_ms: float = 0.0
+    throughput_rps: float = 0.0
+    alloc_bytes_per_request: Optional[float] = None
+    skipped: Optional[str] = None
+    status_codes: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.requests if self.requests else 0.0
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class BenchmarkRunner:
+    """Runs scenarios one after another, each with `concurrency` parallel workers"""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        scenarios: List[Scenario],
+        concurrency: int = 10,
+        requests_per_scenario: int = 200,
+        warmup_requests: int = 10,
+        allocation_samples: int = 20,
+        app: Any = None
+    ):
+        self.client = client
+        self.scenarios = scenarios
+        self.concurrency = max(1, concurrency)
+        self.requests_per_scenario = max(1, requests_per_scenario)
+        self.warmup_requests = max(0, warmup_requests)
+        self.allocation_samples = allocation_samples if app is not None else 0
+        self.app = app
+        self.context: Dict[str, Any] = {"run_id": uuid.uuid4().hex[:8]}
+
+    def route_exists(self, scenario: Scenario) -> bool:
+        """Whether the in-process app mounts a route for the scenario (always True remotely)"""
+        if self.app is None:
+            return True
+        from starlette.routing import Match
+        path = _fill(scenario.path, {**self.context, **{k: "x" for k in scenario.required_keys()}})
+        scope = {"type": "http", "path": path.split("?")[0], "method": scenario.method}
+        return any(route.matches(scope)[0] == Match.FULL for route in self.app.routes)
+
+    async def _request(self, scenario: Scenario, n: int) -> httpx.Response:
+        context = {**self.context, "n": n}
+        return await self.client.request(
+            scenario.method,
+            _fill(scenario.path, context),
+            json=_fill(scenario.body, context) if scenario.body is not None else None
+        )
+
+    async def setup(self) -> None:
+        """Issue each capturing scenario once to collect ids used by other scenarios"""
+        for scenario in self.scenarios:
+            if not scenario.captures or not self.route_exists(scenario):
+                continue
+            try:
+                response = await self._request(scenario, 0)
+                data = response.json() if response.status_code in scenario.expected_status else {}
+            except Exception as e:
+                logger.warning(f"Setup request {scenario.name} failed: {e}")
+                continue
+            for key, field_name in scenario.captures.items():
+                if isinstance(data, dict) and data.get(field_name):
+                    self.context[key] = data[field_name]
+
+    async def run_scenario(self, scenario: Scenario) -> ScenarioResult:
+        result = ScenarioResult(name=scenario.name)
+        if not self.route_exists(scenario):
+            result.skipped = "route not mounted"
+            return result
+        missing = [key for key in scenario.required_keys() if key not in self.context]
+        if missing:
+            result.skipped = f"missing ids: {', '.join(missing)}"
+            return result
+
+        for n in range(self.warmup_requests):
+            try:
+                await self._request(scenario, n)
+            except Exception:
+                pass
+
+        latencies: List[float] = []
+        counter = iter(range(self.requests_per_scenario))
+
+        async def worker() -> None:
+            for n in counter:
+                start = time.perf_counter()
+                try:
+                    response = await self._request(scenario, n)
+                    status_code = response.status_code
+                except Exception:
+                    status_code = 0
+                latencies.append((time.perf_counter() - start) * 1000)
+                key = str(status_code)
+                result.status_codes[key] = result.status_codes.get(key, 0) + 1
+                if status_code not in scenario.expected_status:
+                    result.errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        elapsed = time.perf_counter() - started
+
+        latencies.sort()
+        result.requests = len(latencies)
+        result.p50_ms = percentile(latencies, 50)
+        result.p95_ms = percentile(latencies, 95)
+        result.p99_ms = percentile(latencies, 99)
+        result.mean_ms = sum(latencies) / len(latencies)
+        result.throughput_rps = result.requests / elapsed if elapsed > 0 else 0.0
+
+        if self.allocation_samples:
+            result.alloc_bytes_per_request = await self._measure_allocations(scenario)
+        return result
+
+    async def _measure_allocations(self, scenario: Scenario) -> float:
+        """Mean peak bytes allocated while serving one request (sequential, in-process)"""
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        try:
+            samples = []
+            for n in range(self.allocation_samples):
+                tracemalloc.reset_peak()
+                before, _ = tracemalloc.get_traced_memory()
+                try:
+                    await self._request(scenario, n)
+                except Exception:
+                    pass
+                _, peak = tracemalloc.get_traced_memory()
+                samples.append(peak - before)
+            return sum(samples) / len(samples)
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+
+    async def run(self) -> Dict[str, Any]:
+        await self.setup()
+        results = {}
+        for scenario in self.scenarios:
+            result = await self.run_scenario(scenario)
+            results[scenario.name] = result
+            if result.skipped:
+                logger.info(f"{scenario.name}: skipped ({result.skipped})")
+            else:
+                logger.info(
+                    f"{scenario.name}: p50={result.p50_ms:.1f}ms p95={result.p95_ms:.1f}ms "
+                    f"p99={result.p99_ms:.1f}ms {result.throughput_rps:.1f} req/s errors={result.errors}"
+                )
+        return {
+            "meta": {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "concurrency": self.concurrency,
+                "requests_per_scenario": self.requests_per_scenario,
+                "in_process": self.app is not None
+            },
+            "results": {name: asdict(result) for name, result in results.items()}
+        }
+
+
+def compare_to_baseline(report: Dict[str, Any], baseline: Dict[str, Any],
+                        tolerance: float = 0.2, error_rate_tolerance: float = 0.01) -> List[str]:
+    """
+    Regressions of `report` against `baseline`
+
+    Latency percentiles and allocations may grow, and throughput may shrink, by
+    `tolerance` (a fraction); error rate may grow by `error_rate_tolerance`.
+    """
+    regressions = []
+    for name, base in baseline.get("results", {}).items():
+        current = report.get("results", {}).get(name)
+        if base.get("skipped"):
+            continue
+        if current is None or current.get("skipped"):
+            regressions.append(f"{name}: not measured ({(current or {}).get('skipped', 'missing')})")
+            continue
+
+        for metric in ("p50_ms", "p95_ms", "p99_ms", "alloc_bytes_per_request"):
+            if base.get(metric) and current.get(metric) is not None:
+                limit = base[metric] * (1 + tolerance)
+                if current[metric] > limit:
+                    regressions.append(
+                        f"{name}: {metric} {current[metric]:.1f} > {limit:.1f} (baseline {base[metric]:.1f})"
+                    )
+
+        if base.get("throughput_rps"):
+            floor = base["throughput_rps"] * (1 - tolerance)
+            if current["throughput_rps"] < floor:
+                regressions.append(
+                    f"{name}: throughput_rps {current['throughput_rps']:.1f} < {floor:.1f} "
+                    f"(baseline {base['throughput_rps']:.1f})"
+                )
+
+        base_errors = base["errors"] / base["requests"] if base.get("requests") else 0.0
+        current_errors = current["errors"] / current["requests"] if current.get("requests") else 0.0
+        if current_errors > base_errors + error_rate_tolerance:
+            regressions.append(f"{name}: error rate {current_errors:.1%} > baseline {base_errors:.1%}")
+    return regressions
+
+
+def select_scenarios(patterns: Optional[List[str]]) -> List[Scenario]:
+    if not patterns:
+        return list(DEFAULT_SCENARIOS)
+    return [s for s in DEFAULT_SCENARIOS if any(fnmatch.fnmatch(s.name, p) for p in patterns)]
+
+
+def load_app(spec: str) -> Any:
+    module_name, _, attribute = spec.partition(":")
+    return getattr(importlib.import_module(module_name), attribute or "app")
+
+
+async def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    scenarios = select_scenarios(args.scenarios)
+    options = dict(
+        scenarios=scenarios,
+        concurrency=args.concurrency,
+        requests_per_scenario=args.requests,
+        warmup_requests=args.warmup,
+        allocation_samples=args.allocation_samples
+    )
+
+    if args.base_url:
+        async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout) as client:
+            return await BenchmarkRunner(client, **options).run()
+
+    app = load_app(args.app)
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=args.timeout) as client:
+            return await BenchmarkRunner(client, app=app, **options).run()
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    header = f"{'scenario':42} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'req/s':>9} {'errors':>7} {'KiB/req':>9}"
+    print(header)
+    print("-" * len(header))
+    for name, result in report["results"].items():
+        if result["skipped"]:
+            print(f"{name:42} skipped: {result['skipped']}")
+            continue
+        alloc = result["alloc_bytes_per_request"]
+        print(
+            f"{name:42} {result['p50_ms']:9.1f} {result['p95_ms']:9.1f} {result['p99_ms']:9.1f} "
+            f"{result['throughput_rps']:9.1f} {result['errors']:7d} "
+            f"{(alloc / 1024 if alloc is not None else float('nan')):9.1f}"
+        )
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Synthetic-load benchmark for the TRM-OS API hot paths")
+    parser.add_argument("--app", default="trm_api.main:app", help="ASGI app to benchmark in-process (module:attr)")
+    parser.add_argument("--base-url", help="Benchmark a running server instead of the in-process app")
+    parser.add_argument("--scenarios", nargs="+", metavar="PATTERN",
+                        help="Scenario names or glob patterns (e.g. 'win.*'); default: all")
+    parser.add_argument("--concurrency", type=int, default=10, help="Concurrent requests per scenario")
+    parser.add_argument("--requests", type=int, default=200, help="Measured requests per scenario")
+    parser.add_argument("--warmup", type=int, default=10, help="Unmeasured warm-up requests per scenario")
+    parser.add_argument("--allocation-samples", type=int, default=20,
+                        help="Sequential requests traced for allocations (in-process only, 0 disables)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--save-baseline", metavar="FILE", help="Write the JSON report as the new baseline")
+    parser.add_argument("--baseline", metavar="FILE", help="Compare against this baseline; regressions exit 1")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed relative regression for latency, throughput and allocations")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    args = parse_args(argv)
+    report = asyncio.run(run_benchmark(args))
+    print_report(report)
+
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Report written to {path}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(report, baseline, args.tolerance)
+        if regressions:
+            print(f"\nPERFORMANCE REGRESSIONS vs {args.baseline}:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+        print(f"\nNo regressions vs {args.baseline} (tolerance {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,547 @@
+"""
+Microbenchmarks for the CPU-bound engines (reasoning, quantum, learning, NLP, temporal)
+
+Each benchmark builds a seeded synthetic input of a given size (10, 1k, 100k
+items by default), times the engine call (best of several repeats) and fits a
+scaling exponent from log(time) / log(size). Exponents above the threshold are
+flagged as super-linear. Commercial AI calls are served by an in-process stub,
+so the numbers reflect only local algorithmic cost.
+
+Results can be saved as a baseline JSON and later runs compared against it;
+regressions exit non-zero.
+
+Usage:
+    python tools/engine_benchmarks.py --save-baseline benchmarks/engine_baseline.json
+    python tools/engine_benchmarks.py --baseline benchmarks/engine_baseline.json
+    python tools/engine_benchmarks.py --benchmarks 'reasoning.*' --sizes 10 1000 10000
+"""
+
+import argparse
+import asyncio
+import contextlib
+import fnmatch
+import inspect
+import json
+import logging
+import math
+import os
+import platform
+import random
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+
+# Thêm thư mục gốc của project vào sys.path để có thể import các module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logger = logging.getLogger("engine_benchmarks")
+
+DEFAULT_SIZES = [10, 1_000, 100_000]
+
+# Benchmark setup: (size, seeded rng) -> zero-argument callable (sync or async)
+Setup = Callable[[int, random.Random], Callable[[], Any]]
+
+VOCABULARY = [
+    "customer", "revenue", "deadline", "urgent", "critical", "bug", "performance", "slow",
+    "team", "process", "conflict", "opportunity", "risk", "market", "project", "delay",
+    "quality", "cost", "budget", "security", "outage", "latency", "growth", "strategy",
+    "khách", "hàng", "doanh", "thu", "khẩn", "cấp", "hiệu", "suất", "dự", "án", "tension",
+    "the", "and", "with", "for", "after", "release", "during", "peak", "hours",
+]
+
+
+def synthetic_text(size: int, rng: random.Random) -> str:
+    return " ".join(rng.choice(VOCABULARY) for _ in range(size))
+
+
+@dataclass
+class Benchmark:
+    """One engine entry point and how `size` scales its input"""
+    name: str
+    description: str  # What one "item" is
+    setup: Setup
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings per size and the fitted scaling exponent"""
+    name: str
+    description: str
+    seconds: Dict[str, float] = field(default_factory=dict)  # size -> best time
+    per_item_us: Dict[str, float] = field(default_factory=dict)
+    exponent: Optional[float] = None  # Slope of log(time) over log(size)
+    segment_exponents: Dict[str, float] = field(default_factory=dict)  # "a->b" -> slope
+    super_linear: bool = False
+    skipped_sizes: List[int] = field(default_factory=list)
+    unavailable: Optional[str] = None
+
+
+# --- Commercial AI stub ---
+
+class StubCommercialAICoordinator:
+    """Answers commercial AI requests instantly with neutral content"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def _respond(self, *args, **kwargs):
+        from trm_api.core.commercial_ai_coordinator import AIProvider, AIResponse
+        self.calls += 1
+        return AIResponse(
+            content="{}",
+            provider_used=next(iter(AIProvider)),
+            model_used="benchmark-stub",
+            tokens_used=0,
+            cost_estimate=0.0,
+            processing_time=0.0,
+            confidence_score=0.5
+        )
+
+    def __getattr__(self, name: str):
+        # Every coordinator coroutine (optimize_parameters, analyze_data, ...) returns the stub response
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self._respond
+
+
+@contextlib.contextmanager
+def stub_commercial_ai() -> Iterator[StubCommercialAICoordinator]:
+    """Make get_commercial_ai_coordinator() return the stub for the duration"""
+    from trm_api.core import commercial_ai_coordinator as coordinator_module
+    stub = StubCommercialAICoordinator()
+    previous = coordinator_module._coordinator_instance
+    coordinator_module._coordinator_instance = stub
+    try:
+        yield stub
+    finally:
+        coordinator_module._coordinator_instance = previous
+
+
+# --- Benchmarks ---
+
+def _tension_analyzer(size: int, rng: random.Random):
+    from trm_api.reasoning.tension_analyzer import TensionAnalyzer
+    analyzer = TensionAnalyzer()
+    description = synthetic_text(size, rng)
+    return lambda: analyzer.analyze_tension("Synthetic tension", description)
+
+
+def _rule_engine(size: int, rng: random.Random):
+    from trm_api.reasoning.rule_engine import (
+        BusinessRule, OperatorType, RuleAction, RuleCondition, RuleEngine, RuleType
+    )
+    engine = RuleEngine()
+    numeric_operators = [OperatorType.EQUALS, OperatorType.GREATER_THAN, OperatorType.LESS_THAN]
+    for i in range(size):
+        field_name = rng.choice(["priority", "impact", "description"])
+        if field_name == "description":
+            operator, value = OperatorType.CONTAINS, rng.choice(VOCABULARY)
+        else:
+            operator, value = rng.choice(numeric_operators), rng.randint(0, 10)
+        engine.add_rule(BusinessRule(
+            id=f"bench_rule_{i}",
+            name=f"Benchmark rule {i}",
+            description="Synthetic rule",
+            rule_type=rng.choice(list(RuleType)),
+            conditions=[RuleCondition(field=field_name, operator=operator, value=value)],
+            actions=[RuleAction(action_type="flag", parameters={"rule": i})],
+            priority=rng.randint(0, 10)
+        ))
+    context = {"priority": 5, "impact": 7, "description": "urgent customer outage", "status": "Open"}
+    return lambda: engine.evaluate_rules(context)
+
+
+def _priority_calculator(size: int, rng: random.Random):
+    from trm_api.reasoning.priority_calculator import PriorityCalculator
+    from trm_api.reasoning.tension_analyzer import TensionAnalyzer
+    analyzer = TensionAnalyzer()
+    calculator = PriorityCalculator()
+    description = synthetic_text(size, rng)
+    analysis = analyzer.analyze_tension("Synthetic tension", description)
+    return lambda: calculator.calculate_priority(analysis, "Synthetic tension", description)
+
+
+def _quantum_system(size: int, rng: random.Random):
+    from trm_api.quantum.quantum_types import QuantumState, QuantumStateType, QuantumSystem
+    states = {}
+    for i in range(size):
+        amplitude = complex(rng.random(), rng.random() * 0.2)
+        states[f"state_{i}"] = QuantumState(
+            state_id=f"state_{i}",
+            state_type=rng.choice(list(QuantumStateType)),
+            amplitude=amplitude,
+            phase=rng.random() * math.pi,
+            probability=abs(amplitude) ** 2,
+            description=f"Synthetic state {i}"
+        )
+    return QuantumSystem(system_id="bench_system", quantum_states=states,
+                         state_transitions={}, entanglement_network={})
+
+
+def _quantum_optimizer(method: str) -> Setup:
+    def setup(size: int, rng: random.Random):
+        from trm_api.learning.adaptive_learning_system import AdaptiveLearningSystem
+        from trm_api.quantum.optimization_engine import OptimizationObjective, QuantumOptimizationEngine
+        engine = QuantumOptimizationEngine(AdaptiveLearningSystem("benchmark_agent"))
+        system = _quantum_system(size, rng)
+        objectives = [
+            OptimizationObjective("o1", "win_probability", "Maximize WIN probability"),
+            OptimizationObjective("o2", "coherence", "Maximize coherence", weight=0.5),
+            OptimizationObjective("o3", "stability", "Maximize stability", weight=0.5),
+        ]
+        optimizer = getattr(engine, method)
+
+        async def run():
+            # Optimizers draw from the global NumPy generator; seed it so repeats do the same work
+            np_random_state = np.random.get_state()
+            np.random.seed(size)
+            try:
+                return await optimizer(engine._encode_system_state(system), system, objectives)
+            finally:
+                np.random.set_state(np_random_state)
+        return run
+    return setup
+
+
+def _transition_path(size: int, rng: random.Random):
+    from trm_api.quantum.transition_graph import TransitionGraph, default_transition_rules
+    system = _quantum_system(size, rng)
+    graph = TransitionGraph(system.quantum_states, rules=default_transition_rules())
+    start, target = "state_0", f"state_{size - 1}"
+
+    def run():
+        # Drop cached paths so every repeat searches
+        graph.invalidate()
+        return graph.find_path(start, target)
+    return run
+
+
+def _quantum_measurement(size: int, rng: random.Random):
+    from trm_api.quantum.quantum_runtime import measure_systems
+    system = _quantum_system(size, rng)
+    return lambda: measure_systems({system.system_id: system})
+
+
+def _pattern_recognizer(size: int, rng: random.Random):
+    from trm_api.learning.learning_types import ExperienceType, LearningExperience
+    from trm_api.learning.pattern_recognizer import PatternRecognizer
+    types = list(ExperienceType)[:8]
+    start = datetime(2025, 1, 1)
+    experiences = [
+        LearningExperience(
+            experience_type=rng.choice(types),
+            agent_id="benchmark_agent",
+            context={"team": rng.choice(["a", "b", "c"]), "complexity": rng.choice(["low", "high"])},
+            action_taken={"strategy": rng.choice(["direct", "delegate", "escalate"])},
+            outcome={"result": rng.choice(["ok", "partial", "failed"])},
+            success=rng.random() < 0.7,
+            performance_before={"efficiency": rng.random()},
+            performance_after={"efficiency": rng.random()},
+            timestamp=start + timedelta(minutes=i * 7),
+            duration_seconds=rng.random() * 60,
+            confidence_level=rng.random()
+        )
+        for i in range(size)
+    ]
+
+    def run():
+        # Fresh recognizer so stored patterns do not accumulate across repeats
+        return PatternRecognizer("benchmark_agent").analyze_experiences(experiences)
+    return run
+
+
+def _conversation_processor(size: int, rng: random.Random):
+    from trm_api.v2.conversation.nlp_processor import ConversationProcessor
+    processor = ConversationProcessor()
+    message = "Tạo tension mới: " + synthetic_text(size, rng)
+    return lambda: processor.parse_natural_language_query(message)
+
+
+def _temporal_reasoning(size: int, rng: random.Random):
+    from trm_api.v3.temporal.temporal_reasoning_engine import (
+        TemporalDataPoint, TemporalReasoningEngine, TemporalSeries
+    )
+    start = datetime(2025, 1, 1)
+    points = [
+        TemporalDataPoint(
+            timestamp=start + timedelta(hours=i),
+            value=math.sin(i / 24 * 2 * math.pi) * 10 + i * 0.01 + rng.gauss(0, 1),
+            metadata={},
+            source="benchmark"
+        )
+        for i in range(size)
+    ]
+    series = [TemporalSeries("bench_series", points, "throughput", timedelta(hours=1))]
+
+    def run():
+        return TemporalReasoningEngine().analyze_temporal_patterns(series)
+    return run
+
+
+BENCHMARKS: List[Benchmark] = [
+    Benchmark("reasoning.tension_analyzer.analyze_tension", "words of tension description", _tension_analyzer),
+    Benchmark("reasoning.rule_engine.evaluate_rules", "business rules", _rule_engine),
+    Benchmark("reasoning.priority_calculator.calculate_priority", "words of tension description",
+              _priority_calculator),
+    Benchmark("quantum.optimizer.genetic_algorithm", "quantum states",
+              _quantum_optimizer("_genetic_algorithm_optimization")),
+    Benchmark("quantum.optimizer.simulated_annealing", "quantum states",
+              _quantum_optimizer("_simulated_annealing_optimization")),
+    Benchmark("quantum.optimizer.quantum_annealing", "quantum states",
+              _quantum_optimizer("_quantum_annealing_simulation")),
+    Benchmark("quantum.transition_graph.find_path", "quantum states", _transition_path),
+    Benchmark("quantum.runtime.measure_systems", "quantum states", _quantum_measurement),
+    Benchmark("learning.pattern_recognizer.analyze_experiences", "learning experiences", _pattern_recognizer),
+    Benchmark("nlp.conversation_processor.parse_natural_language_query", "words of message",
+              _conversation_processor),
+    Benchmark("temporal.temporal_reasoning_engine.analyze_temporal_patterns", "time-series points",
+              _temporal_reasoning),
+]
+
+
+# --- Runner ---
+
+def fit_exponent(sizes: List[int], seconds: List[float]) -> Optional[float]:
+    """Least-squares slope of log(seconds) over log(size)"""
+    pairs = [(math.log(s), math.log(t)) for s, t in zip(sizes, seconds) if s > 0 and t > 0]
+    if len(pairs) < 2:
+        return None
+    mean_x = sum(x for x, _ in pairs) / len(pairs)
+    mean_y = sum(y for _, y in pairs) / len(pairs)
+    denominator = sum((x - mean_x) ** 2 for x, _ in pairs)
+    if denominator == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in pairs) / denominator
+
+
+class EngineBenchmarkRunner:
+    """Times benchmarks across sizes with a per-run time budget"""
+
+    def __init__(self, sizes: Optional[List[int]] = None, seed: int = 42, min_time: float = 0.2,
+                 max_repeats: int = 5, budget_seconds: float = 30.0, super_linear_threshold: float = 1.15):
+        self.sizes = sorted(sizes or DEFAULT_SIZES)
+        self.seed = seed
+        self.min_time = min_time
+        self.max_repeats = max(1, max_repeats)
+        self.budget_seconds = budget_seconds
+        self.super_linear_threshold = super_linear_threshold
+        self.loop = asyncio.new_event_loop()
+
+    def close(self) -> None:
+        self.loop.close()
+
+    def _call(self, fn: Callable[[], Any]) -> None:
+        result = fn()
+        if inspect.isawaitable(result):
+            self.loop.run_until_complete(result)
+
+    def time_call(self, fn: Callable[[], Any]) -> float:
+        """Best wall time of up to `max_repeats` runs (stops once `min_time` has been spent)"""
+        best = float("inf")
+        spent = 0.0
+        for _ in range(self.max_repeats):
+            start = time.perf_counter()
+            self._call(fn)
+            elapsed = time.perf_counter() - start
+            best = min(best, elapsed)
+            spent += elapsed
+            if spent >= self.min_time or elapsed > self.budget_seconds:
+                break
+        return best
+
+    def run_benchmark(self, benchmark: Benchmark) -> BenchmarkResult:
+        result = BenchmarkResult(name=benchmark.name, description=benchmark.description)
+        measured_sizes: List[int] = []
+        for size in self.sizes:
+            try:
+                fn = benchmark.setup(size, random.Random(f"{self.seed}:{benchmark.name}:{size}"))
+                seconds = self.time_call(fn)
+            except ImportError as e:
+                result.unavailable = f"{type(e).__name__}: {e}"
+                return result
+            except Exception as e:
+                result.unavailable = f"{type(e).__name__} at size {size}: {e}"
+                return result
+
+            result.seconds[str(size)] = seconds
+            result.per_item_us[str(size)] = seconds / size * 1e6
+            measured_sizes.append(size)
+            if seconds > self.budget_seconds:
+                # Larger inputs would blow the budget; the exponent still shows the trend
+                logger.warning(f"{benchmark.name}: {seconds:.1f}s at size {size}, skipping larger sizes")
+                result.skipped_sizes = [s for s in self.sizes if s > size]
+                break
+
+        times = [result.seconds[str(s)] for s in measured_sizes]
+        result.exponent = fit_exponent(measured_sizes, times)
+        for (a, ta), (b, tb) in zip(zip(measured_sizes, times), zip(measured_sizes[1:], times[1:])):
+            segment = fit_exponent([a, b], [ta, tb])
+            if segment is not None:
+                result.segment_exponents[f"{a}->{b}"] = segment
+        # Fixed overhead flattens the overall slope, so the largest segment is checked as well
+        largest_segment = list(result.segment_exponents.values())[-1:]
+        result.super_linear = any(
+            e is not None and e > self.super_linear_threshold for e in [result.exponent] + largest_segment
+        )
+        return result
+
+    def run(self, benchmarks: List[Benchmark]) -> Dict[str, Any]:
+        results = {}
+        with stub_commercial_ai() as stub:
+            for benchmark in benchmarks:
+                result = self.run_benchmark(benchmark)
+                results[benchmark.name] = result
+                if result.unavailable:
+                    logger.warning(f"{benchmark.name}: unavailable ({result.unavailable})")
+                else:
+                    flag = " SUPER-LINEAR" if result.super_linear else ""
+                    exponent = f"{result.exponent:.2f}" if result.exponent is not None else "n/a"
+                    logger.info(f"{benchmark.name}: exponent={exponent}{flag}")
+        return {
+            "meta": {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "sizes": self.sizes,
+                "seed": self.seed,
+                "super_linear_threshold": self.super_linear_threshold,
+                "stubbed_ai_calls": stub.calls
+            },
+            "results": {name: asdict(result) for name, result in results.items()}
+        }
+
+
+def compare_to_baseline(report: Dict[str, Any], baseline: Dict[str, Any],
+                        tolerance: float = 0.25, exponent_tolerance: float = 0.1) -> List[str]:
+    """
+    Regressions of `report` against `baseline`
+
+    Per-size times may grow by `tolerance` (a fraction) and the scaling exponent
+    by `exponent_tolerance`; a benchmark that becomes super-linear is a regression.
+    """
+    regressions = []
+    for name, base in baseline.get("results", {}).items():
+        if base.get("unavailable"):
+            continue
+        current = report.get("results", {}).get(name)
+        if current is None or current.get("unavailable"):
+            regressions.append(f"{name}: not measured ({(current or {}).get('unavailable', 'missing')})")
+            continue
+
+        for size, base_seconds in base.get("seconds", {}).items():
+            seconds = current.get("seconds", {}).get(size)
+            if seconds is None:
+                continue
+            limit = base_seconds * (1 + tolerance)
+            if seconds > limit:
+                regressions.append(
+                    f"{name}: size {size} took {seconds * 1000:.2f}ms > {limit * 1000:.2f}ms "
+                    f"(baseline {base_seconds * 1000:.2f}ms)"
+                )
+
+        if base.get("exponent") is not None and current.get("exponent") is not None:
+            if current["exponent"] > base["exponent"] + exponent_tolerance:
+                regressions.append(
+                    f"{name}: scaling exponent {current['exponent']:.2f} > baseline {base['exponent']:.2f}"
+                )
+        if current.get("super_linear") and not base.get("super_linear"):
+            regressions.append(f"{name}: became super-linear")
+    return regressions
+
+
+def select_benchmarks(patterns: Optional[List[str]]) -> List[Benchmark]:
+    if not patterns:
+        return list(BENCHMARKS)
+    return [b for b in BENCHMARKS if any(fnmatch.fnmatch(b.name, p) for p in patterns)]
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    sizes = report["meta"]["sizes"]
+    header = f"{'benchmark':62} " + " ".join(f"{f'n={s}':>12}" for s in sizes) + f" {'exponent':>9}"
+    print(header)
+    print("-" * len(header))
+    for name, result in report["results"].items():
+        if result["unavailable"]:
+            print(f"{name:62} unavailable: {result['unavailable']}")
+            continue
+        cells = []
+        for size in sizes:
+            seconds = result["seconds"].get(str(size))
+            cells.append(f"{seconds * 1000:10.2f}ms" if seconds is not None else f"{'skipped':>12}")
+        exponent = f"{result['exponent']:9.2f}" if result["exponent"] is not None else f"{'n/a':>9}"
+        flag = "  <-- SUPER-LINEAR" if result["super_linear"] else ""
+        print(f"{name:62} " + " ".join(cells) + f" {exponent}{flag}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Microbenchmarks for TRM-OS CPU-bound engines")
+    parser.add_argument("--benchmarks", nargs="+", metavar="PATTERN",
+                        help="Benchmark names or glob patterns (e.g. 'quantum.*'); default: all")
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES, help="Input sizes")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for synthetic inputs")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds spent per size")
+    parser.add_argument("--max-repeats", type=int, default=5, help="Maximum repeats per size (best is kept)")
+    parser.add_argument("--budget", type=float, default=30.0,
+                        help="Seconds per run after which larger sizes are skipped")
+    parser.add_argument("--super-linear-threshold", type=float, default=1.15,
+                        help="Scaling exponent above which a benchmark is flagged")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--save-baseline", metavar="FILE", help="Write the JSON report as the new baseline")
+    parser.add_argument("--baseline", metavar="FILE", help="Compare against this baseline; regressions exit 1")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative slowdown per size")
+    parser.add_argument("--fail-on-super-linear", action="store_true",
+                        help="Exit 1 if any benchmark is flagged super-linear")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    # Engine INFO logs would dominate the timings of the small sizes
+    logging.getLogger("trm_api").setLevel(logging.WARNING)
+    args = parse_args(argv)
+    runner = EngineBenchmarkRunner(
+        sizes=args.sizes,
+        seed=args.seed,
+        min_time=args.min_time,
+        max_repeats=args.max_repeats,
+        budget_seconds=args.budget,
+        super_linear_threshold=args.super_linear_threshold
+    )
+    try:
+        report = runner.run(select_benchmarks(args.benchmarks))
+    finally:
+        runner.close()
+    print_report(report)
+
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Report written to {path}")
+
+    exit_code = 0
+    super_linear = [name for name, result in report["results"].items() if result["super_linear"]]
+    if super_linear:
+        print(f"\nSuper-linear scaling: {', '.join(super_linear)}")
+        if args.fail_on_super_linear:
+            exit_code = 1
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(report, baseline, args.tolerance)
+        if regressions:
+            print(f"\nPERFORMANCE REGRESSIONS vs {args.baseline}:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            exit_code = 1
+        else:
+            print(f"\nNo regressions vs {args.baseline} (tolerance {args.tolerance:.0%})")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
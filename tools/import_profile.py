@@ -0,0 +1,139 @@
+"""
+Import-time profile for the API process (python -X importtime, summarised)
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter and
+reports the slowest modules by cumulative and self time, plus the top-level
+packages that account for most of the cold start.
+
+Usage:
+    python tools/import_profile.py                        # profiles trm_api.main
+    python tools/import_profile.py --lazy                 # with LAZY_ROUTER_LOADING=true
+    python tools/import_profile.py trm_api.v2.api --top 30 --json profile.json
+    python tools/import_profile.py --max-seconds 1.5      # exit 1 if the import is slower
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+# Đường dẫn tuyệt đối đến thư mục gốc của project
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclass
+class ImportRecord:
+    """One line of -X importtime output (times in microseconds)"""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int  # Nesting level: 0 = imported directly by the profiled statement
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """Parse `import time: self [us] | cumulative | imported package` lines"""
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # Header line
+        name = parts[2].rstrip()
+        stripped = name.lstrip(" ")
+        records.append(ImportRecord(
+            module=stripped,
+            self_us=int(parts[0]),
+            cumulative_us=int(parts[1]),
+            depth=(len(name) - len(stripped) - 1) // 2
+        ))
+    return records
+
+
+def package_totals(records: List[ImportRecord]) -> Dict[str, int]:
+    """Self time summed per top-level package"""
+    totals: Dict[str, int] = {}
+    for record in records:
+        package = record.module.split(".")[0]
+        totals[package] = totals.get(package, 0) + record.self_us
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def profile_import(module: str, env: Optional[Dict[str, str]] = None, python: str = sys.executable) -> List[ImportRecord]:
+    """Import `module` in a fresh interpreter and return its import-time records"""
+    process_env = dict(os.environ)
+    process_env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT_DIR, process_env.get("PYTHONPATH")]))
+    process_env.update(env or {})
+    result = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT_DIR, env=process_env, capture_output=True, text=True
+    )
+    records = parse_importtime(result.stderr)
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError(f"import {module} failed:\n" + "\n".join(errors[-15:]))
+    return records
+
+
+def build_report(module: str, records: List[ImportRecord], top: int = 20) -> Dict:
+    root = next((r for r in records if r.module == module), None)
+    total_us = root.cumulative_us if root else sum(r.self_us for r in records)
+    return {
+        "module": module,
+        "total_seconds": total_us / 1e6,
+        "modules_imported": len(records),
+        "slowest_cumulative": [asdict(r) for r in sorted(records, key=lambda r: r.cumulative_us, reverse=True)[:top]],
+        "slowest_self": [asdict(r) for r in sorted(records, key=lambda r: r.self_us, reverse=True)[:top]],
+        "packages": [{"package": name, "self_us": us} for name, us in list(package_totals(records).items())[:top]],
+    }
+
+
+def print_report(report: Dict) -> None:
+    print(f"import {report['module']}: {report['total_seconds']:.3f}s, {report['modules_imported']} modules")
+    print("\nSlowest by cumulative time:")
+    for r in report["slowest_cumulative"]:
+        print(f"  {r['cumulative_us'] / 1000:9.1f} ms  {'  ' * r['depth']}{r['module']}")
+    print("\nSlowest by self time:")
+    for r in report["slowest_self"]:
+        print(f"  {r['self_us'] / 1000:9.1f} ms  {r['module']}")
+    print("\nSelf time per top-level package:")
+    for p in report["packages"]:
+        print(f"  {p['self_us'] / 1000:9.1f} ms  {p['package']}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Import-time profile (-X importtime) for TRM-OS modules")
+    parser.add_argument("module", nargs="?", default="trm_api.main", help="Module to import (default: trm_api.main)")
+    parser.add_argument("--lazy", action="store_true", help="Profile with LAZY_ROUTER_LOADING=true")
+    parser.add_argument("--top", type=int, default=20, help="Number of entries per section")
+    parser.add_argument("--json", metavar="FILE", help="Also write the report as JSON")
+    parser.add_argument("--max-seconds", type=float, help="Exit 1 if the import takes longer than this")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    env = {"LAZY_ROUTER_LOADING": "true"} if args.lazy else {}
+    try:
+        records = profile_import(args.module, env)
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    report = build_report(args.module, records, args.top)
+    print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.max_seconds is not None and report["total_seconds"] > args.max_seconds:
+        print(f"\nImport of {args.module} took {report['total_seconds']:.3f}s > {args.max_seconds}s", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
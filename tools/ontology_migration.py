@@ -4,7 +4,9 @@ import logging
 import json
 import argparse
 import datetime
-from typing import Dict, Any, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from neo4j import GraphDatabase
 
 # Thêm thư mục gốc của project vào sys.path để có thể import các module
@@ -33,12 +35,80 @@ logging.basicConfig(
 
 logger = logging.getLogger("ontology_migration")
 
+
+class MigrationCheckpoint:
+    """
+    File checkpoint để tiếp tục migration bị gián đoạn.
+    
+    Lưu id(n) cuối cùng đã migrate cho từng label và từng worker stripe.
+    Nếu số worker thay đổi giữa các lần chạy, migration tiếp tục từ vị trí
+    nhỏ nhất (an toàn vì node đã chuẩn hóa sẽ không có thay đổi nào).
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self.state: Dict[str, Any] = {"labels": {}}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.state = json.load(f)
+    
+    def position(self, label: str, stripe: int, stripes: int) -> int:
+        """id(n) cuối cùng đã migrate (-1 nếu chưa bắt đầu)."""
+        with self._lock:
+            entry = self.state["labels"].get(label)
+            if not entry or not entry["positions"]:
+                return -1
+            if entry["stripes"] == stripes:
+                return entry["positions"].get(str(stripe), -1)
+            return min(entry["positions"].values())
+    
+    def advance(self, label: str, stripe: int, stripes: int, last_id: int) -> None:
+        with self._lock:
+            entry = self.state["labels"].get(label)
+            if not entry or entry["stripes"] != stripes:
+                start = min(entry["positions"].values()) if entry and entry["positions"] else -1
+                entry = {
+                    "stripes": stripes,
+                    "positions": {str(i): start for i in range(stripes)},
+                    "completed": False
+                }
+                self.state["labels"][label] = entry
+            entry["positions"][str(stripe)] = last_id
+            self._save()
+    
+    def complete(self, label: str) -> None:
+        with self._lock:
+            entry = self.state["labels"].setdefault(label, {"stripes": 1, "positions": {}})
+            entry["completed"] = True
+            self._save()
+    
+    def is_complete(self, label: str) -> bool:
+        return self.state["labels"].get(label, {}).get("completed", False)
+    
+    def reset(self) -> None:
+        with self._lock:
+            self.state = {"labels": {}}
+            self._save()
+    
+    def _save(self) -> None:
+        # Ghi file tạm rồi thay thế để checkpoint không bị hỏng khi tiến trình bị dừng
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
 class OntologyMigrationTool:
     """Công cụ migration dữ liệu legacy trong Neo4j để đồng bộ với chuẩn ontology V3.2."""
     
-    def __init__(self, uri, username, password, database="neo4j"):
+    def __init__(self, uri, username, password, database="neo4j", workers: int = 1,
+                 checkpoint_path: Optional[str] = None):
         self.driver = GraphDatabase.driver(uri, auth=(username, password))
         self.database = database
+        self.workers = max(1, workers)
+        self.checkpoint = MigrationCheckpoint(checkpoint_path) if checkpoint_path else None
+        self._stats_lock = threading.Lock()
         self.adapters = {
             EntityType.WIN: WinAdapter(),
             EntityType.RECOGNITION: RecognitionAdapter(),
@@ -66,7 +136,10 @@ class OntologyMigrationTool:
     def close(self):
         self.driver.close()
     
-    def run_query(self, query, parameters=None):
+    def run_query(self, query, parameters=None, session=None):
+        """Chạy query; dùng lại session được truyền vào thay vì mở session mới."""
+        if session is not None:
+            return session.run(query, parameters or {}).data()
         with self.driver.session(database=self.database) as session:
             return session.run(query, parameters or {}).data()
     
@@ -78,25 +151,67 @@ class OntologyMigrationTool:
         """
         return self.run_query(query, {"node_id": node_id, "properties": properties})
     
-    def get_all_entities(self, entity_type: EntityType, limit: Optional[int] = None, skip: Optional[int] = 0):
-        """Lấy tất cả các entity theo loại từ Neo4j."""
+    def update_nodes(self, rows: List[Dict[str, Any]], session=None) -> int:
+        """
+        Cập nhật nhiều node trong một write transaction duy nhất.
+        
+        Mỗi row có dạng {"node_id": id(n), "properties": {...thay đổi...}}.
+        """
+        query = """
+        UNWIND $rows AS row
+        MATCH (n) WHERE id(n) = row.node_id
+        SET n += row.properties
+        RETURN count(n) AS updated
+        """
+        
+        def write(tx):
+            return tx.run(query, rows=rows).single()["updated"]
+        
+        if session is not None:
+            return session.execute_write(write)
+        with self.driver.session(database=self.database) as session:
+            return session.execute_write(write)
+    
+    def _label(self, entity_type) -> str:
         # Handle both string and enum entity types
         if isinstance(entity_type, str):
-            label = entity_type.capitalize()
-        else:
-            label = entity_type.value.capitalize()
+            return entity_type.capitalize()
+        return entity_type.value.capitalize()
+    
+    def get_all_entities(self, entity_type: EntityType, limit: Optional[int] = None, skip: Optional[int] = 0,
+                         after_id: Optional[int] = None, stripe: Optional[Tuple[int, int]] = None,
+                         session=None):
+        """
+        Lấy các entity theo loại từ Neo4j, sắp xếp theo id(n).
+        
+        Dùng `after_id` (keyset) thay cho `skip` để phân trang ổn định; `stripe`
+        = (worker, số worker) chỉ lấy các node có id(n) % số worker = worker.
+        """
+        label = self._label(entity_type)
+        
+        conditions = []
+        parameters: Dict[str, Any] = {}
+        if after_id is not None:
+            conditions.append("id(n) > $after_id")
+            parameters["after_id"] = after_id
+        if stripe is not None and stripe[1] > 1:
+            conditions.append("id(n) % $stripes = $stripe")
+            parameters["stripe"], parameters["stripes"] = stripe
         
-        limit_clause = f"LIMIT {limit}" if limit is not None else ""
-        skip_clause = f"SKIP {skip}" if skip > 0 else ""
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        limit_clause = f"LIMIT {int(limit)}" if limit is not None else ""
+        skip_clause = f"SKIP {int(skip)}" if skip else ""
         
         query = f"""
         MATCH (n:{label})
+        {where_clause}
         RETURN n, id(n) as node_id
+        ORDER BY node_id
         {skip_clause}
         {limit_clause}
         """
         
-        return self.run_query(query)
+        return self.run_query(query, parameters, session=session)
     
     def migrate_entity(self, entity_data: Dict[str, Any], entity_type: EntityType) -> Dict[str, Any]:
         """Áp dụng adapter để chuẩn hóa dữ liệu entity theo ontology."""
@@ -124,70 +239,112 @@ class OntologyMigrationTool:
             logger.error(f"Lỗi khi chuẩn hóa {entity_type} với uid={entity_data.get('uid')}: {str(e)}")
             return entity_data
     
+    def _record(self, entity_type_str: str, outcome: str, count: int = 1) -> None:
+        with self._stats_lock:
+            self.migration_stats[outcome] += count
+            self.migration_stats["entity_stats"][entity_type_str][outcome] += count
+    
     def process_entity_batch(self, entity_type: EntityType, dry_run: bool = True, batch_size: int = 100):
-        """Xử lý migration cho một loại entity theo batch."""
-        count = 0
-        skip = 0
+        """
+        Xử lý migration cho một loại entity theo batch.
         
+        Node được chia thành `self.workers` stripe theo id(n); mỗi stripe chạy
+        trên session riêng, phân trang keyset và ghi mỗi batch bằng một lệnh UNWIND.
+        """
         # Handle both string and enum entity types for display
         entity_type_str = entity_type if isinstance(entity_type, str) else entity_type.value
+        label = self._label(entity_type)
+        stripes = self.workers
         
-        while True:
-            entities = self.get_all_entities(entity_type, limit=batch_size, skip=skip)
-            if not entities:
-                break
-                
-            logger.info(f"Xử lý batch {skip//batch_size + 1} với {len(entities)} {entity_type_str}")
-            
-            for entity_record in entities:
-                count += 1
-                self.migration_stats["total"] += 1
-                self.migration_stats["entity_stats"][entity_type_str]["total"] += 1
-                
-                node = entity_record["n"]
-                node_id = entity_record["node_id"]
+        if stripes == 1:
+            count = self._process_stripe(entity_type, 0, 1, dry_run, batch_size)
+        else:
+            with ThreadPoolExecutor(max_workers=stripes, thread_name_prefix=f"migrate-{label}") as pool:
+                futures = [
+                    pool.submit(self._process_stripe, entity_type, stripe, stripes, dry_run, batch_size)
+                    for stripe in range(stripes)
+                ]
+                count = sum(future.result() for future in futures)
+        
+        if self.checkpoint and not dry_run:
+            self.checkpoint.complete(label)
+        
+        logger.info(f"Đã xử lý tổng cộng {count} {entity_type_str}")
+        return count
+    
+    def _process_stripe(self, entity_type: EntityType, stripe: int, stripes: int,
+                        dry_run: bool, batch_size: int) -> int:
+        """Migration một stripe của một label, tiếp tục từ checkpoint nếu có."""
+        entity_type_str = entity_type if isinstance(entity_type, str) else entity_type.value
+        label = self._label(entity_type)
+        last_id = self.checkpoint.position(label, stripe, stripes) if self.checkpoint else -1
+        count = 0
+        batch_number = 0
+        
+        with self.driver.session(database=self.database) as session:
+            while True:
+                entities = self.get_all_entities(
+                    entity_type, limit=batch_size, after_id=last_id,
+                    stripe=(stripe, stripes), session=session
+                )
+                if not entities:
+                    break
                 
-                entity_data = dict(node.items())
+                batch_number += 1
+                logger.info(f"Xử lý batch {batch_number} (worker {stripe}) với {len(entities)} {entity_type_str}")
                 
-                try:
-                    # Chuẩn hóa dữ liệu theo ontology
-                    normalized_data = self.migrate_entity(entity_data, entity_type)
+                rows = []
+                for entity_record in entities:
+                    count += 1
+                    self._record(entity_type_str, "total")
                     
-                    # Kiểm tra xem data có thay đổi không
-                    changes = {}
-                    for key, value in normalized_data.items():
-                        if key in entity_data and entity_data[key] != value:
-                            changes[key] = value
+                    node = entity_record["n"]
+                    entity_data = dict(node.items())
                     
-                    if changes:
-                        logger.info(f"Các thay đổi cho {entity_type_str} (uid={entity_data.get('uid')}): {json.dumps(changes)}")
+                    try:
+                        # Chuẩn hóa dữ liệu theo ontology
+                        normalized_data = self.migrate_entity(entity_data, entity_type)
                         
-                        if not dry_run:
-                            # Cập nhật vào Neo4j
-                            self.update_node(node_id, changes)
-                            logger.info(f"Đã cập nhật {entity_type_str} với uid={entity_data.get('uid')}")
-                            self.migration_stats["success"] += 1
-                            self.migration_stats["entity_stats"][entity_type_str]["success"] += 1
+                        # Kiểm tra xem data có thay đổi không
+                        changes = {
+                            key: value for key, value in normalized_data.items()
+                            if key in entity_data and entity_data[key] != value
+                        }
+                        
+                        if changes:
+                            logger.info(f"Các thay đổi cho {entity_type_str} (uid={entity_data.get('uid')}): {json.dumps(changes, default=str)}")
+                            if dry_run:
+                                logger.info(f"[DRY RUN] Sẽ cập nhật {entity_type_str} với uid={entity_data.get('uid')}")
+                                self._record(entity_type_str, "skipped")
+                            else:
+                                rows.append({"node_id": entity_record["node_id"], "properties": changes})
                         else:
-                            logger.info(f"[DRY RUN] Sẽ cập nhật {entity_type_str} với uid={entity_data.get('uid')}")
-                            self.migration_stats["skipped"] += 1
-                            self.migration_stats["entity_stats"][entity_type_str]["skipped"] += 1
-                    else:
-                        logger.debug(f"Không có thay đổi cho {entity_type_str} với uid={entity_data.get('uid')}")
-                        self.migration_stats["skipped"] += 1
-                        self.migration_stats["entity_stats"][entity_type_str]["skipped"] += 1
+                            logger.debug(f"Không có thay đổi cho {entity_type_str} với uid={entity_data.get('uid')}")
+                            self._record(entity_type_str, "skipped")
+                    
+                    except Exception as e:
+                        logger.error(f"Lỗi khi xử lý {entity_type_str} với uid={entity_data.get('uid')}: {str(e)}")
+                        self._record(entity_type_str, "failed")
                 
-                except Exception as e:
-                    logger.error(f"Lỗi khi xử lý {entity_type_str} với uid={entity_data.get('uid')}: {str(e)}")
-                    self.migration_stats["failed"] += 1
-                    self.migration_stats["entity_stats"][entity_type_str]["failed"] += 1
-            
-            skip += batch_size
-            
-            if len(entities) < batch_size:
-                break
+                if rows:
+                    try:
+                        # Cập nhật toàn bộ batch vào Neo4j trong một transaction
+                        self.update_nodes(rows, session=session)
+                        logger.info(f"Đã cập nhật {len(rows)} {entity_type_str}")
+                        self._record(entity_type_str, "success", len(rows))
+                    except Exception as e:
+                        # Dừng stripe mà không tiến checkpoint để lần chạy lại ghi lại batch này
+                        logger.error(f"Lỗi khi cập nhật batch {entity_type_str} (worker {stripe}) sau id {last_id}: {str(e)}")
+                        self._record(entity_type_str, "failed", len(rows))
+                        raise
+                
+                last_id = entities[-1]["node_id"]
+                if self.checkpoint and not dry_run:
+                    self.checkpoint.advance(label, stripe, stripes, last_id)
+                
+                if len(entities) < batch_size:
+                    break
         
-        logger.info(f"Đã xử lý tổng cộng {count} {entity_type_str}")
         return count
     
     def run_migration(self, entity_types=None, dry_run=True, batch_size=100):
@@ -204,6 +361,10 @@ class OntologyMigrationTool:
             # Handle both string and enum entity types for display
             entity_type_str = entity_type if isinstance(entity_type, str) else entity_type.value
             
+            if self.checkpoint and not dry_run and self.checkpoint.is_complete(self._label(entity_type)):
+                logger.info(f"Bỏ qua {entity_type_str}: đã hoàn thành theo checkpoint {self.checkpoint.path}")
+                continue
+            
             logger.info(f"Bắt đầu migration cho {entity_type_str}")
             count = self.process_entity_batch(entity_type, dry_run, batch_size)
             total_count += count
@@ -227,6 +388,9 @@ def parse_args():
                       help='Specific entity types to migrate')
     parser.add_argument('--batch-size', type=int, default=100, help='Batch size for processing')
     parser.add_argument('--dry-run', action='store_true', help='Run in dry-run mode without making changes')
+    parser.add_argument('--workers', type=int, default=1, help='Parallel worker sessions per entity type')
+    parser.add_argument('--checkpoint', help='Checkpoint file used to resume an interrupted migration')
+    parser.add_argument('--restart', action='store_true', help='Ignore and reset the checkpoint file')
     return parser.parse_args()
 
 
@@ -246,8 +410,12 @@ if __name__ == "__main__":
         uri=args.uri,
         username=args.user,
         password=args.password,
-        database=args.database
+        database=args.database,
+        workers=args.workers,
+        checkpoint_path=args.checkpoint
     )
+    if args.restart and migration_tool.checkpoint:
+        migration_tool.checkpoint.reset()
     
     try:
         migration_tool.run_migration(
@@ -280,17 +280,18 @@ async def apply_solution_handler(agent, tension_id: str, solution: Dict[str, Any
     agent.logger.info(f"Applying solution to tension {tension_id}")
     
     # Cập nhật trạng thái tension với giải pháp
+    resolved_status = "resolved"
     await agent.tension_repository.update_tension(
         tension_id,
         {
             "resolution": solution.get("description", ""),
             "resolution_steps": solution.get("steps", []),
-            "status": "resolved",
+            "status": resolved_status,
             "resolved_at": datetime.now()
         }
     )
     
-    # Tạo sự kiện WIN nếu giải pháp thành công
+    # Thông báo WIN cho tension; chưa có WIN node nên analytics không đếm sự kiện này
     await agent.send_event(
         event_type=EventType.WIN_CREATED,
         entity_id=tension_id,
@@ -308,6 +309,7 @@ async def apply_solution_handler(agent, tension_id: str, solution: Dict[str, Any
         entity_id=tension_id,
         entity_type="tension",
         data={
+            "status": resolved_status,
             "resolution": solution.get("description", ""),
             "resolved_by": agent.agent_id
         }
@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from typing import Any, List
+from typing import Any, Dict, List
 
 from trm_api.models.tension import Tension, TensionCreate, TensionUpdate
 from trm_api.models.relationships import Relationship
 from trm_api.repositories.tension_repository import TensionRepository
+from trm_api.services.tension_service import TensionService
 
 router = APIRouter()
 
@@ -41,6 +42,16 @@ def create_tension(
         )
     return created_tension
 
+@router.get("/analytics", response_model=Dict[str, Any])
+async def get_tension_analytics(
+    *,
+    repo: TensionRepository = Depends(get_tension_repo)
+) -> Any:
+    """
+    Get tension status, priority and type distributions.
+    """
+    return await TensionService(repo).get_tension_analytics()
+
 @router.get("/{tension_id}", response_model=Tension)
 def get_tension(
     *, 
@@ -57,6 +57,24 @@ async def create_win(
             detail=f"AGE: WIN creation failed: {str(e)}"
         )
 
+@router.get("/analytics", response_model=Dict[str, Any])
+async def get_win_analytics(
+    service: WinService = Depends(lambda: win_service)
+):
+    """
+    WIN Analytics - AGE Strategic Outcome Distributions
+    
+    Served from incrementally maintained counters (no full WIN scan).
+    """
+    try:
+        return service.get_win_analytics()
+    except Exception as e:
+        logging.error(f"AGE: Error computing WIN analytics: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"AGE: WIN analytics failed: {str(e)}"
+        )
+
 @router.get("/{win_id}")
 async def get_win(
     win_id: str,
@@ -19,10 +19,9 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional, Union, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
-import openai
-from openai import AsyncOpenAI
-import anthropic
-import google.generativeai as genai
+
+# Provider SDKs (openai, anthropic, google.generativeai) take seconds to import;
+# they are imported when a client is first created, not at application startup.
 
 from trm_api.core.logging_config import get_logger
 
@@ -163,6 +162,7 @@ class CommercialAICoordinator:
             # Initialize OpenAI
             openai_key = os.getenv("OPENAI_API_KEY")
             if openai_key:
+                from openai import AsyncOpenAI
                 self.openai_client = AsyncOpenAI(api_key=openai_key)
                 self.logger.info("OpenAI client initialized")
             else:
@@ -171,6 +171,7 @@ class CommercialAICoordinator:
             # Initialize Anthropic
             anthropic_key = os.getenv("ANTHROPIC_API_KEY")
             if anthropic_key:
+                import anthropic
                 self.anthropic_client = anthropic.AsyncAnthropic(api_key=anthropic_key)
                 self.logger.info("Anthropic client initialized")
             else:
@@ -179,6 +180,7 @@ class CommercialAICoordinator:
             # Initialize Google
             google_key = os.getenv("GOOGLE_API_KEY")
             if google_key:
+                import google.generativeai as genai
                 genai.configure(api_key=google_key)
                 self.google_client = genai.GenerativeModel('gemini-1.5-pro')
                 self.logger.info("Google AI client initialized")
@@ -396,6 +398,8 @@ class CommercialAICoordinator:
         if request.context:
             full_content = f"Context: {request.context}\n\nRequest: {request.content}"
         
+        import google.generativeai as genai
+        
         response = self.google_client.generate_content(
             full_content,
             generation_config=genai.types.GenerationConfig(
@@ -42,6 +42,13 @@ class Settings(BaseSettings):
     # Redis Connection - Made optional for deployment flexibility
     REDIS_URL: Optional[str] = "redis://localhost:6379"
     
+    # Realtime WebSocket backplane across workers: None (single worker), "memory" or a redis:// URL
+    REALTIME_BACKPLANE_URL: Optional[str] = None
+    
+    # Shared state for process-local singletons (sessions, event history, metrics, limits)
+    # across uvicorn workers: None/"memory" (single worker), a redis:// URL or sqlite:///path.db
+    STATE_BACKEND_URL: Optional[str] = None
+    
     # === COMMERCIAL AI CONFIGURATION ===
     
     # OpenAI GPT-4o Integration
@@ -80,6 +87,15 @@ class Settings(BaseSettings):
     SUCCESS_PATTERN_RETENTION: int = 1000  # Number of success patterns to retain
     FAILURE_MITIGATION_RETENTION: int = 500  # Number of failure patterns to retain
     
+    # Shared learning runtime: one scheduler and a bounded pool run every agent's learning cycles
+    LEARNING_RUNTIME_WORKERS: int = 4  # Concurrent learning cycles per process
+    LEARNING_RUNTIME_MAX_PENDING: Optional[int] = None  # Defer triggers beyond this many queued cycles
+    LEARNING_MINING_USE_PROCESSES: bool = False  # Mine patterns in a process pool
+    
+    # SQLite file persisting the reasoning engines' shared knowledge store across restarts
+    # (None keeps knowledge in memory only)
+    KNOWLEDGE_STORE_PATH: Optional[str] = None
+    
     # === ENTERPRISE INTEGRATION ===
     
     # CODA.io Enterprise Management
@@ -90,13 +106,32 @@ class Settings(BaseSettings):
     RAILWAY_PROJECT_ID: Optional[str] = None
     DEPLOYMENT_ENVIRONMENT: str = "production"
     
+    # Cold start: import API routers on the first request under their prefix (and
+    # warm them up in the background once serving) instead of at import time
+    LAZY_ROUTER_LOADING: bool = False
+    ROUTER_WARMUP_ON_STARTUP: bool = True
+    DB_STARTUP_TIMEOUT: float = 10.0  # Seconds for the Neo4j connectivity check during startup
+    
     # === SECURITY & COMPLIANCE ===
     
     # Security Settings
     SECRET_KEY: str = secrets.token_urlsafe(32)
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
-    
+
+    # Password hashing runs off the event loop in a bounded pool; hashes with another
+    # scheme or cost are upgraded on the next successful login
+    PASSWORD_HASH_SCHEME: str = "bcrypt"  # "bcrypt" or "argon2" (needs argon2-cffi)
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 4  # Concurrent hash/verify operations per process
+    PASSWORD_HASH_MAX_QUEUE: Optional[int] = None  # Reject new operations beyond this many waiting
+    PASSWORD_HASH_USE_PROCESSES: bool = False
+
+    # Request hygiene: bodies over the limit are rejected while streaming (413);
+    # sanitization strips markup characters from JSON/text bodies
+    REQUEST_MAX_BODY_BYTES: int = 10 * 1024 * 1024
+    REQUEST_SANITIZATION_ENABLED: bool = False
+
     # Enterprise Security
     ZERO_TRUST_ENABLED: bool = True
     AUDIT_TRAIL_ENABLED: bool = True
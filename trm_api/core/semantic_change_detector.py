@@ -26,10 +26,6 @@ from trm_api.core.logging_config import get_logger
 from trm_api.core.living_knowledge_core import ContentChangeType, ContentSnapshot
 from trm_api.eventbus.system_event_bus import SystemEventBus, SystemEvent, EventType
 
-# Real Commercial AI imports
-import openai
-from openai import AsyncOpenAI
-
 logger = get_logger(__name__)
 
 
@@ -99,7 +95,8 @@ class VectorEmbeddingAnalyzer:
     def __init__(self):
         self.logger = get_logger("vector_embedding_analyzer")
         
-        # Initialize OpenAI client với API key từ environment
+        # Initialize OpenAI client với API key từ environment (SDK imported on first use)
+        from openai import AsyncOpenAI
         self.openai_client = AsyncOpenAI(
             api_key=os.getenv("OPENAI_API_KEY")
         )
@@ -0,0 +1,330 @@
+"""
+TRM-OS State Backend
+====================
+
+Storage for state that process-local singletons (event bus history, conversation
+sessions, access audit, request metrics, rate limits, MCP counters) must share
+when uvicorn runs with several workers.
+
+- InMemoryStateBackend: default; state stays in the process (single worker)
+- RedisStateBackend: any server speaking the Redis protocol (multi-host)
+- SQLiteStateBackend: one SQLite file in WAL mode (several workers, one host)
+
+Values are stored as JSON. Select the backend with STATE_BACKEND_URL:
+unset or "memory", "redis://host:6379/0", or "sqlite:///path/to/state.db".
+"""
+
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class StateBackend(ABC):
+    """Key/value, counter and bounded-list storage shared by the workers using it"""
+
+    # True when other processes see the same state; singletons only write through when set
+    shared: bool = False
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    async def incr(self, key: str, amount: float = 1, ttl: Optional[float] = None) -> float:
+        """Atomically add `amount`; `ttl` (seconds) is applied when the counter is created"""
+
+    @abstractmethod
+    async def append(self, key: str, value: Any, max_length: Optional[int] = None) -> None:
+        """Append to a list, keeping only the newest `max_length` items"""
+
+    @abstractmethod
+    async def get_list(self, key: str, limit: Optional[int] = None) -> List[Any]:
+        """List items oldest first; `limit` returns only the newest items"""
+
+    async def close(self) -> None:
+        pass
+
+
+class InMemoryStateBackend(StateBackend):
+    """Process-local state (the default, for a single worker)"""
+
+    def __init__(self):
+        self._values: Dict[str, Tuple[Any, Optional[float]]] = {}
+        self._lists: Dict[str, Deque[Any]] = {}
+
+    def _live(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        entry = self._values.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+            del self._values[key]
+            return None
+        return entry
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._live(key)
+        return json.loads(entry[0]) if entry else None
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._values[key] = (json.dumps(value), expires_at)
+
+    async def delete(self, key: str) -> None:
+        self._values.pop(key, None)
+        self._lists.pop(key, None)
+
+    async def incr(self, key: str, amount: float = 1, ttl: Optional[float] = None) -> float:
+        entry = self._live(key)
+        if entry is None:
+            value, expires_at = amount, (time.monotonic() + ttl if ttl else None)
+        else:
+            value, expires_at = json.loads(entry[0]) + amount, entry[1]
+        self._values[key] = (json.dumps(value), expires_at)
+        return value
+
+    async def append(self, key: str, value: Any, max_length: Optional[int] = None) -> None:
+        items = self._lists.get(key)
+        if items is None or items.maxlen != max_length:
+            items = self._lists[key] = deque(items or (), maxlen=max_length)
+        items.append(json.dumps(value))
+
+    async def get_list(self, key: str, limit: Optional[int] = None) -> List[Any]:
+        items = list(self._lists.get(key, ()))
+        if limit is not None:
+            items = items[-limit:] if limit > 0 else []
+        return [json.loads(item) for item in items]
+
+
+class RedisStateBackend(StateBackend):
+    """State in Redis (or any server speaking the Redis protocol), shared across hosts"""
+
+    shared = True
+
+    def __init__(self, redis_url: str = "redis://localhost:6379", key_prefix: str = "trm:state:"):
+        self.redis_url = redis_url
+        self.key_prefix = key_prefix
+        self._redis = None
+
+    async def _client(self):
+        if self._redis is None:
+            import redis.asyncio as redis
+            self._redis = redis.from_url(self.redis_url, decode_responses=True)
+        return self._redis
+
+    async def get(self, key: str) -> Optional[Any]:
+        client = await self._client()
+        raw = await client.get(self.key_prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        client = await self._client()
+        await client.set(self.key_prefix + key, json.dumps(value), px=int(ttl * 1000) if ttl else None)
+
+    async def delete(self, key: str) -> None:
+        client = await self._client()
+        await client.delete(self.key_prefix + key)
+
+    async def incr(self, key: str, amount: float = 1, ttl: Optional[float] = None) -> float:
+        client = await self._client()
+        value = float(await client.incrbyfloat(self.key_prefix + key, amount))
+        if ttl and value == amount:
+            # First increment created the key
+            await client.pexpire(self.key_prefix + key, int(ttl * 1000))
+        return value
+
+    async def append(self, key: str, value: Any, max_length: Optional[int] = None) -> None:
+        client = await self._client()
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.rpush(self.key_prefix + key, json.dumps(value))
+            if max_length:
+                pipe.ltrim(self.key_prefix + key, -max_length, -1)
+            await pipe.execute()
+
+    async def get_list(self, key: str, limit: Optional[int] = None) -> List[Any]:
+        if limit is not None and limit <= 0:
+            return []
+        client = await self._client()
+        items = await client.lrange(self.key_prefix + key, -limit if limit else 0, -1)
+        return [json.loads(item) for item in items]
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+
+class SQLiteStateBackend(StateBackend):
+    """State in one SQLite file, shared by the workers of a single host"""
+
+    shared = True
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS state_values (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS state_lists (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "key TEXT NOT NULL, value TEXT NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS state_lists_key ON state_lists (key, id)")
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread; statements run in the default executor
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    async def _run(self, fn, *args):
+        return await asyncio.to_thread(fn, *args)
+
+    def _get(self, key: str) -> Optional[Any]:
+        row = self._connection().execute(
+            "SELECT value FROM state_values WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (key, time.time())
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _set(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        self._connection().execute(
+            "INSERT OR REPLACE INTO state_values (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, json.dumps(value), time.time() + ttl if ttl else None)
+        )
+
+    def _delete(self, key: str) -> None:
+        conn = self._connection()
+        conn.execute("DELETE FROM state_values WHERE key = ?", (key,))
+        conn.execute("DELETE FROM state_lists WHERE key = ?", (key,))
+
+    def _incr(self, key: str, amount: float, ttl: Optional[float]) -> float:
+        conn = self._connection()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT value, expires_at FROM state_values WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, now)
+            ).fetchone()
+            if row is None:
+                value, expires_at = amount, (now + ttl if ttl else None)
+            else:
+                value, expires_at = json.loads(row[0]) + amount, row[1]
+            conn.execute(
+                "INSERT OR REPLACE INTO state_values (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), expires_at)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return value
+
+    def _append(self, key: str, value: Any, max_length: Optional[int]) -> None:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("INSERT INTO state_lists (key, value) VALUES (?, ?)", (key, json.dumps(value)))
+            if max_length:
+                conn.execute(
+                    "DELETE FROM state_lists WHERE key = ? AND id <= "
+                    "(SELECT id FROM state_lists WHERE key = ? ORDER BY id DESC LIMIT 1 OFFSET ?)",
+                    (key, key, max_length)
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _get_list(self, key: str, limit: Optional[int]) -> List[Any]:
+        if limit is not None and limit <= 0:
+            return []
+        rows = self._connection().execute(
+            "SELECT value FROM (SELECT id, value FROM state_lists WHERE key = ? ORDER BY id DESC LIMIT ?) "
+            "ORDER BY id",
+            (key, limit if limit is not None else -1)
+        ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    async def get(self, key: str) -> Optional[Any]:
+        return await self._run(self._get, key)
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        await self._run(self._set, key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        await self._run(self._delete, key)
+
+    async def incr(self, key: str, amount: float = 1, ttl: Optional[float] = None) -> float:
+        return await self._run(self._incr, key, amount, ttl)
+
+    async def append(self, key: str, value: Any, max_length: Optional[int] = None) -> None:
+        await self._run(self._append, key, value, max_length)
+
+    async def get_list(self, key: str, limit: Optional[int] = None) -> List[Any]:
+        return await self._run(self._get_list, key, limit)
+
+
+class RateLimiter:
+    """Fixed-window limit counted in a state backend (shared by all workers using it)"""
+
+    def __init__(self, name: str, limit: int, window_seconds: float, backend: Optional[StateBackend] = None):
+        self.name = name
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.backend = backend
+
+    async def allow(self, key: str) -> bool:
+        backend = self.backend or get_state_backend()
+        window = int(time.time() // self.window_seconds)
+        count = await backend.incr(f"ratelimit:{self.name}:{key}:{window}", ttl=self.window_seconds * 2)
+        return count <= self.limit
+
+
+def create_state_backend(url: Optional[str] = None) -> StateBackend:
+    """Backend for a STATE_BACKEND_URL value"""
+    if not url or url == "memory":
+        return InMemoryStateBackend()
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisStateBackend(url)
+    if url.startswith("sqlite://"):
+        # sqlite:///relative.db or sqlite:////absolute/path.db
+        return SQLiteStateBackend(url[len("sqlite:///"):])
+    raise ValueError(f"Unsupported STATE_BACKEND_URL: {url}")
+
+
+_state_backend: Optional[StateBackend] = None
+
+
+def get_state_backend() -> StateBackend:
+    """Process-wide state backend configured by STATE_BACKEND_URL"""
+    global _state_backend
+    if _state_backend is None:
+        from trm_api.core.config import settings
+        _state_backend = create_state_backend(settings.STATE_BACKEND_URL)
+        logger.info(f"State backend: {type(_state_backend).__name__}")
+    return _state_backend
+
+
+def set_state_backend(backend: Optional[StateBackend]) -> None:
+    """Replace the process-wide backend (None re-reads settings on next use)"""
+    global _state_backend
+    _state_backend = backend
@@ -0,0 +1,550 @@
+"""
+Bulk graph import for seeding and load-testing
+
+Streams node and relationship records from JSON-lines files, CSV files or a
+synthetic generator and either:
+- writes them with batched `UNWIND` write transactions over several sessions, or
+- writes `neo4j-admin database import` CSV files for offline loads.
+
+Nodes are keyed by `uid` (as BaseNode does); relationships reference their
+endpoints by label and uid.
+"""
+
+import csv
+import json
+import logging
+import os
+import random
+import re
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+@dataclass
+class NodeRecord:
+    """A node to import; `properties` must contain `uid`"""
+    label: str
+    properties: Dict[str, Any]
+
+
+@dataclass
+class RelationshipRecord:
+    """A relationship between two nodes identified by label and uid"""
+    rel_type: str
+    start_label: str
+    start_uid: str
+    end_label: str
+    end_uid: str
+    properties: Dict[str, Any] = field(default_factory=dict)
+
+
+GraphRecord = Union[NodeRecord, RelationshipRecord]
+
+
+@dataclass
+class BulkImportStats:
+    """Counters for one import run"""
+    nodes: int = 0
+    relationships: int = 0
+    batches: int = 0
+    failed_batches: int = 0
+    failed_records: int = 0
+    elapsed_seconds: float = 0.0
+    by_label: Dict[str, int] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def records_per_second(self) -> float:
+        total = self.nodes + self.relationships
+        return total / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+def _identifier(name: str) -> str:
+    """Validate a label/type name before it is interpolated into Cypher"""
+    if not _IDENTIFIER.match(name or ""):
+        raise ValueError(f"Invalid label or relationship type: {name!r}")
+    return name
+
+
+# --- Sources ---
+
+def record_from_dict(data: Dict[str, Any]) -> GraphRecord:
+    """
+    Build a record from a JSON object
+
+    Nodes: {"label": "Tension", "properties": {"uid": ..., ...}}
+    Relationships: {"type": "LEADS_TO_WIN", "start_label": ..., "start_uid": ...,
+                    "end_label": ..., "end_uid": ..., "properties": {...}}
+    """
+    if "type" in data:
+        return RelationshipRecord(
+            rel_type=data["type"],
+            start_label=data["start_label"],
+            start_uid=data["start_uid"],
+            end_label=data["end_label"],
+            end_uid=data["end_uid"],
+            properties=data.get("properties") or {}
+        )
+    properties = data.get("properties")
+    if properties is None:
+        properties = {k: v for k, v in data.items() if k != "label"}
+    if "uid" not in properties:
+        raise ValueError(f"Node record without uid: {data}")
+    return NodeRecord(label=data["label"], properties=properties)
+
+
+def read_jsonl(path: str) -> Iterator[GraphRecord]:
+    """Stream records from a JSON-lines file (one record object per line)"""
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield record_from_dict(json.loads(line))
+            except (ValueError, KeyError) as e:
+                raise ValueError(f"{path}:{line_number}: {e}") from e
+
+
+_CSV_CONVERTERS = {
+    "int": int,
+    "long": int,
+    "float": float,
+    "double": float,
+    "boolean": lambda value: value.strip().lower() == "true",
+    "string": str,
+}
+
+
+def _parse_csv_header(header: str) -> Tuple[str, str, bool]:
+    """'tags:string[]' -> ('tags', 'string', True); uses neo4j-admin header notation"""
+    name, _, type_name = header.partition(":")
+    is_array = type_name.endswith("[]")
+    return name, (type_name[:-2] if is_array else type_name) or "string", is_array
+
+
+def read_csv(path: str, label: Optional[str] = None, rel_type: Optional[str] = None,
+             array_delimiter: str = ";") -> Iterator[GraphRecord]:
+    """
+    Stream records from a CSV file with a typed header (e.g. `priority:int,tags:string[]`)
+
+    Node files need a `uid` column and a `label` column unless `label` is given.
+    Relationship files (`rel_type` given or a `type` column) need `start_label`,
+    `start_uid`, `end_label` and `end_uid` columns. Empty cells are omitted.
+    """
+    reserved = {"label", "type", "start_label", "start_uid", "end_label", "end_uid"}
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        columns = [_parse_csv_header(header) for header in next(reader)]
+        for row in reader:
+            raw: Dict[str, str] = {}
+            properties: Dict[str, Any] = {}
+            for (name, type_name, is_array), value in zip(columns, row):
+                if value == "":
+                    continue
+                if name in reserved:
+                    raw[name] = value
+                    continue
+                convert = _CSV_CONVERTERS.get(type_name, str)
+                properties[name] = (
+                    [convert(item) for item in value.split(array_delimiter)] if is_array else convert(value)
+                )
+
+            if rel_type or "type" in raw:
+                yield RelationshipRecord(
+                    rel_type=rel_type or raw["type"],
+                    start_label=raw["start_label"],
+                    start_uid=raw["start_uid"],
+                    end_label=raw["end_label"],
+                    end_uid=raw["end_uid"],
+                    properties=properties
+                )
+            else:
+                if "uid" not in properties:
+                    raise ValueError(f"{path}: node row without uid")
+                yield NodeRecord(label=label or raw["label"], properties=properties)
+
+
+def read_records(path: str) -> Iterator[GraphRecord]:
+    """Stream records from a .jsonl/.ndjson or .csv file"""
+    if path.endswith((".jsonl", ".ndjson")):
+        return read_jsonl(path)
+    if path.endswith(".csv"):
+        return read_csv(path)
+    raise ValueError(f"Unsupported import file type: {path}")
+
+
+class SyntheticGraphGenerator:
+    """
+    Generates Tension, WIN and Event nodes with realistic property distributions
+
+    Relationships follow the ontology: (Tension)-[:LEADS_TO_WIN]->(WIN) and
+    (WIN)-[:GENERATES_EVENT]->(Event). Nodes of a label are emitted before
+    relationships that reference them.
+    """
+
+    TENSION_STATUSES = ["Open", "InProgress", "Resolved", "Closed"]
+    TENSION_TYPES = ["Problem", "Opportunity", "Risk", "Conflict", "Idea"]
+    TENSION_SOURCES = ["FounderInput", "CustomerFeedback", "DataSensingAgent"]
+    WIN_STATUSES = ["draft", "under_review", "published", "archived"]
+    WIN_TYPES = ["problem_resolution", "insight_discovery", "process_optimization",
+                 "learning_milestone", "strategic_achievement"]
+    EVENT_NAMES = ["TENSION_CREATED", "TASK_COMPLETED", "WIN_RECORDED", "PROJECT_UPDATED", "AGENT_ACTION"]
+    TAGS = ["strategy", "operations", "customer", "product", "finance", "people", "ai", "growth"]
+
+    def __init__(self, tensions: int = 0, wins: int = 0, events: int = 0,
+                 seed: Optional[int] = None, history_days: int = 365):
+        self.counts = {"Tension": tensions, "WIN": wins, "Event": events}
+        self.random = random.Random(seed)
+        self.history_seconds = history_days * 86400
+        self.now = time.time()
+
+    def _uid(self) -> str:
+        return uuid.UUID(int=self.random.getrandbits(128), version=4).hex
+
+    def _timestamps(self) -> Dict[str, float]:
+        # neomodel DateTimeProperty stores epoch seconds
+        created = self.now - self.random.random() * self.history_seconds
+        return {"created_at": created, "updated_at": min(self.now, created + self.random.random() * 86400)}
+
+    def _tags(self) -> List[str]:
+        return self.random.sample(self.TAGS, self.random.randint(0, 3))
+
+    def tension(self, index: int) -> NodeRecord:
+        timestamps = self._timestamps()
+        return NodeRecord("Tension", {
+            "uid": self._uid(),
+            "title": f"Synthetic tension {index}",
+            "description": f"Generated tension {index} for load testing",
+            "status": self.random.choice(self.TENSION_STATUSES),
+            "priority": self.random.choices([0, 1, 2], weights=[70, 25, 5])[0],
+            "source": self.random.choice(self.TENSION_SOURCES),
+            "tensionType": self.random.choice(self.TENSION_TYPES),
+            "tags": self._tags(),
+            "creationDate": timestamps["created_at"],
+            "lastModifiedDate": timestamps["updated_at"],
+            **timestamps
+        })
+
+    def win(self, index: int) -> NodeRecord:
+        return NodeRecord("WIN", {
+            "uid": self._uid(),
+            "name": f"Synthetic WIN {index}",
+            "narrative": f"Generated WIN {index} for load testing",
+            "status": self.random.choice(self.WIN_STATUSES),
+            "winType": self.random.choice(self.WIN_TYPES),
+            "impact_level": self.random.randint(1, 5),
+            "tags": self._tags(),
+            **self._timestamps()
+        })
+
+    def event(self, index: int) -> NodeRecord:
+        return NodeRecord("Event", {
+            "uid": self._uid(),
+            "name": self.random.choice(self.EVENT_NAMES),
+            "description": f"Generated event {index} for load testing",
+            "tags": self._tags(),
+            **self._timestamps()
+        })
+
+    def __iter__(self) -> Iterator[GraphRecord]:
+        tension_uids: List[str] = []
+        for i in range(self.counts["Tension"]):
+            record = self.tension(i)
+            tension_uids.append(record.properties["uid"])
+            yield record
+
+        win_uids: List[str] = []
+        for i in range(self.counts["WIN"]):
+            record = self.win(i)
+            win_uids.append(record.properties["uid"])
+            yield record
+            if tension_uids:
+                yield RelationshipRecord(
+                    "LEADS_TO_WIN", "Tension", self.random.choice(tension_uids), "WIN", record.properties["uid"],
+                    {"contribution_level": self.random.randint(1, 5)}
+                )
+
+        for i in range(self.counts["Event"]):
+            record = self.event(i)
+            yield record
+            if win_uids:
+                yield RelationshipRecord(
+                    "GENERATES_EVENT", "WIN", self.random.choice(win_uids), "Event", record.properties["uid"]
+                )
+
+
+# --- Online import ---
+
+class BulkGraphImporter:
+    """
+    Writes records with batched UNWIND transactions over parallel sessions
+
+    Records are grouped per label (nodes) or per (type, start label, end label)
+    (relationships). Relationship batches are only written once every node batch
+    submitted before them has committed, so streams that emit nodes before the
+    relationships referencing them import correctly.
+    """
+
+    def __init__(self, driver: Any, database: Optional[str] = None, batch_size: int = 5000,
+                 workers: int = 4, merge: bool = True, max_pending_batches: Optional[int] = None):
+        self.driver = driver
+        self.database = database
+        self.batch_size = max(1, batch_size)
+        self.workers = max(1, workers)
+        self.merge = merge
+        self.max_pending_batches = max_pending_batches or self.workers * 2
+
+    def ensure_constraints(self, labels: Iterable[str]) -> None:
+        """Create uid uniqueness constraints (MERGE on uid needs them to be fast)"""
+        with self._session() as session:
+            for label in labels:
+                session.run(
+                    f"CREATE CONSTRAINT {_identifier(label).lower()}_uid_unique IF NOT EXISTS "
+                    f"FOR (n:{label}) REQUIRE n.uid IS UNIQUE"
+                ).consume()
+
+    def _session(self):
+        if self.database:
+            return self.driver.session(database=self.database)
+        return self.driver.session()
+
+    def node_query(self, label: str) -> str:
+        label = _identifier(label)
+        if self.merge:
+            return f"UNWIND $rows AS row MERGE (n:{label} {{uid: row.uid}}) SET n += row"
+        return f"UNWIND $rows AS row CREATE (n:{label}) SET n = row"
+
+    def relationship_query(self, rel_type: str, start_label: str, end_label: str) -> str:
+        verb = "MERGE" if self.merge else "CREATE"
+        return (
+            f"UNWIND $rows AS row "
+            f"MATCH (a:{_identifier(start_label)} {{uid: row.start_uid}}) "
+            f"MATCH (b:{_identifier(end_label)} {{uid: row.end_uid}}) "
+            f"{verb} (a)-[r:{_identifier(rel_type)}]->(b) "
+            f"SET r += row.properties"
+        )
+
+    def _write_batch(self, query: str, rows: List[Dict[str, Any]]) -> int:
+        with self._session() as session:
+            session.execute_write(lambda tx: tx.run(query, rows=rows).consume())
+        return len(rows)
+
+    def import_records(self, records: Iterable[GraphRecord]) -> BulkImportStats:
+        """Import a stream of records; returns counters (failed batches are logged, not raised)"""
+        stats = BulkImportStats()
+        started = time.perf_counter()
+        node_batches: Dict[str, List[Dict[str, Any]]] = {}
+        rel_batches: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = {}
+        pending: Dict[Future, Tuple[str, bool, int]] = {}  # future -> (key, is_node, rows)
+        pending_nodes: Set[Future] = set()
+
+        def collect(done: Iterable[Future]) -> None:
+            for future in done:
+                key, is_node, row_count = pending.pop(future)
+                pending_nodes.discard(future)
+                stats.batches += 1
+                try:
+                    count = future.result()
+                except Exception as e:
+                    stats.failed_batches += 1
+                    stats.failed_records += row_count
+                    stats.errors.append(f"{key}: {e}")
+                    logger.error(f"Bulk import batch failed for {key}: {e}")
+                    continue
+                if is_node:
+                    stats.nodes += count
+                else:
+                    stats.relationships += count
+                stats.by_label[key] = stats.by_label.get(key, 0) + count
+
+        def submit(pool: ThreadPoolExecutor, key: str, is_node: bool, query: str,
+                   rows: List[Dict[str, Any]]) -> None:
+            while len(pending) >= self.max_pending_batches:
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                collect(done)
+            if not is_node and pending_nodes:
+                # Endpoints must be committed before relationships are matched
+                done, _ = wait(list(pending_nodes))
+                collect(done)
+            future = pool.submit(self._write_batch, query, rows)
+            pending[future] = (key, is_node, len(rows))
+            if is_node:
+                pending_nodes.add(future)
+
+        def flush_nodes(pool: ThreadPoolExecutor, label: str) -> None:
+            rows = node_batches.pop(label, None)
+            if rows:
+                submit(pool, label, True, self.node_query(label), rows)
+
+        def flush_relationships(pool: ThreadPoolExecutor, key: Tuple[str, str, str]) -> None:
+            rows = rel_batches.pop(key, None)
+            if rows:
+                rel_type, start_label, end_label = key
+                submit(pool, f"{start_label}-{rel_type}->{end_label}", False,
+                       self.relationship_query(rel_type, start_label, end_label), rows)
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bulk-import") as pool:
+            for record in records:
+                if isinstance(record, NodeRecord):
+                    rows = node_batches.setdefault(record.label, [])
+                    rows.append(record.properties)
+                    if len(rows) >= self.batch_size:
+                        flush_nodes(pool, record.label)
+                else:
+                    key = (record.rel_type, record.start_label, record.end_label)
+                    rows = rel_batches.setdefault(key, [])
+                    rows.append({
+                        "start_uid": record.start_uid,
+                        "end_uid": record.end_uid,
+                        "properties": record.properties
+                    })
+                    if len(rows) >= self.batch_size:
+                        # Partial node batches may hold this batch's endpoints
+                        for label in list(node_batches):
+                            flush_nodes(pool, label)
+                        flush_relationships(pool, key)
+
+            for label in list(node_batches):
+                flush_nodes(pool, label)
+            for key in list(rel_batches):
+                flush_relationships(pool, key)
+            collect(wait(list(pending)).done)
+
+        stats.elapsed_seconds = time.perf_counter() - started
+        logger.info(
+            f"Bulk import finished: {stats.nodes} nodes, {stats.relationships} relationships "
+            f"in {stats.elapsed_seconds:.1f}s ({stats.records_per_second:.0f} records/s), "
+            f"{stats.failed_batches} failed batches"
+        )
+        return stats
+
+
+# --- Offline import ---
+
+def _admin_type(value: Any) -> str:
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "long"
+    if isinstance(value, float):
+        return "double"
+    if isinstance(value, datetime):
+        return "datetime"
+    if isinstance(value, date):
+        return "date"
+    return "string"
+
+
+class AdminImportWriter:
+    """
+    Writes `neo4j-admin database import full` CSV files
+
+    One node file per label and one relationship file per (type, start label,
+    end label). Columns are fixed by the first record of each file; properties
+    missing from that record are dropped (and counted in `dropped_properties`).
+    Each label has its own ID space keyed by uid.
+    """
+
+    def __init__(self, output_dir: str, array_delimiter: str = ";"):
+        self.output_dir = output_dir
+        self.array_delimiter = array_delimiter
+        self.node_files: Dict[str, str] = {}
+        self.relationship_files: Dict[Tuple[str, str, str], str] = {}
+        self.dropped_properties = 0
+        self._writers: Dict[Any, Tuple[Any, Any, List[str]]] = {}
+        os.makedirs(output_dir, exist_ok=True)
+
+    def _cell(self, value: Any) -> str:
+        if value is None:
+            return ""
+        if isinstance(value, (list, tuple)):
+            return self.array_delimiter.join(self._cell(item) for item in value)
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        if isinstance(value, dict):
+            return json.dumps(value)
+        return str(value)
+
+    def _header(self, name: str, value: Any) -> str:
+        if isinstance(value, (list, tuple)):
+            return f"{name}:{_admin_type(value[0]) if value else 'string'}[]"
+        return f"{name}:{_admin_type(value)}"
+
+    def _open(self, key: Any, filename: str, header: List[str], columns: List[str]):
+        path = os.path.join(self.output_dir, filename)
+        handle = open(path, "w", encoding="utf-8", newline="")
+        writer = csv.writer(handle)
+        writer.writerow(header)
+        self._writers[key] = (handle, writer, columns)
+        return path
+
+    def add(self, record: GraphRecord) -> None:
+        if isinstance(record, NodeRecord):
+            label = _identifier(record.label)
+            key = ("node", label)
+            if key not in self._writers:
+                columns = [name for name in record.properties if name != "uid"]
+                header = [f"uid:ID({label})"] + [self._header(c, record.properties[c]) for c in columns] + [":LABEL"]
+                self.node_files[label] = self._open(key, f"nodes_{label}.csv", header, columns)
+            _, writer, columns = self._writers[key]
+            self.dropped_properties += len(set(record.properties) - set(columns) - {"uid"})
+            writer.writerow(
+                [record.properties["uid"]]
+                + [self._cell(record.properties.get(column)) for column in columns]
+                + [label]
+            )
+        else:
+            rel_key = (_identifier(record.rel_type), _identifier(record.start_label), _identifier(record.end_label))
+            key = ("relationship",) + rel_key
+            if key not in self._writers:
+                columns = list(record.properties)
+                header = (
+                    [f":START_ID({record.start_label})", f":END_ID({record.end_label})"]
+                    + [self._header(c, record.properties[c]) for c in columns]
+                    + [":TYPE"]
+                )
+                self.relationship_files[rel_key] = self._open(
+                    key, f"rels_{record.start_label}_{record.rel_type}_{record.end_label}.csv", header, columns
+                )
+            _, writer, columns = self._writers[key]
+            self.dropped_properties += len(set(record.properties) - set(columns))
+            writer.writerow(
+                [record.start_uid, record.end_uid]
+                + [self._cell(record.properties.get(column)) for column in columns]
+                + [record.rel_type]
+            )
+
+    def write(self, records: Iterable[GraphRecord]) -> int:
+        """Write all records, close the files and return the number written"""
+        count = 0
+        try:
+            for record in records:
+                self.add(record)
+                count += 1
+        finally:
+            self.close()
+        return count
+
+    def close(self) -> None:
+        for handle, _, _ in self._writers.values():
+            handle.close()
+        self._writers.clear()
+
+    def command(self, database: str = "neo4j") -> str:
+        """The neo4j-admin invocation that loads the written files"""
+        args = ["neo4j-admin database import full", f"--array-delimiter='{self.array_delimiter}'"]
+        args += [f"--nodes={label}={path}" for label, path in sorted(self.node_files.items())]
+        args += [f"--relationships={key[0]}={path}" for key, path in sorted(self.relationship_files.items())]
+        args.append(database)
+        return " ".join(args)
@@ -1,14 +1,20 @@
 from neomodel import config, db
 from neo4j import GraphDatabase
 from trm_api.core.config import settings
+import asyncio
 import logging
 import os
 
 logger = logging.getLogger(__name__)
 
-def init_neo4j():
+def _graceful_degradation_enabled() -> bool:
+    """Railway deployments keep serving (degraded) when Neo4j is unreachable"""
+    return bool(os.getenv('RAILWAY_ENVIRONMENT') or os.getenv('RAILWAY_PROJECT_ID'))
+
+
+def configure_neo4j():
     """
-    Initialize Neo4j connection with proper error handling for deployment environments.
+    Configure neomodel's DATABASE_URL. No network I/O: safe to run at import time.
     """
     try:
         # Get Neo4j connection details with Railway deployment fallbacks
@@ -54,33 +60,65 @@ def init_neo4j():
             config.DATABASE_URL = f"neo4j+s://{neo4j_user}@{host}"
         
         logging.info(f"✅ Neo4j configured for host: {host}")
-        
-        # Test the connection
-        try:
-            db.cypher_query("RETURN 1 as test", {})
-            logging.info("✅ Neo4j connection test successful")
-        except Exception as conn_error:
-            logging.error(f"❌ Neo4j connection test failed: {conn_error}")
-            # For Railway deployment, don't crash the app - use mock mode
-            if os.getenv('RAILWAY_ENVIRONMENT') or os.getenv('RAILWAY_PROJECT_ID'):
-                logging.warning("🚀 Railway deployment detected - enabling graceful degradation mode")
-                return False
-            else:
-                raise conn_error
-                
         return True
         
     except Exception as e:
-        logging.error(f"❌ Failed to initialize Neo4j: {e}")
+        logging.error(f"❌ Failed to configure Neo4j: {e}")
         
         # For Railway deployment, enable graceful degradation
-        if os.getenv('RAILWAY_ENVIRONMENT') or os.getenv('RAILWAY_PROJECT_ID'):
+        if _graceful_degradation_enabled():
             logging.warning("🚀 Railway deployment detected - enabling graceful degradation mode")
             return False
         else:
             raise e
 
 
+def init_neo4j():
+    """
+    Configure Neo4j and test the connection synchronously (scripts and tools).
+    The API server uses verify_db_connection() from its lifespan instead.
+    """
+    if not configure_neo4j():
+        return False
+    
+    try:
+        db.cypher_query("RETURN 1 as test", {})
+        logging.info("✅ Neo4j connection test successful")
+    except Exception as conn_error:
+        logging.error(f"❌ Neo4j connection test failed: {conn_error}")
+        # For Railway deployment, don't crash the app - use mock mode
+        if _graceful_degradation_enabled():
+            logging.warning("🚀 Railway deployment detected - enabling graceful degradation mode")
+            return False
+        else:
+            raise conn_error
+            
+    return True
+
+
+async def verify_db_connection(timeout: float = 10.0) -> bool:
+    """
+    Test Neo4j connectivity without blocking the event loop, giving up after `timeout` seconds.
+    
+    Raises on failure unless graceful degradation (Railway) is enabled, in which
+    case it returns False. The outcome is kept in `neo4j_available`.
+    """
+    global neo4j_available
+    try:
+        await asyncio.wait_for(asyncio.to_thread(db.cypher_query, "RETURN 1 as test", {}), timeout)
+        logging.info("✅ Neo4j connection test successful")
+        neo4j_available = True
+    except Exception as conn_error:
+        if isinstance(conn_error, asyncio.TimeoutError):
+            conn_error = TimeoutError(f"Neo4j connection test timed out after {timeout}s")
+        logging.error(f"❌ Neo4j connection test failed: {conn_error}")
+        neo4j_available = False
+        if not _graceful_degradation_enabled():
+            raise conn_error
+        logging.warning("🚀 Railway deployment detected - enabling graceful degradation mode")
+    return neo4j_available
+
+
 def get_neo4j_connection_status():
     """
     Get current Neo4j connection status for health checks.
@@ -92,8 +130,9 @@ def get_neo4j_connection_status():
         return {"status": "disconnected", "message": f"Neo4j connection failed: {str(e)}"}
 
 
-# Initialize Neo4j connection on module import
-neo4j_available = init_neo4j()
+# Configure neomodel on import; connectivity is checked by verify_db_connection() (None = not checked yet)
+configure_neo4j()
+neo4j_available = None
 
 
 def connect_to_db():
@@ -7,6 +7,10 @@ from datetime import datetime
 from pydantic import BaseModel, Field
 
 from trm_api.core.config import settings
+from trm_api.core.state_backend import get_state_backend
+
+# Shared (multi-worker) event history list in the state backend
+EVENT_HISTORY_KEY = "eventbus:history"
 
 class EventType(str, Enum):
     """Các loại sự kiện trong hệ thống TRM-OS theo Ontology V3.2"""
@@ -14,6 +18,7 @@ class EventType(str, Enum):
     TENSION_CREATED = "tension.created"
     TENSION_UPDATED = "tension.updated"
     TENSION_RESOLVED = "tension.resolved"
+    TENSION_DELETED = "tension.deleted"
     
     # Task events
     TASK_CREATED = "task.created"
@@ -31,6 +36,11 @@ class EventType(str, Enum):
     AGENT_ERROR = "agent.error"
     AGENT_ACTION_COMPLETED = "agent.action.completed"
     
+    # Strategic event (Event entity) lifecycle
+    EVENT_CREATED = "event.created"
+    EVENT_UPDATED = "event.updated"
+    EVENT_DELETED = "event.deleted"
+    
     # Knowledge events
     KNOWLEDGE_CREATED = "knowledge.created"
     KNOWLEDGE_VALIDATED = "knowledge.validated"
@@ -40,6 +50,8 @@ class EventType(str, Enum):
     
     # WIN events
     WIN_CREATED = "win.created"
+    WIN_UPDATED = "win.updated"
+    WIN_DELETED = "win.deleted"
     
     # Reasoning events
     REASONING_COMPLETED = "reasoning.completed"
@@ -81,6 +93,14 @@ class SystemEventBus:
         if len(self._event_history) > self._max_history_size:
             self._event_history.pop(0)
         
+        # Ghi vào lịch sử chung khi chạy nhiều worker
+        backend = get_state_backend()
+        if backend.shared:
+            try:
+                await backend.append(EVENT_HISTORY_KEY, event.model_dump(mode="json"), self._max_history_size)
+            except Exception as e:
+                self._logger.error(f"Failed to record event {event.event_id} in shared history: {e}")
+        
         # Kiểm tra nếu có subscribers
         if event.event_type in self._subscribers:
             coroutines = [handler(event) for handler in self._subscribers[event.event_type]]
@@ -117,6 +137,20 @@ class SystemEventBus:
         
         # Trả về các sự kiện mới nhất trước
         return list(reversed(filtered_events))[:limit]
+    
+    async def load_event_history(self, limit: int = 100, event_type: Optional[EventType] = None,
+                                 entity_id: Optional[str] = None) -> List[SystemEvent]:
+        """Lịch sử sự kiện của tất cả worker (shared backend), hoặc của process này"""
+        backend = get_state_backend()
+        if not backend.shared:
+            return self.get_event_history(limit, event_type, entity_id)
+        
+        events = [SystemEvent.model_validate(item) for item in await backend.get_list(EVENT_HISTORY_KEY)]
+        if event_type:
+            events = [e for e in events if e.event_type == event_type]
+        if entity_id:
+            events = [e for e in events if e.entity_id == entity_id]
+        return list(reversed(events))[:limit]
 
 # Singleton instance
 system_event_bus = SystemEventBus()
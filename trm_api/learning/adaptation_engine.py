@@ -20,6 +20,7 @@ from .learning_types import (
     MetricType,
     safe_enum_value
 )
+from .adaptation_matcher import ActiveAdaptationIndex, RuleIndex, conditions_match
 from ..eventbus.system_event_bus import publish_event, EventType
 
 
@@ -30,12 +31,12 @@ class AdaptationEngine:
         self.agent_id = agent_id
         self.logger = logging.getLogger(f"learning.adaptation_engine.{agent_id}")
         
-        # Adaptation storage
-        self.adaptation_rules: Dict[str, AdaptationRule] = {}
+        # Adaptation storage (rules indexed by trigger condition)
+        self.adaptation_rules = RuleIndex()
         self.adaptation_history: List[Dict[str, Any]] = []
         
-        # Current adaptations applied
-        self.active_adaptations: Dict[str, Any] = {}
+        # Current adaptations applied (indexed by rule and by the targets they set)
+        self.active_adaptations = ActiveAdaptationIndex()
         
         # Adaptation parameters
         self.adaptation_threshold = 0.7        # Minimum confidence to apply adaptation
@@ -363,13 +364,16 @@ class AdaptationEngine:
         """Apply relevant adaptations based on current context"""
         
         if available_rules is None:
-            available_rules = list(self.adaptation_rules.values())
-        
-        # Filter applicable rules
-        applicable_rules = []
-        for rule in available_rules:
-            if await self._is_rule_applicable(rule, context):
-                applicable_rules.append(rule)
+            # Only rules whose conditions the context hits are looked at (memoized per context)
+            applicable_rules = [
+                rule for rule in self.adaptation_rules.match(context)
+                if self._is_rule_ready(rule)
+            ]
+        else:
+            applicable_rules = []
+            for rule in available_rules:
+                if await self._is_rule_applicable(rule, context):
+                    applicable_rules.append(rule)
         
         # Sort by priority and confidence
         applicable_rules.sort(
@@ -402,6 +406,11 @@ class AdaptationEngine:
     ) -> bool:
         """Check if adaptation rule is applicable to current context"""
         
+        return self._is_rule_ready(rule) and conditions_match(rule.trigger_conditions, context)
+    
+    def _is_rule_ready(self, rule: AdaptationRule) -> bool:
+        """Check rule state: active, not expired or exhausted, outside cooldown"""
+        
         # Check if rule is active
         if not rule.active:
             return False
@@ -422,66 +431,16 @@ class AdaptationEngine:
             if time_since_last < self.adaptation_cooldown:
                 return False
         
-        # Check trigger conditions
-        for condition_key, condition_value in rule.trigger_conditions.items():
-            if condition_key not in context:
-                return False
-            
-            context_value = context[condition_key]
-            
-            # Handle different condition types
-            if isinstance(condition_value, bool):
-                if context_value != condition_value:
-                    return False
-            elif isinstance(condition_value, (int, float)):
-                if isinstance(context_value, (int, float)):
-                    if context_value < condition_value:
-                        return False
-                else:
-                    return False
-            elif isinstance(condition_value, str):
-                if context_value != condition_value:
-                    return False
-            elif isinstance(condition_value, list):
-                if context_value not in condition_value:
-                    return False
-        
         return True
     
     async def _can_apply_rule(self, rule: AdaptationRule) -> bool:
         """Check if rule can be applied (not conflicting with active adaptations)"""
         
-        # Check for conflicts with active adaptations
-        for active_adaptation in self.active_adaptations.values():
-            if active_adaptation.get("rule_id") == rule.rule_id:
-                return False  # Already applied
-            
-            # Check for type conflicts
-            if active_adaptation.get("adaptation_type") == safe_enum_value(rule.adaptation_type):
-                # Same type adaptations might conflict
-                if self._adaptations_conflict(active_adaptation, rule):
-                    return False
+        if self.active_adaptations.has_rule(rule.rule_id):
+            return False  # Already applied
         
-        return True
-    
-    def _adaptations_conflict(
-        self, 
-        active_adaptation: Dict[str, Any], 
-        new_rule: AdaptationRule
-    ) -> bool:
-        """Check if adaptations conflict with each other"""
-        
-        # Simple conflict detection - can be made more sophisticated
-        active_actions = active_adaptation.get("actions", {})
-        new_actions = new_rule.adaptation_actions
-        
-        # Check for direct conflicts
-        for key in active_actions:
-            if key in new_actions:
-                if active_actions[key] != new_actions[key]:
-                    return True  # Conflicting values for same parameter
-        
-        return False
+        # Same type adaptations conflict when they set the same parameter differently
+        return not self.active_adaptations.conflicts(rule)
     
     async def _apply_adaptation_rule(
         self, 
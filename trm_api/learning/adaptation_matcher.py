@@ -0,0 +1,323 @@
+"""
+Adaptation Matcher for Adaptive Learning System
+
+Indexes that keep adaptation on the request path independent of rule count:
+- RuleIndex: rules bucketed by trigger condition (hash buckets for equality
+  and list membership, sorted thresholds for numeric minimums, key presence
+  for everything else); a rule matches when every one of its conditions is
+  hit, and matches are memoized per context fingerprint
+- ActiveAdaptationIndex: active adaptations indexed by rule and by the
+  (adaptation type, action key) they set, so conflicts are dictionary lookups
+"""
+
+import bisect
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from .learning_types import AdaptationRule, safe_enum_value
+
+
+def conditions_match(trigger_conditions: Dict[str, Any], context: Dict[str, Any]) -> bool:
+    """True if the context satisfies every trigger condition"""
+    for condition_key, condition_value in trigger_conditions.items():
+        if condition_key not in context:
+            return False
+
+        context_value = context[condition_key]
+
+        # Handle different condition types
+        if isinstance(condition_value, bool):
+            if context_value != condition_value:
+                return False
+        elif isinstance(condition_value, (int, float)):
+            if isinstance(context_value, (int, float)):
+                if context_value < condition_value:
+                    return False
+            else:
+                return False
+        elif isinstance(condition_value, str):
+            if context_value != condition_value:
+                return False
+        elif isinstance(condition_value, list):
+            if context_value not in condition_value:
+                return False
+
+    return True
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable form of a value; values that compare equal (1, 1.0, True) freeze to equal keys.
+
+    Raises TypeError for unhashable values other than dicts, lists, tuples and sets.
+    """
+    if isinstance(value, dict):
+        return (dict, frozenset((_freeze(key), _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return (list, tuple(_freeze(item) for item in value))
+    if isinstance(value, tuple):
+        return (tuple, tuple(_freeze(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return (frozenset, frozenset(_freeze(item) for item in value))
+    hash(value)
+    return value
+
+
+def context_fingerprint(context: Dict[str, Any]) -> Optional[Hashable]:
+    """Canonical form of a context, or None if it holds unhashable values"""
+    try:
+        return _freeze(context)
+    except TypeError:
+        return None
+
+
+def _hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+class RuleIndex(MutableMapping):
+    """Adaptation rules by id, indexed by trigger condition.
+
+    Behaves like the dict it replaces (rule_id -> AdaptationRule). Rules are
+    indexed when stored; re-store a rule after changing its trigger conditions.
+    """
+
+    def __init__(self, cache_size: int = 1024):
+        self.cache_size = cache_size
+        self._rules: Dict[str, AdaptationRule] = {}
+        self._order: Dict[str, int] = {}  # Insertion position; matches are returned in this order
+        self._inserted = 0
+        self._condition_counts: Dict[str, int] = {}
+        self._equals: Dict[Tuple[str, Any], Dict[str, None]] = {}  # (key, value) -> rule ids
+        self._thresholds: Dict[str, Tuple[List[float], List[str]]] = {}  # key -> sorted minimums, rule ids
+        self._present: Dict[str, Dict[str, None]] = {}  # key -> rule ids needing only the key
+        self._unconditional: Dict[str, None] = {}
+        self._unindexed: Dict[str, None] = {}  # Conditions we cannot bucket; checked directly
+        self._cache: "OrderedDict[Hashable, Tuple[str, ...]]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    # Mapping interface
+
+    def __getitem__(self, rule_id: str) -> AdaptationRule:
+        return self._rules[rule_id]
+
+    def __setitem__(self, rule_id: str, rule: AdaptationRule) -> None:
+        if rule_id in self._rules:
+            self._unindex(rule_id)
+        else:
+            self._order[rule_id] = self._inserted
+            self._inserted += 1
+        self._rules[rule_id] = rule
+        self._index(rule_id, rule)
+        self._cache.clear()
+
+    def __delitem__(self, rule_id: str) -> None:
+        self._unindex(rule_id)
+        del self._rules[rule_id]
+        del self._order[rule_id]
+        self._cache.clear()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rules)
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def clear(self) -> None:
+        self._rules.clear()
+        self._order.clear()
+        self._condition_counts.clear()
+        self._equals.clear()
+        self._thresholds.clear()
+        self._present.clear()
+        self._unconditional.clear()
+        self._unindexed.clear()
+        self._cache.clear()
+
+    # Indexing
+
+    def _index(self, rule_id: str, rule: AdaptationRule) -> None:
+        conditions = rule.trigger_conditions
+        if not conditions:
+            self._unconditional[rule_id] = None
+            return
+        if any(isinstance(v, list) and not all(_hashable(item) for item in v) for v in conditions.values()):
+            self._unindexed[rule_id] = None
+            return
+
+        self._condition_counts[rule_id] = len(conditions)
+        for key, value in conditions.items():
+            if isinstance(value, (bool, str)):
+                self._equals.setdefault((key, value), {})[rule_id] = None
+            elif isinstance(value, (int, float)):
+                minimums, rule_ids = self._thresholds.setdefault(key, ([], []))
+                position = bisect.bisect_right(minimums, value)
+                minimums.insert(position, value)
+                rule_ids.insert(position, rule_id)
+            elif isinstance(value, list):
+                for item in set(value):
+                    self._equals.setdefault((key, item), {})[rule_id] = None
+            else:
+                self._present.setdefault(key, {})[rule_id] = None
+
+    def _unindex(self, rule_id: str) -> None:
+        self._unconditional.pop(rule_id, None)
+        self._unindexed.pop(rule_id, None)
+        if self._condition_counts.pop(rule_id, None) is None:
+            return
+        for key, value in self._rules[rule_id].trigger_conditions.items():
+            if isinstance(value, (bool, str)):
+                self._discard(self._equals, (key, value), rule_id)
+            elif isinstance(value, (int, float)):
+                minimums, rule_ids = self._thresholds[key]
+                position = rule_ids.index(rule_id, bisect.bisect_left(minimums, value))
+                del minimums[position], rule_ids[position]
+                if not minimums:
+                    del self._thresholds[key]
+            elif isinstance(value, list):
+                for item in set(value):
+                    self._discard(self._equals, (key, item), rule_id)
+            else:
+                self._discard(self._present, key, rule_id)
+
+    @staticmethod
+    def _discard(index: Dict, key, rule_id: str) -> None:
+        ids = index.get(key)
+        if ids is not None:
+            ids.pop(rule_id, None)
+            if not ids:
+                del index[key]
+
+    # Matching
+
+    def match(self, context: Dict[str, Any]) -> List[AdaptationRule]:
+        """Rules whose trigger conditions the context satisfies (memoized per context)"""
+        fingerprint = context_fingerprint(context)
+        rule_ids = self._cache.get(fingerprint) if fingerprint is not None else None
+        if rule_ids is None:
+            self.cache_misses += 1
+            rule_ids = self._match_ids(context)
+            if fingerprint is not None:
+                self._cache[fingerprint] = rule_ids
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        else:
+            self.cache_hits += 1
+            self._cache.move_to_end(fingerprint)
+        return [self._rules[rule_id] for rule_id in rule_ids]
+
+    def _match_ids(self, context: Dict[str, Any]) -> Tuple[str, ...]:
+        # Count satisfied conditions per rule; only rules sharing a bucket with the context are touched
+        hits: Dict[str, int] = {}
+        for key, value in context.items():
+            if _hashable(value):
+                for rule_id in self._equals.get((key, value), ()):
+                    hits[rule_id] = hits.get(rule_id, 0) + 1
+            for rule_id in self._present.get(key, ()):
+                hits[rule_id] = hits.get(rule_id, 0) + 1
+            thresholds = self._thresholds.get(key)
+            if thresholds is not None and isinstance(value, (int, float)):
+                minimums, rule_ids = thresholds
+                for rule_id in rule_ids[:bisect.bisect_right(minimums, value)]:
+                    hits[rule_id] = hits.get(rule_id, 0) + 1
+
+        matched = [rule_id for rule_id, count in hits.items() if count == self._condition_counts[rule_id]]
+        matched.extend(self._unconditional)
+        matched.extend(
+            rule_id for rule_id in self._unindexed
+            if conditions_match(self._rules[rule_id].trigger_conditions, context)
+        )
+        matched.sort(key=self._order.__getitem__)
+        return tuple(matched)
+
+
+class ActiveAdaptationIndex(MutableMapping):
+    """Active adaptations by id, indexed by rule and by the targets they set.
+
+    Behaves like the dict it replaces (adaptation_id -> adaptation dict).
+    Two adaptations conflict when they have the same adaptation type and set
+    the same action key to different values.
+    """
+
+    def __init__(self):
+        self._adaptations: Dict[str, Dict[str, Any]] = {}
+        self._by_rule: Dict[str, Dict[str, None]] = {}
+        # (adaptation type, action key) -> {value fingerprint: adaptation ids}
+        self._targets: Dict[Tuple[str, str], Dict[str, Dict[str, None]]] = {}
+
+    def __getitem__(self, adaptation_id: str) -> Dict[str, Any]:
+        return self._adaptations[adaptation_id]
+
+    def __setitem__(self, adaptation_id: str, adaptation: Dict[str, Any]) -> None:
+        if adaptation_id in self._adaptations:
+            self._unindex(adaptation_id, self._adaptations[adaptation_id])
+        self._adaptations[adaptation_id] = adaptation
+        self._index(adaptation_id, adaptation)
+
+    def __delitem__(self, adaptation_id: str) -> None:
+        self._unindex(adaptation_id, self._adaptations.pop(adaptation_id))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._adaptations)
+
+    def __len__(self) -> int:
+        return len(self._adaptations)
+
+    def clear(self) -> None:
+        self._adaptations.clear()
+        self._by_rule.clear()
+        self._targets.clear()
+
+    @staticmethod
+    def _value_key(value: Any) -> Hashable:
+        try:
+            return _freeze(value)
+        except TypeError:
+            return (repr, repr(value))
+
+    def _index(self, adaptation_id: str, adaptation: Dict[str, Any]) -> None:
+        rule_id = adaptation.get("rule_id")
+        if rule_id is not None:
+            self._by_rule.setdefault(rule_id, {})[adaptation_id] = None
+        adaptation_type = adaptation.get("adaptation_type")
+        for key, value in adaptation.get("actions", {}).items():
+            values = self._targets.setdefault((adaptation_type, key), {})
+            values.setdefault(self._value_key(value), {})[adaptation_id] = None
+
+    def _unindex(self, adaptation_id: str, adaptation: Dict[str, Any]) -> None:
+        rule_id = adaptation.get("rule_id")
+        ids = self._by_rule.get(rule_id)
+        if ids is not None:
+            ids.pop(adaptation_id, None)
+            if not ids:
+                del self._by_rule[rule_id]
+        adaptation_type = adaptation.get("adaptation_type")
+        for key, value in adaptation.get("actions", {}).items():
+            values = self._targets.get((adaptation_type, key))
+            if values is None:
+                continue
+            value_key = self._value_key(value)
+            ids = values.get(value_key)
+            if ids is not None:
+                ids.pop(adaptation_id, None)
+                if not ids:
+                    del values[value_key]
+            if not values:
+                del self._targets[(adaptation_type, key)]
+
+    def has_rule(self, rule_id: str) -> bool:
+        return rule_id in self._by_rule
+
+    def conflicts(self, rule: AdaptationRule) -> bool:
+        """True if an active adaptation of the same type sets one of the rule's action keys differently"""
+        adaptation_type = safe_enum_value(rule.adaptation_type)
+        for key, value in rule.adaptation_actions.items():
+            values = self._targets.get((adaptation_type, key))
+            if values and (len(values) > 1 or self._value_key(value) not in values):
+                return True
+        return False
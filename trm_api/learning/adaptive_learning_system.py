@@ -26,6 +26,7 @@ from .experience_collector import ExperienceCollector
 from .pattern_recognizer import PatternRecognizer
 from .adaptation_engine import AdaptationEngine
 from .performance_tracker import PerformanceTracker
+from .learning_runtime import LearningRuntime, get_learning_runtime
 
 from ..eventbus.system_event_bus import publish_event, EventType
 from ..reasoning.advanced_reasoning_engine import AdvancedReasoningEngine
@@ -34,7 +35,7 @@ from ..reasoning.advanced_reasoning_engine import AdvancedReasoningEngine
 class AdaptiveLearningSystem:
     """Main orchestrator for adaptive learning capabilities"""
     
-    def __init__(self, agent_id: str):
+    def __init__(self, agent_id: str, runtime: Optional[LearningRuntime] = None):
         self.agent_id = agent_id
         self.logger = logging.getLogger(f"learning.adaptive_system.{agent_id}")
         
@@ -47,16 +48,19 @@ class AdaptiveLearningSystem:
         # Learning configuration
         self.learning_enabled = True
         self.auto_adaptation_enabled = True
-        self.learning_frequency_hours = 24  # Run learning cycle every 24 hours
+        self.learning_frequency_hours = 24  # Fallback cycle interval when experiences trickle in
         self.min_experiences_for_learning = 10  # Minimum experiences needed to trigger learning
+        self.experiences_per_cycle = 25  # New experiences that trigger a cycle
         
         # Learning goals and state
         self.learning_goals: Dict[str, LearningGoal] = {}
         self.active_learning_sessions: Dict[str, LearningSession] = {}
         self.last_learning_cycle: Optional[datetime] = None
+        self._experience_cursor = 0  # Experiences up to this insertion sequence are already mined
         self.reasoning_engine: Optional[AdvancedReasoningEngine] = None
         
-        # Background task management
+        # Learning cycles are scheduled by the shared runtime (process-wide one if not given)
+        self.runtime = runtime
         self.background_tasks: Set[asyncio.Task] = set()
         self.learning_cycle_task: Optional[asyncio.Task] = None
         
@@ -80,10 +84,11 @@ class AdaptiveLearningSystem:
         # Set up default learning goals
         await self._setup_default_goals()
         
-        # Start background learning cycle
+        # Schedule learning cycles on the shared runtime
+        if self.runtime is None:
+            self.runtime = get_learning_runtime()
         if self.learning_enabled:
-            self.learning_cycle_task = asyncio.create_task(self._learning_cycle_loop())
-            self.background_tasks.add(self.learning_cycle_task)
+            self.runtime.register(self)
         
         self.logger.info("Adaptive Learning System initialized and ready")
         
@@ -226,16 +231,23 @@ class AdaptiveLearningSystem:
                     # Skip unknown metric types
                     pass
         
-        # Check if we should trigger immediate learning
-        total_experiences = len(self.experience_collector.experiences)
-        if total_experiences >= self.min_experiences_for_learning:
-            # Trigger learning cycle if enough new experiences
-            if self.last_learning_cycle is None or \
-               (datetime.now() - self.last_learning_cycle).total_seconds() > 3600:  # 1 hour
-                asyncio.create_task(self.run_learning_cycle())
+        # Let the runtime queue a cycle once enough new experiences are pending
+        if self.runtime is not None:
+            self.runtime.notify_experience(self)
         
         return experience_id
     
+    def pending_experiences(self) -> int:
+        """Experiences collected since the last analysed cycle"""
+        return self.experience_collector.experiences.sequence - self._experience_cursor
+    
+    def has_learning_work(self) -> bool:
+        """True if a learning cycle would analyse anything"""
+        return (
+            self.pending_experiences() > 0
+            and len(self.experience_collector.experiences) >= self.min_experiences_for_learning
+        )
+    
     async def learn_from_experience_obj(self, experience: LearningExperience) -> str:
         """Learn from a LearningExperience object (deprecated - use learn_from_experience)"""
         return await self.learn_from_experience(experience)
@@ -262,13 +274,18 @@ class AdaptiveLearningSystem:
         }
         
         try:
-            # Step 1: Analyze experiences to discover patterns
-            experiences = list(self.experience_collector.experiences.values())
+            # Step 1: Analyze experiences added since the last analysed cycle to update patterns
+            experiences, cursor = self.experience_collector.experiences.added_since(self._experience_cursor)
             cycle_results["experiences_analyzed"] = len(experiences)
             
-            if len(experiences) >= self.min_experiences_for_learning:
-                # Discover patterns
-                patterns = await self.pattern_recognizer.analyze_experiences(experiences)
+            if len(self.experience_collector.experiences) >= self.min_experiences_for_learning:
+                self._experience_cursor = cursor
+                
+                # Discover patterns (incremental: only new experiences update the statistics)
+                patterns = await self.pattern_recognizer.analyze_experiences(
+                    experiences,
+                    executor=self.runtime.mining_executor if self.runtime is not None else None
+                )
                 cycle_results["patterns_discovered"] = len(patterns)
                 
                 # Step 2: Generate adaptations from patterns
@@ -473,38 +490,6 @@ class AdaptiveLearningSystem:
         # For now, just log the integration
         self.logger.info(f"Integrated {len(patterns)} patterns and {len(adaptation_rules)} adaptations with reasoning engine")
     
-    async def _learning_cycle_loop(self) -> None:
-        """Background loop for periodic learning cycles"""
-        
-        try:
-            while self.learning_enabled:
-                try:
-                    # Wait for the specified interval
-                    await asyncio.sleep(self.learning_frequency_hours * 3600)
-                    
-                    # Run learning cycle if we have enough experiences
-                    if len(self.experience_collector.experiences) >= self.min_experiences_for_learning:
-                        await self.run_learning_cycle()
-                    
-                except asyncio.CancelledError:
-                    # Task was cancelled, break the loop
-                    self.logger.info("Learning cycle loop cancelled")
-                    break
-                except Exception as e:
-                    self.logger.error(f"Error in learning cycle loop: {str(e)}")
-                    # Wait 1 hour before retrying, but allow cancellation
-                    try:
-                        await asyncio.sleep(3600)
-                    except asyncio.CancelledError:
-                        self.logger.info("Learning cycle loop cancelled during retry wait")
-                        break
-        except asyncio.CancelledError:
-            # Handle cancellation at the top level
-            self.logger.info("Learning cycle loop task cancelled")
-        finally:
-            # Cleanup when loop ends
-            self.logger.info("Learning cycle loop ended")
-    
     async def add_learning_goal(self, goal: LearningGoal) -> str:
         """Add a new learning goal"""
         
@@ -563,7 +548,9 @@ class AdaptiveLearningSystem:
                 for goal_id, goal in self.learning_goals.items()
             },
             "active_adaptations": self.adaptation_engine.get_active_adaptations(),
-            "current_performance": self.performance_tracker.get_current_performance()
+            "current_performance": self.performance_tracker.get_current_performance(),
+            "pending_experiences": self.pending_experiences(),
+            "scheduled": self.runtime is not None and self.runtime.is_registered(self)
         }
     
     def get_learning_insights(self) -> Dict[str, Any]:
@@ -647,6 +634,9 @@ class AdaptiveLearningSystem:
     async def cleanup(self) -> None:
         """Clean up background tasks and resources"""
         
+        if self.runtime is not None:
+            self.runtime.unregister(self)
+        
         # Cancel background tasks
         for task in self.background_tasks:
             if not task.done():
@@ -676,6 +666,7 @@ class AdaptiveLearningSystem:
         # Reset learning goals and state
         self.learning_goals.clear()
         self.last_learning_cycle = None
+        self._experience_cursor = self.experience_collector.experiences.sequence
         
         # Reset system statistics
         self.system_stats = {
@@ -692,10 +683,9 @@ class AdaptiveLearningSystem:
         
         self.logger.info("Learning system reset completed")
         
-        # Restart background tasks if learning is enabled
-        if self.learning_enabled:
-            self.learning_cycle_task = asyncio.create_task(self._learning_cycle_loop())
-            self.background_tasks.add(self.learning_cycle_task)
+        # Reschedule learning cycles if learning is enabled
+        if self.learning_enabled and self.runtime is not None:
+            self.runtime.register(self)
         
         # Create reset event
         await publish_event(
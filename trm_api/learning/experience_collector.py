@@ -17,18 +17,26 @@ from .learning_types import (
     LearningSession,
     safe_enum_value
 )
+from .experience_store import ExperienceStore, SQLiteExperienceSpill
 from ..eventbus.system_event_bus import publish_event, EventType
 
 
 class ExperienceCollector:
     """Collects and manages learning experiences for agents"""
     
-    def __init__(self, agent_id: str):
+    def __init__(
+        self,
+        agent_id: str,
+        max_experiences_stored: int = 10000,
+        spill_path: Optional[str] = None
+    ):
         self.agent_id = agent_id
         self.logger = logging.getLogger(f"learning.experience_collector.{agent_id}")
         
-        # Experience storage
-        self.experiences: Dict[str, LearningExperience] = {}
+        # Experience storage: bounded FIFO with indexes; evicted experiences go
+        # to a SQLite file when spill_path is given
+        spill = SQLiteExperienceSpill(spill_path) if spill_path else None
+        self.experiences = ExperienceStore(max_items=max_experiences_stored, spill=spill)
         self.active_sessions: Dict[str, LearningSession] = {}
         
         # Collection statistics
@@ -43,7 +51,15 @@ class ExperienceCollector:
         # Configuration
         self.auto_capture_enabled = True
         self.min_confidence_threshold = 0.3
-        self.max_experiences_stored = 10000  # Memory management
+    
+    @property
+    def max_experiences_stored(self) -> int:
+        """Experiences kept in memory (memory management)"""
+        return self.experiences.max_items
+    
+    @max_experiences_stored.setter
+    def max_experiences_stored(self, value: int) -> None:
+        self.experiences.max_items = value
         
     async def start_learning_session(
         self, 
@@ -274,7 +290,7 @@ class ExperienceCollector:
                 f"({experience.confidence_level}), storing anyway"
             )
         
-        # Store experience
+        # Store experience (the store evicts the oldest beyond max_experiences_stored)
         self.experiences[experience.experience_id] = experience
         
         # Add to active session if specified
@@ -284,9 +300,6 @@ class ExperienceCollector:
         # Update statistics
         self._update_collection_stats(experience)
         
-        # Memory management
-        await self._manage_memory()
-        
         self.logger.debug(
             f"Stored experience {experience.experience_id} of type "
             f"{safe_enum_value(experience.experience_type)}"
@@ -358,50 +371,35 @@ class ExperienceCollector:
             (current_avg_imp * (total - 1) + experience.importance_weight) / total
         )
     
-    async def _manage_memory(self) -> None:
-        """Manage memory by removing old experiences if needed"""
-        
-        if len(self.experiences) > self.max_experiences_stored:
-            # Remove oldest experiences (simple FIFO strategy)
-            experiences_to_remove = len(self.experiences) - self.max_experiences_stored
-            
-            # Sort by timestamp and remove oldest
-            sorted_experiences = sorted(
-                self.experiences.items(),
-                key=lambda x: x[1].timestamp
-            )
-            
-            for i in range(experiences_to_remove):
-                exp_id = sorted_experiences[i][0]
-                del self.experiences[exp_id]
-                
-            self.logger.info(f"Removed {experiences_to_remove} old experiences for memory management")
-    
-    def get_experiences_by_type(self, experience_type: ExperienceType) -> List[LearningExperience]:
+    def get_experiences_by_type(
+        self, experience_type: ExperienceType, include_spilled: bool = False
+    ) -> List[LearningExperience]:
         """Get experiences filtered by type"""
-        return [
-            exp for exp in self.experiences.values()
-            if exp.experience_type == experience_type
-        ]
+        return self.experiences.by_type(experience_type, include_spilled)
     
-    def get_experiences_by_success(self, success: bool) -> List[LearningExperience]:
+    def get_experiences_by_success(
+        self, success: bool, include_spilled: bool = False
+    ) -> List[LearningExperience]:
         """Get experiences filtered by success status"""
-        return [
-            exp for exp in self.experiences.values()
-            if exp.success == success
-        ]
+        return self.experiences.by_success(success, include_spilled)
+    
+    def get_experiences_by_agent(
+        self, agent_id: str, include_spilled: bool = False
+    ) -> List[LearningExperience]:
+        """Get experiences recorded for an agent"""
+        return self.experiences.by_agent(agent_id, include_spilled)
     
-    def get_recent_experiences(self, hours: int = 24) -> List[LearningExperience]:
+    def get_recent_experiences(self, hours: int = 24, include_spilled: bool = False) -> List[LearningExperience]:
         """Get experiences from the last N hours"""
         cutoff_time = datetime.now() - timedelta(hours=hours)
-        return [
-            exp for exp in self.experiences.values()
-            if exp.timestamp >= cutoff_time
-        ]
+        return self.experiences.since(cutoff_time, include_spilled)
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get collection statistics"""
-        return self.collection_stats.copy()
+        stats = self.collection_stats.copy()
+        stats["experiences_in_memory"] = len(self.experiences)
+        stats["experiences_evicted"] = self.experiences.evicted
+        return stats
     
     def clear_experiences(self) -> None:
         """Clear all stored experiences (use with caution)"""
@@ -0,0 +1,263 @@
+"""
+Experience Store for Adaptive Learning System
+
+Bounded, indexed storage for LearningExperience objects:
+- Insertion-ordered FIFO eviction in O(1)
+- Secondary indexes by type, success and agent, plus time buckets for recency queries
+- Optional SQLite spill so evicted experiences stay queryable on disk
+"""
+
+import bisect
+import json
+import logging
+import sqlite3
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .learning_types import LearningExperience, safe_enum_value
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteExperienceSpill:
+    """Experiences evicted from memory, kept in a SQLite file"""
+
+    def __init__(self, path: str, batch_size: int = 100):
+        self.path = path
+        self.batch_size = batch_size
+        self._pending: List[LearningExperience] = []
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS experiences ("
+            "experience_id TEXT PRIMARY KEY, experience_type TEXT, success INTEGER, "
+            "agent_id TEXT, timestamp REAL, data TEXT NOT NULL)"
+        )
+        for column in ("experience_type", "success", "agent_id", "timestamp"):
+            self._conn.execute(f"CREATE INDEX IF NOT EXISTS experiences_{column} ON experiences ({column})")
+        self._conn.commit()
+
+    def add(self, experience: LearningExperience) -> None:
+        # Written in batches: one transaction per batch_size evictions
+        self._pending.append(experience)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        rows = [
+            (
+                exp.experience_id, safe_enum_value(exp.experience_type), int(exp.success),
+                exp.agent_id, exp.timestamp.timestamp(), exp.model_dump_json()
+            )
+            for exp in self._pending
+        ]
+        with self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO experiences VALUES (?, ?, ?, ?, ?, ?)", rows)
+        self._pending.clear()
+
+    def get(self, experience_id: str) -> Optional[LearningExperience]:
+        self.flush()
+        row = self._conn.execute(
+            "SELECT data FROM experiences WHERE experience_id = ?", (experience_id,)
+        ).fetchone()
+        return LearningExperience.model_validate(json.loads(row[0])) if row else None
+
+    def query(self, experience_type: Optional[str] = None, success: Optional[bool] = None,
+              agent_id: Optional[str] = None, since: Optional[datetime] = None,
+              limit: Optional[int] = None) -> List[LearningExperience]:
+        """Spilled experiences matching all given filters, oldest first"""
+        self.flush()
+        clauses, params = [], []
+        if experience_type is not None:
+            clauses.append("experience_type = ?")
+            params.append(experience_type)
+        if success is not None:
+            clauses.append("success = ?")
+            params.append(int(success))
+        if agent_id is not None:
+            clauses.append("agent_id = ?")
+            params.append(agent_id)
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(since.timestamp())
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._conn.execute(
+            f"SELECT data FROM experiences {where} ORDER BY timestamp LIMIT ?",
+            (*params, limit if limit is not None else -1)
+        ).fetchall()
+        return [LearningExperience.model_validate(json.loads(row[0])) for row in rows]
+
+    def count(self) -> int:
+        self.flush()
+        return self._conn.execute("SELECT COUNT(*) FROM experiences").fetchone()[0]
+
+    def clear(self) -> None:
+        self._pending.clear()
+        with self._conn:
+            self._conn.execute("DELETE FROM experiences")
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+
+class ExperienceStore(MutableMapping):
+    """Experiences by id with FIFO eviction and secondary indexes.
+
+    Behaves like the dict it replaces (experience_id -> LearningExperience);
+    index sets are dicts used as insertion-ordered sets.
+    """
+
+    def __init__(self, max_items: int = 10000, bucket_seconds: int = 3600,
+                 spill: Optional[SQLiteExperienceSpill] = None):
+        self.max_items = max_items
+        self.bucket_seconds = bucket_seconds
+        self.spill = spill
+        self.evicted = 0
+
+        # Insertion sequence numbers, so consumers can fetch only what was added since their cursor
+        self.sequence = 0
+        self._sequence_of: Dict[str, int] = {}
+
+        self._items: "OrderedDict[str, LearningExperience]" = OrderedDict()
+        self._by_type: Dict[str, Dict[str, None]] = {}
+        self._by_success: Dict[bool, Dict[str, None]] = {True: {}, False: {}}
+        self._by_agent: Dict[str, Dict[str, None]] = {}
+        self._by_bucket: Dict[int, Dict[str, None]] = {}
+        self._bucket_keys: List[int] = []  # Sorted
+
+    # Mapping interface
+
+    def __getitem__(self, experience_id: str) -> LearningExperience:
+        return self._items[experience_id]
+
+    def __setitem__(self, experience_id: str, experience: LearningExperience) -> None:
+        if experience_id in self._items:
+            self._unindex(experience_id, self._items[experience_id])
+            self._items.move_to_end(experience_id)
+        self._items[experience_id] = experience
+        self.sequence += 1
+        self._sequence_of[experience_id] = self.sequence
+        self._index(experience_id, experience)
+        self._evict()
+
+    def __delitem__(self, experience_id: str) -> None:
+        experience = self._items.pop(experience_id)
+        self._sequence_of.pop(experience_id, None)
+        self._unindex(experience_id, experience)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._sequence_of.clear()
+        self._by_type.clear()
+        self._by_success = {True: {}, False: {}}
+        self._by_agent.clear()
+        self._by_bucket.clear()
+        self._bucket_keys.clear()
+        if self.spill is not None:
+            self.spill.clear()
+
+    # Indexes
+
+    def _bucket(self, timestamp: datetime) -> int:
+        return int(timestamp.timestamp() // self.bucket_seconds)
+
+    def _index(self, experience_id: str, experience: LearningExperience) -> None:
+        self._by_type.setdefault(safe_enum_value(experience.experience_type), {})[experience_id] = None
+        self._by_success[bool(experience.success)][experience_id] = None
+        self._by_agent.setdefault(experience.agent_id, {})[experience_id] = None
+        bucket = self._bucket(experience.timestamp)
+        if bucket not in self._by_bucket:
+            self._by_bucket[bucket] = {}
+            bisect.insort(self._bucket_keys, bucket)
+        self._by_bucket[bucket][experience_id] = None
+
+    def _unindex(self, experience_id: str, experience: LearningExperience) -> None:
+        self._discard(self._by_type, safe_enum_value(experience.experience_type), experience_id)
+        self._by_success[bool(experience.success)].pop(experience_id, None)
+        self._discard(self._by_agent, experience.agent_id, experience_id)
+        bucket = self._bucket(experience.timestamp)
+        if self._discard(self._by_bucket, bucket, experience_id):
+            del self._bucket_keys[bisect.bisect_left(self._bucket_keys, bucket)]
+
+    @staticmethod
+    def _discard(index: Dict, key, experience_id: str) -> bool:
+        """Remove from an index set; True if the set became empty and was dropped"""
+        ids = index.get(key)
+        if ids is None:
+            return False
+        ids.pop(experience_id, None)
+        if not ids:
+            del index[key]
+            return True
+        return False
+
+    def _evict(self) -> None:
+        while len(self._items) > self.max_items:
+            experience_id, experience = self._items.popitem(last=False)
+            self._sequence_of.pop(experience_id, None)
+            self._unindex(experience_id, experience)
+            self.evicted += 1
+            if self.spill is not None:
+                self.spill.add(experience)
+
+    # Queries
+
+    def added_since(self, cursor: int) -> Tuple[List[LearningExperience], int]:
+        """Experiences inserted after `cursor` (still in memory) and the new cursor; O(new)"""
+        added = []
+        for experience_id in reversed(self._items):
+            if self._sequence_of[experience_id] <= cursor:
+                break
+            added.append(self._items[experience_id])
+        added.reverse()
+        return added, self.sequence
+
+    def _resolve(self, ids) -> List[LearningExperience]:
+        return [self._items[experience_id] for experience_id in ids]
+
+    def by_type(self, experience_type, include_spilled: bool = False) -> List[LearningExperience]:
+        key = safe_enum_value(experience_type)
+        found = self._resolve(self._by_type.get(key, ()))
+        if include_spilled and self.spill is not None:
+            found = self.spill.query(experience_type=key) + found
+        return found
+
+    def by_success(self, success: bool, include_spilled: bool = False) -> List[LearningExperience]:
+        found = self._resolve(self._by_success[bool(success)])
+        if include_spilled and self.spill is not None:
+            found = self.spill.query(success=success) + found
+        return found
+
+    def by_agent(self, agent_id: str, include_spilled: bool = False) -> List[LearningExperience]:
+        found = self._resolve(self._by_agent.get(agent_id, ()))
+        if include_spilled and self.spill is not None:
+            found = self.spill.query(agent_id=agent_id) + found
+        return found
+
+    def since(self, cutoff: datetime, include_spilled: bool = False) -> List[LearningExperience]:
+        """Experiences with timestamp >= cutoff; only buckets at or after the cutoff are visited"""
+        first_bucket = self._bucket(cutoff)
+        found = []
+        for bucket in self._bucket_keys[bisect.bisect_left(self._bucket_keys, first_bucket):]:
+            for experience_id in self._by_bucket[bucket]:
+                experience = self._items[experience_id]
+                if bucket != first_bucket or experience.timestamp >= cutoff:
+                    found.append(experience)
+        if include_spilled and self.spill is not None:
+            found = self.spill.query(since=cutoff) + found
+        return found
+
+    def get_spilled(self, experience_id: str) -> Optional[LearningExperience]:
+        return self.spill.get(experience_id) if self.spill is not None else None
@@ -0,0 +1,260 @@
+"""
+Learning Runtime for Adaptive Learning System
+
+One scheduler for the learning cycles of every AdaptiveLearningSystem in the
+process, instead of a sleeping background task per agent:
+- Cycles are triggered by new experiences (experiences_per_cycle), with the
+  wall-clock interval (learning_frequency_hours) only as a jittered fallback;
+  first interval cycles are spread over a whole interval
+- Cycles run in a bounded worker pool; pattern mining can optionally run in
+  worker processes
+- Backpressure: triggers beyond max_pending are deferred, and intervals are
+  stretched while cycles queue up
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import time
+import weakref
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from .adaptive_learning_system import AdaptiveLearningSystem
+
+logger = logging.getLogger(__name__)
+
+
+class LearningRuntime:
+    """Schedules learning cycles of registered systems on a bounded worker pool.
+
+    Systems are held by weak reference, so a system that is dropped without
+    being unregistered simply stops being scheduled.
+    """
+
+    def __init__(self, max_workers: int = 4, max_pending: Optional[int] = None,
+                 jitter: float = 0.1, retry_seconds: float = 60.0,
+                 use_processes: bool = False, mining_workers: Optional[int] = None):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.jitter = jitter
+        self.retry_seconds = retry_seconds
+        self.use_processes = use_processes
+        self.mining_workers = mining_workers or max_workers
+
+        # Registered systems -> token of their current timer (older heap entries are stale)
+        self._systems: "weakref.WeakKeyDictionary[AdaptiveLearningSystem, int]" = weakref.WeakKeyDictionary()
+        self._timers: List[Tuple[float, int, weakref.ref]] = []  # Heap of (due, token, system)
+        self._tokens = itertools.count()
+        self._ready: Deque[Tuple[weakref.ref, float]] = deque()  # (system, enqueued at)
+        self._queued: "weakref.WeakSet[AdaptiveLearningSystem]" = weakref.WeakSet()
+        self._running: "weakref.WeakSet[AdaptiveLearningSystem]" = weakref.WeakSet()
+        self._active: Set[asyncio.Task] = set()
+
+        self._scheduler: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._mining_executor: Optional[Executor] = None
+
+        self.metrics: Dict[str, Any] = {
+            'cycles_completed': 0,
+            'cycles_failed': 0,
+            'experience_triggers': 0,
+            'interval_triggers': 0,
+            'coalesced': 0,
+            'deferred': 0,
+            'peak_queue_depth': 0,
+            'total_wait_seconds': 0.0,
+            'max_wait_seconds': 0.0,
+            'total_cycle_seconds': 0.0,
+        }
+
+    # Registration
+
+    def register(self, system: "AdaptiveLearningSystem") -> None:
+        """Schedule a system; its first interval cycle lands at a random point within one interval"""
+        self._ensure_started()
+        self._schedule(system, random.uniform(0, self._interval(system)))
+
+    def unregister(self, system: "AdaptiveLearningSystem") -> None:
+        self._systems.pop(system, None)
+        self._queued.discard(system)
+        if not self._systems and self._scheduler is not None:
+            self._scheduler.cancel()
+            self._scheduler = None
+
+    def is_registered(self, system: "AdaptiveLearningSystem") -> bool:
+        return system in self._systems
+
+    # Triggers
+
+    def notify_experience(self, system: "AdaptiveLearningSystem") -> bool:
+        """Called after a system collected an experience; queues a cycle once enough are pending"""
+        if system not in self._systems or not system.learning_enabled:
+            return False
+        if system.pending_experiences() < system.experiences_per_cycle:
+            return False
+        return self._enqueue(system, 'experience_triggers')
+
+    def _on_timer(self, system: "AdaptiveLearningSystem") -> None:
+        if system.learning_enabled and system.has_learning_work():
+            if self._enqueue(system, 'interval_triggers'):
+                return  # Rescheduled when the cycle finishes
+            self._schedule(system, self._jittered(self.retry_seconds))
+            return
+        self._schedule(system, self._jittered(self._interval(system)))
+
+    def _enqueue(self, system: "AdaptiveLearningSystem", trigger: str) -> bool:
+        if system in self._queued or system in self._running:
+            # New experiences are picked up by the queued/running cycle or the next one
+            self.metrics['coalesced'] += 1
+            return True
+        if self.max_pending is not None and len(self._queued) >= self.max_pending:
+            self.metrics['deferred'] += 1
+            return False
+        self.metrics[trigger] += 1
+        self._queued.add(system)
+        self._ready.append((weakref.ref(system), time.monotonic()))
+        self.metrics['peak_queue_depth'] = max(self.metrics['peak_queue_depth'], len(self._queued))
+        self._wake()
+        return True
+
+    # Scheduling
+
+    def _interval(self, system: "AdaptiveLearningSystem") -> float:
+        # Stretched while cycles are queued beyond what the workers can take
+        backlog = len(self._queued) / self.max_workers
+        return system.learning_frequency_hours * 3600 * (1 + backlog)
+
+    def _jittered(self, seconds: float) -> float:
+        return seconds * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def _schedule(self, system: "AdaptiveLearningSystem", delay: float) -> None:
+        token = next(self._tokens)
+        self._systems[system] = token
+        heapq.heappush(self._timers, (time.monotonic() + delay, token, weakref.ref(system)))
+        self._wake()
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _ensure_started(self) -> None:
+        # The scheduler belongs to one event loop; tests and scripts may run several
+        loop = asyncio.get_running_loop()
+        if self._scheduler is None or self._scheduler.done() or self._scheduler.get_loop() is not loop:
+            self._wakeup = asyncio.Event()
+            self._scheduler = loop.create_task(self._scheduler_loop())
+
+    async def _scheduler_loop(self) -> None:
+        try:
+            while True:
+                now = time.monotonic()
+                while self._timers and self._timers[0][0] <= now:
+                    _, token, ref = heapq.heappop(self._timers)
+                    system = ref()
+                    if system is not None and self._systems.get(system) == token:
+                        self._on_timer(system)
+                self._dispatch()
+
+                timeout = self._timers[0][0] - now if self._timers else None
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        except asyncio.CancelledError:
+            logger.debug("Learning runtime scheduler stopped")
+
+    def _dispatch(self) -> None:
+        while self._ready and len(self._active) < self.max_workers:
+            ref, enqueued_at = self._ready.popleft()
+            system = ref()
+            if system is None or system not in self._queued:
+                continue
+            self._queued.discard(system)
+            self._running.add(system)
+
+            waited = time.monotonic() - enqueued_at
+            self.metrics['total_wait_seconds'] += waited
+            self.metrics['max_wait_seconds'] = max(self.metrics['max_wait_seconds'], waited)
+
+            task = asyncio.create_task(self._run_cycle(system))
+            self._active.add(task)
+            task.add_done_callback(self._active.discard)
+
+    async def _run_cycle(self, system: "AdaptiveLearningSystem") -> None:
+        started_at = time.monotonic()
+        try:
+            result = await system.run_learning_cycle()
+            if not result.get("success", False):
+                self.metrics['cycles_failed'] += 1
+        except Exception as e:
+            self.metrics['cycles_failed'] += 1
+            logger.error(f"Learning cycle of {system.agent_id} failed: {e}")
+        finally:
+            self._running.discard(system)
+            self.metrics['cycles_completed'] += 1
+            self.metrics['total_cycle_seconds'] += time.monotonic() - started_at
+            if system in self._systems:
+                self._schedule(system, self._jittered(self._interval(system)))
+            self._wake()
+
+    # Mining executor
+
+    @property
+    def mining_executor(self) -> Optional[Executor]:
+        """Process pool for pattern mining when use_processes is set (else mining runs in the loop)"""
+        if self.use_processes and self._mining_executor is None:
+            self._mining_executor = ProcessPoolExecutor(max_workers=self.mining_workers)
+        return self._mining_executor
+
+    def get_metrics(self) -> Dict[str, Any]:
+        completed = self.metrics['cycles_completed']
+        dispatched = completed + len(self._active)
+        return {
+            **self.metrics,
+            'registered_systems': len(self._systems),
+            'queue_depth': len(self._queued),
+            'running': len(self._active),
+            'max_workers': self.max_workers,
+            'max_pending': self.max_pending,
+            'avg_wait_seconds': self.metrics['total_wait_seconds'] / dispatched if dispatched else 0.0,
+            'avg_cycle_seconds': self.metrics['total_cycle_seconds'] / completed if completed else 0.0,
+        }
+
+    async def shutdown(self) -> None:
+        """Stop scheduling and wait for running cycles"""
+        if self._scheduler is not None:
+            self._scheduler.cancel()
+            self._scheduler = None
+        if self._active:
+            await asyncio.gather(*self._active, return_exceptions=True)
+        if self._mining_executor is not None:
+            self._mining_executor.shutdown(wait=False)
+            self._mining_executor = None
+
+
+_learning_runtime: Optional[LearningRuntime] = None
+
+
+def get_learning_runtime() -> LearningRuntime:
+    """Process-wide runtime configured by the LEARNING_* settings"""
+    global _learning_runtime
+    if _learning_runtime is None:
+        from ..core.config import settings
+        _learning_runtime = LearningRuntime(
+            max_workers=settings.LEARNING_RUNTIME_WORKERS,
+            max_pending=settings.LEARNING_RUNTIME_MAX_PENDING,
+            use_processes=settings.LEARNING_MINING_USE_PROCESSES
+        )
+    return _learning_runtime
+
+
+def set_learning_runtime(runtime: Optional[LearningRuntime]) -> None:
+    """Replace the process-wide runtime (None re-reads settings on next use)"""
+    global _learning_runtime
+    _learning_runtime = runtime
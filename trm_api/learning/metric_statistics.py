@@ -0,0 +1,257 @@
+"""
+Streaming Metric Statistics for Adaptive Learning System
+
+Constant-cost building blocks for per-metric performance tracking:
+- Welford running mean/variance (baselines, significance checks, rollups)
+- Sliding-window least-squares slope maintained from running sums
+- Time-bucketed rollups for range queries beyond the raw history
+- NumPy-backed ring buffers for the raw (timestamp, value) history
+"""
+
+import bisect
+import math
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class RunningStats:
+    """Welford mean/variance with min/max; mergeable (Chan et al.)"""
+
+    __slots__ = ("count", "mean", "m2", "min", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "RunningStats") -> None:
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0.0 below two samples)"""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.mean if self.count else None,
+            "stdev": self.stdev,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+
+class SlidingRegression:
+    """Least-squares slope over the last `window` values (x = 0..n-1) in O(1) per value.
+
+    Keeps sum(y) and sum(i * y) for the window; sliding drops the first value
+    and shifts every remaining index down by one, i.e. subtracts sum(y).
+    """
+
+    def __init__(self, window: int = 10, resync_every: int = 1000):
+        self.window = window
+        self.resync_every = resync_every
+        self._values: deque = deque(maxlen=window)
+        self._sum = 0.0
+        self._weighted = 0.0
+        self._updates = 0
+
+    def add(self, value: float) -> None:
+        if len(self._values) == self.window:
+            self._sum -= self._values.popleft()
+            self._weighted -= self._sum
+        self._weighted += len(self._values) * value
+        self._sum += value
+        self._values.append(value)
+
+        self._updates += 1
+        if self._updates % self.resync_every == 0:
+            # Recompute exactly so floating-point drift cannot accumulate
+            self._sum = math.fsum(self._values)
+            self._weighted = math.fsum(i * v for i, v in enumerate(self._values))
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def slope(self) -> float:
+        n = len(self._values)
+        if n < 2:
+            return 0.0
+        return (self._weighted - (n - 1) / 2 * self._sum) / (n * (n * n - 1) / 12)
+
+    @property
+    def first(self) -> Optional[float]:
+        return self._values[0] if self._values else None
+
+    @property
+    def last(self) -> Optional[float]:
+        return self._values[-1] if self._values else None
+
+
+class TimeBucketRollup:
+    """Per-bucket RunningStats for range queries at bucket granularity"""
+
+    def __init__(self, bucket_seconds: int = 3600, retention_seconds: Optional[float] = None):
+        self.bucket_seconds = bucket_seconds
+        self.retention_seconds = retention_seconds
+        self.buckets: Dict[int, RunningStats] = {}
+        self._keys: List[int] = []  # Sorted
+
+    def add(self, timestamp: float, value: float) -> None:
+        key = int(timestamp // self.bucket_seconds)
+        stats = self.buckets.get(key)
+        if stats is None:
+            stats = self.buckets[key] = RunningStats()
+            bisect.insort(self._keys, key)
+            if self.retention_seconds is not None:
+                self.prune(timestamp - self.retention_seconds)
+        stats.add(value)
+
+    def prune(self, before: float) -> None:
+        """Drop buckets that end before the given timestamp"""
+        cut = bisect.bisect_left(self._keys, int(before // self.bucket_seconds))
+        for key in self._keys[:cut]:
+            del self.buckets[key]
+        del self._keys[:cut]
+
+    def query(self, start: float, end: Optional[float] = None) -> RunningStats:
+        """Merged statistics of the buckets overlapping [start, end]"""
+        first = bisect.bisect_left(self._keys, int(start // self.bucket_seconds))
+        last = len(self._keys) if end is None else bisect.bisect_right(self._keys, int(end // self.bucket_seconds))
+        merged = RunningStats()
+        for key in self._keys[first:last]:
+            merged.merge(self.buckets[key])
+        return merged
+
+
+class MetricRingBuffer:
+    """Fixed-capacity (timestamp, value) history in NumPy arrays, oldest overwritten first.
+
+    Timestamps are epoch seconds and assumed non-decreasing, so time windows
+    are found with a binary search. Original datetimes and contexts are kept
+    alongside for history queries.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self._timestamps = np.empty(capacity, dtype=np.float64)
+        self._values = np.empty(capacity, dtype=np.float64)
+        self._meta: List[Optional[Tuple[datetime, Dict[str, Any]]]] = [None] * capacity
+        self._start = 0
+        self._size = 0
+
+    def append(self, timestamp: datetime, value: float, context: Optional[Dict[str, Any]] = None) -> None:
+        slot = (self._start + self._size) % self.capacity
+        if self._size == self.capacity:
+            self._start = (self._start + 1) % self.capacity
+        else:
+            self._size += 1
+        self._timestamps[slot] = timestamp.timestamp()
+        self._values[slot] = value
+        self._meta[slot] = (timestamp, context or {})
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _ordered(self, array: np.ndarray) -> np.ndarray:
+        end = self._start + self._size
+        if end <= self.capacity:
+            return array[self._start:end]
+        return np.concatenate((array[self._start:], array[:end - self.capacity]))
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Timestamps and values, oldest first"""
+        return self._ordered(self._timestamps), self._ordered(self._values)
+
+    def index_at(self, timestamp: datetime) -> int:
+        """Number of entries strictly before the timestamp"""
+        return int(np.searchsorted(self._ordered(self._timestamps), timestamp.timestamp(), side="left"))
+
+    def tail(self, count: int) -> np.ndarray:
+        return self._ordered(self._values)[-count:] if count else self._values[:0]
+
+    @property
+    def last_value(self) -> Optional[float]:
+        if not self._size:
+            return None
+        return float(self._values[(self._start + self._size - 1) % self.capacity])
+
+    def items(self, start: int = 0) -> List[Dict[str, Any]]:
+        """History entries from position `start` on, as {"timestamp", "value", "context"} dicts"""
+        entries = []
+        for position in range(start, self._size):
+            slot = (self._start + position) % self.capacity
+            timestamp, context = self._meta[slot]
+            entries.append({"timestamp": timestamp, "value": float(self._values[slot]), "context": context})
+        return entries
+
+    def clear(self) -> None:
+        self._start = 0
+        self._size = 0
+        self._meta = [None] * self.capacity
+
+
+class MetricSeries:
+    """Everything tracked for one metric: raw ring buffer, trend regression and rollups"""
+
+    def __init__(self, capacity: int = 1000, trend_window: int = 10, bucket_seconds: int = 3600,
+                 retention_seconds: Optional[float] = None):
+        self.buffer = MetricRingBuffer(capacity)
+        self.regression = SlidingRegression(trend_window)
+        self.rollup = TimeBucketRollup(bucket_seconds, retention_seconds)
+
+    def record(self, timestamp: datetime, value: float, context: Optional[Dict[str, Any]] = None) -> None:
+        self.buffer.append(timestamp, value, context)
+        self.regression.add(value)
+        self.rollup.add(timestamp.timestamp(), value)
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    @property
+    def latest(self) -> Optional[float]:
+        return self.buffer.last_value
+
+    def window(self, since: Optional[datetime] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Timestamps and values recorded at or after `since`"""
+        timestamps, values = self.buffer.arrays()
+        if since is None:
+            return timestamps, values
+        start = int(np.searchsorted(timestamps, since.timestamp(), side="left"))
+        return timestamps[start:], values[start:]
+
+    def history(self, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        return self.buffer.items(self.buffer.index_at(since) if since is not None else 0)
@@ -3,14 +3,21 @@ Pattern Recognizer for Adaptive Learning System
 
 Identifies patterns in learning experiences and performance data.
 Follows TRM-OS philosophy: Recognition → Event → WIN through pattern discovery.
+
+Mining is incremental: each experience updates sufficient statistics once, and
+only the patterns whose statistics changed are re-derived and updated in place
+(patterns are keyed by a canonical signature of their type and conditions).
 """
 
+import asyncio
+import json
 import logging
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple, Set
-from collections import defaultdict, Counter
-from statistics import mean, stdev
-import math
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Set
 
 from .learning_types import (
     LearningExperience, 
@@ -23,6 +30,218 @@ from .learning_types import (
 from ..eventbus.system_event_bus import publish_event, EventType
 
 
+DAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+
+def pattern_signature(pattern: LearningPattern) -> str:
+    """Canonical identity of a pattern: its type and conditions"""
+    return f"{pattern.pattern_type}|{json.dumps(pattern.conditions, sort_keys=True, default=str)}"
+
+
+def action_signature(action_data: Dict[str, Any]) -> Optional[str]:
+    """Simplified signature for actions"""
+    
+    if not action_data:
+        return None
+    
+    # Extract key action characteristics
+    signature_parts = []
+    
+    # Look for common action patterns
+    if "action_type" in action_data:
+        signature_parts.append(f"type:{action_data['action_type']}")
+    
+    if "approach" in action_data:
+        if isinstance(action_data["approach"], dict):
+            if "strategy" in action_data["approach"]:
+                signature_parts.append(f"strategy:{action_data['approach']['strategy']}")
+        else:
+            signature_parts.append(f"approach:{action_data['approach']}")
+    
+    if "decision_made" in action_data:
+        if isinstance(action_data["decision_made"], dict):
+            if "option" in action_data["decision_made"]:
+                signature_parts.append(f"option:{action_data['decision_made']['option']}")
+    
+    # Generic fallback - use first few keys
+    if not signature_parts and len(action_data) > 0:
+        for key in sorted(action_data.keys())[:3]:
+            value = action_data[key]
+            if isinstance(value, (str, int, float, bool)):
+                signature_parts.append(f"{key}:{value}")
+    
+    return "|".join(signature_parts) if signature_parts else None
+
+
+@dataclass
+class PatternStatistics:
+    """Sufficient statistics for pattern mining; counts are [successes, total]"""
+    success_by_type: Dict[str, List[int]] = field(default_factory=dict)
+    by_hour: Dict[int, List[int]] = field(default_factory=dict)
+    by_weekday: Dict[int, List[int]] = field(default_factory=dict)
+    by_context: Dict[Tuple[str, str], List[int]] = field(default_factory=dict)
+    # (experience_type, metric) -> [sum of improvements, count]
+    improvement: Dict[Tuple[str, str], List[float]] = field(default_factory=dict)
+    # action signature -> [successes, total, sum of confidence]
+    by_action: Dict[str, List[float]] = field(default_factory=dict)
+    experiences: int = 0
+
+    def absorb(self, exp: LearningExperience) -> Set[Tuple]:
+        """Update sufficient statistics with one experience; returns the keys of affected patterns"""
+        self.experiences += 1
+        success = 1 if exp.success else 0
+        exp_type = safe_enum_value(exp.experience_type)
+        dirty = {("temporal_performance",), ("weekly_performance",)}
+
+        counts = self.success_by_type.setdefault(exp_type, [0, 0])
+        counts[0] += success
+        counts[1] += 1
+        dirty.add(("success_rate", exp_type))
+
+        for histogram, bucket in ((self.by_hour, exp.timestamp.hour), (self.by_weekday, exp.timestamp.weekday())):
+            counts = histogram.setdefault(bucket, [0, 0])
+            counts[0] += success
+            counts[1] += 1
+
+        for key, value in exp.context.items():
+            if isinstance(value, (str, int, float, bool)):
+                context_key = (key, str(value))
+                counts = self.by_context.setdefault(context_key, [0, 0])
+                counts[0] += success
+                counts[1] += 1
+                dirty.add(("context_correlation", *context_key))
+
+        for metric, improvement in (exp.improvement or {}).items():
+            totals = self.improvement.setdefault((exp_type, metric), [0.0, 0])
+            totals[0] += improvement
+            totals[1] += 1
+            dirty.add(("performance_improvement", exp_type, metric))
+
+        action_sig = action_signature(exp.action_taken)
+        if action_sig:
+            counts = self.by_action.setdefault(action_sig, [0, 0, 0.0])
+            counts[0] += success
+            counts[1] += 1
+            counts[2] += exp.confidence_level
+            dirty.add(("action_outcome", action_sig))
+
+        return dirty
+
+    def merge(self, other: "PatternStatistics") -> None:
+        """Add another set of statistics (e.g. mined from a batch in a worker process)"""
+        for mine, theirs in (
+            (self.success_by_type, other.success_by_type), (self.by_hour, other.by_hour),
+            (self.by_weekday, other.by_weekday), (self.by_context, other.by_context),
+            (self.improvement, other.improvement), (self.by_action, other.by_action)
+        ):
+            for key, values in theirs.items():
+                totals = mine.get(key)
+                if totals is None:
+                    mine[key] = list(values)
+                else:
+                    for i, value in enumerate(values):
+                        totals[i] += value
+        self.experiences += other.experiences
+
+
+def absorb_batch(experiences: List[LearningExperience]) -> Tuple[PatternStatistics, Set[Tuple]]:
+    """Statistics of a batch and the keys it affects; picklable for process pools"""
+    stats = PatternStatistics()
+    dirty: Set[Tuple] = set()
+    for exp in experiences:
+        dirty.update(stats.absorb(exp))
+    return stats, dirty
+
+
+class PatternStore(MutableMapping):
+    """Patterns by id, deduplicated by signature, with type and context-key indexes.
+
+    Behaves like the dict it replaces (pattern_id -> LearningPattern). Storing
+    a pattern whose signature already exists replaces the older pattern.
+    """
+
+    def __init__(self):
+        self._items: Dict[str, LearningPattern] = {}
+        self._by_signature: Dict[str, str] = {}
+        self._by_type: Dict[str, Dict[str, None]] = {}
+        # Context key -> patterns that require it; patterns requiring no key are always candidates
+        self._by_context_key: Dict[str, Dict[str, None]] = {}
+        self._unconditional: Dict[str, None] = {}
+
+    @staticmethod
+    def required_context_keys(pattern: LearningPattern) -> Set[str]:
+        keys = set(pattern.context_constraints or {})
+        if pattern.conditions.get("context_key"):
+            keys.add(str(pattern.conditions["context_key"]))
+        return keys
+
+    def __getitem__(self, pattern_id: str) -> LearningPattern:
+        return self._items[pattern_id]
+
+    def __setitem__(self, pattern_id: str, pattern: LearningPattern) -> None:
+        if pattern_id in self._items:
+            self._unindex(pattern_id, self._items[pattern_id])
+        signature = pattern_signature(pattern)
+        duplicate = self._by_signature.get(signature)
+        if duplicate is not None and duplicate != pattern_id:
+            del self[duplicate]
+        self._items[pattern_id] = pattern
+        self._by_signature[signature] = pattern_id
+        self._by_type.setdefault(pattern.pattern_type, {})[pattern_id] = None
+        keys = self.required_context_keys(pattern)
+        for key in keys:
+            self._by_context_key.setdefault(key, {})[pattern_id] = None
+        if not keys:
+            self._unconditional[pattern_id] = None
+
+    def __delitem__(self, pattern_id: str) -> None:
+        self._unindex(pattern_id, self._items.pop(pattern_id))
+
+    def _unindex(self, pattern_id: str, pattern: LearningPattern) -> None:
+        signature = pattern_signature(pattern)
+        if self._by_signature.get(signature) == pattern_id:
+            del self._by_signature[signature]
+        self._discard(self._by_type, pattern.pattern_type, pattern_id)
+        for key in self.required_context_keys(pattern):
+            self._discard(self._by_context_key, key, pattern_id)
+        self._unconditional.pop(pattern_id, None)
+
+    @staticmethod
+    def _discard(index: Dict[str, Dict[str, None]], key: str, pattern_id: str) -> None:
+        ids = index.get(key)
+        if ids is not None:
+            ids.pop(pattern_id, None)
+            if not ids:
+                del index[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._by_signature.clear()
+        self._by_type.clear()
+        self._by_context_key.clear()
+        self._unconditional.clear()
+
+    def by_signature(self, signature: str) -> Optional[LearningPattern]:
+        pattern_id = self._by_signature.get(signature)
+        return self._items[pattern_id] if pattern_id is not None else None
+
+    def by_type(self, pattern_type: str) -> List[LearningPattern]:
+        return [self._items[pattern_id] for pattern_id in self._by_type.get(pattern_type, ())]
+
+    def candidates(self, context: Dict[str, Any]) -> List[LearningPattern]:
+        """Patterns that could apply to the context: unconditional ones plus those keyed by its keys"""
+        ids = dict(self._unconditional)
+        for key in context:
+            ids.update(self._by_context_key.get(key, {}))
+        return [self._items[pattern_id] for pattern_id in ids]
+
+
 class PatternRecognizer:
     """Recognizes patterns in learning experiences and performance data"""
     
@@ -30,8 +249,14 @@ class PatternRecognizer:
         self.agent_id = agent_id
         self.logger = logging.getLogger(f"learning.pattern_recognizer.{agent_id}")
         
-        # Pattern storage
-        self.discovered_patterns: Dict[str, LearningPattern] = {}
+        # Pattern storage (deduplicated by signature, indexed by context key)
+        self.discovered_patterns = PatternStore()
+        
+        # Sufficient statistics, updated once per experience
+        self.statistics = PatternStatistics()
+        self.max_tracked_experiences = 100000  # Ids remembered to skip already-absorbed experiences
+        self._absorbed_ids: "OrderedDict[str, None]" = OrderedDict()
+        self._key_signatures: Dict[Tuple, str] = {}  # Statistics key -> signature of its pattern
         
         # Recognition parameters
         self.min_pattern_frequency = 3      # Minimum occurrences to consider a pattern
@@ -49,297 +274,234 @@ class PatternRecognizer:
     async def analyze_experiences(
         self, 
         experiences: List[LearningExperience],
-        focus_types: List[ExperienceType] = None
+        focus_types: List[ExperienceType] = None,
+        executor: Optional[Executor] = None
     ) -> List[LearningPattern]:
-        """Analyze experiences to discover patterns"""
+        """Absorb new experiences and return the patterns they created or updated.
+
+        Experiences already absorbed (by id) are skipped, so passing the full
+        history each cycle costs only the new experiences. With an executor
+        (e.g. a process pool) the batch is mined there and its statistics
+        merged back.
+        """
         
         if not experiences:
             return []
         
         # Filter experiences if focus types specified
         if focus_types:
+            focus_values = {safe_enum_value(t) for t in focus_types}
             experiences = [
                 exp for exp in experiences 
-                if exp.experience_type in focus_types
+                if safe_enum_value(exp.experience_type) in focus_values
             ]
         
-        discovered_patterns = []
-        
-        # Analyze different types of patterns
-        discovered_patterns.extend(await self._analyze_success_patterns(experiences))
-        discovered_patterns.extend(await self._analyze_temporal_patterns(experiences))
-        discovered_patterns.extend(await self._analyze_context_patterns(experiences))
-        discovered_patterns.extend(await self._analyze_performance_patterns(experiences))
-        discovered_patterns.extend(await self._analyze_action_outcome_patterns(experiences))
+        new_experiences = []
+        for exp in experiences:
+            if exp.experience_id in self._absorbed_ids:
+                continue
+            self._remember(exp.experience_id)
+            new_experiences.append(exp)
+        absorbed = len(new_experiences)
         
-        # Store and validate patterns
-        validated_patterns = []
-        for pattern in discovered_patterns:
-            if await self._validate_pattern(pattern, experiences):
-                await self._store_pattern(pattern)
-                validated_patterns.append(pattern)
+        if not absorbed:
+            return []
         
-        self.logger.info(f"Discovered {len(validated_patterns)} patterns from {len(experiences)} experiences")
+        dirty: Set[Tuple] = set()
+        if executor is not None:
+            loop = asyncio.get_running_loop()
+            batch_statistics, dirty = await loop.run_in_executor(executor, absorb_batch, new_experiences)
+            self.statistics.merge(batch_statistics)
+        else:
+            for exp in new_experiences:
+                dirty.update(self._absorb(exp))
+        
+        # Re-derive only patterns whose statistics changed
+        updated_patterns = []
+        for key in sorted(dirty):
+            pattern = await self._refresh_pattern(key)
+            if pattern is not None:
+                updated_patterns.append(pattern)
+        
+        self.logger.info(
+            f"Updated {len(updated_patterns)} patterns from {absorbed} new experiences "
+            f"({self.statistics.experiences} absorbed in total)"
+        )
         
-        return validated_patterns
+        return updated_patterns
     
-    async def _analyze_success_patterns(
-        self, 
-        experiences: List[LearningExperience]
-    ) -> List[LearningPattern]:
-        """Analyze patterns related to success/failure"""
-        
-        patterns = []
-        
-        # Group by experience type and success
-        success_by_type = defaultdict(list)
-        for exp in experiences:
-            success_by_type[exp.experience_type].append(exp.success)
-        
-        for exp_type, success_list in success_by_type.items():
-            if len(success_list) >= self.min_pattern_frequency:
-                success_rate = sum(success_list) / len(success_list)
-                
-                if success_rate >= 0.8 or success_rate <= 0.2:  # Strong pattern
-                    pattern = LearningPattern(
-                        pattern_type="success_rate",
-                        agent_id=self.agent_id,
-                        description=f"High {'success' if success_rate >= 0.8 else 'failure'} rate "
-                                  f"for {safe_enum_value(exp_type)} experiences",
-                        conditions={"experience_type": safe_enum_value(exp_type)},
-                        outcomes={"expected_success_rate": success_rate},
-                        frequency=len(success_list),
-                        confidence=min(0.9, success_rate if success_rate >= 0.8 else 1 - success_rate),
-                        strength=abs(success_rate - 0.5) * 2,  # Distance from random
-                        success_rate=success_rate
-                    )
-                    patterns.append(pattern)
-        
-        return patterns
+    def _remember(self, experience_id: str) -> None:
+        self._absorbed_ids[experience_id] = None
+        while len(self._absorbed_ids) > self.max_tracked_experiences:
+            self._absorbed_ids.popitem(last=False)
     
-    async def _analyze_temporal_patterns(
-        self, 
-        experiences: List[LearningExperience]
-    ) -> List[LearningPattern]:
-        """Analyze time-based patterns"""
-        
-        patterns = []
-        
-        # Analyze patterns by hour of day
-        hourly_performance = defaultdict(list)
-        for exp in experiences:
-            hour = exp.timestamp.hour
-            hourly_performance[hour].append(exp.success)
-        
-        # Find peak performance hours
-        peak_hours = []
-        for hour, successes in hourly_performance.items():
-            if len(successes) >= 3:  # Minimum sample size
-                success_rate = sum(successes) / len(successes)
-                if success_rate >= 0.8:
-                    peak_hours.append((hour, success_rate))
-        
-        if peak_hours:
-            best_hours = [h for h, rate in sorted(peak_hours, key=lambda x: x[1], reverse=True)[:3]]
-            pattern = LearningPattern(
-                pattern_type="temporal_performance",
+    def _absorb(self, exp: LearningExperience) -> Set[Tuple]:
+        """Update sufficient statistics with one experience; returns the keys of affected patterns"""
+        return self.statistics.absorb(exp)
+    
+    def derive_pattern(self, key: Tuple) -> Optional[LearningPattern]:
+        """Build the pattern for a statistics key, or None if the statistics show no pattern"""
+        
+        kind = key[0]
+        stats = self.statistics
+        
+        if kind == "success_rate":
+            successes, total = stats.success_by_type.get(key[1], (0, 0))
+            if total < self.min_pattern_frequency:
+                return None
+            success_rate = successes / total
+            if not (success_rate >= 0.8 or success_rate <= 0.2):  # Strong pattern
+                return None
+            return LearningPattern(
+                pattern_type="success_rate",
                 agent_id=self.agent_id,
-                description=f"Peak performance during hours: {best_hours}",
-                conditions={"time_constraint": "hour_of_day"},
-                outcomes={"peak_hours": best_hours},
-                frequency=sum(len(hourly_performance[h]) for h in best_hours),
-                confidence=0.7,
-                strength=0.6
+                description=f"High {'success' if success_rate >= 0.8 else 'failure'} rate "
+                          f"for {key[1]} experiences",
+                conditions={"experience_type": key[1]},
+                outcomes={"expected_success_rate": success_rate},
+                frequency=total,
+                confidence=min(0.9, success_rate if success_rate >= 0.8 else 1 - success_rate),
+                strength=abs(success_rate - 0.5) * 2,  # Distance from random
+                success_rate=success_rate
             )
-            patterns.append(pattern)
         
-        # Analyze day-of-week patterns
-        daily_performance = defaultdict(list)
-        for exp in experiences:
-            day = exp.timestamp.weekday()  # 0=Monday, 6=Sunday
-            daily_performance[day].append(exp.success)
-        
-        best_days = []
-        for day, successes in daily_performance.items():
-            if len(successes) >= 3:
-                success_rate = sum(successes) / len(successes)
-                if success_rate >= 0.8:
-                    best_days.append((day, success_rate))
-        
-        if best_days:
-            days_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-            best_day_names = [days_names[d] for d, rate in sorted(best_days, key=lambda x: x[1], reverse=True)[:3]]
-            pattern = LearningPattern(
-                pattern_type="weekly_performance",
+        if kind in ("temporal_performance", "weekly_performance"):
+            histogram = stats.by_hour if kind == "temporal_performance" else stats.by_weekday
+            # Buckets with enough samples and a high success rate (at most 24 or 7 buckets)
+            peaks = sorted(
+                ((bucket, successes / total) for bucket, (successes, total) in histogram.items()
+                 if total >= 3 and successes / total >= 0.8),
+                key=lambda x: x[1], reverse=True
+            )
+            if not peaks:
+                return None
+            if kind == "temporal_performance":
+                best_hours = [h for h, _ in peaks[:3]]
+                return LearningPattern(
+                    pattern_type=kind,
+                    agent_id=self.agent_id,
+                    description=f"Peak performance during hours: {best_hours}",
+                    conditions={"time_constraint": "hour_of_day"},
+                    outcomes={"peak_hours": best_hours},
+                    frequency=sum(histogram[h][1] for h in best_hours),
+                    confidence=0.7,
+                    strength=0.6
+                )
+            best_day_names = [DAY_NAMES[d] for d, _ in peaks[:3]]
+            return LearningPattern(
+                pattern_type=kind,
                 agent_id=self.agent_id,
                 description=f"Best performance on: {best_day_names}",
                 conditions={"time_constraint": "day_of_week"},
                 outcomes={"best_days": best_day_names},
-                frequency=sum(len(daily_performance[d]) for d, _ in best_days),
+                frequency=sum(histogram[d][1] for d, _ in peaks),
                 confidence=0.7,
                 strength=0.6
             )
-            patterns.append(pattern)
         
-        return patterns
-    
-    async def _analyze_context_patterns(
-        self, 
-        experiences: List[LearningExperience]
-    ) -> List[LearningPattern]:
-        """Analyze context-based patterns"""
+        if kind == "context_correlation":
+            _, context_key, context_value = key
+            successes, total = stats.by_context.get((context_key, context_value), (0, 0))
+            if total < self.min_pattern_frequency:
+                return None
+            success_rate = successes / total
+            if not (success_rate >= 0.8 or success_rate <= 0.2):
+                return None
+            return LearningPattern(
+                pattern_type="context_correlation",
+                agent_id=self.agent_id,
+                description=f"Context '{context_key}={context_value}' correlates with "
+                          f"{'high' if success_rate >= 0.8 else 'low'} success rate",
+                conditions={"context_key": context_key, "context_value": context_value},
+                outcomes={"expected_success_rate": success_rate},
+                frequency=total,
+                confidence=min(0.9, abs(success_rate - 0.5) * 2),
+                strength=abs(success_rate - 0.5) * 2,
+                success_rate=success_rate
+            )
         
-        patterns = []
+        if kind == "performance_improvement":
+            _, exp_type, metric = key
+            improvement_sum, count = stats.improvement.get((exp_type, metric), (0.0, 0))
+            if count < self.min_pattern_frequency:
+                return None
+            avg_improvement = improvement_sum / count
+            if avg_improvement <= 0.1:  # Significant improvement only
+                return None
+            return LearningPattern(
+                pattern_type="performance_improvement",
+                agent_id=self.agent_id,
+                description=f"Consistent improvement in {metric} for {exp_type} experiences",
+                conditions={"experience_type": exp_type, "metric": metric},
+                outcomes={"expected_improvement": avg_improvement},
+                frequency=count,
+                confidence=min(0.9, avg_improvement * 2),
+                strength=min(1.0, avg_improvement * 3)
+            )
         
-        # Analyze common context keys that correlate with success
-        context_success_correlation = defaultdict(lambda: {"success": 0, "total": 0})
+        if kind == "action_outcome":
+            successes, total, confidence_sum = stats.by_action.get(key[1], (0, 0, 0.0))
+            if total < self.min_pattern_frequency:
+                return None
+            success_rate = successes / total
+            if not (success_rate >= 0.8 or success_rate <= 0.2):
+                return None
+            return LearningPattern(
+                pattern_type="action_outcome",
+                agent_id=self.agent_id,
+                description=f"Action pattern '{key[1]}' leads to "
+                          f"{'high' if success_rate >= 0.8 else 'low'} success rate",
+                conditions={"action_signature": key[1]},
+                outcomes={
+                    "expected_success_rate": success_rate,
+                    "avg_confidence": confidence_sum / total
+                },
+                frequency=total,
+                confidence=min(0.9, abs(success_rate - 0.5) * 2),
+                strength=abs(success_rate - 0.5) * 2,
+                success_rate=success_rate
+            )
         
-        for exp in experiences:
-            for key, value in exp.context.items():
-                if isinstance(value, (str, int, float, bool)):
-                    context_key = f"{key}:{value}"
-                    context_success_correlation[context_key]["total"] += 1
-                    if exp.success:
-                        context_success_correlation[context_key]["success"] += 1
-        
-        # Find strong context correlations
-        for context_key, stats in context_success_correlation.items():
-            if stats["total"] >= self.min_pattern_frequency:
-                success_rate = stats["success"] / stats["total"]
-                
-                if success_rate >= 0.8 or success_rate <= 0.2:
-                    key, value = context_key.split(":", 1)
-                    pattern = LearningPattern(
-                        pattern_type="context_correlation",
-                        agent_id=self.agent_id,
-                        description=f"Context '{key}={value}' correlates with "
-                                  f"{'high' if success_rate >= 0.8 else 'low'} success rate",
-                        conditions={"context_key": key, "context_value": value},
-                        outcomes={"expected_success_rate": success_rate},
-                        frequency=stats["total"],
-                        confidence=min(0.9, abs(success_rate - 0.5) * 2),
-                        strength=abs(success_rate - 0.5) * 2,
-                        success_rate=success_rate
-                    )
-                    patterns.append(pattern)
-        
-        return patterns
+        return None
     
-    async def _analyze_performance_patterns(
-        self, 
-        experiences: List[LearningExperience]
-    ) -> List[LearningPattern]:
-        """Analyze performance improvement patterns"""
-        
-        patterns = []
-        
-        # Analyze improvement patterns by experience type
-        improvement_by_type = defaultdict(list)
-        for exp in experiences:
-            if exp.improvement:
-                for metric, improvement in exp.improvement.items():
-                    improvement_by_type[f"{exp.safe_enum_value(experience_type)}_{metric}"].append(improvement)
-        
-        for pattern_key, improvements in improvement_by_type.items():
-            if len(improvements) >= self.min_pattern_frequency:
-                avg_improvement = mean(improvements)
-                
-                if avg_improvement > 0.1:  # Significant improvement
-                    exp_type, metric = pattern_key.split("_", 1)
-                    pattern = LearningPattern(
-                        pattern_type="performance_improvement",
-                        agent_id=self.agent_id,
-                        description=f"Consistent improvement in {metric} for {exp_type} experiences",
-                        conditions={"experience_type": exp_type, "metric": metric},
-                        outcomes={"expected_improvement": avg_improvement},
-                        frequency=len(improvements),
-                        confidence=min(0.9, avg_improvement * 2),
-                        strength=min(1.0, avg_improvement * 3)
-                    )
-                    patterns.append(pattern)
-        
-        return patterns
+    def derive_patterns(self) -> List[LearningPattern]:
+        """All patterns currently supported by the statistics (without storing them)"""
+        stats = self.statistics
+        keys = [("temporal_performance",), ("weekly_performance",)]
+        keys += [("success_rate", t) for t in stats.success_by_type]
+        keys += [("context_correlation", k, v) for k, v in stats.by_context]
+        keys += [("performance_improvement", t, m) for t, m in stats.improvement]
+        keys += [("action_outcome", a) for a in stats.by_action]
+        return [pattern for pattern in map(self.derive_pattern, keys) if pattern is not None]
     
-    async def _analyze_action_outcome_patterns(
-        self, 
-        experiences: List[LearningExperience]
-    ) -> List[LearningPattern]:
-        """Analyze action-outcome patterns"""
-        
-        patterns = []
+    async def _refresh_pattern(self, key: Tuple) -> Optional[LearningPattern]:
+        """Re-derive one pattern and update the stored one in place; None if it no longer holds"""
+        
+        derived = self.derive_pattern(key)
+        if derived is not None and not await self._validate_pattern(derived, []):
+            derived = None
+        
+        if derived is None:
+            signature = self._key_signatures.get(key)
+            stale = self.discovered_patterns.by_signature(signature) if signature else None
+            if stale is not None:
+                del self.discovered_patterns[stale.pattern_id]
+            return None
         
-        # Group similar actions and their outcomes
-        action_outcome_map = defaultdict(list)
+        signature = self._key_signatures[key] = pattern_signature(derived)
+        existing = self.discovered_patterns.by_signature(signature)
+        if existing is None:
+            await self._store_pattern(derived)
+            return derived
         
-        for exp in experiences:
-            # Create a simplified action signature
-            action_sig = self._create_action_signature(exp.action_taken)
-            if action_sig:
-                action_outcome_map[action_sig].append({
-                    "success": exp.success,
-                    "outcome": exp.outcome,
-                    "confidence": exp.confidence_level
-                })
-        
-        # Find patterns in action-outcome relationships
-        for action_sig, outcomes in action_outcome_map.items():
-            if len(outcomes) >= self.min_pattern_frequency:
-                success_rate = sum(1 for o in outcomes if o["success"]) / len(outcomes)
-                avg_confidence = mean(o["confidence"] for o in outcomes)
-                
-                if success_rate >= 0.8 or success_rate <= 0.2:
-                    pattern = LearningPattern(
-                        pattern_type="action_outcome",
-                        agent_id=self.agent_id,
-                        description=f"Action pattern '{action_sig}' leads to "
-                                  f"{'high' if success_rate >= 0.8 else 'low'} success rate",
-                        conditions={"action_signature": action_sig},
-                        outcomes={
-                            "expected_success_rate": success_rate,
-                            "avg_confidence": avg_confidence
-                        },
-                        frequency=len(outcomes),
-                        confidence=min(0.9, abs(success_rate - 0.5) * 2),
-                        strength=abs(success_rate - 0.5) * 2,
-                        success_rate=success_rate
-                    )
-                    patterns.append(pattern)
-        
-        return patterns
+        for attribute in ("description", "outcomes", "frequency", "confidence", "strength", "success_rate"):
+            setattr(existing, attribute, getattr(derived, attribute))
+        existing.last_updated = datetime.now()
+        return existing
     
     def _create_action_signature(self, action_data: Dict[str, Any]) -> Optional[str]:
         """Create a simplified signature for actions"""
-        
-        if not action_data:
-            return None
-        
-        # Extract key action characteristics
-        signature_parts = []
-        
-        # Look for common action patterns
-        if "action_type" in action_data:
-            signature_parts.append(f"type:{action_data['action_type']}")
-        
-        if "approach" in action_data:
-            if isinstance(action_data["approach"], dict):
-                if "strategy" in action_data["approach"]:
-                    signature_parts.append(f"strategy:{action_data['approach']['strategy']}")
-            else:
-                signature_parts.append(f"approach:{action_data['approach']}")
-        
-        if "decision_made" in action_data:
-            if isinstance(action_data["decision_made"], dict):
-                if "option" in action_data["decision_made"]:
-                    signature_parts.append(f"option:{action_data['decision_made']['option']}")
-        
-        # Generic fallback - use first few keys
-        if not signature_parts and len(action_data) > 0:
-            for key in sorted(action_data.keys())[:3]:
-                value = action_data[key]
-                if isinstance(value, (str, int, float, bool)):
-                    signature_parts.append(f"{key}:{value}")
-        
-        return "|".join(signature_parts) if signature_parts else None
+        return action_signature(action_data)
     
     async def _validate_pattern(
         self, 
@@ -380,7 +542,7 @@ class PatternRecognizer:
         
         self.discovered_patterns[pattern.pattern_id] = pattern
         
-        # Update statistics
+        # Update statistics (new signatures only; existing patterns are updated in place)
         self.recognition_stats["total_patterns_discovered"] += 1
         
         pattern_type = pattern.pattern_type
@@ -420,10 +582,7 @@ class PatternRecognizer:
     
     def get_patterns_by_type(self, pattern_type: str) -> List[LearningPattern]:
         """Get patterns filtered by type"""
-        return [
-            pattern for pattern in self.discovered_patterns.values()
-            if pattern.pattern_type == pattern_type
-        ]
+        return self.discovered_patterns.by_type(pattern_type)
     
     def get_patterns_by_confidence(self, min_confidence: float) -> List[LearningPattern]:
         """Get patterns with confidence above threshold"""
@@ -434,11 +593,10 @@ class PatternRecognizer:
     
     def get_applicable_patterns(self, context: Dict[str, Any]) -> List[LearningPattern]:
         """Get patterns applicable to given context"""
-        applicable = []
-        
-        for pattern in self.discovered_patterns.values():
-            if self._is_pattern_applicable(pattern, context):
-                applicable.append(pattern)
+        applicable = [
+            pattern for pattern in self.discovered_patterns.candidates(context)
+            if self._is_pattern_applicable(pattern, context)
+        ]
         
         return sorted(applicable, key=lambda p: p.confidence, reverse=True)
     
@@ -462,7 +620,8 @@ class PatternRecognizer:
                     context_key = pattern.conditions.get("context_key")
                     context_value = pattern.conditions.get("context_value")
                     if context_key and context_value:
-                        if context.get(context_key) != context_value:
+                        # Context values are recorded as strings
+                        if context_key not in context or str(context[context_key]) != str(context_value):
                             return False
                 elif key in context:
                     if context[key] != expected_value:
@@ -477,6 +636,9 @@ class PatternRecognizer:
     def clear_patterns(self) -> None:
         """Clear all discovered patterns (use with caution)"""
         self.discovered_patterns.clear()
+        self.statistics = PatternStatistics()
+        self._absorbed_ids.clear()
+        self._key_signatures.clear()
         self.recognition_stats = {
             "total_patterns_discovered": 0,
             "patterns_by_type": {},
@@ -8,9 +8,7 @@ Follows TRM-OS philosophy: Recognition → Event → WIN through performance mea
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
-from collections import defaultdict, deque
-from statistics import mean, stdev
-import math
+from collections import OrderedDict, defaultdict
 
 from .learning_types import (
     PerformanceMetric,
@@ -19,6 +17,7 @@ from .learning_types import (
     AdaptationRule,
     safe_enum_value
 )
+from .metric_statistics import MetricSeries, RunningStats
 from ..eventbus.system_event_bus import publish_event, EventType
 
 
@@ -29,17 +28,24 @@ class PerformanceTracker:
         self.agent_id = agent_id
         self.logger = logging.getLogger(f"learning.performance_tracker.{agent_id}")
         
+        # Configuration
+        self.baseline_sample_size = 10  # Number of samples needed to establish baseline
+        self.significant_change_threshold = 0.1  # 10% change threshold
+        self.significance_z_threshold: Optional[float] = None  # Also require |z| vs baseline spread, if set
+        self.history_size = 1000  # Raw measurements kept per metric
+        self.trend_window = 10  # Measurements in the trend regression
+        self.rollup_bucket_seconds = 3600
+        self.max_metrics_stored = 10000  # PerformanceMetric objects kept by id
+        self.tracking_window_days = 30      # Days to keep in active tracking (rollup retention)
+        
         # Performance data storage
-        self.performance_metrics: Dict[str, PerformanceMetric] = {}
-        self.performance_history: Dict[MetricType, deque] = defaultdict(lambda: deque(maxlen=1000))
+        self.performance_metrics: "OrderedDict[str, PerformanceMetric]" = OrderedDict()
+        self.performance_history: Dict[MetricType, MetricSeries] = defaultdict(self._new_series)
         self.baseline_metrics: Dict[MetricType, float] = {}
+        self.baseline_stats: Dict[MetricType, RunningStats] = defaultdict(RunningStats)
         self.baseline_established: Dict[MetricType, bool] = defaultdict(bool)
         self.performance_targets: Dict[MetricType, float] = {}
         
-        # Configuration
-        self.baseline_sample_size = 10  # Number of samples needed to establish baseline
-        self.significant_change_threshold = 0.1  # 10% change threshold
-        
         # Statistics
         self.tracking_stats = {
             "total_measurements": 0,
@@ -52,11 +58,16 @@ class PerformanceTracker:
         
         # Initialize performance history for all metric types
         for metric_type in MetricType:
-            self.performance_history[metric_type] = deque(maxlen=1000)
+            self.performance_history[metric_type] = self._new_series()
             self.baseline_established[metric_type] = False
-        
-        # Tracking configuration
-        self.tracking_window_days = 30      # Days to keep in active tracking
+    
+    def _new_series(self) -> MetricSeries:
+        return MetricSeries(
+            capacity=self.history_size,
+            trend_window=self.trend_window,
+            bucket_seconds=self.rollup_bucket_seconds,
+            retention_seconds=self.tracking_window_days * 86400
+        )
     
     async def record_performance_metric(
         self,
@@ -67,6 +78,8 @@ class PerformanceTracker:
     ) -> str:
         """Record a performance measurement"""
         
+        metric_type = MetricType(metric_type)
+        
         # Create measurement period if not provided
         if measurement_period is None:
             now = datetime.now()
@@ -93,24 +106,23 @@ class PerformanceTracker:
         if metric_type in self.performance_targets:
             metric.target = self.performance_targets[metric_type]
         
+        # Add to history (ring buffer, trend sums and rollups)
+        self.performance_history[metric_type].record(metric.timestamp, value, context)
+        
         # Calculate trend information
         await self._calculate_trend_info(metric)
         
         # Store metric
         self.performance_metrics[metric.metric_id] = metric
-        
-        # Add to history
-        self.performance_history[metric_type].append({
-            "timestamp": metric.timestamp,
-            "value": value,
-            "context": context or {}
-        })
+        while len(self.performance_metrics) > self.max_metrics_stored:
+            self.performance_metrics.popitem(last=False)
         
         # Update statistics
         self.tracking_stats["total_measurements"] += 1
         
         # Check for baseline establishment
         if not self.baseline_established[metric_type]:
+            self.baseline_stats[metric_type].add(value)
             await self._check_baseline_establishment(metric_type)
         
         # Check for significant changes
@@ -141,36 +153,15 @@ class PerformanceTracker:
     async def _calculate_trend_info(self, metric: PerformanceMetric) -> None:
         """Calculate trend information for a metric"""
         
-        history = self.performance_history[metric.metric_type]
-        
-        if len(history) < 2:
-            metric.trend_direction = "stable"
-            metric.change_rate = 0.0
-            return
+        # Slope of the last trend_window values, kept up to date by the series in O(1)
+        regression = self.performance_history[MetricType(metric.metric_type)].regression
         
-        # Get recent values for trend calculation
-        recent_values = [item["value"] for item in list(history)[-10:]]  # Last 10 values
-        
-        if len(recent_values) < 2:
+        if len(regression) < 2:
             metric.trend_direction = "stable"
             metric.change_rate = 0.0
             return
         
-        # Calculate trend using linear regression slope
-        n = len(recent_values)
-        x_values = list(range(n))
-        
-        # Calculate slope
-        x_mean = sum(x_values) / n
-        y_mean = sum(recent_values) / n
-        
-        numerator = sum((x_values[i] - x_mean) * (recent_values[i] - y_mean) for i in range(n))
-        denominator = sum((x_values[i] - x_mean) ** 2 for i in range(n))
-        
-        if denominator == 0:
-            slope = 0
-        else:
-            slope = numerator / denominator
+        slope = regression.slope
         
         # Determine trend direction
         if abs(slope) < 0.01:  # Very small slope
@@ -181,31 +172,27 @@ class PerformanceTracker:
             metric.trend_direction = "declining"
         
         # Calculate change rate as percentage
-        if len(recent_values) >= 2:
-            first_value = recent_values[0]
-            last_value = recent_values[-1]
-            
-            if first_value != 0:
-                metric.change_rate = (last_value - first_value) / abs(first_value)
-            else:
-                metric.change_rate = last_value
+        first_value = regression.first
+        last_value = regression.last
+        
+        if first_value != 0:
+            metric.change_rate = (last_value - first_value) / abs(first_value)
         else:
-            metric.change_rate = 0.0
+            metric.change_rate = last_value
     
     async def _check_baseline_establishment(self, metric_type: MetricType) -> None:
         """Check if we have enough data to establish a baseline"""
         
-        history = self.performance_history[metric_type]
+        stats = self.baseline_stats[metric_type]
         
-        if len(history) >= self.baseline_sample_size:
-            # Calculate baseline as average of first samples
-            baseline_values = [item["value"] for item in list(history)[:self.baseline_sample_size]]
-            self.baseline_metrics[metric_type] = mean(baseline_values)
+        if stats.count >= self.baseline_sample_size:
+            # Baseline is the (Welford) mean of the first samples
+            self.baseline_metrics[metric_type] = stats.mean
             self.baseline_established[metric_type] = True
             
             # Update all existing metrics with baseline
             for metric in self.performance_metrics.values():
-                if metric.metric_type == metric_type:
+                if metric.metric_type == metric_type.value:
                     metric.baseline = self.baseline_metrics[metric_type]
             
             self.tracking_stats["baselines_established"] += 1
@@ -221,6 +208,7 @@ class PerformanceTracker:
                 data={
                     "metric_type": safe_enum_value(metric_type),
                     "baseline_value": self.baseline_metrics[metric_type],
+                    "baseline_stdev": stats.stdev,
                     "sample_size": self.baseline_sample_size
                 }
             )
@@ -228,10 +216,12 @@ class PerformanceTracker:
     async def _check_significant_changes(self, metric: PerformanceMetric) -> None:
         """Check for significant performance changes"""
         
-        if not self.baseline_established[metric.metric_type]:
+        metric_type = MetricType(metric.metric_type)
+        if not self.baseline_established[metric_type]:
             return
         
-        baseline = self.baseline_metrics[metric.metric_type]
+        baseline = self.baseline_metrics[metric_type]
+        baseline_stdev = self.baseline_stats[metric_type].stdev
         current_value = metric.value
         
         if baseline == 0:
@@ -239,7 +229,12 @@ class PerformanceTracker:
         else:
             change_percentage = abs(current_value - baseline) / abs(baseline)
         
-        if change_percentage >= self.significant_change_threshold:
+        z_score = (current_value - baseline) / baseline_stdev if baseline_stdev > 0 else None
+        significant = change_percentage >= self.significant_change_threshold
+        if significant and self.significance_z_threshold is not None:
+            significant = z_score is None or abs(z_score) >= self.significance_z_threshold
+        
+        if significant:
             is_improvement = current_value > baseline
             
             if is_improvement:
@@ -266,7 +261,8 @@ class PerformanceTracker:
                     "change_type": change_type,
                     "current_value": current_value,
                     "baseline_value": baseline,
-                    "change_percentage": change_percentage
+                    "change_percentage": change_percentage,
+                    "z_score": z_score
                 }
             )
     
@@ -313,57 +309,44 @@ class PerformanceTracker:
         trend_analysis = {}
         
         for metric_type in metric_types:
-            history = self.performance_history[metric_type]
-            
-            # Filter to time window
-            recent_data = [
-                item for item in history
-                if item["timestamp"] >= cutoff_date
-            ]
+            # Time window found by binary search; statistics computed over NumPy arrays
+            timestamps, values = self.performance_history[metric_type].window(cutoff_date)
             
-            if len(recent_data) < 2:
+            if len(values) < 2:
                 continue
             
-            values = [item["value"] for item in recent_data]
-            timestamps = [item["timestamp"] for item in recent_data]
-            
             # Calculate trend statistics
             trend_stats = {
                 "metric_type": safe_enum_value(metric_type),
                 "sample_count": len(values),
-                "time_span_days": (timestamps[-1] - timestamps[0]).days,
-                "current_value": values[-1],
-                "average_value": mean(values),
-                "min_value": min(values),
-                "max_value": max(values),
+                "time_span_days": int((timestamps[-1] - timestamps[0]) // 86400),
+                "current_value": float(values[-1]),
+                "average_value": float(values.mean()),
+                "min_value": float(values.min()),
+                "max_value": float(values.max()),
                 "trend_direction": "stable",
                 "improvement_rate": 0.0,
                 "volatility": 0.0
             }
             
             # Calculate trend direction and rate
-            if len(values) >= 2:
-                first_half = values[:len(values)//2]
-                second_half = values[len(values)//2:]
+            half = len(values) // 2
+            first_avg = float(values[:half].mean())
+            second_avg = float(values[half:].mean())
+            
+            if first_avg != 0:
+                improvement_rate = (second_avg - first_avg) / abs(first_avg)
+                trend_stats["improvement_rate"] = improvement_rate
                 
-                if len(first_half) > 0 and len(second_half) > 0:
-                    first_avg = mean(first_half)
-                    second_avg = mean(second_half)
-                    
-                    if first_avg != 0:
-                        improvement_rate = (second_avg - first_avg) / abs(first_avg)
-                        trend_stats["improvement_rate"] = improvement_rate
-                        
-                        if improvement_rate > 0.05:  # 5% improvement
-                            trend_stats["trend_direction"] = "improving"
-                        elif improvement_rate < -0.05:  # 5% decline
-                            trend_stats["trend_direction"] = "declining"
-                        else:
-                            trend_stats["trend_direction"] = "stable"
+                if improvement_rate > 0.05:  # 5% improvement
+                    trend_stats["trend_direction"] = "improving"
+                elif improvement_rate < -0.05:  # 5% decline
+                    trend_stats["trend_direction"] = "declining"
+                else:
+                    trend_stats["trend_direction"] = "stable"
             
             # Calculate volatility (standard deviation)
-            if len(values) > 1:
-                trend_stats["volatility"] = stdev(values)
+            trend_stats["volatility"] = float(values.std(ddof=1))
             
             # Add baseline comparison if available
             if self.baseline_established[metric_type]:
@@ -371,9 +354,9 @@ class PerformanceTracker:
                 trend_stats["baseline_value"] = baseline
                 
                 if baseline != 0:
-                    trend_stats["baseline_improvement"] = (values[-1] - baseline) / abs(baseline)
+                    trend_stats["baseline_improvement"] = (float(values[-1]) - baseline) / abs(baseline)
                 else:
-                    trend_stats["baseline_improvement"] = values[-1]
+                    trend_stats["baseline_improvement"] = float(values[-1])
             
             trend_analysis[metric_type] = trend_stats
         
@@ -396,7 +379,7 @@ class PerformanceTracker:
             rule_impact = {
                 "rule_id": rule.rule_id,
                 "rule_name": rule.name,
-                "adaptation_type": rule.safe_enum_value(adaptation_type),
+                "adaptation_type": safe_enum_value(rule.adaptation_type),
                 "applied_at": rule.last_applied,
                 "applications": rule.applications,
                 "effectiveness": rule.effectiveness,
@@ -404,21 +387,14 @@ class PerformanceTracker:
             }
             
             # Analyze performance changes after adaptation
-            for metric_type, history in self.performance_history.items():
-                # Get measurements before and after adaptation
-                before_adaptation = [
-                    item for item in history
-                    if item["timestamp"] < rule.last_applied
-                ]
-                
-                after_adaptation = [
-                    item for item in history
-                    if item["timestamp"] >= rule.last_applied
-                ]
+            for metric_type, series in self.performance_history.items():
+                # Split measurements at the adaptation time (binary search)
+                _, values = series.window()
+                split = series.buffer.index_at(rule.last_applied)
                 
-                if len(before_adaptation) >= 3 and len(after_adaptation) >= 3:
-                    before_avg = mean([item["value"] for item in before_adaptation[-5:]])
-                    after_avg = mean([item["value"] for item in after_adaptation[:5]])
+                if split >= 3 and len(values) - split >= 3:
+                    before_avg = float(values[max(0, split - 5):split].mean())
+                    after_avg = float(values[split:split + 5].mean())
                     
                     if before_avg != 0:
                         change_percentage = (after_avg - before_avg) / abs(before_avg)
@@ -447,7 +423,7 @@ class PerformanceTracker:
         
         # Update existing metrics with target
         for metric in self.performance_metrics.values():
-            if metric.metric_type == metric_type:
+            if metric.metric_type == safe_enum_value(metric_type):
                 metric.target = target_value
         
         self.logger.info(f"Set target for {safe_enum_value(metric_type)}: {target_value}")
@@ -457,9 +433,9 @@ class PerformanceTracker:
         
         current_performance = {}
         
-        for metric_type, history in self.performance_history.items():
-            if history:
-                current_performance[metric_type] = history[-1]["value"]
+        for metric_type, series in self.performance_history.items():
+            if len(series):
+                current_performance[metric_type] = series.latest
         
         return current_performance
     
@@ -482,12 +458,12 @@ class PerformanceTracker:
         
         # Add recent trend information
         recent_trends = {}
-        for metric_type, history in self.performance_history.items():
-            if len(history) >= 2:
-                recent_values = [item["value"] for item in list(history)[-5:]]
+        for metric_type, series in self.performance_history.items():
+            if len(series) >= 2:
+                recent_values = series.buffer.tail(5)
                 if len(recent_values) >= 2:
-                    first_val = recent_values[0]
-                    last_val = recent_values[-1]
+                    first_val = float(recent_values[0])
+                    last_val = float(recent_values[-1])
                     
                     if first_val != 0:
                         trend_change = (last_val - first_val) / abs(first_val)
@@ -511,12 +487,23 @@ class PerformanceTracker:
         """Get historical data for a specific metric"""
         
         cutoff_date = datetime.now() - timedelta(days=days)
-        history = self.performance_history[metric_type]
-        
-        return [
-            item for item in history
-            if item["timestamp"] >= cutoff_date
-        ]
+        return self.performance_history[metric_type].history(cutoff_date)
+    
+    def get_metric_rollup(
+        self,
+        metric_type: MetricType,
+        start: datetime,
+        end: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """Count, mean, stdev, min and max over a time range (hourly bucket granularity).
+        
+        Served from rollups, so ranges older than the raw history are still
+        covered (up to tracking_window_days).
+        """
+        
+        rollup = self.performance_history[metric_type].rollup
+        stats = rollup.query(start.timestamp(), end.timestamp() if end is not None else None)
+        return {"metric_type": safe_enum_value(metric_type), **stats.to_dict()}
     
     def clear_performance_data(self) -> None:
         """Clear all performance data (use with caution)"""
@@ -524,6 +511,7 @@ class PerformanceTracker:
         self.performance_metrics.clear()
         self.performance_history.clear()
         self.baseline_metrics.clear()
+        self.baseline_stats.clear()
         self.baseline_established.clear()
         self.performance_targets.clear()
         
@@ -538,7 +526,7 @@ class PerformanceTracker:
         
         # Initialize performance history for all metric types
         for metric_type in MetricType:
-            self.performance_history[metric_type] = deque(maxlen=1000)
+            self.performance_history[metric_type] = self._new_series()
             self.baseline_established[metric_type] = False
         
         self.logger.info("Cleared all performance data")
@@ -12,36 +12,47 @@ through autonomous Commercial AI coordination.
 
 import sys
 import os
+import asyncio
 import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 # AGE System Logging
 LOG_FILE = "age_system_startup.log"
 
 def log_age_system(message: str, level: str = "INFO"):
     """AGE System logging with semantic context"""
+    log_age_system_lines([message], level)
+
+def log_age_system_lines(messages: List[str], level: str = "INFO"):
+    """Write several AGE System log lines with a single file open"""
     timestamp = datetime.datetime.now().isoformat()
     with open(LOG_FILE, "a", encoding="utf-8") as f:
-        f.write(f"[{timestamp}] AGE-{level}: {message}\n")
+        f.writelines(f"[{timestamp}] AGE-{level}: {message}\n" for message in messages)
 
-# === AGE SYSTEM INITIALIZATION ===
-log_age_system("=== AGE (Artificial Genesis Engine) INITIALIZATION ===")
-log_age_system(f"System Identity: Commercial AI Orchestration Platform")
-log_age_system(f"Architecture: Recognition → Event → WIN")
-log_age_system(f"Python Executable: {sys.executable}")
-log_age_system(f"System Path: {sys.path}")
-log_age_system(f"Working Directory: {os.getcwd()}")
-log_age_system(f"Environment - PYTHONPATH: {os.environ.get('PYTHONPATH')}")
-log_age_system(f"Environment - VIRTUAL_ENV: {os.environ.get('VIRTUAL_ENV')}")
+def log_age_system_environment():
+    """Record interpreter and environment details (at startup, not at import)"""
+    log_age_system_lines([
+        "=== AGE (Artificial Genesis Engine) INITIALIZATION ===",
+        "System Identity: Commercial AI Orchestration Platform",
+        "Architecture: Recognition → Event → WIN",
+        f"Python Executable: {sys.executable}",
+        f"System Path: {sys.path}",
+        f"Working Directory: {os.getcwd()}",
+        f"Environment - PYTHONPATH: {os.environ.get('PYTHONPATH')}",
+        f"Environment - VIRTUAL_ENV: {os.environ.get('VIRTUAL_ENV')}",
+    ])
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from contextlib import asynccontextmanager
 from trm_api.core.config import settings
-from trm_api.db.session import connect_to_db, close_db_connection
+from trm_api.db.session import connect_to_db, close_db_connection, verify_db_connection
 from trm_api.core.logging_config import setup_logging
+from trm_api.middleware.lazy_routers import LazyRouterMiddleware, LazyRouterRegistry
 from trm_api.middleware.ontology_logging import OntologyLoggingMiddleware
+from trm_api.middleware.request_hygiene import RequestHygieneMiddleware
+from trm_api.services.analytics_service import get_graph_analytics
 
 @asynccontextmanager
 async def age_system_lifespan(app: FastAPI):
@@ -50,6 +61,7 @@ async def age_system_lifespan(app: FastAPI):
     Handles startup and shutdown of Commercial AI Orchestration components
     """
     # === AGE SYSTEM STARTUP ===
+    log_age_system_environment()
     log_age_system("AGE System Startup Initiated", "STARTUP")
     
     # Initialize logging system
@@ -59,16 +71,40 @@ async def age_system_lifespan(app: FastAPI):
     # Connect to Knowledge Graph (Neo4j) and Vector Database (Supabase)
     try:
         connect_to_db()
-        log_age_system("Knowledge Graph & Vector Database connected", "STARTUP")
+        if await verify_db_connection(timeout=settings.DB_STARTUP_TIMEOUT):
+            log_age_system("Knowledge Graph & Vector Database connected", "STARTUP")
+        else:
+            log_age_system("Knowledge Graph unreachable - running in degraded mode", "WARNING")
     except Exception as e:
         log_age_system(f"Database connection failed: {str(e)}", "ERROR")
         raise
     
+    # Load the persisted reasoning knowledge store before serving
+    if settings.KNOWLEDGE_STORE_PATH:
+        from trm_api.reasoning.knowledge_store import configure_shared_knowledge_store
+        knowledge_store = configure_shared_knowledge_store(settings.KNOWLEDGE_STORE_PATH)
+        log_age_system(f"Knowledge store loaded: {len(knowledge_store)} nodes from {settings.KNOWLEDGE_STORE_PATH}", "STARTUP")
+    
+    # Keep Event/Tension/WIN analytics counters current from system events
+    get_graph_analytics().subscribe_to_event_bus()
+    log_age_system("Analytics counters subscribed to system events", "STARTUP")
+    
+    # Stream system events into the shared causal analyzer used by reasoning engines
+    from trm_api.reasoning.causal_analyzer import get_causal_analyzer
+    get_causal_analyzer().subscribe_to_event_bus()
+    log_age_system("Causal analyzer streaming system events", "STARTUP")
+    
     # Initialize Commercial AI Coordination Layer
     log_age_system("Commercial AI Coordination Layer ready", "STARTUP")
     log_age_system("MCP (Model Context Protocol) integration active", "STARTUP")
     log_age_system("ADK (Agent Development Kit) framework loaded", "STARTUP")
     
+    # Lazy router mode: import the API routers in the background while already serving
+    warmup_task = None
+    if router_registry.pending and settings.ROUTER_WARMUP_ON_STARTUP:
+        warmup_task = asyncio.create_task(router_registry.load_all())
+        log_age_system("API routers warming up in background", "STARTUP")
+    
     # AGE System ready for strategic orchestration
     log_age_system("=== AGE SYSTEM OPERATIONAL - READY FOR STRATEGIC ORCHESTRATION ===", "READY")
     
@@ -77,6 +113,12 @@ async def age_system_lifespan(app: FastAPI):
     # === AGE SYSTEM SHUTDOWN ===
     log_age_system("AGE System Shutdown Initiated", "SHUTDOWN")
     
+    if warmup_task and not warmup_task.done():
+        warmup_task.cancel()
+    
+    get_graph_analytics().unsubscribe_from_event_bus()
+    get_causal_analyzer().unsubscribe_from_event_bus()
+    
     try:
         close_db_connection()
         log_age_system("Knowledge Graph & Vector Database disconnected", "SHUTDOWN")
@@ -150,6 +192,13 @@ app.add_middleware(
     ]
 )
 
+# Request body size limit (while streaming) and optional sanitization
+app.add_middleware(
+    RequestHygieneMiddleware,
+    max_body_bytes=settings.REQUEST_MAX_BODY_BYTES,
+    sanitize=settings.REQUEST_SANITIZATION_ENABLED
+)
+
 # AGE Ontology Logging Middleware
 app.add_middleware(
     OntologyLoggingMiddleware,
@@ -250,13 +299,15 @@ def age_deployment_info():
 
 # === API ROUTER INTEGRATION ===
 
+# Routers are imported here (eager) or on first request under their prefix (LAZY_ROUTER_LOADING)
+router_registry = LazyRouterRegistry(app, lazy=settings.LAZY_ROUTER_LOADING)
+app.add_middleware(LazyRouterMiddleware, registry=router_registry)
+
 # Include Semantic Action APIs (Primary Architecture)
-from trm_api.api.v1.api import api_router
-app.include_router(api_router, prefix=settings.API_V1_STR)
+router_registry.add("trm_api.api.v1.api:api_router", prefix=settings.API_V1_STR)
 
 # Include TRM-OS v2 Conversational Intelligence API
-from trm_api.v2.api import v2_router
-app.include_router(v2_router)
+router_registry.add("trm_api.v2.api:v2_router", trigger_prefixes=["/v2"])
 
 # === AGE SYSTEM ERROR HANDLING ===
 
@@ -0,0 +1,110 @@
+import asyncio
+import importlib
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, FastAPI
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LazyRouter:
+    """A router identified by "package.module:attribute", imported on demand"""
+    import_path: str
+    prefix: str = ""
+    trigger_prefixes: List[str] = field(default_factory=list)  # Request paths that need this router
+    include_kwargs: Dict[str, Any] = field(default_factory=dict)
+    loaded: bool = False
+    load_seconds: Optional[float] = None
+
+    def import_router(self) -> APIRouter:
+        module_name, _, attribute = self.import_path.partition(":")
+        module = importlib.import_module(module_name)
+        return getattr(module, attribute)
+
+
+class LazyRouterRegistry:
+    """Registers API routers either at import time (eager) or on first use (lazy).
+
+    In lazy mode a router's module - and everything it pulls in (reasoning,
+    quantum, learning engines, commercial AI clients) - is only imported when a
+    request arrives under one of its trigger prefixes, when the OpenAPI schema
+    is requested, or when `load_all()` warms everything up in the background.
+    """
+
+    def __init__(self, app: FastAPI, lazy: bool = False, schema_paths: Optional[List[str]] = None):
+        self.app = app
+        self.lazy = lazy
+        self.routers: List[LazyRouter] = []
+        self.schema_paths = schema_paths if schema_paths is not None else [
+            p for p in (app.openapi_url, app.docs_url, app.redoc_url) if p
+        ]
+        self._lock = asyncio.Lock()
+
+    def add(self, import_path: str, prefix: str = "", trigger_prefixes: Optional[List[str]] = None,
+            **include_kwargs) -> LazyRouter:
+        router = LazyRouter(import_path, prefix, trigger_prefixes or ([prefix] if prefix else []), include_kwargs)
+        if self.lazy and not router.trigger_prefixes:
+            raise ValueError(f"Lazy router {import_path} needs a prefix or trigger_prefixes")
+        self.routers.append(router)
+        if not self.lazy:
+            self._include(router, router.import_router())
+        return router
+
+    @property
+    def pending(self) -> List[LazyRouter]:
+        return [r for r in self.routers if not r.loaded]
+
+    def routers_for_path(self, path: str) -> List[LazyRouter]:
+        if path in self.schema_paths:
+            return self.pending
+        return [
+            r for r in self.pending
+            if any(path == p or path.startswith(p.rstrip("/") + "/") for p in r.trigger_prefixes)
+        ]
+
+    async def ensure_loaded(self, path: str) -> None:
+        if not self.routers_for_path(path):
+            return
+        async with self._lock:
+            for router in self.routers_for_path(path):
+                await self._load(router)
+
+    async def load_all(self) -> None:
+        """Import every pending router (background warm-up after startup)"""
+        async with self._lock:
+            for router in self.pending:
+                try:
+                    await self._load(router)
+                except Exception as e:
+                    # The request that needs it will retry and surface the error
+                    logger.error(f"Warm-up of router {router.import_path} failed: {e}")
+
+    async def _load(self, router: LazyRouter) -> None:
+        start = time.perf_counter()
+        # Importing is CPU-bound and may take seconds; keep the event loop serving meanwhile
+        api_router = await asyncio.to_thread(router.import_router)
+        self._include(router, api_router)
+        router.load_seconds = time.perf_counter() - start
+        logger.info(f"Router {router.import_path} loaded in {router.load_seconds:.2f}s")
+
+    def _include(self, router: LazyRouter, api_router: APIRouter) -> None:
+        self.app.include_router(api_router, prefix=router.prefix, **router.include_kwargs)
+        self.app.openapi_schema = None  # Regenerate the schema with the new routes
+        router.loaded = True
+
+
+class LazyRouterMiddleware:
+    """ASGI middleware that loads the routers a request needs before routing it"""
+
+    def __init__(self, app, registry: LazyRouterRegistry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] in ("http", "websocket") and self.registry.pending:
+            await self.registry.ensure_loaded(scope["path"])
+        await self.app(scope, receive, send)
@@ -0,0 +1,312 @@
+import json
+import logging
+import re
+from dataclasses import dataclass
+from typing import Annotated, Any, Dict, List, Literal, Optional, Pattern, Tuple, get_args, get_origin
+
+from pydantic import BaseModel
+from starlette.exceptions import HTTPException
+from starlette.routing import Match
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SanitizationRule:
+    """Characters/sequences removed from string values"""
+    name: str
+    pattern: str  # Matched in decoded string values
+    raw_pattern: Optional[str] = None  # How the same input can appear in the encoded body (e.g. JSON escapes)
+
+
+# Rules per content type; each set is compiled into one combined regex
+DEFAULT_SANITIZATION_RULES: Dict[str, List[SanitizationRule]] = {
+    "application/json": [
+        SanitizationRule("html_special", r"""[<>"']""", r"""[<>']|\\"|\\u00(?:3[cCeE]|22|27)"""),
+        SanitizationRule("null_byte", r"\x00", r"\\u0000"),
+    ],
+    "text/plain": [
+        SanitizationRule("html_special", r"""[<>"']"""),
+        SanitizationRule("null_byte", r"\x00"),
+    ],
+}
+
+
+@dataclass
+class CompiledRules:
+    value_regex: Pattern[str]
+    raw_regex: Pattern[bytes]
+
+
+def compile_rules(rules: List[SanitizationRule]) -> CompiledRules:
+    value = "|".join(f"(?P<{r.name}>{r.pattern})" for r in rules)
+    raw = "|".join(f"(?:{r.raw_pattern or r.pattern})" for r in rules)
+    return CompiledRules(re.compile(value), re.compile(raw.encode("utf-8")))
+
+
+class RequestSanitizer:
+    """Removes risky characters from request values using rules compiled once per content type.
+
+    Bodies are first scanned in encoded form with the combined raw regex; clean
+    bodies (the common case) are returned untouched without being parsed, so
+    the cost grows with the number of risky fields rather than payload size.
+    """
+
+    def __init__(self, rules: Optional[Dict[str, List[SanitizationRule]]] = None):
+        self.compiled: Dict[str, CompiledRules] = {
+            content_type: compile_rules(content_rules)
+            for content_type, content_rules in (rules or DEFAULT_SANITIZATION_RULES).items()
+        }
+
+    def handles(self, content_type: str) -> bool:
+        return content_type in self.compiled
+
+    def sanitize_value(self, value: str, content_type: str = "application/json") -> str:
+        regex = self.compiled[content_type].value_regex
+        return regex.sub("", value) if regex.search(value) else value
+
+    def sanitize_tree(self, data: Any, content_type: str = "application/json") -> Tuple[Any, int]:
+        """Sanitize already-parsed data (dicts, lists, strings); returns (data, changed fields)"""
+        regex = self.compiled[content_type].value_regex
+        changed = 0
+
+        def visit(value):
+            nonlocal changed
+            if isinstance(value, str):
+                if regex.search(value) is None:
+                    return value
+                changed += 1
+                return regex.sub("", value)
+            if isinstance(value, dict):
+                return {k: visit(v) for k, v in value.items()}
+            if isinstance(value, list):
+                return [visit(v) for v in value]
+            return value
+
+        return visit(data), changed
+
+    def sanitize_body(self, body: bytes, content_type: str) -> Tuple[bytes, int]:
+        """Sanitized body and the number of changed fields (same bytes object if clean)"""
+        compiled = self.compiled.get(content_type)
+        if compiled is None or not body or compiled.raw_regex.search(body) is None:
+            return body, 0
+
+        if content_type != "application/json":
+            text = body.decode("utf-8", errors="replace")
+            return compiled.value_regex.sub("", text).encode("utf-8"), 1
+
+        regex = compiled.value_regex
+        changed = 0
+
+        def clean(value):
+            # Objects are cleaned by the hook as the parser builds them; only
+            # strings and lists (which have no hook) are visited here
+            nonlocal changed
+            if isinstance(value, str):
+                if regex.search(value) is None:
+                    return value
+                changed += 1
+                return regex.sub("", value)
+            if isinstance(value, list):
+                return [clean(v) for v in value]
+            return value
+
+        try:
+            data = json.loads(body, object_pairs_hook=lambda pairs: {k: clean(v) for k, v in pairs})
+        except ValueError:
+            return body, 0  # Invalid JSON is left for the endpoint to reject
+        data = clean(data)
+        if not changed:
+            return body, 0
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), changed
+
+
+# Types that can hold arbitrary strings
+_UNCONSTRAINED = (str, bytes, dict, list, set, tuple, object, Any)
+
+
+def _annotation_constrained(annotation: Any, seen: set) -> bool:
+    if annotation in _UNCONSTRAINED:
+        return False
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return model_constrains_strings(annotation, seen)
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return True
+    if origin is Annotated:
+        inner, *metadata = get_args(annotation)
+        return any(getattr(m, "pattern", None) for m in metadata) or _annotation_constrained(inner, seen)
+    if origin is not None:
+        # Containers and unions are constrained if every member type is
+        args = [a for a in get_args(annotation) if a is not type(None) and a is not Ellipsis]
+        return all(_annotation_constrained(a, seen) for a in args)
+    # int, float, bool, Enum, UUID, datetime, ... cannot carry markup
+    return True
+
+
+def model_constrains_strings(model: type, seen: Optional[set] = None) -> bool:
+    """True if every string field of the model (recursively) has a `pattern` constraint"""
+    seen = seen if seen is not None else set()
+    if model in seen:
+        return True
+    seen.add(model)
+    for field in model.model_fields.values():
+        if any(getattr(m, "pattern", None) for m in field.metadata):
+            continue
+        if not _annotation_constrained(field.annotation, seen):
+            return False
+    return True
+
+
+class RequestBodyTooLarge(HTTPException):
+    """Raised from receive() once a streamed body crosses the limit.
+
+    An HTTPException so that FastAPI's body parsing re-raises it (as a 413)
+    instead of reporting a generic parse error.
+    """
+
+    def __init__(self):
+        super().__init__(status_code=413, detail="Request body too large")
+
+
+class RequestHygieneMiddleware:
+    """ASGI middleware: streaming body size limit and body sanitization.
+
+    - Content-Length above the limit is rejected before reading; chunked bodies
+      are counted as they stream and rejected as soon as they cross it.
+    - Bodies of content types with sanitization rules are sanitized (see
+      RequestSanitizer) unless the matched route's Pydantic body model already
+      constrains every string field with a pattern.
+    """
+
+    def __init__(self, app, max_body_bytes: int = 10 * 1024 * 1024,
+                 content_type_limits: Optional[Dict[str, int]] = None,
+                 sanitize: bool = True, sanitizer: Optional[RequestSanitizer] = None):
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+        self.content_type_limits = content_type_limits or {}
+        self.sanitize = sanitize
+        self.sanitizer = sanitizer or RequestSanitizer()
+        self._constrained_routes: List[Any] = []
+        self._routes_seen = -1
+        self.stats: Dict[str, int] = {
+            "requests": 0,
+            "rejected_too_large": 0,
+            "bodies_sanitized": 0,
+            "fields_sanitized": 0,
+            "skipped_constrained": 0,
+        }
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        self.stats["requests"] += 1
+        headers = dict(scope.get("headers") or [])
+        content_type = headers.get(b"content-type", b"").split(b";")[0].strip().decode("latin-1").lower()
+        limit = self.content_type_limits.get(content_type, self.max_body_bytes)
+
+        content_length = headers.get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > limit:
+            self.stats["rejected_too_large"] += 1
+            await self._send_413(send)
+            return
+
+        response_started = False
+
+        async def tracking_send(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    self.stats["rejected_too_large"] += 1
+                    raise RequestBodyTooLarge()
+            return message
+
+        try:
+            if self.sanitize and self.sanitizer.handles(content_type) and not self._route_constrained(scope):
+                scope, app_receive = await self._sanitized(scope, limited_receive, content_type)
+            else:
+                app_receive = limited_receive
+            await self.app(scope, app_receive, tracking_send)
+        except RequestBodyTooLarge:
+            if response_started:
+                raise
+            await self._send_413(send)
+
+    async def _sanitized(self, scope, receive, content_type: str):
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                break
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        body = b"".join(chunks)
+
+        sanitized, changed = self.sanitizer.sanitize_body(body, content_type)
+        if changed:
+            self.stats["bodies_sanitized"] += 1
+            self.stats["fields_sanitized"] += changed
+            headers = [(k, v) for k, v in scope.get("headers", []) if k != b"content-length"]
+            headers.append((b"content-length", str(len(sanitized)).encode("latin-1")))
+            scope = {**scope, "headers": headers}
+
+        replayed = False
+
+        async def replay_receive():
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": sanitized, "more_body": False}
+            return await receive()
+
+        return scope, replay_receive
+
+    def _route_constrained(self, scope) -> bool:
+        # scope["app"] is set when mounted via app.add_middleware; else we wrap the app itself
+        app = scope.get("app") or self.app
+        routes = getattr(app, "routes", None)
+        if routes is None:
+            return False
+        if len(routes) != self._routes_seen:
+            # Routes can be added after startup (lazy routers)
+            self._constrained_routes = [r for r in routes if self._body_constrained(r)]
+            self._routes_seen = len(routes)
+        for route in self._constrained_routes:
+            if route.matches(scope)[0] == Match.FULL:
+                self.stats["skipped_constrained"] += 1
+                return True
+        return False
+
+    @staticmethod
+    def _body_constrained(route) -> bool:
+        body_field = getattr(route, "body_field", None)
+        if body_field is None:
+            return False
+        annotation = getattr(body_field, "type_", None)
+        try:
+            return _annotation_constrained(annotation, set())
+        except Exception as e:
+            logger.debug(f"Cannot inspect body model of {getattr(route, 'path', route)}: {e}")
+            return False
+
+    async def _send_413(self, send) -> None:
+        body = json.dumps({"detail": "Request body too large"}).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -21,6 +21,8 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import aiohttp
 
+from trm_api.core.state_backend import RateLimiter, get_state_backend
+
 logger = logging.getLogger(__name__)
 
 
@@ -376,8 +378,14 @@ TRM-OS Monitoring System
     async def _send_alert_notifications(self, alert: Alert, rule: AlertRule) -> None:
         """Send notifications for alert"""
         try:
-            # Check rate limits
-            if not self._check_rate_limit(alert.id):
+            # Check rate limits (counted across workers when the state backend is shared)
+            if get_state_backend().shared:
+                within_limit = await RateLimiter(
+                    "alert_notifications", self.max_notifications_per_hour, 3600
+                ).allow(alert.id)
+            else:
+                within_limit = self._check_rate_limit(alert.id)
+            if not within_limit:
                 self.logger.warning(f"Rate limit exceeded for alert {alert.id}")
                 return
             
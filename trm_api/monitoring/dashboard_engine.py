@@ -4,14 +4,17 @@ Dashboard Engine cho TRM-OS Phase 3
 Real-time monitoring dashboard với:
 - Interactive charts và graphs
 - Custom dashboard layouts
-- Real-time data streaming
+- Real-time data streaming (subscription-driven, incremental deltas)
+- Server-side downsampling (LTTB / min-max) to the chart's pixel width
 - Export capabilities
 - Multi-tenant support
 """
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Union
+import time
+from collections import deque
+from typing import Dict, List, Optional, Any, Union, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -71,6 +74,8 @@ class ChartConfig:
     width: int = 400
     height: int = 300
     refresh_interval: int = 30  # seconds
+    pixel_width: Optional[int] = None  # Rendered width; defaults from width
+    downsample_method: str = "lttb"  # "lttb" or "minmax"
     
     # Chart-specific settings
     x_axis_label: str = ""
@@ -120,6 +125,99 @@ class DashboardLayout:
     tags: List[str] = field(default_factory=list)
 
 
+# Chart types whose data is a time series kept in ring buffers
+TIME_SERIES_CHARTS = {ChartType.LINE, ChartType.SCATTER}
+
+# A time-series point: (timestamp, value)
+Point = Tuple[datetime, float]
+
+
+class TimeSeriesBuffer:
+    """
+    Ring buffer of (timestamp, value) points
+    
+    Points older than `retention` before the newest point are evicted; `capacity`
+    is a hard cap on the number of points kept.
+    """
+    
+    def __init__(self, capacity: int, retention: Optional[timedelta] = None):
+        self.points: deque = deque(maxlen=capacity)
+        self.retention = retention
+    
+    @property
+    def last_timestamp(self) -> Optional[datetime]:
+        return self.points[-1][0] if self.points else None
+    
+    def append(self, points: List[Point]) -> List[Point]:
+        """Append points newer than the last stored one; returns the accepted points"""
+        last = self.last_timestamp
+        accepted = []
+        for timestamp, value in sorted(points, key=lambda p: p[0]):
+            if last is None or timestamp > last:
+                self.points.append((timestamp, value))
+                accepted.append((timestamp, value))
+                last = timestamp
+        if accepted and self.retention is not None:
+            cutoff = last - self.retention
+            while self.points and self.points[0][0] < cutoff:
+                self.points.popleft()
+        return accepted
+    
+    def window(self, start: datetime, end: datetime) -> List[Point]:
+        return [p for p in self.points if start <= p[0] <= end]
+
+
+def lttb_downsample(points: List[Point], threshold: int) -> List[Point]:
+    """Largest-Triangle-Three-Buckets downsampling to at most `threshold` points"""
+    if threshold >= len(points) or threshold < 3:
+        return list(points)
+    
+    xs = [p[0].timestamp() for p in points]
+    ys = [p[1] for p in points]
+    sampled = [points[0]]
+    bucket_size = (len(points) - 2) / (threshold - 2)
+    selected = 0
+    
+    for bucket in range(threshold - 2):
+        # Average of the next bucket is the third triangle vertex
+        next_start = int((bucket + 1) * bucket_size) + 1
+        next_end = min(int((bucket + 2) * bucket_size) + 1, len(points))
+        avg_x = sum(xs[next_start:next_end]) / (next_end - next_start)
+        avg_y = sum(ys[next_start:next_end]) / (next_end - next_start)
+        
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+        ax, ay = xs[selected], ys[selected]
+        best_area, best = -1.0, start
+        for i in range(start, end):
+            area = abs((ax - avg_x) * (ys[i] - ay) - (ax - xs[i]) * (avg_y - ay))
+            if area > best_area:
+                best_area, best = area, i
+        sampled.append(points[best])
+        selected = best
+    
+    sampled.append(points[-1])
+    return sampled
+
+
+def minmax_downsample(points: List[Point], threshold: int) -> List[Point]:
+    """Keep the minimum and maximum of each bucket (at most `threshold` points)"""
+    if threshold >= len(points):
+        return list(points)
+    buckets = max(1, threshold // 2)
+    bucket_size = len(points) / buckets
+    sampled = []
+    for bucket in range(buckets):
+        chunk = points[int(bucket * bucket_size):int((bucket + 1) * bucket_size)]
+        if not chunk:
+            continue
+        low = min(range(len(chunk)), key=lambda i: chunk[i][1])
+        high = max(range(len(chunk)), key=lambda i: chunk[i][1])
+        for i in sorted({low, high}):
+            sampled.append(chunk[i])
+    return sampled
+
+
 @dataclass
 class DashboardData:
     """Dashboard data response"""
@@ -144,12 +242,23 @@ class DashboardEngine:
         self.data_sources: Dict[str, Any] = {}
         self.data_cache: Dict[str, Dict[str, Any]] = {}
         
-        # Real-time connections
+        # Real-time connections (chart_id -> subscribed websockets)
         self.websocket_connections: Dict[str, List[Any]] = {}
         
+        # Time-series ring buffers, keyed by (data_source, series label)
+        self.series_buffers: Dict[Tuple[str, str], TimeSeriesBuffer] = {}
+        self.chart_series: Dict[str, List[str]] = {}  # chart_id -> series labels
+        self.chart_styles: Dict[str, Dict[str, Dict[str, Any]]] = {}  # chart_id -> label -> dataset style
+        self._next_refresh: Dict[str, float] = {}  # chart_id -> monotonic due time
+        self._wakeup = asyncio.Event()
+        
         # Configuration
         self.cache_ttl = 30  # seconds
-        self.max_data_points = 1000
+        # Buffers keep the longest time range of the charts on their data source;
+        # the cap fits 30 days at the 5-minute collection interval
+        self.max_data_points = 10000  # Ring buffer capacity per series
+        self.grid_columns = 12  # Chart widths up to this are grid columns...
+        self.grid_column_pixels = 100  # ...rendered at this many pixels each
         
         # Default color schemes
         self.color_schemes = {
@@ -297,59 +406,234 @@ class DashboardEngine:
     async def stop(self) -> None:
         """Stop dashboard engine"""
         self.is_running = False
+        self._wakeup.set()
         self.logger.info("Dashboard engine stopped")
     
     async def _data_refresh_loop(self) -> None:
-        """Data refresh loop"""
+        """Refresh subscribed charts when due; sleep while nobody is watching"""
         while self.is_running:
             try:
-                # Refresh data for all charts
-                for chart_id, chart_config in self.chart_configs.items():
-                    await self._refresh_chart_data(chart_config)
+                self._wakeup.clear()
+                subscribed = [
+                    self.chart_configs[chart_id]
+                    for chart_id, connections in self.websocket_connections.items()
+                    if connections and chart_id in self.chart_configs
+                ]
+                
+                if not subscribed:
+                    await self._wakeup.wait()
+                    continue
                 
-                # Broadcast updates to websocket connections
-                await self._broadcast_updates()
+                now = time.monotonic()
+                for chart_config in subscribed:
+                    if now >= self._next_refresh.get(chart_config.id, 0):
+                        self._next_refresh[chart_config.id] = now + chart_config.refresh_interval
+                        await self._refresh_chart_data(chart_config, force=True)
                 
-                # Wait before next refresh
-                await asyncio.sleep(30)
+                next_due = min(self._next_refresh[chart.id] for chart in subscribed)
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), max(0.0, next_due - time.monotonic()))
+                except asyncio.TimeoutError:
+                    pass
                 
             except Exception as e:
                 self.logger.error(f"Data refresh error: {e}")
-                await asyncio.sleep(30)
+                await asyncio.sleep(1)
     
-    async def _refresh_chart_data(self, chart_config: ChartConfig) -> None:
-        """Refresh data for a specific chart"""
+    def _cache_is_fresh(self, cache_key: str) -> bool:
+        cached_data = self.data_cache.get(cache_key)
+        if not cached_data:
+            return False
+        cache_time = cached_data.get('timestamp', datetime.min)
+        return (datetime.utcnow() - cache_time).total_seconds() < self.cache_ttl
+    
+    async def _refresh_chart_data(self, chart_config: ChartConfig, force: bool = False) -> None:
+        """
+        Refresh data for a specific chart
+        
+        Time-series charts are seeded once, then only points newer than their
+        buffers are pulled and pushed to subscribers as deltas. Other charts are
+        re-fetched and re-sent to subscribers only when the data changed.
+        """
         try:
-            # Check cache first
             cache_key = f"{chart_config.id}_{chart_config.data_source}"
-            cached_data = self.data_cache.get(cache_key)
-            
-            if cached_data:
-                cache_time = cached_data.get('timestamp', datetime.min)
-                if (datetime.utcnow() - cache_time).seconds < self.cache_ttl:
-                    return  # Use cached data
-            
-            # Fetch new data
-            data = await self._fetch_chart_data(chart_config)
-            
-            if data:
-                # Cache the data
-                self.data_cache[cache_key] = {
-                    'timestamp': datetime.utcnow(),
-                    'data': data,
-                    'chart_id': chart_config.id
-                }
+            if not force and self._cache_is_fresh(cache_key):
+                return  # Use cached data
+            
+            since = self._series_last_timestamp(chart_config)
+            data = await self._fetch_chart_data(chart_config, start_time=since)
+            if not data:
+                return
+            
+            series_points = self._extract_series(chart_config, data)
+            if series_points is not None:
+                await self._publish_series(chart_config.data_source, series_points)
+                self._cache_chart_data(chart_config, self._render_chart_data(chart_config))
+                return
+            
+            previous = self.data_cache.get(cache_key, {}).get('data')
+            self._cache_chart_data(chart_config, data)
+            if data != previous:
+                await self._broadcast_updates(chart_config.id, {
+                    'type': 'chart_data',
+                    'chart_id': chart_config.id,
+                    'data': data
+                })
             
         except Exception as e:
             self.logger.error(f"Chart data refresh failed for {chart_config.id}: {e}")
     
-    async def _fetch_chart_data(self, chart_config: ChartConfig) -> Optional[Dict[str, Any]]:
-        """Fetch data for chart from data source"""
+    def _cache_chart_data(self, chart_config: ChartConfig, data: Dict[str, Any]) -> None:
+        self.data_cache[f"{chart_config.id}_{chart_config.data_source}"] = {
+            'timestamp': datetime.utcnow(),
+            'data': data,
+            'chart_id': chart_config.id
+        }
+    
+    def _extract_series(self, chart_config: ChartConfig,
+                        data: Dict[str, Any]) -> Optional[Dict[str, List[Point]]]:
+        """Split time-labelled chart data into per-series points (None if not a time series)"""
+        if chart_config.chart_type not in TIME_SERIES_CHARTS:
+            return None
+        try:
+            timestamps = [datetime.fromisoformat(label) for label in data.get('labels', [])]
+        except (TypeError, ValueError):
+            return None
+        
+        series_points = {}
+        styles = self.chart_styles.setdefault(chart_config.id, {})
+        for dataset in data.get('datasets', []):
+            label = dataset.get('label', '')
+            series_points[label] = [
+                (timestamp, value) for timestamp, value in zip(timestamps, dataset.get('data', []))
+                if value is not None
+            ]
+            styles[label] = {k: v for k, v in dataset.items() if k not in ('label', 'data')}
+        
+        if chart_config.id not in self.chart_series:
+            self.chart_series[chart_config.id] = list(series_points)
+        return series_points
+    
+    def _series_last_timestamp(self, chart_config: ChartConfig) -> Optional[datetime]:
+        """Oldest 'latest point' across a time-series chart's buffers (None until seeded)"""
+        labels = self.chart_series.get(chart_config.id)
+        if not labels:
+            return None
+        timestamps = []
+        for label in labels:
+            buffer = self.series_buffers.get((chart_config.data_source, label))
+            if buffer is None or buffer.last_timestamp is None:
+                return None
+            timestamps.append(buffer.last_timestamp)
+        return min(timestamps)
+    
+    async def publish_points(self, data_source: str, series: str, points: List[Point]) -> int:
+        """
+        Push new (timestamp, value) points of a series into its ring buffer
+        
+        Subscribers of charts showing the series receive only the new points.
+        
+        Returns:
+            Number of points accepted (points not newer than the buffer are ignored)
+        """
+        accepted = await self._publish_series(data_source, {series: points})
+        return len(accepted.get(series, []))
+    
+    async def _publish_series(self, data_source: str,
+                              series_points: Dict[str, List[Point]]) -> Dict[str, List[Point]]:
+        accepted = {}
+        retention = self._series_retention(data_source)
+        for label, points in series_points.items():
+            key = (data_source, label)
+            if key not in self.series_buffers:
+                self.series_buffers[key] = TimeSeriesBuffer(self.max_data_points, retention)
+            buffer = self.series_buffers[key]
+            buffer.retention = retention  # Grows when a chart with a longer range is added
+            new_points = buffer.append(points)
+            if new_points:
+                accepted[label] = new_points
+        
+        if not accepted:
+            return accepted
+        
+        for chart_id, labels in self.chart_series.items():
+            chart_config = self.chart_configs.get(chart_id)
+            if chart_config is None or chart_config.data_source != data_source:
+                continue
+            delta = {label: accepted[label] for label in labels if label in accepted}
+            if not delta:
+                continue
+            # Drop the stale full render; it is rebuilt from the buffers on read
+            self.data_cache.pop(f"{chart_id}_{data_source}", None)
+            if self.websocket_connections.get(chart_id):
+                start_time, _ = self._get_time_range(chart_config)
+                message = self._series_payload(chart_config, delta, self._chart_pixel_width(chart_config))
+                message.update({
+                    'type': 'chart_delta',
+                    'chart_id': chart_id,
+                    'window_start': start_time.isoformat()
+                })
+                await self._broadcast_updates(chart_id, message)
+        return accepted
+    
+    def _series_retention(self, data_source: str) -> timedelta:
+        """Longest time range among the charts showing a data source"""
+        spans = [timedelta(hours=1)]
+        for chart_config in self.chart_configs.values():
+            if chart_config.data_source == data_source:
+                start_time, end_time = self._get_time_range(chart_config)
+                spans.append(end_time - start_time)
+        return max(spans)
+    
+    def _chart_pixel_width(self, chart_config: ChartConfig) -> int:
+        if chart_config.pixel_width:
+            return chart_config.pixel_width
+        if chart_config.width <= self.grid_columns:
+            return chart_config.width * self.grid_column_pixels
+        return chart_config.width
+    
+    def _downsample(self, chart_config: ChartConfig, points: List[Point], threshold: int) -> List[Point]:
+        if chart_config.downsample_method == "minmax":
+            return minmax_downsample(points, threshold)
+        return lttb_downsample(points, threshold)
+    
+    def _series_payload(self, chart_config: ChartConfig, series_points: Dict[str, List[Point]],
+                        max_points: int) -> Dict[str, Any]:
+        """Chart data for series, downsampled so the chart gets at most `max_points` labels"""
+        threshold = max(3, max_points // max(1, len(series_points)))
+        sampled = {
+            label: dict(self._downsample(chart_config, points, threshold))
+            for label, points in series_points.items()
+        }
+        timestamps = sorted(set().union(*(points.keys() for points in sampled.values())))
+        styles = self.chart_styles.get(chart_config.id, {})
+        return {
+            'labels': [t.isoformat() for t in timestamps],
+            'datasets': [
+                {'label': label, 'data': [points.get(t) for t in timestamps], **styles.get(label, {})}
+                for label, points in sampled.items()
+            ]
+        }
+    
+    def _render_chart_data(self, chart_config: ChartConfig) -> Dict[str, Any]:
+        """Full chart data from the ring buffers, windowed and downsampled"""
+        start_time, end_time = self._get_time_range(chart_config)
+        series_points = {
+            label: self.series_buffers[(chart_config.data_source, label)].window(start_time, end_time)
+            for label in self.chart_series.get(chart_config.id, [])
+            if (chart_config.data_source, label) in self.series_buffers
+        }
+        return self._series_payload(chart_config, series_points, self._chart_pixel_width(chart_config))
+    
+    async def _fetch_chart_data(self, chart_config: ChartConfig,
+                                start_time: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+        """Fetch data for chart from data source (from `start_time` when pulling increments)"""
         try:
             data_source = chart_config.data_source
             
             # Get time range
-            start_time, end_time = self._get_time_range(chart_config)
+            window_start, end_time = self._get_time_range(chart_config)
+            start_time = max(start_time, window_start) if start_time else window_start
             
             # Simulate data fetching based on data source
             if data_source == "system_metrics":
@@ -547,17 +831,54 @@ class DashboardEngine:
             self.logger.error(f"Alert metrics fetch failed: {e}")
             return {}
     
-    async def _broadcast_updates(self) -> None:
-        """Broadcast updates to connected websockets"""
+    async def _broadcast_updates(self, chart_id: str, message: Dict[str, Any]) -> None:
+        """Send a message to every websocket subscribed to a chart; drop failed ones"""
         try:
-            # In a real implementation, this would send updates to websocket connections
-            # For now, just log the update
-            if self.websocket_connections:
-                self.logger.debug(f"Broadcasting updates to {len(self.websocket_connections)} connections")
+            connections = list(self.websocket_connections.get(chart_id, []))
+            if not connections:
+                return
+            
+            results = await asyncio.gather(
+                *(connection.send_json(message) for connection in connections),
+                return_exceptions=True
+            )
+            for connection, result in zip(connections, results):
+                if isinstance(result, Exception):
+                    self.logger.info(f"Dropping dashboard subscriber of {chart_id}: {result}")
+                    self.unsubscribe(chart_id, connection)
             
         except Exception as e:
             self.logger.error(f"Broadcast failed: {e}")
     
+    async def subscribe(self, chart_id: str, websocket: Any) -> bool:
+        """
+        Subscribe a websocket to a chart
+        
+        The websocket receives a downsampled snapshot now, then only updates
+        ('chart_delta' for time series, 'chart_data' otherwise). The chart is
+        refreshed only while it has subscribers.
+        """
+        chart_config = self.chart_configs.get(chart_id)
+        if not chart_config:
+            return False
+        
+        data = await self.get_chart_data(chart_id)
+        await websocket.send_json({'type': 'chart_snapshot', 'chart_id': chart_id, 'data': data or {}})
+        
+        self.websocket_connections.setdefault(chart_id, []).append(websocket)
+        self._next_refresh.setdefault(chart_id, time.monotonic() + chart_config.refresh_interval)
+        self._wakeup.set()
+        return True
+    
+    def unsubscribe(self, chart_id: str, websocket: Any) -> None:
+        """Remove a websocket's chart subscription"""
+        connections = self.websocket_connections.get(chart_id)
+        if connections and websocket in connections:
+            connections.remove(websocket)
+        if not connections:
+            self.websocket_connections.pop(chart_id, None)
+            self._next_refresh.pop(chart_id, None)
+    
     # Public API methods
     
     def create_dashboard(self, layout: DashboardLayout) -> bool:
@@ -646,15 +967,11 @@ class DashboardEngine:
             # Check cache first
             cache_key = f"{chart_id}_{chart_config.data_source}"
             
-            if not refresh and cache_key in self.data_cache:
-                cached_data = self.data_cache[cache_key]
-                cache_time = cached_data.get('timestamp', datetime.min)
-                
-                if (datetime.utcnow() - cache_time).seconds < self.cache_ttl:
-                    return cached_data.get('data')
+            if not refresh and self._cache_is_fresh(cache_key):
+                return self.data_cache[cache_key].get('data')
             
             # Fetch fresh data
-            await self._refresh_chart_data(chart_config)
+            await self._refresh_chart_data(chart_config, force=True)
             
             # Return cached data
             if cache_key in self.data_cache:
@@ -871,6 +1188,8 @@ class DashboardEngine:
                 'chart_types': chart_types,
                 'data_sources': list(self.data_sources.keys()),
                 'cached_datasets': len(self.data_cache),
+                'series_buffers': len(self.series_buffers),
+                'subscribed_charts': len(self.websocket_connections),
                 'active_connections': sum(len(conns) for conns in self.websocket_connections.values())
             }
             
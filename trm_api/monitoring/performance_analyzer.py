@@ -18,9 +18,15 @@ from enum import Enum
 import statistics
 import json
 
+from trm_api.core.state_backend import get_state_backend
+
 logger = logging.getLogger(__name__)
 
 
+# Shared (multi-worker) request metrics list in the state backend
+SHARED_REQUESTS_KEY = "performance:requests"
+
+
 class PerformanceLevel(Enum):
     """Performance levels"""
     EXCELLENT = "excellent"
@@ -198,12 +204,32 @@ class PerformanceAnalyzer:
             if len(self.request_metrics) > self.max_requests:
                 self.request_metrics = self.request_metrics[-self.max_requests:]
             
+            # Multi-worker: every worker analyses the requests of all workers
+            backend = get_state_backend()
+            if backend.shared:
+                await backend.append(SHARED_REQUESTS_KEY, {
+                    **request_metric.__dict__,
+                    'timestamp': request_metric.timestamp.isoformat()
+                }, max_length=self.max_requests)
+            
         except Exception as e:
             self.logger.error(f"Failed to record request metric: {e}")
     
+    async def _load_shared_requests(self) -> None:
+        """Replace the local request metrics with those recorded by all workers"""
+        backend = get_state_backend()
+        if not backend.shared:
+            return
+        self.request_metrics = [
+            RequestMetric(**{**item, 'timestamp': datetime.fromisoformat(item['timestamp'])})
+            for item in await backend.get_list(SHARED_REQUESTS_KEY, limit=self.max_requests)
+        ]
+    
     async def _analyze_performance(self) -> None:
         """Analyze current performance"""
         try:
+            await self._load_shared_requests()
+            
             # Get recent requests (last 5 minutes)
             recent_requests = self._get_recent_requests(minutes=5)
             
@@ -421,6 +447,8 @@ class PerformanceAnalyzer:
     async def get_endpoint_performance(self, endpoint: str = None, hours: int = 24) -> Dict[str, Any]:
         """Get performance analysis for specific endpoint"""
         try:
+            await self._load_shared_requests()
+            
             # Get recent requests
             cutoff_time = datetime.utcnow() - timedelta(hours=hours)
             recent_requests = [
@@ -18,6 +18,7 @@ import json
 from enum import Enum
 from collections import defaultdict
 
+from trm_api.core.state_backend import get_state_backend
 from .base_mcp_connector import (
     BaseMCPConnector, 
     MCPConnectionConfig, 
@@ -226,18 +227,7 @@ class MCPConnectorRegistry:
             response = await connector.execute_request(request)
             
             # Update metrics
-            self._metrics.total_requests += 1
-            if response.success:
-                self._metrics.successful_requests += 1
-            else:
-                self._metrics.failed_requests += 1
-            
-            # Update average response time
-            total_requests = self._metrics.total_requests
-            current_avg = self._metrics.avg_response_time
-            self._metrics.avg_response_time = (
-                (current_avg * (total_requests - 1) + response.execution_time_ms) / total_requests
-            )
+            await self._record_request(response.success, response.execution_time_ms)
             
             # Cache successful routes
             if response.success and request.resource:
@@ -247,8 +237,7 @@ class MCPConnectorRegistry:
             
         except Exception as e:
             logger.error(f"Failed to execute request {request.request_id}: {str(e)}")
-            self._metrics.total_requests += 1
-            self._metrics.failed_requests += 1
+            await self._record_request(False)
             
             return MCPResponse(
                 request_id=request.request_id,
@@ -588,6 +577,56 @@ class MCPConnectorRegistry:
             except Exception as e:
                 logger.error(f"Health check loop error: {str(e)}")
     
+    async def _record_request(self, success: bool, execution_time_ms: Optional[float] = None):
+        """Update request metrics locally and, with several workers, in the shared backend"""
+        self._metrics.total_requests += 1
+        if success:
+            self._metrics.successful_requests += 1
+        else:
+            self._metrics.failed_requests += 1
+        
+        if execution_time_ms is not None:
+            # Update average response time
+            total_requests = self._metrics.total_requests
+            current_avg = self._metrics.avg_response_time
+            self._metrics.avg_response_time = (
+                (current_avg * (total_requests - 1) + execution_time_ms) / total_requests
+            )
+        
+        backend = get_state_backend()
+        if backend.shared:
+            try:
+                await backend.incr("mcp:requests:total")
+                await backend.incr("mcp:requests:successful" if success else "mcp:requests:failed")
+                if execution_time_ms is not None:
+                    await backend.incr("mcp:requests:timed", 1)
+                    await backend.incr("mcp:requests:time_ms", execution_time_ms)
+            except Exception as e:
+                logger.error(f"Failed to record shared MCP metrics: {str(e)}")
+    
+    async def get_request_metrics(self) -> Dict[str, Any]:
+        """Request metrics of all workers (shared backend), or of this process"""
+        backend = get_state_backend()
+        if not backend.shared:
+            total = self._metrics.total_requests
+            successful = self._metrics.successful_requests
+            failed = self._metrics.failed_requests
+            avg_response_time = self._metrics.avg_response_time
+        else:
+            total = int(await backend.get("mcp:requests:total") or 0)
+            successful = int(await backend.get("mcp:requests:successful") or 0)
+            failed = int(await backend.get("mcp:requests:failed") or 0)
+            timed = await backend.get("mcp:requests:timed") or 0
+            avg_response_time = (await backend.get("mcp:requests:time_ms") or 0) / timed if timed else 0.0
+        
+        return {
+            'total_requests': total,
+            'successful_requests': successful,
+            'failed_requests': failed,
+            'success_rate': (successful / max(total, 1)) * 100,
+            'avg_response_time_ms': avg_response_time,
+        }
+    
     def _update_metrics(self):
         """Update registry metrics"""
         self._metrics.total_connectors = len(self._connectors)
@@ -9,6 +9,7 @@ from .optimization_engine import QuantumOptimizationEngine
 from .state_transition_engine import StateTransitionEngine
 from .win_probability_calculator import WINProbabilityCalculator
 from .quantum_coherence_monitor import QuantumCoherenceMonitor
+from .transition_graph import TransitionGraph, TransitionRules
 from .quantum_types import QuantumState, WINProbability, StateTransition, QuantumSystem, QuantumStateType, WINCategory
 
 __all__ = [
@@ -18,6 +19,8 @@ __all__ = [
     "StateTransitionEngine",
     "WINProbabilityCalculator",
     "QuantumCoherenceMonitor",
+    "TransitionGraph",
+    "TransitionRules",
     "QuantumState",
     "WINProbability",
     "StateTransition",
@@ -14,6 +14,7 @@ import random
 import json
 
 from .quantum_types import QuantumState, QuantumStateType, WINProbability, StateTransition, QuantumSystem
+from .transition_graph import transition_graph
 from ..learning.adaptive_learning_system import AdaptiveLearningSystem
 from ..learning.learning_types import LearningExperience, ExperienceType
 from trm_api.core.commercial_ai_coordinator import get_commercial_ai_coordinator, AIRequest, TaskType
@@ -166,7 +167,8 @@ class QuantumOptimizationEngine:
         
         # Extract optimal components
         optimal_states = list(optimal_system.quantum_states.values())
-        optimal_transitions = list(optimal_system.state_transitions.values())
+        # Stored transitions only: rule transitions between every pair of states are not materialized
+        optimal_transitions = transition_graph(optimal_system).stored_transitions()
         optimal_win_probabilities = {
             state_id: state.probability 
             for state_id, state in optimal_system.quantum_states.items()
@@ -312,16 +314,22 @@ class QuantumOptimizationEngine:
             print(f"State encoding error: {e}")
             return np.zeros(32)
     
+    def _copy_system(self, quantum_system: QuantumSystem, system_id: str) -> QuantumSystem:
+        """Copy of a system with its own states dict and transition graph"""
+        system_copy = QuantumSystem(
+            system_id=system_id,
+            quantum_states=quantum_system.quantum_states.copy(),
+            entanglement_network=quantum_system.entanglement_network.copy()
+        )
+        # Assigned after construction: validating the field would expand every rule transition into a dict
+        system_copy.state_transitions = transition_graph(quantum_system).copy(states=system_copy.quantum_states)
+        return system_copy
+    
     def _decode_system_state(self, state_vector: np.ndarray, original_system: QuantumSystem) -> QuantumSystem:
         """Decode numerical vector back to quantum system"""
         try:
             # Create copy of original system
-            optimized_system = QuantumSystem(
-                system_id=original_system.system_id,
-                quantum_states=original_system.quantum_states.copy(),
-                state_transitions=original_system.state_transitions.copy(),
-                current_state_id=original_system.current_state_id
-            )
+            optimized_system = self._copy_system(original_system, original_system.system_id)
             
             # Update state probabilities from vector
             state_ids = list(optimized_system.quantum_states.keys())
@@ -771,12 +779,7 @@ class QuantumOptimizationEngine:
     def _create_perturbed_system(self, quantum_system: QuantumSystem, noise_level: float = 0.05) -> QuantumSystem:
         """Create perturbed version of quantum system"""
         try:
-            perturbed_system = QuantumSystem(
-                system_id=quantum_system.system_id + "_perturbed",
-                quantum_states=quantum_system.quantum_states.copy(),
-                state_transitions=quantum_system.state_transitions.copy(),
-                current_state_id=quantum_system.current_state_id
-            )
+            perturbed_system = self._copy_system(quantum_system, quantum_system.system_id + "_perturbed")
             
             # Add noise to state probabilities
             for state in perturbed_system.quantum_states.values():
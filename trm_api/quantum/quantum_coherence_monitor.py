@@ -16,6 +16,7 @@ from ..learning.adaptive_learning_system import AdaptiveLearningSystem
 from ..learning.learning_types import LearningExperience, ExperienceType
 from ..eventbus.system_event_bus import publish_event
 from .quantum_types import QuantumState, QuantumSystem, QuantumStateType
+from .quantum_runtime import QuantumRuntime, SystemMeasurement, get_quantum_runtime, measure_systems
 
 
 class CoherenceAlertLevel(Enum):
@@ -125,9 +126,10 @@ class QuantumCoherenceMonitor:
     Monitor và maintain quantum system coherence với intelligent alerts
     """
     
-    def __init__(self, learning_system: AdaptiveLearningSystem):
+    def __init__(self, learning_system: AdaptiveLearningSystem, runtime: Optional[QuantumRuntime] = None):
         self.learning_system = learning_system
         self.logger = logging.getLogger(__name__)
+        self.consumer_name = f"coherence_monitor:{uuid4()}"
         
         # Monitoring state
         self.monitored_systems: Dict[str, QuantumSystem] = {}
@@ -164,8 +166,8 @@ class QuantumCoherenceMonitor:
             }
         }
         
-        # Background tasks
-        self.monitoring_task: Optional[asyncio.Task] = None
+        # Monitoring runs on the shared quantum runtime (process-wide one if not given)
+        self.runtime = runtime
         self.is_monitoring = False
         
         # Statistics
@@ -375,8 +377,13 @@ class QuantumCoherenceMonitor:
         if self.is_monitoring:
             return
         
+        if self.runtime is None:
+            self.runtime = get_quantum_runtime()
+        
         self.is_monitoring = True
-        self.monitoring_task = asyncio.create_task(self._monitoring_loop())
+        self.runtime.register(
+            self.consumer_name, self._on_measurements, self.monitoring_interval, self.monitored_systems
+        )
         
         self.logger.info("Coherence monitoring started")
     
@@ -385,12 +392,8 @@ class QuantumCoherenceMonitor:
         
         self.is_monitoring = False
         
-        if self.monitoring_task and not self.monitoring_task.done():
-            self.monitoring_task.cancel()
-            try:
-                await self.monitoring_task
-            except asyncio.CancelledError:
-                pass
+        if self.runtime is not None:
+            self.runtime.unregister(self.consumer_name)
         
         self.logger.info("Coherence monitoring stopped")
     
@@ -459,29 +462,19 @@ class QuantumCoherenceMonitor:
         
         self.logger.info(f"Initialized metrics for system: {system_id}")
     
-    async def _monitoring_loop(self) -> None:
-        """Main monitoring loop"""
-        
-        while self.is_monitoring:
-            try:
-                # Update metrics for all systems
-                for system_id in self.monitored_systems:
-                    await self._update_system_metrics(system_id)
-                    await self._check_alerts(system_id)
-                
-                # Update statistics
-                await self._update_monitoring_stats()
-                
-                # Learn from monitoring data
-                await self._learn_from_monitoring()
-                
-                await asyncio.sleep(self.monitoring_interval)
-                
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                self.logger.error(f"Error in monitoring loop: {e}")
-                await asyncio.sleep(self.monitoring_interval)
+    async def _on_measurements(self, measurements: Dict[str, SystemMeasurement]) -> None:
+        """Monitoring tick (runtime consumer)"""
+        
+        # Update metrics for all systems
+        for system_id, measurement in measurements.items():
+            self._apply_measurement(system_id, measurement)
+            await self._check_alerts(system_id)
+        
+        # Update statistics
+        await self._update_monitoring_stats()
+        
+        # Learn from monitoring data
+        await self._learn_from_monitoring()
     
     async def _update_system_metrics(self, system_id: str) -> None:
         """Update metrics for a specific system"""
@@ -489,11 +482,17 @@ class QuantumCoherenceMonitor:
         if system_id not in self.monitored_systems or system_id not in self.coherence_metrics:
             return
         
-        quantum_system = self.monitored_systems[system_id]
-        metrics = self.coherence_metrics[system_id]
+        measurement = measure_systems({system_id: self.monitored_systems[system_id]})[system_id]
+        self._apply_measurement(system_id, measurement)
+    
+    def _apply_measurement(self, system_id: str, measurement: SystemMeasurement) -> None:
+        """Update a system's metrics from a measurement"""
         
-        # Calculate current metric values
-        metric_values = await self._calculate_metric_values(quantum_system)
+        metrics = self.coherence_metrics.get(system_id)
+        if metrics is None:
+            return
+        
+        metric_values = self._metric_values(measurement)
         
         # Update each metric
         for metric_id, metric in metrics.items():
@@ -503,33 +502,19 @@ class QuantumCoherenceMonitor:
         
         self.monitoring_stats["total_measurements"] += 1
     
-    async def _calculate_metric_values(self, quantum_system: QuantumSystem) -> Dict[CoherenceMetricType, float]:
-        """Calculate current metric values for system"""
-        
-        values = {}
-        
-        # System coherence
-        values[CoherenceMetricType.SYSTEM_COHERENCE] = quantum_system.calculate_system_coherence()
-        
-        # State stability (average of state probabilities)
-        if quantum_system.quantum_states:
-            state_probs = [state.probability for state in quantum_system.quantum_states.values()]
-            values[CoherenceMetricType.STATE_STABILITY] = np.mean(state_probs)
-        else:
-            values[CoherenceMetricType.STATE_STABILITY] = 0.0
+    @staticmethod
+    def _metric_values(measurement: SystemMeasurement) -> Dict[CoherenceMetricType, float]:
+        """Metric values from a system measurement"""
         
-        # Entanglement strength (mock calculation)
-        entanglement_count = sum(len(states) for states in quantum_system.entanglement_network.values())
-        total_possible = len(quantum_system.quantum_states) * (len(quantum_system.quantum_states) - 1)
-        if total_possible > 0:
-            values[CoherenceMetricType.ENTANGLEMENT_STRENGTH] = entanglement_count / total_possible
-        else:
-            values[CoherenceMetricType.ENTANGLEMENT_STRENGTH] = 0.0
-        
-        # Decoherence rate (inverse of coherence)
-        values[CoherenceMetricType.DECOHERENCE_RATE] = 1.0 - values[CoherenceMetricType.SYSTEM_COHERENCE]
-        
-        return values
+        return {
+            CoherenceMetricType.SYSTEM_COHERENCE: measurement.coherence,
+            # State stability (average of state probabilities)
+            CoherenceMetricType.STATE_STABILITY: measurement.mean_probability,
+            # Entanglement strength (mock calculation)
+            CoherenceMetricType.ENTANGLEMENT_STRENGTH: measurement.entanglement_strength,
+            # Decoherence rate (inverse of coherence)
+            CoherenceMetricType.DECOHERENCE_RATE: measurement.decoherence_rate
+        }
     
     async def _check_alerts(self, system_id: str) -> None:
         """Check for alert conditions"""
@@ -0,0 +1,306 @@
+"""
+Quantum Runtime cho TRM-OS
+Một tick chung cho các background consumers của quantum systems
+
+Instead of every component looping over every system on its own schedule
+(metrics collection, optimization, coherence checks, coherence monitor):
+- Each tick gathers the states of all systems once into contiguous NumPy
+  arrays and measures every system in one vectorized pass
+- Consumers register with their own interval; the measurements of a tick are
+  fanned out to every consumer that is due
+- A consumer still running from an earlier tick is skipped, so a slow
+  consumer (e.g. optimization) does not hold back the others
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from .quantum_types import QuantumStateType, QuantumSystem
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SystemMeasurement:
+    """Metrics of one quantum system from one vectorized pass"""
+    system_id: str
+    state_count: int
+    coherence: float            # Same as QuantumSystem.calculate_system_coherence()
+    mean_probability: float     # Average state probability
+    win_probability: float      # Average probability of WIN states
+    entanglement_count: int     # Entries in the entanglement network
+
+    @property
+    def entanglement_strength(self) -> float:
+        total_possible = self.state_count * (self.state_count - 1)
+        return self.entanglement_count / total_possible if total_possible > 0 else 0.0
+
+    @property
+    def decoherence_rate(self) -> float:
+        return 1.0 - self.coherence
+
+
+class QuantumStateArrays:
+    """States of many systems packed into contiguous arrays, one row per state"""
+
+    def __init__(self, systems: Sequence[QuantumSystem]):
+        self.systems = list(systems)
+        rows = []
+        owners = []
+        for index, system in enumerate(self.systems):
+            states = system.quantum_states.values()
+            rows.extend(
+                (abs(state.amplitude) ** 2, state.probability, state.decoherence_rate,
+                 state.created_at.timestamp(), state.measured, state.state_type == QuantumStateType.WIN)
+                for state in states
+            )
+            owners.append(np.full(len(system.quantum_states), index, dtype=np.intp))
+
+        columns = np.array(rows, dtype=np.float64).reshape(len(rows), 6)
+        self.weight = columns[:, 0]
+        self.probability = columns[:, 1]
+        self.decoherence_rate = columns[:, 2]
+        self.created_at = columns[:, 3]
+        self.measured = columns[:, 4].astype(bool)
+        self.is_win = columns[:, 5].astype(bool)
+        self.system_index = np.concatenate(owners) if owners else np.empty(0, dtype=np.intp)
+
+    def __len__(self) -> int:
+        return len(self.probability)
+
+    def _per_system(self, values: np.ndarray) -> np.ndarray:
+        return np.bincount(self.system_index, weights=values, minlength=len(self.systems)).astype(np.float64)
+
+    @staticmethod
+    def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        return np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator > 0)
+
+    def measure(self, now: Optional[float] = None) -> List[SystemMeasurement]:
+        """Measurements of every system, in the order the systems were given"""
+        now = time.time() if now is None else now
+
+        # Coherence: probability-weighted decoherence factor of unmeasured states
+        weight = np.where(self.measured, 0.0, self.weight)
+        decay = np.exp(-self.decoherence_rate * (now - self.created_at))
+        coherence = self._ratio(self._per_system(weight * decay), self._per_system(weight))
+
+        state_counts = np.bincount(self.system_index, minlength=len(self.systems))
+        mean_probability = self._ratio(self._per_system(self.probability), state_counts.astype(np.float64))
+        win_probability = self._ratio(self._per_system(np.where(self.is_win, self.probability, 0.0)),
+                                      self._per_system(self.is_win.astype(np.float64)))
+
+        return [
+            SystemMeasurement(
+                system_id=system.system_id,
+                state_count=int(state_counts[index]),
+                coherence=float(coherence[index]),
+                mean_probability=float(mean_probability[index]),
+                win_probability=float(win_probability[index]),
+                entanglement_count=sum(len(states) for states in system.entanglement_network.values())
+            )
+            for index, system in enumerate(self.systems)
+        ]
+
+
+def _measure_unique(systems: Iterable[QuantumSystem]) -> Dict[int, SystemMeasurement]:
+    # The same system may be listed several times (e.g. by several consumers); gather it once
+    unique: Dict[int, QuantumSystem] = {}
+    for system in systems:
+        unique.setdefault(id(system), system)
+    ordered = list(unique.values())
+    measured = {}
+    for system, measurement in zip(ordered, QuantumStateArrays(ordered).measure()):
+        system.total_coherence = measurement.coherence
+        measured[id(system)] = measurement
+    return measured
+
+
+def measure_systems(systems: Mapping) -> Dict[str, SystemMeasurement]:
+    """Measure systems (id -> QuantumSystem) in one pass; updates each system's total_coherence"""
+    measured = _measure_unique(systems.values())
+    return {system_id: measured[id(system)] for system_id, system in systems.items()}
+
+
+TickConsumer = Callable[[Dict[str, SystemMeasurement]], Awaitable[Any]]
+
+# Shortest gap between scheduled ticks, so a zero interval does not spin the event loop
+MIN_TICK_INTERVAL = 0.05
+
+
+@dataclass
+class _Consumer:
+    name: str
+    callback: TickConsumer
+    interval: float
+    systems: Mapping  # Live view: system id -> QuantumSystem
+    next_due: float = 0.0
+    task: Optional[asyncio.Task] = None
+
+
+class QuantumRuntime:
+    """Runs registered quantum consumers from one shared, vectorized tick"""
+
+    def __init__(self):
+        self._consumers: Dict[str, _Consumer] = {}
+        self._scheduler: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+        self.metrics: Dict[str, Any] = {
+            'ticks': 0,
+            'systems_measured': 0,
+            'states_measured': 0,
+            'consumer_calls': 0,
+            'consumer_failures': 0,
+            'tick_failures': 0,
+            'skipped_running': 0,
+            'total_measure_seconds': 0.0,
+            'last_measure_seconds': 0.0,
+        }
+
+    # Registration
+
+    def register(self, name: str, callback: TickConsumer, interval: float, systems: Mapping) -> None:
+        """Call `callback(measurements)` every `interval` seconds for the systems in `systems`; first call is immediate"""
+        self.unregister(name)
+        self._consumers[name] = _Consumer(name, callback, interval, systems, next_due=time.monotonic())
+        self._ensure_started()
+        self._wake()
+
+    def unregister(self, name: str) -> None:
+        consumer = self._consumers.pop(name, None)
+        if consumer is not None and consumer.task is not None and not consumer.task.done():
+            consumer.task.cancel()
+        if not self._consumers and self._scheduler is not None:
+            self._scheduler.cancel()
+            self._scheduler = None
+
+    def is_registered(self, name: str) -> bool:
+        return name in self._consumers
+
+    # Ticks
+
+    async def tick(self, force: bool = False) -> int:
+        """Run one tick now (all consumers if force, else those due) and wait for them; returns consumers run"""
+        tasks = self._run_tick(time.monotonic(), force)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return len(tasks)
+
+    def _run_tick(self, now: float, force: bool = False) -> List[asyncio.Task]:
+        due = []
+        for consumer in self._consumers.values():
+            if not force and consumer.next_due > now:
+                continue
+            consumer.next_due = now + consumer.interval
+            if consumer.task is not None and not consumer.task.done():
+                self.metrics['skipped_running'] += 1
+                continue
+            due.append(consumer)
+        if not due:
+            return []
+
+        # One pass over every system any due consumer watches
+        views = [(consumer, list(consumer.systems.items())) for consumer in due]
+        started_at = time.monotonic()
+        measured = _measure_unique(system for _, items in views for _, system in items)
+        elapsed = time.monotonic() - started_at
+
+        self.metrics['ticks'] += 1
+        self.metrics['systems_measured'] += len(measured)
+        self.metrics['states_measured'] += sum(m.state_count for m in measured.values())
+        self.metrics['total_measure_seconds'] += elapsed
+        self.metrics['last_measure_seconds'] = elapsed
+
+        tasks = []
+        for consumer, items in views:
+            measurements = {system_id: measured[id(system)] for system_id, system in items}
+            consumer.task = asyncio.create_task(self._call(consumer, measurements))
+            tasks.append(consumer.task)
+        return tasks
+
+    async def _call(self, consumer: _Consumer, measurements: Dict[str, SystemMeasurement]) -> None:
+        self.metrics['consumer_calls'] += 1
+        try:
+            await consumer.callback(measurements)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.metrics['consumer_failures'] += 1
+            logger.error(f"Quantum consumer {consumer.name} failed: {e}")
+
+    # Scheduling
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _ensure_started(self) -> None:
+        # The scheduler belongs to one event loop; tests and scripts may run several
+        loop = asyncio.get_running_loop()
+        if self._scheduler is None or self._scheduler.done() or self._scheduler.get_loop() is not loop:
+            self._wakeup = asyncio.Event()
+            self._scheduler = loop.create_task(self._scheduler_loop())
+
+    async def _scheduler_loop(self) -> None:
+        try:
+            while True:
+                try:
+                    self._run_tick(time.monotonic())
+                except Exception as e:
+                    # Keep ticking; consumers were already rescheduled to their next interval
+                    self.metrics['tick_failures'] += 1
+                    logger.error(f"Quantum runtime tick failed: {e}")
+
+                due = [consumer.next_due for consumer in self._consumers.values()]
+                timeout = max(MIN_TICK_INTERVAL, min(due) - time.monotonic()) if due else None
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        except asyncio.CancelledError:
+            logger.debug("Quantum runtime scheduler stopped")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        ticks = self.metrics['ticks']
+        return {
+            **self.metrics,
+            'consumers': {
+                name: {'interval': consumer.interval, 'systems': len(consumer.systems)}
+                for name, consumer in self._consumers.items()
+            },
+            'avg_measure_seconds': self.metrics['total_measure_seconds'] / ticks if ticks else 0.0,
+        }
+
+    async def shutdown(self) -> None:
+        """Stop ticking and wait for running consumers"""
+        scheduler, self._scheduler = self._scheduler, None
+        if scheduler is not None:
+            scheduler.cancel()
+            await asyncio.gather(scheduler, return_exceptions=True)
+        running = [c.task for c in self._consumers.values() if c.task is not None and not c.task.done()]
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
+
+_quantum_runtime: Optional[QuantumRuntime] = None
+
+
+def get_quantum_runtime() -> QuantumRuntime:
+    """Process-wide quantum runtime"""
+    global _quantum_runtime
+    if _quantum_runtime is None:
+        _quantum_runtime = QuantumRuntime()
+    return _quantum_runtime
+
+
+def set_quantum_runtime(runtime: Optional[QuantumRuntime]) -> None:
+    """Replace the process-wide runtime (None creates a new one on next use)"""
+    global _quantum_runtime
+    _quantum_runtime = runtime
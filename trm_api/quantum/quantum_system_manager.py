@@ -21,6 +21,8 @@ from .quantum_types import (
 )
 from .optimization_engine import QuantumOptimizationEngine, OptimizationObjective
 from .state_detector import AdaptiveStateDetector
+from .transition_graph import TransitionGraph, default_transition_rules
+from .quantum_runtime import QuantumRuntime, SystemMeasurement, get_quantum_runtime, measure_systems
 
 
 class QuantumSystemStatus(Enum):
@@ -78,7 +80,7 @@ class QuantumSystemManager:
     Tích hợp tất cả quantum capabilities với existing architecture
     """
     
-    def __init__(self, learning_system: AdaptiveLearningSystem):
+    def __init__(self, learning_system: AdaptiveLearningSystem, runtime: Optional[QuantumRuntime] = None):
         self.learning_system = learning_system
         self.logger = logging.getLogger(__name__)
         
@@ -101,9 +103,10 @@ class QuantumSystemManager:
         self.coherence_threshold = 0.5
         self.optimization_interval = 300  # 5 minutes
         self.metrics_collection_interval = 60  # 1 minute
+        self.coherence_monitoring_interval = 60  # 1 minute
         
-        # Background tasks
-        self.background_tasks: List[asyncio.Task] = []
+        # Background processes run on the shared quantum runtime (process-wide one if not given)
+        self.runtime = runtime
         self.is_running = False
         
         self.logger.info(f"QuantumSystemManager initialized with ID: {self.system_id}")
@@ -392,24 +395,8 @@ class QuantumSystemManager:
             return None
         
         try:
-            quantum_system = self.quantum_systems[system_id]
-            
-            # Calculate metrics
-            metrics = QuantumSystemMetrics(
-                system_coherence=quantum_system.calculate_system_coherence(),
-                win_probability=await self._calculate_average_win_probability(system_id),
-                state_stability=await self._calculate_state_stability(system_id),
-                transition_efficiency=await self._calculate_transition_efficiency(system_id),
-                optimization_effectiveness=self._calculate_optimization_effectiveness(),
-                learning_integration=await self._calculate_learning_integration(),
-                prediction_accuracy=await self._calculate_prediction_accuracy(system_id),
-                adaptation_speed=await self._calculate_adaptation_speed(system_id)
-            )
-            
-            # Store metrics history
-            self.metrics_history.append(metrics)
-            
-            return metrics
+            measurement = measure_systems({system_id: self.quantum_systems[system_id]})[system_id]
+            return await self._build_system_metrics(system_id, measurement)
             
         except Exception as e:
             self.logger.error(f"Failed to get system metrics: {e}")
@@ -418,35 +405,23 @@ class QuantumSystemManager:
     async def start_background_processes(self) -> None:
         """Start background monitoring và optimization processes"""
         
-        if self.background_tasks:
-            await self.stop_background_processes()
-        
-        # Metrics collection task
-        metrics_task = asyncio.create_task(self._metrics_collection_loop())
-        self.background_tasks.append(metrics_task)
+        if self.runtime is None:
+            self.runtime = get_quantum_runtime()
         
-        # Optimization task
-        optimization_task = asyncio.create_task(self._optimization_loop())
-        self.background_tasks.append(optimization_task)
-        
-        # Coherence monitoring task
-        coherence_task = asyncio.create_task(self._coherence_monitoring_loop())
-        self.background_tasks.append(coherence_task)
+        # One shared tick measures all systems; each process consumes it on its own interval
+        for name, callback, interval in self._background_processes():
+            self.runtime.register(name, callback, interval, self.quantum_systems)
+        self.is_running = True
         
         self.logger.info("Background processes started")
     
     async def stop_background_processes(self) -> None:
         """Stop all background processes"""
         
-        for task in self.background_tasks:
-            if not task.done():
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
+        if self.runtime is not None:
+            for name, _, _ in self._background_processes():
+                self.runtime.unregister(name)
         
-        self.background_tasks.clear()
         self.is_running = False
         self.logger.info("Background processes stopped")
     
@@ -501,31 +476,12 @@ class QuantumSystemManager:
     async def _initialize_state_transitions(self, quantum_system: QuantumSystem) -> None:
         """Initialize state transitions cho quantum system"""
         
-        states = list(quantum_system.quantum_states.values())
-        
-        # Create transitions between states
-        for i, from_state in enumerate(states):
-            for j, to_state in enumerate(states):
-                if i != j:
-                    transition_id = str(uuid4())
-                    
-                    # Calculate transition probability based on state types
-                    if from_state.state_type == QuantumStateType.WIN and to_state.state_type == QuantumStateType.WIN:
-                        transition_prob = 0.3
-                    elif from_state.state_type == QuantumStateType.SUPERPOSITION:
-                        transition_prob = 0.7
-                    else:
-                        transition_prob = 0.5
-                    
-                    transition = StateTransition(
-                        transition_id=transition_id,
-                        from_state=from_state.state_id,
-                        to_state=to_state.state_id,
-                        transition_probability=transition_prob,
-                        trigger_conditions={"coherence_threshold": 0.5}
-                    )
-                    
-                    quantum_system.state_transitions[transition_id] = transition
+        # Transitions between states follow from their types; they are created on first use
+        quantum_system.state_transitions = TransitionGraph(
+            quantum_system.quantum_states,
+            rules=default_transition_rules(),
+            transitions=quantum_system.state_transitions
+        )
     
     async def _collect_organizational_signals(self) -> OrganizationalSignals:
         """Collect organizational signals từ TRM-OS systems"""
@@ -621,87 +577,88 @@ class QuantumSystemManager:
         except Exception as e:
             self.logger.error(f"Failed to learn from optimization: {e}")
     
-    async def _metrics_collection_loop(self) -> None:
-        """Background metrics collection loop"""
+    def _background_processes(self) -> List[Tuple[str, Any, float]]:
+        """(runtime consumer name, callback, interval) of the background processes"""
         
-        while self.is_running:
-            try:
-                # Collect metrics for all systems
-                for system_id in self.quantum_systems:
-                    metrics = await self.get_system_metrics(system_id)
-                    if metrics:
-                        # Record metrics event
-                        await publish_event(
-                            event_type="knowledge.created",
-                            source_agent_id=self.system_id,
-                            entity_id=system_id,
-                            entity_type="quantum_metrics",
-                            data=metrics.to_dict()
-                        )
-                
-                await asyncio.sleep(self.metrics_collection_interval)
-                
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                self.logger.error(f"Error in metrics collection loop: {e}")
-                await asyncio.sleep(self.metrics_collection_interval)
+        return [
+            (f"{self.system_id}:metrics", self._collect_metrics, self.metrics_collection_interval),
+            (f"{self.system_id}:optimization", self._optimize_degraded_systems, self.optimization_interval),
+            (f"{self.system_id}:coherence", self._monitor_coherence, self.coherence_monitoring_interval)
+        ]
+    
+    async def _build_system_metrics(
+        self,
+        system_id: str,
+        measurement: SystemMeasurement
+    ) -> QuantumSystemMetrics:
+        """Build system metrics from a measurement và store them in history"""
+        
+        metrics = QuantumSystemMetrics(
+            system_coherence=measurement.coherence,
+            win_probability=measurement.win_probability,
+            state_stability=await self._calculate_state_stability(system_id),
+            transition_efficiency=await self._calculate_transition_efficiency(system_id),
+            optimization_effectiveness=self._calculate_optimization_effectiveness(),
+            learning_integration=await self._calculate_learning_integration(),
+            prediction_accuracy=await self._calculate_prediction_accuracy(system_id),
+            adaptation_speed=await self._calculate_adaptation_speed(system_id)
+        )
+        
+        # Store metrics history
+        self.metrics_history.append(metrics)
+        
+        return metrics
     
-    async def _optimization_loop(self) -> None:
-        """Background optimization loop"""
+    async def _collect_metrics(self, measurements: Dict[str, SystemMeasurement]) -> None:
+        """Background metrics collection (runtime consumer)"""
         
-        while self.is_running:
+        for system_id, measurement in measurements.items():
             try:
-                # Optimize systems that need it
-                for system_id, quantum_system in self.quantum_systems.items():
-                    coherence = quantum_system.calculate_system_coherence()
-                    
-                    if coherence < self.coherence_threshold:
-                        await self.optimize_quantum_system(system_id)
-                
-                await asyncio.sleep(self.optimization_interval)
-                
-            except asyncio.CancelledError:
-                break
+                metrics = await self._build_system_metrics(system_id, measurement)
             except Exception as e:
-                self.logger.error(f"Error in optimization loop: {e}")
-                await asyncio.sleep(self.optimization_interval)
+                self.logger.error(f"Failed to get system metrics: {e}")
+                continue
+            
+            # Record metrics event
+            await publish_event(
+                event_type="knowledge.created",
+                source_agent_id=self.system_id,
+                entity_id=system_id,
+                entity_type="quantum_metrics",
+                data=metrics.to_dict()
+            )
     
-    async def _coherence_monitoring_loop(self) -> None:
-        """Background coherence monitoring loop"""
+    async def _optimize_degraded_systems(self, measurements: Dict[str, SystemMeasurement]) -> None:
+        """Background optimization of systems below the coherence threshold (runtime consumer)"""
         
-        while self.is_running:
-            try:
-                # Monitor coherence for all systems
-                for system_id, quantum_system in self.quantum_systems.items():
-                    coherence = quantum_system.calculate_system_coherence()
-                    
-                    if coherence < self.coherence_threshold:
-                        self.status = QuantumSystemStatus.COHERENCE_DEGRADED
-                        
-                        # Record coherence degradation event
-                        await publish_event(
-                            event_type="agent.action.failed",
-                            source_agent_id=self.system_id,
-                            entity_id=system_id,
-                            entity_type="coherence_alert",
-                            data={
-                                "coherence": coherence,
-                                "threshold": self.coherence_threshold,
-                                "status": self.status.value
-                            }
-                        )
-                    else:
-                        if self.status == QuantumSystemStatus.COHERENCE_DEGRADED:
-                            self.status = QuantumSystemStatus.ACTIVE
-                
-                await asyncio.sleep(60)  # Check every minute
+        for system_id, measurement in measurements.items():
+            if measurement.coherence < self.coherence_threshold:
+                await self.optimize_quantum_system(system_id)
+    
+    async def _monitor_coherence(self, measurements: Dict[str, SystemMeasurement]) -> None:
+        """Background coherence monitoring (runtime consumer)"""
+        
+        for system_id, measurement in measurements.items():
+            coherence = measurement.coherence
+            
+            if coherence < self.coherence_threshold:
+                self.status = QuantumSystemStatus.COHERENCE_DEGRADED
                 
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                self.logger.error(f"Error in coherence monitoring loop: {e}")
-                await asyncio.sleep(60)
+                # Record coherence degradation event
+                await publish_event(
+                    event_type="agent.action.failed",
+                    source_agent_id=self.system_id,
+                    entity_id=system_id,
+                    entity_type="coherence_alert",
+                    data={
+                        "coherence": coherence,
+                        "threshold": self.coherence_threshold,
+                        "status": self.status.value
+                    }
+                )
+            else:
+                if self.status == QuantumSystemStatus.COHERENCE_DEGRADED:
+                    self.status = QuantumSystemStatus.ACTIVE
     
     def _calculate_optimization_effectiveness(self) -> float:
         """Calculate optimization effectiveness từ history"""
@@ -724,20 +681,6 @@ class QuantumSystemManager:
         
         return np.mean(improvement_ratios)
     
-    async def _calculate_average_win_probability(self, system_id: str) -> float:
-        """Calculate average WIN probability cho system"""
-        
-        quantum_system = self.quantum_systems[system_id]
-        win_states = [
-            state for state in quantum_system.quantum_states.values()
-            if state.state_type == QuantumStateType.WIN
-        ]
-        
-        if not win_states:
-            return 0.0
-        
-        return np.mean([state.probability for state in win_states])
-    
     async def _calculate_state_stability(self, system_id: str) -> float:
         """Calculate state stability"""
         
@@ -4,6 +4,7 @@ Quản lý transitions giữa quantum states với Commercial AI coordination
 """
 
 import asyncio
+import itertools
 import logging
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
@@ -20,6 +21,7 @@ from .quantum_types import (
     QuantumState, QuantumSystem, StateTransition, QuantumStateType,
     ProbabilityDistribution
 )
+from .transition_graph import transition_graph
 
 
 class TransitionTriggerType(Enum):
@@ -98,6 +100,7 @@ class StateTransitionEngine:
         self.max_concurrent_transitions = 5
         self.transition_timeout = 30.0  # seconds
         self.prediction_confidence_threshold = 0.7
+        self.path_search_max_frontier = 4096  # Open entries kept by the path search
         
         # Statistics
         self.transition_stats = {
@@ -139,47 +142,31 @@ class StateTransitionEngine:
         possible_transitions = []
         
         try:
-            # Evaluate all transitions
-            for transition_id, transition in quantum_system.state_transitions.items():
-                
-                # Get conditions for this transition
-                conditions = self.transition_conditions.get(transition_id, [])
-                
-                if not conditions:
-                    # Use default transition probability
-                    confidence = transition.transition_probability
-                else:
-                    # Evaluate conditions
-                    met_conditions = []
-                    total_weight = 0.0
-                    met_weight = 0.0
-                    
-                    for condition in conditions:
-                        total_weight += condition.weight
-                        if condition.evaluate(current_metrics):
-                            met_conditions.append(condition.condition_id)
-                            met_weight += condition.weight
-                    
-                    # Calculate confidence based on met conditions
-                    if total_weight > 0:
-                        confidence = (met_weight / total_weight) * transition.transition_probability
-                    else:
-                        confidence = transition.transition_probability
-                
-                # Apply ML prediction enhancement
-                if self.transition_success_predictor:
-                    ml_confidence = await self._predict_transition_success(
-                        transition, current_metrics
-                    )
-                    confidence = (confidence + ml_confidence) / 2
-                
-                # Add to possible transitions if confidence is high enough
-                if confidence >= self.prediction_confidence_threshold:
-                    possible_transitions.append((
-                        transition.from_state,
-                        transition.to_state,
-                        confidence
-                    ))
+            graph = transition_graph(quantum_system)
+            threshold = self.prediction_confidence_threshold
+            
+            # Transitions with conditions are scored one by one; looking them up stores rule transitions
+            for transition_id in list(self.transition_conditions):
+                if transition_id in graph:
+                    graph[transition_id]
+            
+            for transition_id, transition in graph.stored_items():
+                confidence = await self._transition_confidence(transition_id, transition, current_metrics)
+                if confidence >= threshold:
+                    possible_transitions.append((transition.from_state, transition.to_state, confidence))
+            
+            # Other rule transitions of a state type pair differ only in their states, so the
+            # first one scores the whole group instead of evaluating every state pair
+            for from_type, to_type in graph.rule_type_pairs():
+                group = graph.rule_transitions(from_type, to_type)
+                first = next(group, None)
+                if first is None:
+                    continue
+                confidence = await self._transition_confidence(*first, current_metrics)
+                if confidence < threshold:
+                    continue
+                for _, transition in itertools.chain([first], group):
+                    possible_transitions.append((transition.from_state, transition.to_state, confidence))
             
             # Sort by confidence
             possible_transitions.sort(key=lambda x: x[2], reverse=True)
@@ -190,6 +177,45 @@ class StateTransitionEngine:
             self.logger.error(f"Failed to evaluate transition conditions: {e}")
             return []
     
+    async def _transition_confidence(
+        self,
+        transition_id: str,
+        transition: StateTransition,
+        current_metrics: Dict[str, Any]
+    ) -> float:
+        """Transition probability weighted by met conditions, blended with the ML prediction"""
+        
+        # Get conditions for this transition
+        conditions = self.transition_conditions.get(transition_id, [])
+        
+        if not conditions:
+            # Use default transition probability
+            confidence = transition.transition_probability
+        else:
+            # Evaluate conditions
+            total_weight = 0.0
+            met_weight = 0.0
+            
+            for condition in conditions:
+                total_weight += condition.weight
+                if condition.evaluate(current_metrics):
+                    met_weight += condition.weight
+            
+            # Calculate confidence based on met conditions
+            if total_weight > 0:
+                confidence = (met_weight / total_weight) * transition.transition_probability
+            else:
+                confidence = transition.transition_probability
+        
+        # Apply ML prediction enhancement
+        if self.transition_success_predictor:
+            ml_confidence = await self._predict_transition_success(
+                transition, current_metrics
+            )
+            confidence = (confidence + ml_confidence) / 2
+        
+        return confidence
+    
     async def execute_transition(
         self,
         quantum_system: QuantumSystem,
@@ -207,11 +233,7 @@ class StateTransitionEngine:
         
         try:
             # Find transition
-            target_transition = None
-            for trans_id, transition in quantum_system.state_transitions.items():
-                if transition.from_state == from_state_id and transition.to_state == to_state_id:
-                    target_transition = transition
-                    break
+            target_transition = transition_graph(quantum_system).get_transition(from_state_id, to_state_id)
             
             if not target_transition and not force:
                 raise ValueError(f"No transition found from {from_state_id} to {to_state_id}")
@@ -298,7 +320,7 @@ class StateTransitionEngine:
         """Predict optimal transition path to target state"""
         
         try:
-            # Use A* algorithm with Commercial AI enhanced heuristics
+            # A* over -log(probability) costs
             path = await self._find_optimal_path(
                 quantum_system, current_state_id, target_state_id, max_steps
             )
@@ -492,40 +514,11 @@ class StateTransitionEngine:
         target_state: str,
         max_steps: int
     ) -> List[Tuple[str, str, float]]:
-        """Find optimal transition path using A* algorithm"""
-        
-        # Simplified path finding
-        # In real implementation, would use A* with Commercial AI enhanced heuristics
-        
-        path = []
-        current_state = start_state
-        
-        for step in range(max_steps):
-            if current_state == target_state:
-                break
-            
-            # Find best transition from current state
-            best_transition = None
-            best_confidence = 0.0
-            
-            for transition in quantum_system.state_transitions.values():
-                if transition.from_state == current_state:
-                    confidence = transition.transition_probability
-                    if confidence > best_confidence:
-                        best_confidence = confidence
-                        best_transition = transition
-            
-            if best_transition:
-                path.append((
-                    best_transition.from_state,
-                    best_transition.to_state,
-                    best_confidence
-                ))
-                current_state = best_transition.to_state
-            else:
-                break
+        """Find most probable transition path using A* algorithm"""
         
-        return path
+        return transition_graph(quantum_system).find_path(
+            start_state, target_state, max_steps, max_frontier=self.path_search_max_frontier
+        )
     
     def _update_transition_stats(self, result: TransitionResult) -> None:
         """Update transition statistics"""
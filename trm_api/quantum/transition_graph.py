@@ -0,0 +1,515 @@
+"""
+Transition Graph cho TRM-OS Quantum Systems
+Sparse state transitions với shortest-path search
+
+- TransitionRules: transition probabilities by (from type, to type), so
+  transitions between every pair of states need not be materialized
+- TransitionGraph: drop-in for QuantumSystem.state_transitions with adjacency
+  lists keyed by from-state; rule transitions are created on first access
+- find_path: A* over -log(probability) costs (the most probable path), with a
+  hop limit, a bounded frontier and cached results
+"""
+
+import heapq
+import itertools
+import math
+from collections import OrderedDict
+from collections.abc import ItemsView, MutableMapping, ValuesView
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from .quantum_types import QuantumState, QuantumStateType, StateTransition
+
+RULE_ID_SEPARATOR = "->"
+
+
+@dataclass
+class TransitionRules:
+    """Transition probability by state type; None or <= 0 means no transition"""
+    default_probability: Optional[float] = 0.5
+    from_type_probability: Dict[QuantumStateType, float] = field(default_factory=dict)
+    pair_probability: Dict[Tuple[QuantumStateType, QuantumStateType], float] = field(default_factory=dict)
+    trigger_conditions: Dict[str, Any] = field(default_factory=dict)
+
+    def probability(self, from_type: QuantumStateType, to_type: QuantumStateType) -> Optional[float]:
+        # Most specific rule wins: (from, to) pair, then from type, then default
+        if (from_type, to_type) in self.pair_probability:
+            return self.pair_probability[(from_type, to_type)]
+        if from_type in self.from_type_probability:
+            return self.from_type_probability[from_type]
+        return self.default_probability
+
+
+def default_transition_rules() -> TransitionRules:
+    """Rules used by QuantumSystemManager for new systems"""
+    return TransitionRules(
+        default_probability=0.5,
+        from_type_probability={QuantumStateType.SUPERPOSITION: 0.7},
+        pair_probability={(QuantumStateType.WIN, QuantumStateType.WIN): 0.3},
+        trigger_conditions={"coherence_threshold": 0.5}
+    )
+
+
+def rule_transition_id(from_state: str, to_state: str) -> str:
+    return f"{from_state}{RULE_ID_SEPARATOR}{to_state}"
+
+
+def _cost(probability: float) -> float:
+    return -math.log(min(probability, 1.0))
+
+
+class TransitionGraph(MutableMapping):
+    """State transitions by id, indexed by from-state and to-state.
+
+    Behaves like the dict it replaces (transition_id -> StateTransition).
+    Besides explicitly stored transitions it contains one rule transition per
+    ordered pair of distinct states the rules allow, with id "<from>-><to>";
+    a rule transition is created and stored on first lookup by id or pair.
+    Iterating values() or items() yields temporary rule transitions instead,
+    so walking the whole mapping does not store every pair. Explicit
+    transitions override the rule for their pair, and deleting a rule
+    transition removes that pair.
+
+    Path results are cached; use set_probability() to change a probability,
+    or call invalidate() after changing transitions or state types in place.
+    """
+
+    def __init__(self, states: Dict[str, QuantumState], rules: Optional[TransitionRules] = None,
+                 transitions: Optional[Dict[str, StateTransition]] = None, cache_size: int = 256):
+        self.states = states
+        self._rules = rules
+        self.cache_size = cache_size
+
+        self._transitions: Dict[str, StateTransition] = {}
+        self._pairs: Dict[Tuple[str, str], Dict[str, None]] = {}  # (from, to) -> transition ids
+        self._outgoing: Dict[str, Dict[str, None]] = {}  # from -> to states with explicit transitions
+        self._incoming: Dict[str, Dict[str, None]] = {}  # to -> from states with explicit transitions
+        self._removed: Dict[str, Set[str]] = {}  # from -> to states whose rule transition was deleted
+
+        # Rebuilt when the state count changes
+        self._states_signature: Optional[int] = None
+        self._by_type: Dict[QuantumStateType, List[str]] = {}
+
+        self._version = 0
+        self._len_cache: Optional[Tuple[Tuple[int, int], int]] = None
+        self._path_cache: "OrderedDict[Tuple[str, str, int], List[Tuple[str, str, float]]]" = OrderedDict()
+        self._path_cache_version: Tuple[int, int] = (0, 0)
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        for transition_id, transition in (transitions or {}).items():
+            self[transition_id] = transition
+
+    @property
+    def rules(self) -> Optional[TransitionRules]:
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules: Optional[TransitionRules]) -> None:
+        self._rules = rules
+        self.invalidate()
+
+    # Mapping interface
+
+    def __getitem__(self, transition_id: str) -> StateTransition:
+        transition = self._transitions.get(transition_id)
+        if transition is not None:
+            return transition
+        pair = self._rule_pair(transition_id)
+        if pair is None:
+            raise KeyError(transition_id)
+        return self._materialize(*pair)
+
+    def __setitem__(self, transition_id: str, transition: StateTransition) -> None:
+        if transition_id in self._transitions:
+            self._unindex(transition_id, self._transitions[transition_id])
+        self._transitions[transition_id] = transition
+        self._index(transition_id, transition)
+        self.invalidate()
+
+    def __delitem__(self, transition_id: str) -> None:
+        transition = self._transitions.pop(transition_id, None)
+        if transition is not None:
+            self._unindex(transition_id, transition)
+            if transition_id == rule_transition_id(transition.from_state, transition.to_state):
+                self._removed.setdefault(transition.from_state, set()).add(transition.to_state)
+        else:
+            pair = self._rule_pair(transition_id)
+            if pair is None:
+                raise KeyError(transition_id)
+            self._removed.setdefault(pair[0], set()).add(pair[1])
+        self.invalidate()
+
+    def __contains__(self, transition_id: object) -> bool:
+        # Without creating the rule transition
+        return transition_id in self._transitions or (
+            isinstance(transition_id, str) and self._rule_pair(transition_id) is not None
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        yield from list(self._transitions)
+        if self._rules is None:
+            return
+        self._sync_states()
+        for from_id, state in list(self.states.items()):
+            for to_id, _ in self._rule_targets(from_id, state):
+                yield rule_transition_id(from_id, to_id)
+
+    def items(self) -> ItemsView:
+        return _TransitionItems(self)
+
+    def values(self) -> ValuesView:
+        return _TransitionValues(self)
+
+    def _iter_items(self) -> Iterator[Tuple[str, StateTransition]]:
+        yield from list(self._transitions.items())
+        if self._rules is None:
+            return
+        self._sync_states()
+        for from_id, state in list(self.states.items()):
+            for to_id, probability in self._rule_targets(from_id, state):
+                yield rule_transition_id(from_id, to_id), self._rule_transition(from_id, to_id, probability)
+
+    def stored_transitions(self) -> List[StateTransition]:
+        """Explicit transitions and rule transitions created so far (not every rule pair)"""
+        return list(self._transitions.values())
+
+    def stored_items(self) -> List[Tuple[str, StateTransition]]:
+        """(id, transition) of explicit transitions and rule transitions created so far"""
+        return list(self._transitions.items())
+
+    def __len__(self) -> int:
+        self._sync_states()
+        version = (self._version, self._states_signature)
+        if self._len_cache is not None and self._len_cache[0] == version:
+            return self._len_cache[1]
+        length = len(self._transitions) + self._rule_transition_count()
+        self._len_cache = (version, length)
+        return length
+
+    def clear(self) -> None:
+        self._transitions.clear()
+        self._pairs.clear()
+        self._outgoing.clear()
+        self._incoming.clear()
+        self._removed.clear()
+        self._rules = None
+        self.invalidate()
+
+    def copy(self, states: Optional[Dict[str, QuantumState]] = None) -> "TransitionGraph":
+        """Shallow copy sharing rules and transition objects, like dict.copy(); over `states` if given"""
+        graph = TransitionGraph(self.states if states is None else states, self._rules, self._transitions,
+                                self.cache_size)
+        graph._removed = {from_id: set(to_ids) for from_id, to_ids in self._removed.items()}
+        return graph
+
+    # Indexing
+
+    def _index(self, transition_id: str, transition: StateTransition) -> None:
+        pair = (transition.from_state, transition.to_state)
+        self._pairs.setdefault(pair, {})[transition_id] = None
+        self._outgoing.setdefault(pair[0], {})[pair[1]] = None
+        self._incoming.setdefault(pair[1], {})[pair[0]] = None
+
+    def _unindex(self, transition_id: str, transition: StateTransition) -> None:
+        pair = (transition.from_state, transition.to_state)
+        ids = self._pairs.get(pair)
+        if ids is None:
+            return
+        ids.pop(transition_id, None)
+        if ids:
+            return
+        del self._pairs[pair]
+        for index, key, value in ((self._outgoing, pair[0], pair[1]), (self._incoming, pair[1], pair[0])):
+            targets = index[key]
+            targets.pop(value, None)
+            if not targets:
+                del index[key]
+
+    def _sync_states(self) -> None:
+        signature = len(self.states)
+        if signature == self._states_signature:
+            return
+        self._states_signature = signature
+        self._by_type = {}
+        for state_id, state in self.states.items():
+            self._by_type.setdefault(state.state_type, []).append(state_id)
+
+    def invalidate(self) -> None:
+        """Drop cached paths and counts (after in-place changes to transitions or states)"""
+        self._version += 1
+        self._states_signature = None
+        self._len_cache = None
+        self._path_cache.clear()
+
+    # Rule transitions
+
+    def _rule_probability(self, from_id: str, to_id: str) -> Optional[float]:
+        """Probability of the rule transition for a pair, or None if the rules give none"""
+        if self._rules is None or from_id == to_id:
+            return None
+        from_state = self.states.get(from_id)
+        to_state = self.states.get(to_id)
+        if from_state is None or to_state is None or to_id in self._removed.get(from_id, ()):
+            return None
+        probability = self._rules.probability(from_state.state_type, to_state.state_type)
+        return probability if probability is not None and probability > 0 else None
+
+    def _rule_pair(self, transition_id: str) -> Optional[Tuple[str, str]]:
+        """(from, to) of a rule transition id that is not overridden, else None"""
+        if self._rules is None:
+            return None
+        # State ids may themselves contain the separator; try every split
+        position = transition_id.find(RULE_ID_SEPARATOR)
+        while position != -1:
+            from_id = transition_id[:position]
+            to_id = transition_id[position + len(RULE_ID_SEPARATOR):]
+            if (from_id, to_id) not in self._pairs and self._rule_probability(from_id, to_id) is not None:
+                return from_id, to_id
+            position = transition_id.find(RULE_ID_SEPARATOR, position + 1)
+        return None
+
+    def _rule_targets(self, from_id: str, state: QuantumState) -> Iterator[Tuple[str, float]]:
+        """(to state, probability) of the rule transitions from a state; call _sync_states first"""
+        if self._rules is None:
+            return
+        overridden = self._outgoing.get(from_id, {})
+        removed = self._removed.get(from_id, ())
+        for to_type, to_ids in self._by_type.items():
+            probability = self._rules.probability(state.state_type, to_type)
+            if probability is None or probability <= 0:
+                continue
+            for to_id in to_ids:
+                if to_id != from_id and to_id not in overridden and to_id not in removed:
+                    yield to_id, probability
+
+    def rule_type_pairs(self) -> List[Tuple[QuantumStateType, QuantumStateType]]:
+        """(from type, to type) of the states present that the rules connect"""
+        if self._rules is None:
+            return []
+        self._sync_states()
+        pairs = []
+        for from_type in self._by_type:
+            for to_type in self._by_type:
+                probability = self._rules.probability(from_type, to_type)
+                if probability is not None and probability > 0:
+                    pairs.append((from_type, to_type))
+        return pairs
+
+    def rule_transitions(self, from_type: QuantumStateType,
+                         to_type: QuantumStateType) -> Iterator[Tuple[str, StateTransition]]:
+        """Temporary rule transitions between states of two types that are not stored or deleted
+
+        They share probability and trigger conditions and differ only in their states.
+        """
+        if self._rules is None:
+            return
+        probability = self._rules.probability(from_type, to_type)
+        if probability is None or probability <= 0:
+            return
+        self._sync_states()
+        to_ids = self._by_type.get(to_type, [])
+        for from_id in list(self._by_type.get(from_type, [])):
+            overridden = self._outgoing.get(from_id, {})
+            removed = self._removed.get(from_id, ())
+            for to_id in to_ids:
+                if to_id != from_id and to_id not in overridden and to_id not in removed:
+                    yield rule_transition_id(from_id, to_id), self._rule_transition(from_id, to_id, probability)
+
+    def _rule_transition_count(self) -> int:
+        if self._rules is None:
+            return 0
+        counts = {state_type: len(ids) for state_type, ids in self._by_type.items()}
+        total = 0
+        for from_type, from_count in counts.items():
+            for to_type, to_count in counts.items():
+                probability = self._rules.probability(from_type, to_type)
+                if probability is not None and probability > 0:
+                    total += from_count * (to_count - (from_type == to_type))
+        # Pairs taken over by explicit transitions or deleted
+        covered = set(self._pairs)
+        covered.update((from_id, to_id) for from_id, to_ids in self._removed.items() for to_id in to_ids)
+        for from_id, to_id in covered:
+            if from_id == to_id or from_id not in self.states or to_id not in self.states:
+                continue
+            probability = self._rules.probability(self.states[from_id].state_type, self.states[to_id].state_type)
+            if probability is not None and probability > 0:
+                total -= 1
+        return total
+
+    def _rule_transition(self, from_id: str, to_id: str, probability: float) -> StateTransition:
+        return StateTransition(
+            transition_id=rule_transition_id(from_id, to_id),
+            from_state=from_id,
+            to_state=to_id,
+            transition_probability=probability,
+            trigger_conditions=dict(self._rules.trigger_conditions)
+        )
+
+    def _materialize(self, from_id: str, to_id: str) -> StateTransition:
+        # Stored like an explicit transition so in-place changes stick; the pair's probability is unchanged
+        transition = self._rule_transition(from_id, to_id, self._rule_probability(from_id, to_id))
+        self._transitions[transition.transition_id] = transition
+        self._index(transition.transition_id, transition)
+        return transition
+
+    # Adjacency
+
+    def get_transition(self, from_id: str, to_id: str) -> Optional[StateTransition]:
+        """The transition for a pair (the first stored one if there are several)"""
+        ids = self._pairs.get((from_id, to_id))
+        if ids:
+            return self._transitions[next(iter(ids))]
+        if self._rule_probability(from_id, to_id) is None:
+            return None
+        return self._materialize(from_id, to_id)
+
+    def outgoing(self, from_id: str) -> List[StateTransition]:
+        """All transitions from a state"""
+        transitions = [self.get_transition(from_id, to_id) for to_id in list(self._outgoing.get(from_id, ()))]
+        state = self.states.get(from_id)
+        if state is not None:
+            self._sync_states()
+            transitions.extend(self._materialize(from_id, to_id) for to_id, _ in list(self._rule_targets(from_id, state)))
+        return transitions
+
+    def neighbors(self, from_id: str) -> Iterator[Tuple[str, float]]:
+        """(to state, probability) for every transition from a state, without creating transitions"""
+        for to_id in self._outgoing.get(from_id, ()):
+            yield to_id, self._transitions[next(iter(self._pairs[(from_id, to_id)]))].transition_probability
+        state = self.states.get(from_id)
+        if state is not None:
+            yield from self._rule_targets(from_id, state)
+
+    def set_probability(self, from_id: str, to_id: str, probability: float) -> StateTransition:
+        """Change a transition's probability and drop cached paths"""
+        transition = self.get_transition(from_id, to_id)
+        if transition is None:
+            raise KeyError(rule_transition_id(from_id, to_id))
+        transition.transition_probability = probability
+        self.invalidate()
+        return transition
+
+    # Path search
+
+    def find_path(self, start_id: str, target_id: str, max_steps: int = 5,
+                  max_frontier: Optional[int] = None) -> List[Tuple[str, str, float]]:
+        """Most probable path of at most max_steps transitions, as (from, to, probability) steps.
+
+        Empty if start and target are the same or the target is unreachable.
+        With max_frontier set, the search keeps only that many best open
+        entries, trading optimality for bounded memory.
+        """
+        self._sync_states()
+        version = (self._version, self._states_signature)
+        if self._path_cache_version != version:
+            self._path_cache.clear()
+            self._path_cache_version = version
+
+        key = (start_id, target_id, max_steps)
+        path = self._path_cache.get(key)
+        if path is None:
+            self.cache_misses += 1
+            path = self._search(start_id, target_id, max_steps, max_frontier)
+            self._path_cache[key] = path
+            if len(self._path_cache) > self.cache_size:
+                self._path_cache.popitem(last=False)
+        else:
+            self.cache_hits += 1
+            self._path_cache.move_to_end(key)
+        return list(path)
+
+    def _min_incoming_cost(self, target_id: str) -> Optional[float]:
+        """Cheapest cost of any transition into the target, or None if there is none"""
+        best = 0.0
+        for from_id in self._incoming.get(target_id, ()):
+            transition = self._transitions[next(iter(self._pairs[(from_id, target_id)]))]
+            best = max(best, transition.transition_probability)
+        target = self.states.get(target_id)
+        if self._rules is not None and target is not None:
+            for from_type, from_ids in self._by_type.items():
+                if from_type == target.state_type and len(from_ids) == 1:
+                    continue  # Only the target itself
+                probability = self._rules.probability(from_type, target.state_type)
+                if probability is not None and probability > best:
+                    best = probability
+        return _cost(best) if best > 0 else None
+
+    def _search(self, start_id: str, target_id: str, max_steps: int,
+                max_frontier: Optional[int]) -> List[Tuple[str, str, float]]:
+        if start_id == target_id or max_steps < 1:
+            return []
+        # Admissible and consistent: every path into the target ends with a transition costing at least this
+        estimate = self._min_incoming_cost(target_id)
+        if estimate is None:
+            return []
+
+        # Labels are (state, hops): the hop limit means a costlier path with fewer hops can still matter
+        tie = itertools.count()
+        frontier = [(estimate, 0, 1, next(tie), 0.0, start_id)]  # (f, hops, not target, tie, g, state)
+        best_cost: Dict[Tuple[str, int], float] = {(start_id, 0): 0.0}
+        came_from: Dict[Tuple[str, int], Tuple[str, float]] = {}  # label -> (previous state, probability)
+        settled_hops: Dict[str, int] = {}
+
+        while frontier:
+            _, hops, _, _, cost, state_id = heapq.heappop(frontier)
+            # Popped earlier with no higher cost and no more hops: dominated
+            if settled_hops.get(state_id, max_steps + 1) <= hops:
+                continue
+            settled_hops[state_id] = hops
+            if state_id == target_id:
+                return self._reconstruct(came_from, target_id, hops)
+            if hops == max_steps:
+                continue
+
+            next_hops = hops + 1
+            for to_id, probability in self.neighbors(state_id):
+                if probability <= 0 or settled_hops.get(to_id, max_steps + 1) <= next_hops:
+                    continue
+                next_cost = cost + _cost(probability)
+                label = (to_id, next_hops)
+                if next_cost >= best_cost.get(label, math.inf):
+                    continue
+                best_cost[label] = next_cost
+                came_from[label] = (state_id, probability)
+                is_target = to_id == target_id
+                priority = next_cost + (0.0 if is_target else estimate)
+                heapq.heappush(frontier, (priority, next_hops, 0 if is_target else 1, next(tie), next_cost, to_id))
+
+            if max_frontier is not None and len(frontier) > 2 * max_frontier:
+                # nsmallest returns a sorted list, which is a valid heap
+                frontier = heapq.nsmallest(max_frontier, frontier)
+
+        return []
+
+    @staticmethod
+    def _reconstruct(came_from: Dict[Tuple[str, int], Tuple[str, float]], target_id: str,
+                     hops: int) -> List[Tuple[str, str, float]]:
+        path = []
+        state_id = target_id
+        while hops > 0:
+            previous_id, probability = came_from[(state_id, hops)]
+            path.append((previous_id, state_id, probability))
+            state_id = previous_id
+            hops -= 1
+        path.reverse()
+        return path
+
+
+class _TransitionItems(ItemsView):
+    def __iter__(self):
+        return self._mapping._iter_items()
+
+
+class _TransitionValues(ValuesView):
+    def __iter__(self):
+        return (transition for _, transition in self._mapping._iter_items())
+
+
+def transition_graph(quantum_system) -> TransitionGraph:
+    """The system's transitions as a TransitionGraph, converting a plain dict in place"""
+    transitions = quantum_system.state_transitions
+    if not isinstance(transitions, TransitionGraph):
+        transitions = TransitionGraph(quantum_system.quantum_states, transitions=transitions)
+        quantum_system.state_transitions = transitions
+    return transitions
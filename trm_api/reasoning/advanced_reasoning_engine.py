@@ -16,9 +16,10 @@ from .reasoning_types import (
     UncertaintyLevel, CausalChain, KnowledgeNode, ReasoningGoal,
     ReasoningConstraint
 )
-from .causal_analyzer import CausalAnalyzer
+from .causal_analyzer import CausalAnalyzer, get_causal_analyzer
 from .uncertainty_handler import UncertaintyHandler  
 from .context_manager import ContextManager
+from .knowledge_store import KnowledgeStore, KnowledgeStoreView, get_shared_knowledge_store
 from trm_api.eventbus.system_event_bus import publish_event, EventType
 
 
@@ -34,17 +35,25 @@ class AdvancedReasoningEngine:
     5. Event-driven reasoning following TRM-OS philosophy
     """
     
-    def __init__(self, agent_id: str):
+    def __init__(
+        self,
+        agent_id: str,
+        knowledge_store: Optional[KnowledgeStore] = None,
+        causal_analyzer: Optional[CausalAnalyzer] = None
+    ):
         self.agent_id = agent_id
         self.logger = logging.getLogger(f"reasoning.{agent_id}")
         
-        # Sub-components
-        self.causal_analyzer = CausalAnalyzer()
+        # Sub-components; the causal analyzer is shared so every engine sees the streamed chains
+        self.causal_analyzer = causal_analyzer or get_causal_analyzer()
         self.uncertainty_handler = UncertaintyHandler()
         self.context_manager = ContextManager()
         
-        # Knowledge base for reasoning
-        self.knowledge_base: Dict[str, KnowledgeNode] = {}
+        # Knowledge base for reasoning: copy-on-write view over the shared store
+        if knowledge_store is None:
+            knowledge_store = get_shared_knowledge_store()
+        self.knowledge_base: KnowledgeStoreView = knowledge_store.fork()
+        self.max_context_knowledge = 50
         
         # Active reasoning sessions
         self.active_sessions: Dict[str, ReasoningResult] = {}
@@ -150,6 +159,9 @@ class AdvancedReasoningEngine:
                 pass  # Don't fail on event creation error
         
         finally:
+            # Share knowledge gathered by this agent with the other engines
+            await self.publish_knowledge()
+            
             # Update statistics
             self._update_reasoning_stats(result)
             
@@ -189,10 +201,20 @@ class AdvancedReasoningEngine:
             for constraint in constraints:
                 await self._apply_constraint(result.context, constraint)
             
+            # Load knowledge tagged with the context's entities via the tag index
+            relevant_knowledge = self.knowledge_base.find_by_tags(
+                self._context_entity_ids(result.context), limit=self.max_context_knowledge
+            )
+            if relevant_knowledge:
+                result.context.current_state["relevant_knowledge"] = [
+                    knowledge.node_id for knowledge in relevant_knowledge
+                ]
+            
             step.output_data = {
                 "entities_loaded": len(result.context.related_entities),
                 "events_loaded": len(result.context.historical_events),
-                "constraints_applied": len(constraints)
+                "constraints_applied": len(constraints),
+                "knowledge_loaded": len(relevant_knowledge)
             }
             step.confidence = 0.95
             
@@ -206,6 +228,13 @@ class AdvancedReasoningEngine:
         
         result.add_step(step)
     
+    def _context_entity_ids(self, context: ReasoningContext) -> List[str]:
+        """All ontology entity IDs referenced by a reasoning context"""
+        entity_ids = [context.tension_id, context.project_id, *context.task_ids]
+        for ids in context.related_entities.values():
+            entity_ids.extend(ids)
+        return [entity_id for entity_id in entity_ids if entity_id]
+    
     async def _execute_reasoning_chain(
         self, 
         result: ReasoningResult, 
@@ -384,7 +413,21 @@ class AdvancedReasoningEngine:
             )
             result.causal_chains.extend(causal_chains)
             
-            step.output_data = {"causal_chains_found": len(causal_chains)}
+            # Merge continuously maintained chains from the event stream
+            streamed_chains = []
+            if self.causal_analyzer.is_streaming:
+                context_entities = self._context_entity_ids(result.context)
+                known = {(c.root_cause, c.final_effect) for c in result.causal_chains}
+                streamed_chains = [
+                    chain for chain in self.causal_analyzer.get_streaming_chains(entity_ids=context_entities)
+                    if (chain.root_cause, chain.final_effect) not in known
+                ]
+                result.causal_chains.extend(streamed_chains)
+            
+            step.output_data = {
+                "causal_chains_found": len(causal_chains),
+                "streamed_chains_merged": len(streamed_chains)
+            }
             step.confidence = 0.8
             
         except Exception as e:
@@ -977,31 +1020,34 @@ class AdvancedReasoningEngine:
         """Get reasoning engine performance statistics"""
         return self.reasoning_stats.copy()
     
-    async def add_knowledge(self, knowledge: KnowledgeNode) -> None:
+    async def add_knowledge(
+        self,
+        knowledge: KnowledgeNode,
+        embedding: Optional[List[float]] = None
+    ) -> None:
         """Add knowledge to the reasoning engine's knowledge base"""
-        self.knowledge_base[knowledge.node_id] = knowledge
+        self.knowledge_base.add(knowledge, embedding)
         self.logger.info(f"Added knowledge node: {knowledge.node_type} - {knowledge.content[:50]}...")
     
     async def query_knowledge(
         self, 
         query: str, 
-        node_types: Optional[List[str]] = None
+        node_types: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+        limit: Optional[int] = None
     ) -> List[KnowledgeNode]:
-        """Query knowledge base for relevant information"""
-        
-        results = []
-        query_lower = query.lower()
-        
-        for knowledge in self.knowledge_base.values():
-            # Filter by node type if specified
-            if node_types and knowledge.node_type not in node_types:
-                continue
-            
-            # Simple text matching (can be enhanced with semantic search)
-            if query_lower in knowledge.content.lower():
-                results.append(knowledge)
-        
-        # Sort by confidence and relevance
-        results.sort(key=lambda k: k.confidence, reverse=True)
-        
-        return results 
\ No newline at end of file
+        """Query knowledge base for nodes whose content contains the query, by confidence"""
+        return self.knowledge_base.query(query, node_types, tags, limit)
+    
+    async def query_similar_knowledge(
+        self,
+        embedding: List[float],
+        top_k: int = 10,
+        node_types: Optional[List[str]] = None
+    ) -> List[Tuple[KnowledgeNode, float]]:
+        """Semantic knowledge query by embedding cosine similarity"""
+        return self.knowledge_base.similar(embedding, top_k, node_types)
+    
+    async def publish_knowledge(self) -> int:
+        """Share this agent's knowledge changes with all engines using the same store"""
+        return self.knowledge_base.commit()
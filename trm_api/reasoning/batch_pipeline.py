@@ -0,0 +1,338 @@
+"""
+BatchReasoningPipeline - Staged, bounded-concurrency batch processing for ReasoningCoordinator
+
+Splits the per-tension reasoning workflow into stages connected by bounded queues:
+- analysis     (TensionAnalyzer, CPU-bound)
+- rules        (RuleEngine)
+- solutions    (SolutionGenerator, CPU-bound)
+- priority     (PriorityCalculator, CPU-bound)
+- commercial_ai (micro-batched across the batch)
+
+Every stage has its own worker pool, so a slow stage only backs up its own queue
+and the feeder blocks instead of materializing the whole batch in memory.
+CPU-bound stages can optionally be offloaded to a process pool.
+"""
+
+from typing import Dict, List, Optional, Any, AsyncIterator, Callable, Awaitable
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+import asyncio
+import logging
+import time
+
+from .tension_analyzer import TensionAnalysis
+
+
+# Components available inside process pool workers (set once per worker process)
+_worker_components: Dict[str, Any] = {}
+
+
+def _init_pipeline_worker(components: Dict[str, Any]) -> None:
+    """Process pool initializer - receives pickled reasoning components once per worker"""
+    _worker_components.update(components)
+
+
+def _run_tension_analysis(title: str, description: str, current_status: str) -> TensionAnalysis:
+    return _worker_components["tension_analyzer"].analyze_tension(
+        title=title, description=description, current_status=current_status
+    )
+
+
+def _run_solution_generation(analysis: TensionAnalysis, title: str, description: str,
+                             context: Optional[Dict[str, Any]]):
+    return _worker_components["solution_generator"].generate_solutions(
+        tension_analysis=analysis, tension_title=title,
+        tension_description=description, context=context
+    )
+
+
+def _run_priority_calculation(analysis: TensionAnalysis, title: str, description: str,
+                              context: Optional[Dict[str, Any]], method: str):
+    return _worker_components["priority_calculator"].calculate_priority(
+        tension_analysis=analysis, title=title, description=description,
+        context=context, method=method
+    )
+
+
+@dataclass
+class BatchPipelineConfig:
+    """Configuration for the staged batch pipeline"""
+    stage_workers: Dict[str, int] = field(default_factory=lambda: {
+        "analysis": 4,
+        "rules": 2,
+        "solutions": 4,
+        "priority": 4,
+        "commercial_ai": 1
+    })
+    queue_size: int = 64  # Bound for every inter-stage queue
+    use_process_pool: bool = False  # Offload CPU-bound stages to processes
+    process_pool_workers: Optional[int] = None
+    commercial_ai_batch_size: int = 16
+    commercial_ai_batch_timeout: float = 0.05  # Seconds to wait to fill a micro-batch
+
+
+@dataclass
+class _PipelineItem:
+    """Work item flowing through the pipeline"""
+    index: int
+    request: Any
+    result: Any
+    start_time: datetime
+    enqueued_at: float = 0.0
+
+
+_STAGES = ["analysis", "rules", "solutions", "priority", "commercial_ai"]
+
+
+class BatchReasoningPipeline:
+    """
+    Staged batch pipeline built on a ReasoningCoordinator.
+
+    Results are streamed as they complete through `run()`.
+    """
+
+    def __init__(self, coordinator, config: Optional[BatchPipelineConfig] = None):
+        self.coordinator = coordinator
+        self.config = config or BatchPipelineConfig()
+        self.logger = logging.getLogger(__name__)
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+
+        self.stage_stats: Dict[str, Dict[str, Any]] = coordinator.processing_stats.setdefault(
+            "pipeline_stages", {}
+        )
+        for stage in _STAGES:
+            self.stage_stats.setdefault(stage, {
+                "count": 0,
+                "total_time": 0.0,
+                "queue_wait_time": 0.0,
+                "max_queue_depth": 0,
+                "batches": 0
+            })
+
+    async def run(self, requests) -> AsyncIterator[Any]:
+        """
+        Stream ReasoningResults for the given requests in completion order
+
+        Args:
+            requests: Iterable of ReasoningRequest
+
+        Yields:
+            (index, ReasoningResult) tuples as each tension finishes
+        """
+        queues = [asyncio.Queue(maxsize=self.config.queue_size) for _ in _STAGES]
+        output: asyncio.Queue = asyncio.Queue(maxsize=self.config.queue_size)
+        done = object()
+
+        if self.config.use_process_pool:
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.config.process_pool_workers,
+                initializer=_init_pipeline_worker,
+                initargs=({
+                    "tension_analyzer": self.coordinator.tension_analyzer,
+                    "solution_generator": self.coordinator.solution_generator,
+                    "priority_calculator": self.coordinator.priority_calculator
+                },)
+            )
+
+        handlers: Dict[str, Callable[[_PipelineItem], Awaitable[None]]] = {
+            "analysis": self._analysis_stage,
+            "rules": self._rules_stage,
+            "solutions": self._solutions_stage,
+            "priority": self._priority_stage
+        }
+
+        workers: List[asyncio.Task] = []
+        for position, stage in enumerate(_STAGES):
+            inbox = queues[position]
+            outbox = queues[position + 1] if position + 1 < len(queues) else None
+            for _ in range(max(1, self.config.stage_workers.get(stage, 1))):
+                if stage == "commercial_ai":
+                    workers.append(asyncio.create_task(self._commercial_ai_worker(inbox, output)))
+                else:
+                    workers.append(asyncio.create_task(
+                        self._stage_worker(stage, handlers[stage], inbox, outbox)
+                    ))
+
+        async def feed():
+            try:
+                for index, request in enumerate(requests):
+                    result = self._new_result(request)
+                    item = _PipelineItem(index=index, request=request, result=result,
+                                         start_time=datetime.now())
+                    await self._put(queues[0], item, _STAGES[0])
+                # Queues drain strictly in stage order, so joining them in order waits for the batch
+                for queue in queues:
+                    await queue.join()
+            finally:
+                await output.put(done)
+
+        feeder = asyncio.create_task(feed())
+
+        try:
+            while True:
+                item = await output.get()
+                if item is done:
+                    break
+                yield item.index, item.result
+            await feeder
+        finally:
+            feeder.cancel()
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(feeder, *workers, return_exceptions=True)
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=False, cancel_futures=True)
+                self._process_pool = None
+
+    def _new_result(self, request):
+        from .reasoning_coordinator import ReasoningResult
+        return ReasoningResult(tension_id=request.tension_id)
+
+    async def _put(self, queue: asyncio.Queue, item: _PipelineItem, stage: str) -> None:
+        item.enqueued_at = time.perf_counter()
+        await queue.put(item)
+        stats = self.stage_stats[stage]
+        stats["max_queue_depth"] = max(stats["max_queue_depth"], queue.qsize())
+
+    async def _stage_worker(self, stage: str, handler, inbox: asyncio.Queue,
+                            outbox: asyncio.Queue) -> None:
+        next_stage = _STAGES[_STAGES.index(stage) + 1]
+        while True:
+            item = await inbox.get()
+            try:
+                started = time.perf_counter()
+                stats = self.stage_stats[stage]
+                stats["queue_wait_time"] += started - item.enqueued_at
+
+                if item.result.success:
+                    try:
+                        await handler(item)
+                    except Exception as e:
+                        self.logger.error(f"Pipeline stage {stage} failed for {item.request.tension_id}: {e}")
+                        item.result.errors.append(f"Processing error: {str(e)}")
+                        item.result.success = False
+                    stats["count"] += 1
+                    stats["total_time"] += time.perf_counter() - started
+
+                await self._put(outbox, item, next_stage)
+            finally:
+                inbox.task_done()
+
+    async def _run_cpu(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._process_pool, fn, *args)
+
+    async def _analysis_stage(self, item: _PipelineItem) -> None:
+        request = item.request
+        if "analysis" not in request.requested_services:
+            return
+
+        if self._process_pool is not None:
+            start_time = datetime.now()
+            try:
+                analysis = await self._run_cpu(
+                    _run_tension_analysis, request.title, request.description, request.current_status
+                )
+                self.coordinator._update_component_stats("analysis", start_time)
+            except Exception as e:
+                self.logger.error(f"Tension analysis failed: {str(e)}")
+                analysis = None
+        else:
+            analysis = await self.coordinator._perform_tension_analysis(request)
+
+        item.result.analysis = analysis
+        if not analysis:
+            item.result.errors.append("Failed to analyze tension")
+            item.result.success = False
+
+    async def _rules_stage(self, item: _PipelineItem) -> None:
+        request = item.request
+        if "rules" in request.requested_services and item.result.analysis:
+            item.result.rule_results = await self.coordinator._evaluate_rules(request, item.result.analysis)
+
+    async def _solutions_stage(self, item: _PipelineItem) -> None:
+        request = item.request
+        if "solutions" not in request.requested_services or not item.result.analysis:
+            return
+
+        if self._process_pool is not None:
+            start_time = datetime.now()
+            try:
+                item.result.solutions = await self._run_cpu(
+                    _run_solution_generation, item.result.analysis,
+                    request.title, request.description, request.context
+                )
+                self.coordinator._update_component_stats("solutions", start_time)
+            except Exception as e:
+                self.logger.error(f"Solution generation failed: {str(e)}")
+                item.result.solutions = []
+        else:
+            item.result.solutions = await self.coordinator._generate_solutions(request, item.result.analysis)
+
+    async def _priority_stage(self, item: _PipelineItem) -> None:
+        request = item.request
+        if "priority" not in request.requested_services or not item.result.analysis:
+            return
+
+        if self._process_pool is not None:
+            start_time = datetime.now()
+            method = request.context.get("priority_method", "weighted_average") if request.context else "weighted_average"
+            try:
+                item.result.priority_calculation = await self._run_cpu(
+                    _run_priority_calculation, item.result.analysis,
+                    request.title, request.description, request.context, method
+                )
+                self.coordinator._update_component_stats("priority", start_time)
+            except Exception as e:
+                self.logger.error(f"Priority calculation failed: {str(e)}")
+                item.result.priority_calculation = None
+        else:
+            item.result.priority_calculation = await self.coordinator._calculate_priority(
+                request, item.result.analysis
+            )
+
+    async def _commercial_ai_worker(self, inbox: asyncio.Queue, output: asyncio.Queue) -> None:
+        """Collect items into micro-batches and run commercial AI reasoning once per batch"""
+        stats = self.stage_stats["commercial_ai"]
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await inbox.get()]
+            deadline = loop.time() + self.config.commercial_ai_batch_timeout
+            while len(batch) < self.config.commercial_ai_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(inbox.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                started = time.perf_counter()
+                for item in batch:
+                    stats["queue_wait_time"] += started - item.enqueued_at
+
+                eligible = [
+                    item for item in batch
+                    if item.result.success
+                    and "commercial_ai" in item.request.requested_services
+                    and self.coordinator._commercial_ai_initialized
+                ]
+                if eligible:
+                    ai_results = await self.coordinator._perform_commercial_ai_reasoning_batch(
+                        [(item.request, item.result) for item in eligible]
+                    )
+                    for item, ai_result in zip(eligible, ai_results):
+                        item.result.commercial_ai_result = ai_result
+                    stats["batches"] += 1
+                    stats["count"] += len(eligible)
+                    stats["total_time"] += time.perf_counter() - started
+
+                for item in batch:
+                    self.coordinator._finalize_result(item.result, item.start_time)
+                    await output.put(item)
+            finally:
+                for _ in batch:
+                    inbox.task_done()
@@ -7,13 +7,126 @@ following TRM-OS ontology principles.
 
 import asyncio
 import logging
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
-from collections import defaultdict
+from typing import Dict, List, Any, Optional, Tuple, Deque
+from collections import defaultdict, deque, OrderedDict
 
 from .reasoning_types import CausalChain, ReasoningContext, UncertaintyLevel
 
 
+@dataclass
+class CausalChainAggregate:
+    """Running aggregate for a (root_cause, final_effect) relationship"""
+    best_chain: CausalChain
+    occurrences: int = 0
+    confidence_sum: float = 0.0
+    max_confidence: float = 0.0
+    entity_ids: set = field(default_factory=set)
+    last_seen: Optional[datetime] = None
+
+    @property
+    def mean_confidence(self) -> float:
+        return self.confidence_sum / self.occurrences if self.occurrences else 0.0
+
+    def update(self, chain: CausalChain, entity_ids: Tuple[Optional[str], ...], seen_at: Optional[datetime]) -> None:
+        self.occurrences += 1
+        self.confidence_sum += chain.confidence
+        if chain.confidence > self.max_confidence:
+            self.max_confidence = chain.confidence
+            self.best_chain = chain
+        self.entity_ids.update(e for e in entity_ids if e)
+        if seen_at is not None:
+            self.last_seen = seen_at
+
+
+@dataclass
+class _IntervalStats:
+    """Welford running statistics over inter-arrival times of one event type"""
+    last_timestamp: Optional[datetime] = None
+    occurrences: int = 0
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def add(self, timestamp: datetime) -> None:
+        self.occurrences += 1
+        if self.last_timestamp is not None:
+            interval = (timestamp - self.last_timestamp).total_seconds()
+            self.count += 1
+            delta = interval - self.mean
+            self.mean += delta / self.count
+            self.m2 += delta * (interval - self.mean)
+        self.last_timestamp = timestamp
+
+    def coefficient_of_variation(self) -> Optional[float]:
+        if self.count < 3 or self.mean == 0:
+            return None
+        return (self.m2 / self.count) ** 0.5 / self.mean
+
+
+class CausalStreamState:
+    """
+    Sliding-window state for incremental causal chain mining.
+
+    Each new event is only scored against the last ``lookahead`` events, so
+    ingesting a stream costs O(lookahead) per event instead of re-sorting and
+    re-pairing the whole history.
+    """
+
+    def __init__(self, lookahead: int = 4, max_entities: int = 10000, max_chains: int = 5000):
+        self.recent_events: Deque[Dict[str, Any]] = deque(maxlen=lookahead)
+        self.entity_windows: "OrderedDict[str, Deque[Dict[str, Any]]]" = OrderedDict()
+        self.type_intervals: Dict[str, _IntervalStats] = defaultdict(_IntervalStats)
+        self.chains: "OrderedDict[Tuple[str, str], CausalChainAggregate]" = OrderedDict()
+        self.lookahead = lookahead
+        self.max_entities = max_entities
+        self.max_chains = max_chains
+        self.events_ingested = 0
+
+    def predecessors(self, event: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Recent events (global window plus same-entity window) preceding ``event``"""
+        candidates = list(self.recent_events)
+        entity_id = event.get("entity_id")
+        if entity_id and entity_id in self.entity_windows:
+            seen = {id(e) for e in candidates}
+            candidates.extend(e for e in self.entity_windows[entity_id] if id(e) not in seen)
+        return candidates
+
+    def push(self, event: Dict[str, Any]) -> None:
+        self.events_ingested += 1
+        self.recent_events.append(event)
+
+        entity_id = event.get("entity_id")
+        if entity_id:
+            window = self.entity_windows.get(entity_id)
+            if window is None:
+                window = deque(maxlen=self.lookahead)
+                self.entity_windows[entity_id] = window
+                if len(self.entity_windows) > self.max_entities:
+                    self.entity_windows.popitem(last=False)
+            else:
+                self.entity_windows.move_to_end(entity_id)
+            window.append(event)
+
+        timestamp = event.get("timestamp")
+        if timestamp:
+            self.type_intervals[event.get("event_type", "unknown")].add(timestamp)
+
+    def record_chain(self, chain: CausalChain, entity_ids: Tuple[Optional[str], ...] = (),
+                     seen_at: Optional[datetime] = None) -> None:
+        key = (chain.root_cause, chain.final_effect)
+        aggregate = self.chains.get(key)
+        if aggregate is None:
+            aggregate = CausalChainAggregate(best_chain=chain)
+            self.chains[key] = aggregate
+            if len(self.chains) > self.max_chains:
+                self.chains.popitem(last=False)
+        else:
+            self.chains.move_to_end(key)
+        aggregate.update(chain, entity_ids, seen_at)
+
+
 class CausalAnalyzer:
     """
     Analyzes causal relationships between events, entities, and states
@@ -68,6 +181,11 @@ class CausalAnalyzer:
             "medium_term": timedelta(hours=24),    # Possibly causal
             "long_term": timedelta(days=7)         # Unlikely causal
         }
+        
+        # Incremental (streaming) causal state
+        self.lookahead = 4  # Each event is scored against at most 4 predecessors
+        self.stream_state = CausalStreamState(lookahead=self.lookahead)
+        self._event_bus = None
     
     async def analyze_relationships(
         self, 
@@ -132,27 +250,23 @@ class CausalAnalyzer:
         if not events or len(events) < 2:
             return []
         
-        causal_chains = []
-        
         try:
-            # Sort events by timestamp
+            # Sort events by timestamp and replay them through a fresh sliding window
             sorted_events = sorted(
                 events, 
                 key=lambda e: e.get("timestamp", datetime.min)
             )
             
-            # Analyze sequential patterns
-            for i, event1 in enumerate(sorted_events[:-1]):
-                for j in range(i+1, min(i+5, len(sorted_events))):  # Look ahead max 4 events
-                    event2 = sorted_events[j]
-                    
-                    chain = await self._analyze_event_pair(event1, event2)
-                    if chain and chain.confidence >= 0.5:
-                        causal_chains.append(chain)
+            state = CausalStreamState(
+                lookahead=self.lookahead,
+                max_entities=len(sorted_events),
+                max_chains=len(sorted_events) * self.lookahead
+            )
+            for event in sorted_events:
+                await self._ingest_into_state(state, event, include_entity_window=False)
             
-            # Look for longer causal sequences
-            sequence_chains = await self._find_causal_sequences(sorted_events)
-            causal_chains.extend(sequence_chains)
+            causal_chains = [aggregate.best_chain for aggregate in state.chains.values()]
+            causal_chains.extend(self._recurring_pattern_chains(state))
             
             # Remove duplicates and weak relationships
             causal_chains = self._deduplicate_chains(causal_chains)
@@ -161,9 +275,165 @@ class CausalAnalyzer:
             
         except Exception as e:
             self.logger.error(f"Error analyzing event sequences: {str(e)}")
+            causal_chains = []
         
         return causal_chains
     
+    async def ingest_event(self, event: Dict[str, Any]) -> List[CausalChain]:
+        """
+        Incrementally score a new event against its recent predecessors
+        
+        Args:
+            event: Event dict with event_id, event_type, timestamp and entity_id
+            
+        Returns:
+            Causal chains discovered (or reinforced) by this event
+        """
+        if not event or not event.get("timestamp"):
+            return []
+        
+        return await self._ingest_into_state(self.stream_state, event, include_entity_window=True)
+    
+    def get_streaming_chains(
+        self,
+        entity_ids: Optional[List[str]] = None,
+        min_confidence: float = 0.5,
+        limit: Optional[int] = None
+    ) -> List[CausalChain]:
+        """
+        Get the continuously maintained causal chains from the event stream
+        
+        Args:
+            entity_ids: Only return chains touching these entities
+            min_confidence: Minimum best-observed confidence
+            limit: Maximum number of chains to return
+            
+        Returns:
+            Causal chains ranked by confidence, annotated with running aggregates
+        """
+        wanted = set(entity_ids) if entity_ids else None
+        aggregates = [
+            aggregate for aggregate in self.stream_state.chains.values()
+            if aggregate.max_confidence >= min_confidence
+            and (wanted is None or aggregate.entity_ids & wanted)
+        ]
+        aggregates.sort(key=lambda a: (a.max_confidence, a.occurrences), reverse=True)
+        if limit is not None:
+            aggregates = aggregates[:limit]
+        
+        chains = []
+        for aggregate in aggregates:
+            chain = aggregate.best_chain.model_copy(deep=True)
+            chain.evidence.append({
+                "type": "stream_aggregate",
+                "occurrences": aggregate.occurrences,
+                "mean_confidence": aggregate.mean_confidence,
+                "max_confidence": aggregate.max_confidence,
+                "last_seen": aggregate.last_seen.isoformat() if aggregate.last_seen else None
+            })
+            chains.append(chain)
+        
+        chains.extend(
+            chain for chain in self._recurring_pattern_chains(self.stream_state)
+            if wanted is None
+        )
+        return chains
+    
+    def subscribe_to_event_bus(self, event_bus=None) -> None:
+        """Keep streaming causal state up to date from the system event bus"""
+        if self._event_bus is not None:
+            return
+        
+        if event_bus is None:
+            from trm_api.eventbus.system_event_bus import system_event_bus as event_bus
+        from trm_api.eventbus.system_event_bus import EventType
+        
+        for event_type in EventType:
+            event_bus.subscribe(event_type, self._handle_system_event)
+        self._event_bus = event_bus
+        self.logger.info("CausalAnalyzer subscribed to system event bus")
+    
+    def unsubscribe_from_event_bus(self) -> None:
+        """Stop receiving events from the system event bus"""
+        if self._event_bus is None:
+            return
+        
+        from trm_api.eventbus.system_event_bus import EventType
+        
+        for event_type in EventType:
+            self._event_bus.unsubscribe(event_type, self._handle_system_event)
+        self._event_bus = None
+    
+    @property
+    def is_streaming(self) -> bool:
+        """Whether incremental state is being fed from the event bus"""
+        return self._event_bus is not None
+    
+    def reset_stream(self) -> None:
+        """Drop all incremental causal state"""
+        self.stream_state = CausalStreamState(lookahead=self.lookahead)
+    
+    async def _handle_system_event(self, event) -> None:
+        """Event bus handler converting SystemEvent into the analyzer event format"""
+        try:
+            await self.ingest_event({
+                "event_id": event.event_id,
+                "event_type": event.event_type.name,
+                "timestamp": event.timestamp,
+                "entity_id": event.entity_id,
+                "entity_type": event.entity_type,
+                "data": event.data
+            })
+        except Exception as e:
+            self.logger.error(f"Error ingesting event {event.event_id}: {str(e)}")
+    
+    async def _ingest_into_state(
+        self,
+        state: CausalStreamState,
+        event: Dict[str, Any],
+        include_entity_window: bool
+    ) -> List[CausalChain]:
+        """Score an event against its window predecessors and push it into the state"""
+        
+        predecessors = state.predecessors(event) if include_entity_window else list(state.recent_events)
+        timestamp = event.get("timestamp")
+        
+        new_chains = []
+        for previous in predecessors:
+            chain = await self._analyze_event_pair(previous, event)
+            if chain and chain.confidence >= 0.5:
+                state.record_chain(
+                    chain,
+                    entity_ids=(previous.get("entity_id"), event.get("entity_id")),
+                    seen_at=timestamp
+                )
+                new_chains.append(chain)
+        
+        state.push(event)
+        return new_chains
+    
+    def _recurring_pattern_chains(self, state: CausalStreamState) -> List[CausalChain]:
+        """Build recurring-pattern chains from running interval statistics"""
+        
+        sequences = []
+        for event_type, stats in state.type_intervals.items():
+            cv = stats.coefficient_of_variation()
+            if cv is None or cv >= 0.5:
+                continue
+            sequences.append(CausalChain(
+                root_cause=f"pattern_{event_type}_recurring",
+                final_effect=f"sequence_{event_type}_pattern",
+                confidence=0.6,
+                strength=0.7,
+                evidence=[{
+                    "type": "recurring_pattern",
+                    "event_type": event_type,
+                    "occurrences": stats.occurrences,
+                    "avg_interval_seconds": stats.mean
+                }]
+            ))
+        return sequences
+    
     async def _analyze_entity_pair(
         self, 
         entity1: str, 
@@ -293,50 +563,6 @@ class CausalAnalyzer:
         
         return chain
     
-    async def _find_causal_sequences(
-        self, 
-        events: List[Dict[str, Any]]
-    ) -> List[CausalChain]:
-        """Find longer causal sequences in events"""
-        
-        sequences = []
-        
-        # Group events by type to find patterns
-        event_groups = defaultdict(list)
-        for event in events:
-            event_type = event.get("event_type", "unknown")
-            event_groups[event_type].append(event)
-        
-        # Look for recurring patterns that might indicate causal sequences
-        for event_type, type_events in event_groups.items():
-            if len(type_events) >= 3:
-                # Analyze intervals between events of same type
-                intervals = []
-                for i in range(len(type_events) - 1):
-                    time_diff = (
-                        type_events[i+1].get("timestamp", datetime.min) - 
-                        type_events[i].get("timestamp", datetime.min)
-                    )
-                    intervals.append(time_diff.total_seconds())
-                
-                # If intervals are consistent, might indicate causal pattern
-                if intervals and self._is_consistent_pattern(intervals):
-                    chain = CausalChain(
-                        root_cause=f"pattern_{event_type}_recurring",
-                        final_effect=f"sequence_{event_type}_pattern",
-                        confidence=0.6,
-                        strength=0.7,
-                        evidence=[{
-                            "type": "recurring_pattern",
-                            "event_type": event_type,
-                            "occurrences": len(type_events),
-                            "avg_interval_seconds": sum(intervals) / len(intervals)
-                        }]
-                    )
-                    sequences.append(chain)
-        
-        return sequences
-    
     async def _create_ontology_chain(
         self, 
         cause_entity: str, 
@@ -601,25 +827,6 @@ class CausalAnalyzer:
         
         return min(1.2, max(0.7, adjustment))  # Clamp between 0.7 and 1.2
     
-    def _is_consistent_pattern(self, intervals: List[float]) -> bool:
-        """Check if time intervals show consistent pattern"""
-        
-        if len(intervals) < 3:
-            return False
-        
-        # Calculate coefficient of variation
-        mean_interval = sum(intervals) / len(intervals)
-        variance = sum((x - mean_interval) ** 2 for x in intervals) / len(intervals)
-        std_dev = variance ** 0.5
-        
-        if mean_interval == 0:
-            return False
-        
-        cv = std_dev / mean_interval
-        
-        # Consider pattern consistent if CV < 0.5
-        return cv < 0.5
-    
     async def _verify_temporal_ordering(
         self, 
         entities: List[str], 
@@ -685,24 +892,27 @@ class CausalAnalyzer:
         return filtered_chains[:20]
     
     def _deduplicate_chains(self, chains: List[CausalChain]) -> List[CausalChain]:
-        """Remove duplicate causal chains"""
+        """Remove duplicate causal chains, keeping the most confident per signature"""
         
-        seen_relationships = set()
-        unique_chains = []
+        unique_chains: Dict[Tuple[str, str], CausalChain] = {}
         
         for chain in chains:
             # Create signature based on cause and effect
             signature = (chain.root_cause, chain.final_effect)
+            existing_chain = unique_chains.get(signature)
             
-            if signature not in seen_relationships:
-                seen_relationships.add(signature)
-                unique_chains.append(chain)
-            else:
-                # If duplicate, keep the one with higher confidence
-                for i, existing_chain in enumerate(unique_chains):
-                    if (existing_chain.root_cause == chain.root_cause and 
-                        existing_chain.final_effect == chain.final_effect):
-                        
-                        if chain.confidence > existing_chain.confidence:
-                            unique_chains[i] = chain
-                        break 
\ No newline at end of file
+            if existing_chain is None or chain.confidence > existing_chain.confidence:
+                unique_chains[signature] = chain
+        
+        return list(unique_chains.values())
+
+
+_causal_analyzer: Optional[CausalAnalyzer] = None
+
+
+def get_causal_analyzer() -> CausalAnalyzer:
+    """Process-wide analyzer whose streaming state is fed by the system event bus"""
+    global _causal_analyzer
+    if _causal_analyzer is None:
+        _causal_analyzer = CausalAnalyzer()
+    return _causal_analyzer
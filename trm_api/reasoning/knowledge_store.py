@@ -0,0 +1,484 @@
+"""
+Knowledge Store - Shared, indexed storage for reasoning KnowledgeNodes
+
+Replaces the per-engine dictionary scan with a store that provides:
+- Inverted indexes on node type, tags and content terms
+- Optional vector similarity for semantic queries
+- Copy-on-write views so agent engines share one base store
+- Optional SQLite persistence so the store survives restarts
+
+Tags are taken from `metadata["tags"]` and from `related_entities`, so
+knowledge can be looked up by the ontology entities a context refers to.
+"""
+
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Set, Tuple
+from collections.abc import Mapping
+import json
+import logging
+import re
+import sqlite3
+import threading
+
+import numpy as np
+
+from .reasoning_types import KnowledgeNode
+
+
+_TERM_PATTERN = re.compile(r"\w+")
+
+
+def _terms(text: str) -> Set[str]:
+    """Lowercased word terms used by the content index"""
+    return set(_TERM_PATTERN.findall(text.lower()))
+
+
+def _node_tags(node: KnowledgeNode) -> Set[str]:
+    tags = node.metadata.get("tags", []) if isinstance(node.metadata, dict) else []
+    if isinstance(tags, str):
+        tags = [tags]
+    return {str(tag).lower() for tag in list(tags) + list(node.related_entities)}
+
+
+class SQLiteKnowledgePersistence:
+    """SQLite-backed persistence for a KnowledgeStore"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS knowledge_nodes ("
+                "node_id TEXT PRIMARY KEY, node_json TEXT NOT NULL, embedding BLOB)"
+            )
+
+    def load(self) -> Iterator[Tuple[KnowledgeNode, Optional[np.ndarray]]]:
+        """Yield every persisted node with its embedding (if any)"""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT node_json, embedding FROM knowledge_nodes"
+            ).fetchall()
+        for node_json, embedding in rows:
+            vector = np.frombuffer(embedding, dtype=np.float32) if embedding is not None else None
+            yield KnowledgeNode.model_validate_json(node_json), vector
+
+    def save(self, node: KnowledgeNode, embedding: Optional[np.ndarray] = None) -> None:
+        blob = embedding.astype(np.float32).tobytes() if embedding is not None else None
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO knowledge_nodes (node_id, node_json, embedding) VALUES (?, ?, ?)",
+                (node.node_id, node.model_dump_json(), blob)
+            )
+
+    def delete(self, node_id: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM knowledge_nodes WHERE node_id = ?", (node_id,))
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class KnowledgeStore(Mapping):
+    """
+    Indexed knowledge store
+
+    Behaves as a read-only mapping of node_id -> KnowledgeNode; writes go
+    through `add` and `remove` so the indexes stay consistent.
+    """
+
+    def __init__(self, persistence: Optional[SQLiteKnowledgePersistence] = None):
+        self.logger = logging.getLogger("reasoning.knowledge_store")
+        self.persistence = persistence
+
+        self._nodes: Dict[str, KnowledgeNode] = {}
+        self._type_index: Dict[str, Set[str]] = {}
+        self._tag_index: Dict[str, Set[str]] = {}
+        self._term_index: Dict[str, Set[str]] = {}
+        self._node_terms: Dict[str, Set[str]] = {}
+        self._node_tags: Dict[str, Set[str]] = {}
+        self._lowered: Dict[str, str] = {}
+
+        # Vector similarity: embeddings plus a lazily rebuilt normalized matrix
+        self._embeddings: Dict[str, np.ndarray] = {}
+        self._matrix: Optional[np.ndarray] = None
+        self._matrix_ids: List[str] = []
+
+        # Terms containing a query fragment; only the vocabulary is cached
+        # (postings are read live), so it is cleared when a term key appears
+        # or disappears
+        self._fragment_cache: Dict[str, List[str]] = {}
+        self._lock = threading.RLock()
+
+        if persistence is not None:
+            for node, embedding in persistence.load():
+                self._index(node, embedding)
+
+    # Mapping interface
+
+    def __getitem__(self, node_id: str) -> KnowledgeNode:
+        return self._nodes[node_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._nodes))
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    # Writes
+
+    def add(self, node: KnowledgeNode, embedding: Optional[Iterable[float]] = None) -> None:
+        """Add or replace a knowledge node, optionally with an embedding vector"""
+        vector = np.asarray(embedding, dtype=np.float32) if embedding is not None else None
+        with self._lock:
+            self._index(node, vector)
+        if self.persistence is not None:
+            self.persistence.save(node, self._embeddings.get(node.node_id))
+
+    def remove(self, node_id: str) -> bool:
+        """Remove a node; returns False when it is not present"""
+        with self._lock:
+            if not self._unindex(node_id):
+                return False
+        if self.persistence is not None:
+            self.persistence.delete(node_id)
+        return True
+
+    def _index(self, node: KnowledgeNode, embedding: Optional[np.ndarray]) -> None:
+        previous_embedding = self._embeddings.get(node.node_id)
+        if node.node_id in self._nodes:
+            self._unindex(node.node_id)
+
+        node_id = node.node_id
+        self._nodes[node_id] = node
+        self._lowered[node_id] = node.content.lower()
+        self._type_index.setdefault(node.node_type, set()).add(node_id)
+
+        tags = _node_tags(node)
+        self._node_tags[node_id] = tags
+        for tag in tags:
+            self._tag_index.setdefault(tag, set()).add(node_id)
+
+        terms = _terms(node.content)
+        self._node_terms[node_id] = terms
+        for term in terms:
+            postings = self._term_index.get(term)
+            if postings is None:
+                self._term_index[term] = postings = set()
+                self._fragment_cache.clear()
+            postings.add(node_id)
+
+        embedding = embedding if embedding is not None else previous_embedding
+        if embedding is not None:
+            self._embeddings[node_id] = embedding
+            self._matrix = None
+
+    def _unindex(self, node_id: str) -> bool:
+        node = self._nodes.pop(node_id, None)
+        if node is None:
+            return False
+
+        self._lowered.pop(node_id, None)
+        self._discard(self._type_index, node.node_type, node_id)
+        for tag in self._node_tags.pop(node_id, set()):
+            self._discard(self._tag_index, tag, node_id)
+        for term in self._node_terms.pop(node_id, set()):
+            if self._discard(self._term_index, term, node_id):
+                self._fragment_cache.clear()
+
+        if self._embeddings.pop(node_id, None) is not None:
+            self._matrix = None
+        return True
+
+    @staticmethod
+    def _discard(index: Dict[str, Set[str]], key: str, node_id: str) -> bool:
+        """Remove node_id from a posting list; returns True when the key was dropped"""
+        postings = index.get(key)
+        if postings is None:
+            return False
+        postings.discard(node_id)
+        if not postings:
+            del index[key]
+            return True
+        return False
+
+    # Queries
+
+    def query(
+        self,
+        query: str,
+        node_types: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> List[KnowledgeNode]:
+        """
+        Find nodes whose content contains `query` (case-insensitive substring)
+
+        Candidates come from the type, tag and term indexes; only those are
+        checked against the full content. Results are sorted by confidence.
+        """
+        with self._lock:
+            node_ids = self._candidate_ids(query, node_types, tags)
+            query_lower = query.lower()
+            results = [
+                self._nodes[node_id] for node_id in node_ids
+                if query_lower in self._lowered[node_id]
+            ]
+
+        results.sort(key=lambda k: k.confidence, reverse=True)
+        return results[:limit] if limit is not None else results
+
+    def find_by_tags(
+        self,
+        tags: Iterable[str],
+        node_types: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> List[KnowledgeNode]:
+        """Nodes carrying any of the given tags (or related entity IDs)"""
+        with self._lock:
+            node_ids: Set[str] = set()
+            for tag in tags:
+                node_ids |= self._tag_index.get(str(tag).lower(), set())
+            if node_types:
+                node_ids &= self._ids_for_types(node_types)
+            results = [self._nodes[node_id] for node_id in node_ids]
+
+        results.sort(key=lambda k: k.confidence, reverse=True)
+        return results[:limit] if limit is not None else results
+
+    def similar(
+        self,
+        embedding: Iterable[float],
+        top_k: int = 10,
+        node_types: Optional[List[str]] = None,
+        min_similarity: float = 0.0
+    ) -> List[Tuple[KnowledgeNode, float]]:
+        """Cosine-similarity search over nodes that have embeddings"""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        with self._lock:
+            matrix, ids = self._embedding_matrix()
+            if matrix is None or norm == 0:
+                return []
+            scores = matrix @ (vector / norm)
+
+            allowed = self._ids_for_types(node_types) if node_types else None
+            ranked = []
+            for position in np.argsort(-scores):
+                score = float(scores[position])
+                if score < min_similarity:
+                    break
+                node_id = ids[position]
+                if allowed is not None and node_id not in allowed:
+                    continue
+                ranked.append((self._nodes[node_id], score))
+                if len(ranked) >= top_k:
+                    break
+        return ranked
+
+    def get_embedding(self, node_id: str) -> Optional[np.ndarray]:
+        return self._embeddings.get(node_id)
+
+    def _ids_for_types(self, node_types: Iterable[str]) -> Set[str]:
+        node_ids: Set[str] = set()
+        for node_type in node_types:
+            node_ids |= self._type_index.get(node_type, set())
+        return node_ids
+
+    def _candidate_ids(
+        self,
+        query: str,
+        node_types: Optional[List[str]],
+        tags: Optional[List[str]]
+    ) -> Set[str]:
+        candidates: Optional[Set[str]] = None
+
+        if node_types:
+            candidates = self._ids_for_types(node_types)
+        if tags:
+            tagged: Set[str] = set()
+            for tag in tags:
+                tagged |= self._tag_index.get(str(tag).lower(), set())
+            candidates = tagged if candidates is None else candidates & tagged
+
+        # Every word fragment of a substring query lies inside some content term
+        for fragment in sorted(_terms(query), key=len, reverse=True):
+            if candidates is not None and not candidates:
+                break
+            matching = self._ids_for_fragment(fragment)
+            candidates = matching if candidates is None else candidates & matching
+
+        return set(self._nodes) if candidates is None else candidates
+
+    def _ids_for_fragment(self, fragment: str) -> Set[str]:
+        terms = self._fragment_cache.get(fragment)
+        if terms is None:
+            terms = [term for term in self._term_index if fragment in term]
+            self._fragment_cache[fragment] = terms
+
+        node_ids: Set[str] = set()
+        for term in terms:
+            node_ids |= self._term_index[term]
+        return node_ids
+
+    def _embedding_matrix(self) -> Tuple[Optional[np.ndarray], List[str]]:
+        if not self._embeddings:
+            return None, []
+        if self._matrix is None:
+            self._matrix_ids = list(self._embeddings)
+            matrix = np.vstack([self._embeddings[node_id] for node_id in self._matrix_ids])
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            self._matrix = matrix / norms
+        return self._matrix, self._matrix_ids
+
+    def fork(self) -> "KnowledgeStoreView":
+        """Create a copy-on-write view backed by this store"""
+        return KnowledgeStoreView(self)
+
+
+class KnowledgeStoreView(Mapping):
+    """
+    Copy-on-write view over a shared KnowledgeStore
+
+    Reads fall through to the shared base store. Writes stay in a small local
+    overlay (with tombstones for removals) until `commit()` publishes them.
+    """
+
+    def __init__(self, base: KnowledgeStore):
+        self.base = base
+        self.local = KnowledgeStore()
+        self._removed: Set[str] = set()
+
+    def __getitem__(self, node_id: str) -> KnowledgeNode:
+        if node_id in self.local:
+            return self.local[node_id]
+        if node_id in self._removed:
+            raise KeyError(node_id)
+        return self.base[node_id]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.local
+        for node_id in self.base:
+            if node_id not in self._removed and node_id not in self.local:
+                yield node_id
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def add(self, node: KnowledgeNode, embedding: Optional[Iterable[float]] = None) -> None:
+        self._removed.discard(node.node_id)
+        if embedding is None and node.node_id not in self.local:
+            embedding = self.base.get_embedding(node.node_id)
+        self.local.add(node, embedding)
+
+    def remove(self, node_id: str) -> bool:
+        removed = self.local.remove(node_id)
+        if node_id in self.base and node_id not in self._removed:
+            self._removed.add(node_id)
+            removed = True
+        return removed
+
+    def query(
+        self,
+        query: str,
+        node_types: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> List[KnowledgeNode]:
+        return self._merge(
+            self.local.query(query, node_types, tags),
+            self.base.query(query, node_types, tags),
+            limit
+        )
+
+    def find_by_tags(
+        self,
+        tags: Iterable[str],
+        node_types: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> List[KnowledgeNode]:
+        tags = list(tags)
+        return self._merge(
+            self.local.find_by_tags(tags, node_types),
+            self.base.find_by_tags(tags, node_types),
+            limit
+        )
+
+    def similar(
+        self,
+        embedding: Iterable[float],
+        top_k: int = 10,
+        node_types: Optional[List[str]] = None,
+        min_similarity: float = 0.0
+    ) -> List[Tuple[KnowledgeNode, float]]:
+        shadowed = len(self._removed) + len(self.local)
+        ranked = self.local.similar(embedding, top_k, node_types, min_similarity) + [
+            (node, score)
+            for node, score in self.base.similar(embedding, top_k + shadowed, node_types, min_similarity)
+            if node.node_id not in self._removed and node.node_id not in self.local
+        ]
+        ranked.sort(key=lambda item: item[1], reverse=True)
+        return ranked[:top_k]
+
+    def get_embedding(self, node_id: str) -> Optional[np.ndarray]:
+        if node_id in self.local:
+            return self.local.get_embedding(node_id)
+        if node_id in self._removed:
+            return None
+        return self.base.get_embedding(node_id)
+
+    def commit(self) -> int:
+        """Publish local changes to the base store; returns the number of changes"""
+        changes = len(self.local) + len(self._removed)
+        for node_id in list(self._removed):
+            self.base.remove(node_id)
+        for node_id in list(self.local):
+            self.base.add(self.local[node_id], self.local.get_embedding(node_id))
+        self.local = KnowledgeStore()
+        self._removed.clear()
+        return changes
+
+    def _merge(
+        self,
+        local_results: List[KnowledgeNode],
+        base_results: List[KnowledgeNode],
+        limit: Optional[int]
+    ) -> List[KnowledgeNode]:
+        results = local_results + [
+            node for node in base_results
+            if node.node_id not in self._removed and node.node_id not in self.local
+        ]
+        results.sort(key=lambda k: k.confidence, reverse=True)
+        return results[:limit] if limit is not None else results
+
+
+_shared_store: Optional[KnowledgeStore] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_knowledge_store() -> KnowledgeStore:
+    """Process-wide knowledge store shared by all reasoning engines (persisted at KNOWLEDGE_STORE_PATH if set)"""
+    global _shared_store
+    with _shared_lock:
+        if _shared_store is None:
+            from trm_api.core.config import settings
+            path = settings.KNOWLEDGE_STORE_PATH
+            _shared_store = KnowledgeStore(persistence=SQLiteKnowledgePersistence(path) if path else None)
+        return _shared_store
+
+
+def configure_shared_knowledge_store(path: Optional[str] = None) -> KnowledgeStore:
+    """
+    Replace the shared store, optionally persisting it to a SQLite file
+
+    Engines created afterwards use the new store. The current store is kept if it
+    already persists to `path`.
+    """
+    global _shared_store
+    with _shared_lock:
+        current = _shared_store.persistence if _shared_store is not None else None
+        if path and current is not None and current.path == path:
+            return _shared_store
+        persistence = SQLiteKnowledgePersistence(path) if path else None
+        _shared_store = KnowledgeStore(persistence=persistence)
+        return _shared_store
@@ -8,12 +8,14 @@ Calculates intelligent priority scores based on:
 - Risk factors and dependencies
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
 import math
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from .tension_analyzer import TensionAnalysis, ImpactLevel, UrgencyLevel
 
 class PriorityDimension(Enum):
@@ -58,6 +60,39 @@ class PriorityCalculationResult:
         """Backward compatibility property"""
         return self.final_score
 
+# Column layout of factor matrices (PriorityFactors field order)
+FACTOR_COLUMNS = [
+    "impact_score", "urgency_score", "complexity_score", "resource_availability_score",
+    "business_value_score", "risk_level_score", "stakeholder_interest_score",
+    "deadline_pressure", "dependency_factor", "strategic_alignment"
+]
+
+# Weighted dimensions in the same order as the first seven factor columns
+_DIMENSION_COLUMNS = [
+    PriorityDimension.IMPACT, PriorityDimension.URGENCY, PriorityDimension.COMPLEXITY,
+    PriorityDimension.RESOURCE_AVAILABILITY, PriorityDimension.BUSINESS_VALUE,
+    PriorityDimension.RISK_LEVEL, PriorityDimension.STAKEHOLDER_INTEREST
+]
+
+# Context multiplier keys in the same order as the first seven factor columns
+_MULTIPLIER_KEYS = [
+    "impact_multiplier", "urgency_multiplier", "complexity_multiplier", "resource_multiplier",
+    "business_value_multiplier", "risk_multiplier", "stakeholder_multiplier"
+]
+
+@dataclass
+class PriorityFactorMatrix:
+    """Extracted priority factors for N tensions, reusable across re-scoring"""
+    ids: List[Any]
+    raw: np.ndarray  # (N, 10) factors before context adjustment, FACTOR_COLUMNS order
+    adjusted: np.ndarray  # (N, 10) factors after business context multipliers
+    business_contexts: List[str]
+    context_codes: np.ndarray  # (N,) index into context_names
+    context_names: List[str]
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+
 class PriorityCalculator:
     """
     Advanced priority calculation engine for TRM-OS tensions.
@@ -189,6 +224,276 @@ class PriorityCalculator:
         
         return calculation_result
     
+    def extract_factor_matrix(self, tensions: List[Dict[str, Any]]) -> PriorityFactorMatrix:
+        """
+        Extract priority factors for many tensions into a matrix
+        
+        Args:
+            tensions: List of dicts with "tension_analysis", "title", "description",
+                      optional "context" and optional "id"
+            
+        Returns:
+            PriorityFactorMatrix that can be re-scored without re-extraction
+        """
+        context_names = list(dict.fromkeys(
+            list(self.business_contexts) + list(self.context_weight_adjustments) + ["internal_operations"]
+        ))
+        context_index = {name: i for i, name in enumerate(context_names)}
+        
+        ids = []
+        rows = []
+        business_contexts = []
+        for position, tension in enumerate(tensions):
+            analysis = tension["tension_analysis"]
+            title = tension.get("title", "")
+            description = tension.get("description", "")
+            factors = self._extract_priority_factors(analysis, title, description, tension.get("context"))
+            business_context = self._determine_business_context(analysis, title, description)
+            if business_context not in context_index:
+                context_index[business_context] = len(context_names)
+                context_names.append(business_context)
+            
+            ids.append(tension.get("id", position))
+            rows.append([getattr(factors, column) for column in FACTOR_COLUMNS])
+            business_contexts.append(business_context)
+        
+        raw = np.array(rows, dtype=float).reshape(len(rows), len(FACTOR_COLUMNS))
+        context_codes = np.array([context_index[c] for c in business_contexts], dtype=int)
+        
+        # Apply context multipliers as one array operation
+        multipliers = np.ones((len(context_names), len(_MULTIPLIER_KEYS)))
+        for name, adjustments in self.business_contexts.items():
+            multipliers[context_index[name]] = [adjustments.get(key, 1.0) for key in _MULTIPLIER_KEYS]
+        adjusted = raw.copy()
+        adjusted[:, :7] = np.minimum(1.0, raw[:, :7] * multipliers[context_codes])
+        
+        return PriorityFactorMatrix(
+            ids=ids,
+            raw=raw,
+            adjusted=adjusted,
+            business_contexts=business_contexts,
+            context_codes=context_codes,
+            context_names=context_names
+        )
+    
+    def score_factor_matrix(self, matrix: PriorityFactorMatrix,
+                            method: str = "weighted_average",
+                            weights: Optional[Dict[PriorityDimension, float]] = None) -> Dict[str, np.ndarray]:
+        """
+        Score every tension in a factor matrix with array operations
+        
+        Args:
+            matrix: Factors from extract_factor_matrix
+            method: Calculation method name
+            weights: Optional override of default_weights for weighted_average
+            
+        Returns:
+            Dict of arrays: final_score, normalized_priority, confidence and
+            method-specific contributing factors
+        """
+        f = matrix.adjusted
+        impact, urgency, complexity, resources, business_value, risk, stakeholder = (f[:, i] for i in range(7))
+        deadline, dependency, strategic = f[:, 7], f[:, 8], f[:, 9]
+        
+        if method == "eisenhower_matrix":
+            importance = (impact + business_value + strategic) / 3
+            urgency_axis = (urgency + deadline + risk) / 3
+            q1 = (urgency_axis >= 0.7) & (importance >= 0.7)
+            q2 = (urgency_axis < 0.7) & (importance >= 0.7)
+            q3 = (urgency_axis >= 0.7) & (importance < 0.7)
+            final_score = np.select(
+                [q1, q2, q3],
+                [90 + (urgency_axis + importance) * 5, 70 + importance * 15, 50 + urgency_axis * 15],
+                30 + (urgency_axis + importance) * 10
+            )
+            return {
+                "final_score": np.minimum(final_score, 100),
+                "normalized_priority": np.select([q1, q2 | q3], [2, 1], 0),
+                "priority_level": np.select([q1, q2, q3], ["Critical", "High", "Medium"], "Low"),
+                "confidence": np.minimum(np.abs(urgency_axis - 0.5) + np.abs(importance - 0.5), 1.0),
+                "importance": importance,
+                "urgency": urgency_axis,
+                "quadrant": np.select([q1, q2, q3], ["Q1", "Q2", "Q3"], "Q4")
+            }
+        
+        if method == "rice_framework":
+            confidence = (impact + urgency + business_value) / 3
+            rice_score = (stakeholder * impact * confidence) / np.maximum(complexity, 0.1)
+            final_score = np.minimum(rice_score * 100, 100)
+            return self._with_normalized_levels(final_score, {
+                "confidence": confidence,
+                "reach": stakeholder,
+                "impact": impact,
+                "effort": complexity,
+                "rice_score": rice_score
+            })
+        
+        if method == "value_complexity":
+            value = (business_value + impact + strategic) / 3
+            quick_win = (value >= 0.7) & (complexity <= 0.3)
+            major = (value >= 0.7) & (complexity > 0.3)
+            fill_in = (value < 0.7) & (complexity <= 0.3)
+            final_score = np.select(
+                [quick_win, major, fill_in],
+                [85 + value * 10, 75 + (value - complexity) * 10, 45 + value * 15],
+                25 + (value - complexity) * 20
+            )
+            return {
+                "final_score": np.maximum(0, np.minimum(final_score, 100)),
+                "normalized_priority": np.select([quick_win, major], [2, 1], 0),
+                "priority_level": np.select([quick_win, major, fill_in], ["Critical", "High", "Medium"], "Low"),
+                "confidence": np.minimum(np.abs(value - 0.5) + np.abs(complexity - 0.5), 1.0),
+                "value": value,
+                "complexity": complexity,
+                "value_complexity_ratio": value / np.maximum(complexity, 0.1)
+            }
+        
+        if method == "risk_adjusted":
+            base_priority = (impact + urgency + business_value) / 3
+            risk_adjustment = risk * 0.3
+            resource_adjustment = (1 - resources) * 0.2
+            final_score = (base_priority + risk_adjustment - resource_adjustment) * 100
+            final_score = np.maximum(0, np.minimum(final_score, 100))
+            return self._with_normalized_levels(final_score, {
+                "confidence": (base_priority + risk + resources) / 3,
+                "base_priority": base_priority,
+                "risk_adjustment": risk_adjustment,
+                "resource_adjustment": resource_adjustment
+            })
+        
+        # weighted_average (default)
+        w = self._context_weight_matrix(matrix, weights)[matrix.context_codes]
+        contributions = {
+            "impact": impact * w[:, 0],
+            "urgency": urgency * w[:, 1],
+            "complexity": (1 - complexity) * w[:, 2],  # Invert complexity
+            "resources": resources * w[:, 3],
+            "business_value": business_value * w[:, 4],
+            "risk": risk * w[:, 5],
+            "stakeholder": stakeholder * w[:, 6]
+        }
+        weighted_score = (
+            contributions["impact"] + contributions["urgency"] + contributions["complexity"] +
+            contributions["resources"] + contributions["business_value"] + contributions["risk"] +
+            contributions["stakeholder"]
+        )
+        contextual_boost = deadline * 0.1 + dependency * 0.05 + strategic * 0.05
+        final_score = np.minimum(1.0, weighted_score + contextual_boost) * 100
+        
+        extremeness = (
+            np.abs(impact - 0.5) * 2 + np.abs(urgency - 0.5) * 2 + np.abs(business_value - 0.5) * 2 +
+            np.abs(complexity - 0.5) * 2 + np.abs(resources - 0.5) * 2 +
+            np.abs(risk - 0.5) * 2 + np.abs(stakeholder - 0.5) * 2
+        ) / 7
+        contributions["contextual_boost"] = contextual_boost
+        contributions["confidence"] = np.minimum(extremeness + 0.3, 1.0)
+        return self._with_normalized_levels(final_score, contributions)
+    
+    def calculate_priority_batch(self, tensions: List[Dict[str, Any]],
+                                 method: str = "weighted_average") -> List[PriorityCalculationResult]:
+        """
+        Calculate priority for many tensions at once
+        
+        Produces the same results as calling calculate_priority for each tension,
+        with scoring done as array operations over the whole batch.
+        """
+        matrix = self.extract_factor_matrix(tensions)
+        if method not in self.calculation_methods:
+            scores = self.score_factor_matrix(matrix, "weighted_average")
+        else:
+            scores = self.score_factor_matrix(matrix, method)
+        
+        contributing_keys = {
+            "weighted_average": ["impact", "urgency", "complexity", "resources", "business_value",
+                                 "risk", "stakeholder", "contextual_boost"],
+            "eisenhower_matrix": ["importance", "urgency", "quadrant"],
+            "rice_framework": ["reach", "impact", "confidence", "effort", "rice_score"],
+            "value_complexity": ["value", "complexity", "value_complexity_ratio"],
+            "risk_adjusted": ["base_priority", "risk_adjustment", "resource_adjustment"]
+        }.get(method, ["impact", "urgency", "complexity", "resources", "business_value",
+                       "risk", "stakeholder", "contextual_boost"])
+        
+        # Convert arrays to Python lists once instead of indexing numpy scalars per row
+        columns = {key: values.tolist() for key, values in scores.items()}
+        raw_rows = matrix.raw.tolist()
+        adjusted_rows = matrix.adjusted.tolist()
+        
+        results = []
+        for row in range(len(matrix)):
+            original = PriorityFactors(*raw_rows[row])
+            adjusted = PriorityFactors(*adjusted_rows[row])
+            business_context = matrix.business_contexts[row]
+            result = PriorityCalculationResult(
+                final_score=float(columns["final_score"][row]),
+                normalized_priority=int(columns["normalized_priority"][row]),
+                priority_level=columns["priority_level"][row],
+                contributing_factors={key: columns[key][row] for key in contributing_keys},
+                calculation_method=method,
+                confidence_level=float(columns["confidence"][row]),
+                reasoning="",
+                recommendations=[]
+            )
+            result.reasoning = self._generate_priority_reasoning(original, adjusted, business_context, result)
+            result.recommendations = self._generate_recommendations(result, original, business_context)
+            results.append(result)
+        
+        return results
+    
+    def rerank(self, matrix: PriorityFactorMatrix,
+               method: str = "weighted_average",
+               weights: Optional[Dict[PriorityDimension, float]] = None,
+               top_k: Optional[int] = None) -> List[Tuple[Any, float]]:
+        """
+        Re-rank an already extracted backlog, e.g. after a weight change
+        
+        Args:
+            matrix: Factors from extract_factor_matrix (not recomputed)
+            method: Calculation method name
+            weights: Optional default weight override
+            top_k: Only return the top K tensions
+            
+        Returns:
+            List of (tension id, final score) sorted by descending score
+        """
+        final_score = self.score_factor_matrix(matrix, method, weights)["final_score"]
+        # Stable sort keeps input order for equal scores
+        order = np.argsort(-final_score, kind="stable")
+        if top_k is not None:
+            order = order[:top_k]
+        return [(matrix.ids[i], float(final_score[i])) for i in order]
+    
+    def _context_weight_matrix(self, matrix: PriorityFactorMatrix,
+                               weights: Optional[Dict[PriorityDimension, float]] = None) -> np.ndarray:
+        """Weights per business context (rows) and dimension (columns)"""
+        base_weights = dict(self.default_weights)
+        if weights:
+            base_weights.update(weights)
+        
+        weight_matrix = np.empty((len(matrix.context_names), len(_DIMENSION_COLUMNS)))
+        for i, name in enumerate(matrix.context_names):
+            context_weights = base_weights.copy()
+            if name in self.context_weight_adjustments:
+                adjustments = self.context_weight_adjustments[name]
+                total_context_weight = sum(adjustments.values())
+                for dimension, weight in adjustments.items():
+                    context_weights[dimension] = weight / total_context_weight
+            weight_matrix[i] = [context_weights[dimension] for dimension in _DIMENSION_COLUMNS]
+        return weight_matrix
+    
+    def _with_normalized_levels(self, final_score: np.ndarray,
+                                extra: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Vectorized _normalize_priority"""
+        scores = {
+            "final_score": final_score,
+            "normalized_priority": np.select([final_score >= 80, final_score >= 60], [2, 1], 0),
+            "priority_level": np.select(
+                [final_score >= 80, final_score >= 60, final_score >= 40],
+                ["Critical", "High", "Medium"], "Low"
+            )
+        }
+        scores.update(extra)
+        return scores
+    
     def _extract_priority_factors(self, analysis: TensionAnalysis, 
                                 title: str, description: str,
                                 context: Optional[Dict] = None) -> PriorityFactors:
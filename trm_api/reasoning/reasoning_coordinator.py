@@ -10,7 +10,7 @@ Coordinates:
 - Integration with existing services
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, AsyncIterator, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import asyncio
@@ -24,6 +24,7 @@ from .priority_calculator import PriorityCalculator, PriorityCalculationResult
 from ..learning.adaptive_learning_system import AdaptiveLearningSystem
 from ..quantum.quantum_system_manager import QuantumSystemManager
 from .advanced_reasoning_engine import AdvancedReasoningEngine
+from .batch_pipeline import BatchReasoningPipeline, BatchPipelineConfig
 
 @dataclass
 class ReasoningRequest:
@@ -102,7 +103,9 @@ class ReasoningCoordinator:
                 "solutions": {"count": 0, "total_time": 0.0},
                 "priority": {"count": 0, "total_time": 0.0},
                 "commercial_ai": {"count": 0, "total_time": 0.0}
-            }
+            },
+            # Per-stage timings of the batch pipeline (populated by BatchReasoningPipeline)
+            "pipeline_stages": {}
         }
     
     async def initialize_commercial_ai(self):
@@ -321,32 +324,7 @@ class ReasoningCoordinator:
                 self.logger.warning("Commercial AI Coordination not initialized")
                 return None
             
-            # Create commercial AI coordination context
-            context = {
-                "tension_id": request.tension_id,
-                "domain": "tension_resolution",
-                "stakeholders": request.context.get("stakeholders", []) if request.context else [],
-                "constraints": request.context.get("constraints", {}) if request.context else {},
-                "objectives": ["resolve_tension", "optimize_solution"],
-                "available_resources": request.context.get("resources", {}) if request.context else {},
-                "priority_level": max(1, min(10, int(current_result.priority_calculation.priority_score))) if current_result.priority_calculation else 5,
-                "risk_tolerance": 0.5,  # Default moderate risk tolerance
-                "quantum_context": {"tension_id": request.tension_id}
-            }
-            
-            # Create reasoning query for commercial AI
-            query = f"How to resolve tension: {request.title}? Description: {request.description}"
-            
-            # Coordinate with commercial AI services (OpenAI, Claude, Gemini)
-            commercial_ai_result = {
-                "query": query,
-                "context": context,
-                "coordination_approach": "commercial_ai_apis",
-                "recommended_services": ["openai", "claude", "gemini"],
-                "use_quantum_enhancement": request.use_quantum_enhancement,
-                "confidence": 0.85,  # High confidence in commercial AI coordination
-                "conclusion": f"Commercial AI coordination ready for tension: {request.title}"
-            }
+            commercial_ai_result = self._build_commercial_ai_result(request, current_result)
             
             self._update_component_stats("commercial_ai", start_time)
             return commercial_ai_result
@@ -355,6 +333,63 @@ class ReasoningCoordinator:
             self.logger.error(f"Commercial AI coordination failed: {str(e)}")
             return None
     
+    async def _perform_commercial_ai_reasoning_batch(
+            self, items: List[Tuple[ReasoningRequest, ReasoningResult]]) -> List[Optional[Any]]:
+        """Perform Commercial AI Coordination for a micro-batch of tensions"""
+        start_time = datetime.now()
+        
+        if not self._commercial_ai_initialized:
+            self.logger.warning("Commercial AI Coordination not initialized")
+            return [None] * len(items)
+        
+        results = []
+        for position, (request, current_result) in enumerate(items):
+            try:
+                commercial_ai_result = self._build_commercial_ai_result(request, current_result)
+                commercial_ai_result["micro_batch"] = {"size": len(items), "position": position}
+                results.append(commercial_ai_result)
+            except Exception as e:
+                self.logger.error(f"Commercial AI coordination failed: {str(e)}")
+                results.append(None)
+        
+        # One coordination round trip per micro-batch, accounted per tension
+        processing_time = max((datetime.now() - start_time).total_seconds(), 0.000001)
+        stats = self.processing_stats["component_performance"]["commercial_ai"]
+        stats["count"] += len(items)
+        stats["total_time"] += processing_time
+        
+        return results
+    
+    def _build_commercial_ai_result(self, request: ReasoningRequest,
+                                    current_result: ReasoningResult) -> Dict[str, Any]:
+        """Build commercial AI coordination payload for one tension"""
+        # Create commercial AI coordination context
+        context = {
+            "tension_id": request.tension_id,
+            "domain": "tension_resolution",
+            "stakeholders": request.context.get("stakeholders", []) if request.context else [],
+            "constraints": request.context.get("constraints", {}) if request.context else {},
+            "objectives": ["resolve_tension", "optimize_solution"],
+            "available_resources": request.context.get("resources", {}) if request.context else {},
+            "priority_level": max(1, min(10, int(current_result.priority_calculation.priority_score))) if current_result.priority_calculation else 5,
+            "risk_tolerance": 0.5,  # Default moderate risk tolerance
+            "quantum_context": {"tension_id": request.tension_id}
+        }
+        
+        # Create reasoning query for commercial AI
+        query = f"How to resolve tension: {request.title}? Description: {request.description}"
+        
+        # Coordinate with commercial AI services (OpenAI, Claude, Gemini)
+        return {
+            "query": query,
+            "context": context,
+            "coordination_approach": "commercial_ai_apis",
+            "recommended_services": ["openai", "claude", "gemini"],
+            "use_quantum_enhancement": request.use_quantum_enhancement,
+            "confidence": 0.85,  # High confidence in commercial AI coordination
+            "conclusion": f"Commercial AI coordination ready for tension: {request.title}"
+        }
+    
     def _generate_consolidated_recommendations(self, result: ReasoningResult) -> List[str]:
         """Generate consolidated recommendations from all components"""
         recommendations = []
@@ -471,6 +506,12 @@ class ReasoningCoordinator:
             else:
                 component_stats["average_time"] = 0.0
         
+        # Calculate pipeline stage averages
+        for stage, stage_stats in stats["pipeline_stages"].items():
+            count = stage_stats["count"]
+            stage_stats["average_time"] = stage_stats["total_time"] / count if count else 0.0
+            stage_stats["average_queue_wait"] = stage_stats["queue_wait_time"] / count if count else 0.0
+        
         # Calculate success rate
         if stats["total_processed"] > 0:
             stats["success_rate"] = stats["successful_processing"] / stats["total_processed"]
@@ -535,29 +576,55 @@ class ReasoningCoordinator:
         
         return validation_results
     
-    async def process_batch_tensions(self, requests: List[ReasoningRequest]) -> List[ReasoningResult]:
-        """Process multiple tensions in parallel"""
+    async def process_batch_tensions(self, requests: List[ReasoningRequest],
+                                     config: Optional[BatchPipelineConfig] = None) -> List[ReasoningResult]:
+        """Process multiple tensions through the staged batch pipeline, preserving request order"""
         self.logger.info(f"Processing batch of {len(requests)} tensions")
         
-        # Process tensions in parallel
-        tasks = [self.process_tension(request) for request in requests]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Handle any exceptions
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                error_result = ReasoningResult(
-                    tension_id=requests[i].tension_id,
-                    success=False,
-                    errors=[f"Processing exception: {str(result)}"]
-                )
-                processed_results.append(error_result)
-            else:
-                processed_results.append(result)
+        processed_results: List[Optional[ReasoningResult]] = [None] * len(requests)
+        async for index, result in self.stream_batch_tensions(requests, config):
+            processed_results[index] = result
         
         return processed_results
     
+    async def stream_batch_tensions(self, requests, config: Optional[BatchPipelineConfig] = None
+                                    ) -> AsyncIterator[Tuple[int, ReasoningResult]]:
+        """
+        Stream reasoning results for a batch of tensions as they complete
+        
+        Each stage (analysis, rules, solutions, priority, commercial AI) runs with
+        its own worker pool behind a bounded queue, so memory stays bounded and a
+        slow stage does not serialize the whole batch.
+        
+        Args:
+            requests: Iterable of ReasoningRequest (may be a lazy generator)
+            config: Optional BatchPipelineConfig (worker counts, queue size, process pool)
+            
+        Yields:
+            (request_index, ReasoningResult) in completion order
+        """
+        if isinstance(requests, list) and any(
+            request.use_commercial_ai and "commercial_ai" in request.requested_services
+            for request in requests
+        ) and not self._commercial_ai_initialized:
+            try:
+                await self.initialize_commercial_ai()
+            except Exception as e:
+                self.logger.error(f"Continuing batch without Commercial AI: {e}")
+        
+        pipeline = BatchReasoningPipeline(self, config)
+        async for index, result in pipeline.run(requests):
+            yield index, result
+    
+    def _finalize_result(self, result: ReasoningResult, start_time: datetime) -> None:
+        """Consolidate recommendations and statistics for a pipeline result"""
+        if result.success:
+            result.recommendations = self._generate_consolidated_recommendations(result)
+            self._update_processing_stats(start_time, result.success)
+        
+        processing_time = (datetime.now() - start_time).total_seconds()
+        result.processing_time = max(processing_time, 0.000001)  # Minimum 1 microsecond
+    
     def export_reasoning_insights(self) -> Dict[str, Any]:
         """Export insights and patterns from reasoning engine"""
         insights = {
@@ -9,8 +9,10 @@ Analyzes tensions to:
 """
 
 import re
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Any
+from dataclasses import dataclass, field
 from enum import Enum
 
 class TensionType(Enum):
@@ -45,6 +47,134 @@ class TensionAnalysis:
     suggested_priority: int  # 0-2 (normal, high, critical)
     reasoning: str
 
+
+# Simple word-bounded alternation: \b(alt1|alt2|...)\b
+_SIMPLE_ALTERNATION = re.compile(r'^\\b\((?:\?:)?([^()\[\]\\*+?{}^$.]+)\)\\b$')
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == '_'
+
+
+@dataclass
+class KeywordHits:
+    """All matcher hits for one text, grouped by category"""
+    pattern_counts: Dict[str, int] = field(default_factory=dict)     # category -> regex match count
+    keywords: Dict[str, set] = field(default_factory=dict)           # category -> matched keywords
+
+
+class TensionKeywordMatcher:
+    """
+    Single-pass matcher for every TensionAnalyzer pattern and keyword set.
+
+    All literal phrases are compiled into one trie-shaped regex used inside a
+    lookahead, so a single scan reports the longest phrase starting at each
+    position; shorter phrases starting at the same position are recovered from
+    a precomputed prefix table. Counts reproduce per-pattern ``re.findall``
+    semantics (word boundaries, non-overlapping, leftmost alternative first),
+    and keyword sets keep substring-presence semantics.
+    """
+
+    def __init__(self, pattern_groups: Tuple[Tuple[str, Tuple[str, ...]], ...],
+                 keyword_groups: Tuple[Tuple[str, Tuple[str, ...]], ...]):
+        # phrase -> list of (category, pattern_index, alternative_index); pattern_index None for keywords
+        self._roles: Dict[str, List[Tuple[str, Optional[int], int]]] = defaultdict(list)
+        # Patterns that are not simple alternations fall back to regular findall
+        self._fallback: List[Tuple[str, Any]] = []
+        self._bounded = set()
+        self.pattern_categories = [category for category, _ in pattern_groups]
+        self.keyword_categories = [category for category, _ in keyword_groups]
+
+        for category, patterns in pattern_groups:
+            for pattern_index, pattern in enumerate(patterns):
+                simple = _SIMPLE_ALTERNATION.match(pattern)
+                alternatives = simple.group(1).split('|') if simple else []
+                if not simple or not all(a and _is_word_char(a[0]) and _is_word_char(a[-1]) for a in alternatives):
+                    self._fallback.append((category, re.compile(pattern, re.IGNORECASE)))
+                    continue
+                for alt_index, phrase in enumerate(alternatives):
+                    self._roles[phrase].append((category, pattern_index, alt_index))
+                    self._bounded.add(phrase)
+
+        for category, keywords in keyword_groups:
+            for keyword in keywords:
+                if keyword:
+                    self._roles[keyword].append((category, None, 0))
+
+        phrases = list(self._roles)
+        # For each phrase, the phrases that are string prefixes of it (including itself)
+        self._prefixes: Dict[str, List[str]] = {
+            phrase: [other for other in phrases if phrase.startswith(other)]
+            for phrase in phrases
+        }
+        body = self._trie_regex(phrases)
+        self._regex = re.compile(f'(?=({body}))') if body else None
+
+    @staticmethod
+    def _trie_regex(phrases: List[str]) -> str:
+        """Build a regex from a character trie; greedy optionals prefer the longest phrase"""
+        trie: Dict[str, Any] = {}
+        for phrase in phrases:
+            node = trie
+            for ch in phrase:
+                node = node.setdefault(ch, {})
+            node[''] = True
+
+        def build(node: Dict[str, Any]) -> str:
+            branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+            if not branches:
+                return ''
+            body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+            return f'(?:{body})?' if '' in node else body
+
+        return build(trie)
+
+    def scan(self, text: str) -> KeywordHits:
+        """Scan text once and return hits grouped by category"""
+        hits = KeywordHits(
+            pattern_counts={category: 0 for category in self.pattern_categories},
+            keywords={category: set() for category in self.keyword_categories}
+        )
+        # (category, pattern_index) -> [(start, alt_index, end)]
+        occurrences: Dict[Tuple[str, int], List[Tuple[int, int, int]]] = defaultdict(list)
+
+        if self._regex is not None:
+            text_length = len(text)
+            for match in self._regex.finditer(text):
+                start = match.start()
+                for phrase in self._prefixes[match.group(1)]:
+                    end = start + len(phrase)
+                    bounded = phrase in self._bounded
+                    at_boundary = (
+                        (start == 0 or not _is_word_char(text[start - 1])) and
+                        (end == text_length or not _is_word_char(text[end]))
+                    ) if bounded else True
+                    for category, pattern_index, alt_index in self._roles[phrase]:
+                        if pattern_index is None:
+                            hits.keywords[category].add(phrase)
+                        elif at_boundary:
+                            occurrences[(category, pattern_index)].append((start, alt_index, end))
+
+        # Reproduce re.findall: leftmost, first alternative, non-overlapping
+        for (category, _), spans in occurrences.items():
+            spans.sort()
+            cursor = 0
+            for start, _, end in spans:
+                if start >= cursor:
+                    hits.pattern_counts[category] += 1
+                    cursor = end
+
+        for category, regex in self._fallback:
+            hits.pattern_counts[category] += len(regex.findall(text))
+
+        return hits
+
+
+@lru_cache(maxsize=32)
+def _build_keyword_matcher(pattern_groups, keyword_groups) -> TensionKeywordMatcher:
+    return TensionKeywordMatcher(pattern_groups, keyword_groups)
+
+
 class TensionAnalyzer:
     """
     AI-powered tension analyzer using rule-based pattern matching.
@@ -100,6 +230,14 @@ class TensionAnalyzer:
             r'\b(có thể thử|nên làm|đề nghị)\b',
             r'\b(could try|should do|propose|recommend)\b'
         ]
+        
+        self.theme_patterns = {
+            "Technology": [r'\b(api|database|server|code|bug|system)\b'],
+            "Business": [r'\b(customer|revenue|business|market|strategy)\b'],
+            "Process": [r'\b(process|workflow|procedure|method)\b'],
+            "People": [r'\b(team|user|staff|people|human)\b'],
+            "Security": [r'\b(security|breach|hack|vulnerability|attack)\b']
+        }
     
     def _initialize_keywords(self):
         """Initialize keyword dictionaries for impact/urgency assessment"""
@@ -120,6 +258,29 @@ class TensionAnalyzer:
             'attack', 'rò rỉ', 'leak', 'vi phạm', 'breach', 'pháp lý', 'legal'
         ]
     
+    def _get_keyword_matcher(self) -> TensionKeywordMatcher:
+        """Get the compiled single-pass matcher for the current pattern/keyword sets"""
+        pattern_groups = (
+            ("type:" + TensionType.PROBLEM.value, tuple(self.problem_patterns)),
+            ("type:" + TensionType.OPPORTUNITY.value, tuple(self.opportunity_patterns)),
+            ("type:" + TensionType.RISK.value, tuple(self.risk_patterns)),
+            ("type:" + TensionType.CONFLICT.value, tuple(self.conflict_patterns)),
+            ("type:" + TensionType.IDEA.value, tuple(self.idea_patterns)),
+        ) + tuple(
+            ("theme:" + theme, tuple(patterns)) for theme, patterns in self.theme_patterns.items()
+        )
+        keyword_groups = (
+            ("high_impact", tuple(self.high_impact_keywords)),
+            ("high_urgency", tuple(self.high_urgency_keywords)),
+            ("critical", tuple(self.critical_keywords)),
+        )
+        # Compiled matchers are shared across analyzer instances with the same sets
+        return _build_keyword_matcher(pattern_groups, keyword_groups)
+    
+    def scan_text(self, text: str) -> KeywordHits:
+        """Run every pattern and keyword set over lowercased text in one pass"""
+        return self._get_keyword_matcher().scan(text)
+    
     def analyze_tension(self, title: str, description: str, 
                        current_status: str = "Open") -> TensionAnalysis:
         """
@@ -133,18 +294,40 @@ class TensionAnalyzer:
         Returns:
             TensionAnalysis object với kết quả phân tích
         """
+        return self._analyze_with_matcher(self._get_keyword_matcher(), title, description)
+    
+    def analyze_tensions_batch(self, tensions: List[Dict[str, Any]]) -> List[TensionAnalysis]:
+        """
+        Phân tích nhiều tension trong một lần gọi
+        
+        Args:
+            tensions: List of dicts with "title", "description" and optional "current_status"
+            
+        Returns:
+            List of TensionAnalysis in input order
+        """
+        matcher = self._get_keyword_matcher()
+        return [
+            self._analyze_with_matcher(matcher, tension.get("title", ""), tension.get("description", ""))
+            for tension in tensions
+        ]
+    
+    def _analyze_with_matcher(self, matcher: TensionKeywordMatcher,
+                              title: str, description: str) -> TensionAnalysis:
+        """Analyze one tension using a single matcher pass over its text"""
         # Combine title and description for analysis
         full_text = f"{title} {description}".lower()
+        hits = matcher.scan(full_text)
         
         # Classify tension type
-        tension_type, type_confidence = self._classify_tension_type(full_text)
+        tension_type, type_confidence = self._classify_tension_type(full_text, hits)
         
         # Assess impact and urgency
-        impact_level = self._assess_impact(full_text)
-        urgency_level = self._assess_urgency(full_text)
+        impact_level = self._assess_impact(full_text, hits)
+        urgency_level = self._assess_urgency(full_text, hits)
         
         # Extract themes and entities
-        key_themes = self._extract_themes(full_text)
+        key_themes = self._extract_themes(full_text, hits)
         extracted_entities = self._extract_entities(full_text)
         
         # Calculate suggested priority
@@ -167,14 +350,14 @@ class TensionAnalyzer:
             reasoning=reasoning
         )
     
-    def _classify_tension_type(self, text: str) -> Tuple[TensionType, float]:
+    def _classify_tension_type(self, text: str,
+                               hits: Optional[KeywordHits] = None) -> Tuple[TensionType, float]:
         """Classify tension type using pattern matching"""
+        hits = hits or self.scan_text(text)
         scores = {
-            TensionType.PROBLEM: self._count_pattern_matches(text, self.problem_patterns),
-            TensionType.OPPORTUNITY: self._count_pattern_matches(text, self.opportunity_patterns),
-            TensionType.RISK: self._count_pattern_matches(text, self.risk_patterns),
-            TensionType.CONFLICT: self._count_pattern_matches(text, self.conflict_patterns),
-            TensionType.IDEA: self._count_pattern_matches(text, self.idea_patterns)
+            tension_type: hits.pattern_counts["type:" + tension_type.value]
+            for tension_type in (TensionType.PROBLEM, TensionType.OPPORTUNITY, TensionType.RISK,
+                                 TensionType.CONFLICT, TensionType.IDEA)
         }
         
         if all(score == 0 for score in scores.values()):
@@ -196,10 +379,11 @@ class TensionAnalyzer:
             count += matches
         return count
     
-    def _assess_impact(self, text: str) -> ImpactLevel:
+    def _assess_impact(self, text: str, hits: Optional[KeywordHits] = None) -> ImpactLevel:
         """Assess impact level based on keywords"""
-        critical_count = sum(1 for keyword in self.critical_keywords if keyword in text)
-        high_count = sum(1 for keyword in self.high_impact_keywords if keyword in text)
+        hits = hits or self.scan_text(text)
+        critical_count = len(hits.keywords["critical"])
+        high_count = len(hits.keywords["high_impact"])
         
         if critical_count > 0:
             return ImpactLevel.CRITICAL
@@ -210,10 +394,11 @@ class TensionAnalyzer:
         else:
             return ImpactLevel.LOW
     
-    def _assess_urgency(self, text: str) -> UrgencyLevel:
+    def _assess_urgency(self, text: str, hits: Optional[KeywordHits] = None) -> UrgencyLevel:
         """Assess urgency level based on keywords"""
-        critical_count = sum(1 for keyword in self.critical_keywords if keyword in text)
-        urgent_count = sum(1 for keyword in self.high_urgency_keywords if keyword in text)
+        hits = hits or self.scan_text(text)
+        critical_count = len(hits.keywords["critical"])
+        urgent_count = len(hits.keywords["high_urgency"])
         
         if critical_count > 0:
             return UrgencyLevel.CRITICAL
@@ -224,29 +409,13 @@ class TensionAnalyzer:
         else:
             return UrgencyLevel.LOW
     
-    def _extract_themes(self, text: str) -> List[str]:
+    def _extract_themes(self, text: str, hits: Optional[KeywordHits] = None) -> List[str]:
         """Extract key themes from text"""
-        themes = []
-        
-        # Technology themes
-        if re.search(r'\b(api|database|server|code|bug|system)\b', text):
-            themes.append("Technology")
-        
-        # Business themes  
-        if re.search(r'\b(customer|revenue|business|market|strategy)\b', text):
-            themes.append("Business")
-        
-        # Process themes
-        if re.search(r'\b(process|workflow|procedure|method)\b', text):
-            themes.append("Process")
-        
-        # People themes
-        if re.search(r'\b(team|user|staff|people|human)\b', text):
-            themes.append("People")
-        
-        # Security themes
-        if re.search(r'\b(security|breach|hack|vulnerability|attack)\b', text):
-            themes.append("Security")
+        hits = hits or self.scan_text(text)
+        themes = [
+            theme for theme in self.theme_patterns
+            if hits.pattern_counts["theme:" + theme] > 0
+        ]
         
         return themes or ["General"]
     
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Graph Repository Base - Database-side pagination for neomodel repositories
+
+List queries push ORDER BY / SKIP / LIMIT (or a keyset predicate) into Cypher
+instead of hydrating every node of a label and slicing in Python. Callers that
+only serialize can request a projection of specific fields as plain dict rows.
+"""
+
+from typing import List, Optional, Dict, Any, Tuple, Type, Union
+from neomodel import StructuredNode, db
+
+# Keyset cursor: (value of the order field, uid of the last row on the previous page)
+KeysetCursor = Tuple[Any, str]
+
+
+class GraphRepositoryBase:
+    """
+    Shared list/count queries for repositories backed by a single neomodel label
+
+    Subclasses set `node_class` (and optionally `default_order_by`).
+    """
+
+    node_class: Type[StructuredNode] = None
+    default_order_by: str = "created_at"
+
+    def _properties(self) -> Dict[str, Any]:
+        return self.node_class.defined_properties(aliases=False, rels=False)
+
+    def _db_field(self, field: str) -> str:
+        """Validate a property name and return its database name (also guards the Cypher text)"""
+        properties = self._properties()
+        if field not in properties:
+            raise ValueError(f"{self.node_class.__name__} has no property '{field}'")
+        return getattr(properties[field], "db_property", None) or field
+
+    def _filter_conditions(self, filters: Optional[Dict[str, Any]], params: Dict[str, Any]) -> List[str]:
+        """Equality predicates for `filters`, adding deflated values to `params`"""
+        conditions = []
+        properties = self._properties()
+        for index, (name, value) in enumerate((filters or {}).items()):
+            conditions.append(f"n.{self._db_field(name)} = $filter_{index}")
+            params[f"filter_{index}"] = properties[name].deflate(value) if value is not None else None
+        return conditions
+
+    def list_nodes(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        after: Optional[KeysetCursor] = None,
+        fields: Optional[List[str]] = None,
+        hydrate: bool = True,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[Union[StructuredNode, Dict[str, Any]]]:
+        """
+        List nodes of `node_class` with pagination executed by the database
+
+        Args:
+            skip: Rows to skip (ignored when `after` is given)
+            limit: Maximum number of rows
+            order_by: Property to order by (defaults to `default_order_by`)
+            descending: Sort direction
+            after: Keyset cursor from `cursor_for()` of the last row of the previous page
+            fields: Properties to project; implies dict rows
+            hydrate: Return neomodel objects (True) or dict rows of all properties (False)
+            filters: Property equality filters
+
+        Returns:
+            Page of neomodel nodes or dict rows
+        """
+        order_field = self._db_field(order_by or self.default_order_by)
+        uid_field = self._db_field("uid")
+        direction = "DESC" if descending else "ASC"
+        params: Dict[str, Any] = {"skip": max(0, skip), "limit": max(0, limit)}
+
+        conditions = self._filter_conditions(filters, params)
+
+        if after is not None:
+            comparator = "<" if descending else ">"
+            conditions.append(
+                f"(n.{order_field} {comparator} $after_value OR "
+                f"(n.{order_field} = $after_value AND n.{uid_field} {comparator} $after_uid))"
+            )
+            params["after_value"], params["after_uid"] = after
+            params["skip"] = 0
+
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        if not fields and not hydrate:
+            fields = list(self._properties())
+        if fields:
+            db_fields = {field: self._db_field(field) for field in fields}
+            returns = ", ".join(f"n.{db_name} AS {field}" for field, db_name in db_fields.items())
+        else:
+            returns = "n"
+
+        query = (
+            f"MATCH (n:{self.node_class.__label__}) {where}"
+            f"RETURN {returns} "
+            f"ORDER BY n.{order_field} {direction}, n.{uid_field} {direction} "
+            f"SKIP $skip LIMIT $limit"
+        )
+        results, columns = db.cypher_query(query, params)
+
+        if fields:
+            return [self._inflate_row(dict(zip(columns, row))) for row in results]
+        return [self.node_class.inflate(row[0]) for row in results]
+
+    def count_nodes(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """Count nodes of `node_class` without loading them"""
+        params: Dict[str, Any] = {}
+        conditions = self._filter_conditions(filters, params)
+
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        results, _ = db.cypher_query(
+            f"MATCH (n:{self.node_class.__label__}) {where}RETURN count(n)", params
+        )
+        return results[0][0] if results else 0
+
+    def cursor_for(
+        self,
+        item: Union[StructuredNode, Dict[str, Any]],
+        order_by: Optional[str] = None
+    ) -> KeysetCursor:
+        """Build the keyset cursor that continues after `item`"""
+        field = order_by or self.default_order_by
+        if isinstance(item, dict):
+            value, uid = item[field], item["uid"]
+        else:
+            value, uid = getattr(item, field), item.uid
+        return (self._properties()[field].deflate(value) if value is not None else None, uid)
+
+    def _inflate_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        properties = self._properties()
+        return {
+            field: properties[field].inflate(value) if value is not None else None
+            for field, value in row.items()
+        }
@@ -14,12 +14,15 @@ from trm_api.graph_models.strategic_project import GraphStrategicProject  # Repl
 # TODO: Implement AGEActor ontology integration
 # from trm_api.ontology.age_actor import AGEActor  # Future implementation
 
+from trm_api.repositories.base_repository import GraphRepositoryBase, KeysetCursor
 from trm_api.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
-class EventRepository:
+class EventRepository(GraphRepositoryBase):
     """AGE Event Repository - Strategic event orchestration"""
+
+    node_class = GraphEvent
     
     def create_event(self, event_data: EventCreate) -> GraphEvent:
         """Create strategic event in AGE context"""
@@ -55,10 +58,22 @@ class EventRepository:
             logger.error(f"AGE Event retrieval error: {str(e)}")
             return None
 
-    def list_events(self, skip: int = 0, limit: int = 100) -> List[GraphEvent]:
+    def list_events(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        after: Optional[KeysetCursor] = None,
+        fields: Optional[List[str]] = None,
+        hydrate: bool = True
+    ) -> List[Any]:
         """List strategic events"""
         try:
-            events = GraphEvent.nodes.all()[skip:skip+limit]
+            events = self.list_nodes(
+                skip=skip, limit=limit, order_by=order_by, descending=descending,
+                after=after, fields=fields, hydrate=hydrate
+            )
             logger.info(f"AGE Event Repository: Listed {len(events)} strategic events")
             return events
         except Exception as e:
@@ -4,14 +4,17 @@ from neomodel import db
 from trm_api.models.recognition import RecognitionCreate, RecognitionUpdate
 from trm_api.graph_models.recognition import Recognition as GraphRecognition
 from trm_api.graph_models.win import WIN as GraphWIN
+from trm_api.repositories.base_repository import GraphRepositoryBase
 
-class RecognitionRepository:
+class RecognitionRepository(GraphRepositoryBase):
     """
     AGE Recognition Repository - Pure semantic recognition operations
     
     AGE Philosophy: Recognition drives strategic intelligence without user dependencies.
     """
 
+    node_class = GraphRecognition
+
     @db.transaction
     def create_recognition(self, recognition_data: RecognitionCreate) -> GraphRecognition:
         """
@@ -55,7 +58,7 @@ class RecognitionRepository:
         
         AGE Philosophy: Recognition patterns reveal strategic insights.
         """
-        return GraphRecognition.nodes.all()[skip:skip+limit]
+        return self.list_nodes(skip=skip, limit=limit)
     
     def list_recognitions_by_win(self, win_id: str, skip: int = 0, limit: int = 100) -> List[GraphRecognition]:
         """
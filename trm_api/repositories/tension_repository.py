@@ -14,12 +14,15 @@ from trm_api.graph_models.strategic_project import GraphStrategicProject  # Repl
 # TODO: Implement AGEActor ontology integration
 # from trm_api.ontology.age_actor import AGEActor  # Future implementation
 
+from trm_api.repositories.base_repository import GraphRepositoryBase, KeysetCursor
 from trm_api.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
-class TensionRepository:
+class TensionRepository(GraphRepositoryBase):
     """AGE Tension Repository - Strategic tension resolution"""
+
+    node_class = GraphTension
     
     def create_tension(self, tension_data: TensionCreate) -> Optional[GraphTension]:
         """Create strategic tension in AGE context"""
@@ -57,10 +60,22 @@ class TensionRepository:
             logger.error(f"AGE Tension retrieval error: {str(e)}")
             return None
 
-    def list_tensions(self, skip: int = 0, limit: int = 100) -> List[GraphTension]:
+    def list_tensions(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        after: Optional[KeysetCursor] = None,
+        fields: Optional[List[str]] = None,
+        hydrate: bool = True
+    ) -> List[Any]:
         """List strategic tensions"""
         try:
-            tensions = GraphTension.nodes.all()[skip:skip+limit]
+            tensions = self.list_nodes(
+                skip=skip, limit=limit, order_by=order_by, descending=descending,
+                after=after, fields=fields, hydrate=hydrate
+            )
             logger.info(f"AGE Tension Repository: Listed {len(tensions)} strategic tensions")
             return tensions
         except Exception as e:
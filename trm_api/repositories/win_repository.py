@@ -10,12 +10,15 @@ from neomodel import DoesNotExist
 from trm_api.graph_models.win import WIN as GraphWIN
 from trm_api.models.win import WinCreate, WinUpdate
 from trm_api.graph_models.strategic_project import GraphStrategicProject  # Replaced legacy Project
+from trm_api.repositories.base_repository import GraphRepositoryBase, KeysetCursor
 from trm_api.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
-class WINRepository:
+class WINRepository(GraphRepositoryBase):
     """AGE WIN Repository - Semantic WIN achievement tracking"""
+
+    node_class = GraphWIN
     
     def create_win(self, win_data: WinCreate) -> GraphWIN:
         """Create WIN achievement in AGE semantic context"""
@@ -50,10 +53,22 @@ class WINRepository:
             logger.error(f"AGE WIN retrieval error: {str(e)}")
             return None
 
-    def list_wins(self, skip: int = 0, limit: int = 100) -> List[GraphWIN]:
+    def list_wins(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        after: Optional[KeysetCursor] = None,
+        fields: Optional[List[str]] = None,
+        hydrate: bool = True
+    ) -> List[Any]:
         """List WINs with AGE semantic context"""
         try:
-            wins = GraphWIN.nodes.all()[skip:skip+limit]
+            wins = self.list_nodes(
+                skip=skip, limit=limit, order_by=order_by, descending=descending,
+                after=after, fields=fields, hydrate=hydrate
+            )
             logger.info(f"AGE WIN Repository: Listed {len(wins)} strategic WINs")
             return wins
         except Exception as e:
@@ -10,6 +10,7 @@ Comprehensive security system với:
 """
 
 from .authentication import AuthenticationManager, JWTManager
+from .password_hashing import CredentialHashingService
 from .authorization import AuthorizationEngine, RBACManager
 from .audit_logger import AuditLogger, SecurityEventLogger
 from .encryption import EncryptionService, DataProtection
@@ -18,6 +19,7 @@ from .middleware import SecurityMiddleware, RequestValidator
 __all__ = [
     'AuthenticationManager',
     'JWTManager',
+    'CredentialHashingService',
     'AuthorizationEngine', 
     'RBACManager',
     'AuditLogger',
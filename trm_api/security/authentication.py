@@ -10,19 +10,23 @@ Advanced authentication với:
 """
 
 import asyncio
+import heapq
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+import time
+from collections import OrderedDict, deque
+from typing import Deque, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from uuid import uuid4
 import hashlib
 import secrets
 import jwt
-import bcrypt
 import pyotp
 from email_validator import validate_email, EmailNotValidError
 
 from ..core.config import get_settings
+from ..core.state_backend import get_state_backend
+from .password_hashing import CredentialHashingService, get_hashing_service
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -71,8 +75,9 @@ class UserSession:
 class PasswordManager:
     """Manager cho password security"""
     
-    def __init__(self):
+    def __init__(self, hashing_service: Optional[CredentialHashingService] = None):
         self.logger = logging.getLogger(__name__)
+        self.hashing_service = hashing_service or get_hashing_service()
         self.min_length = 8
         self.require_uppercase = True
         self.require_lowercase = True
@@ -81,26 +86,37 @@ class PasswordManager:
         self.special_chars = "!@#$%^&*()_+-=[]{}|;:,.<>?"
     
     def hash_password(self, password: str) -> str:
-        """Hash password using bcrypt"""
+        """Hash password (blocking; async code uses hash_password_async)"""
         try:
-            # Generate salt và hash password
-            salt = bcrypt.gensalt()
-            hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-            return hashed.decode('utf-8')
+            return self.hashing_service.hasher.hash(password)
             
         except Exception as e:
             self.logger.error(f"Password hashing failed: {e}")
             raise
     
     def verify_password(self, password: str, hashed_password: str) -> bool:
-        """Verify password against hash"""
+        """Verify password against hash (blocking; async code uses verify_password_async)"""
         try:
-            return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+            hasher = self.hashing_service.hasher_for(hashed_password)
+            return hasher is not None and hasher.verify(password, hashed_password)
             
         except Exception as e:
             self.logger.error(f"Password verification failed: {e}")
             return False
     
+    async def hash_password_async(self, password: str) -> str:
+        """Hash password in the hashing pool"""
+        return await self.hashing_service.hash_password(password)
+    
+    async def verify_password_async(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """Verify password in the hashing pool; returns (valid, new hash if the stored one is outdated)"""
+        try:
+            return await self.hashing_service.verify_and_update(password, hashed_password)
+            
+        except Exception as e:
+            self.logger.error(f"Password verification failed: {e}")
+            return False, None
+    
     def validate_password_strength(self, password: str) -> Tuple[bool, List[str]]:
         """Validate password strength"""
         errors = []
@@ -207,15 +223,75 @@ class MFAManager:
             raise
 
 
+class VerifiedTokenCache:
+    """Bounded LRU cache of verified token claims, keyed by token digest"""
+    
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self._entries: "OrderedDict[bytes, Tuple[Dict[str, Any], Optional[float]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode('utf-8')).digest()
+    
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """Cached claims, or None if missing or past `exp`"""
+        key = self._digest(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        claims, exp = entry
+        if exp is not None and exp <= time.time():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return dict(claims)
+    
+    def put(self, token: str, claims: Dict[str, Any]) -> None:
+        if self.max_size <= 0:
+            return
+        key = self._digest(token)
+        self._entries[key] = (dict(claims), claims.get('exp'))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def discard(self, token: str) -> None:
+        self._entries.pop(self._digest(token), None)
+    
+    def clear(self) -> None:
+        self._entries.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+
 class JWTManager:
     """Manager cho JWT tokens"""
     
-    def __init__(self):
+    def __init__(self, token_cache_size: int = 10000):
         self.logger = logging.getLogger(__name__)
         self.secret_key = settings.SECRET_KEY
         self.algorithm = settings.ALGORITHM
         self.access_token_expire_minutes = settings.ACCESS_TOKEN_EXPIRE_MINUTES
         self.refresh_token_expire_days = 30
+        
+        # Tokens already verified skip signature checks until their exp
+        self.token_cache = VerifiedTokenCache(token_cache_size)
     
     def create_access_token(self, user_id: str, permissions: List[str] = None) -> str:
         """Create JWT access token"""
@@ -261,13 +337,18 @@ class JWTManager:
     def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
         """Verify và decode JWT token"""
         try:
+            cached = self.token_cache.get(token)
+            if cached is not None:
+                return cached
+            
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
             
-            # Check if token is expired
+            # Check if token is expired (exp is a UTC timestamp)
             exp = payload.get('exp')
-            if exp and datetime.fromtimestamp(exp) < datetime.utcnow():
+            if exp and exp <= time.time():
                 return None
             
+            self.token_cache.put(token, payload)
             return payload
             
         except jwt.ExpiredSignatureError:
@@ -310,6 +391,12 @@ class SessionManager:
         self.sessions: Dict[str, UserSession] = {}
         self.max_sessions_per_user = 5
         self.session_timeout_minutes = 30
+        
+        # Session ids per user, oldest first (dict as an ordered set)
+        self.user_sessions: Dict[str, Dict[str, None]] = {}
+        # (expires_at, session_id); entries go stale when activity extends a session
+        # and are re-pushed by sweep_expired
+        self._expiry_heap: List[Tuple[datetime, str]] = []
     
     def create_session(self, user_id: str, ip_address: str, user_agent: str) -> UserSession:
         """Create new user session"""
@@ -327,11 +414,14 @@ class SessionManager:
                 user_agent=user_agent
             )
             
-            # Cleanup old sessions cho user
+            # Cleanup expired sessions và old sessions cho user
+            self.sweep_expired(now)
             self._cleanup_user_sessions(user_id)
             
             # Store session
             self.sessions[session_id] = session
+            self.user_sessions.setdefault(user_id, {})[session_id] = None
+            heapq.heappush(self._expiry_heap, (session.expires_at, session_id))
             
             return session
             
@@ -359,41 +449,52 @@ class SessionManager:
     
     def invalidate_session(self, session_id: str) -> bool:
         """Invalidate session"""
-        if session_id in self.sessions:
-            self.sessions[session_id].is_active = False
-            del self.sessions[session_id]
-            return True
-        return False
+        session = self.sessions.pop(session_id, None)
+        if session is None:
+            return False
+        
+        session.is_active = False
+        user_session_ids = self.user_sessions.get(session.user_id)
+        if user_session_ids is not None:
+            user_session_ids.pop(session_id, None)
+            if not user_session_ids:
+                del self.user_sessions[session.user_id]
+        return True
     
     def invalidate_user_sessions(self, user_id: str) -> int:
         """Invalidate tất cả sessions cho user"""
-        count = 0
-        sessions_to_remove = []
-        
-        for session_id, session in self.sessions.items():
-            if session.user_id == user_id:
-                sessions_to_remove.append(session_id)
-                count += 1
-        
-        for session_id in sessions_to_remove:
+        session_ids = list(self.user_sessions.get(user_id, ()))
+        for session_id in session_ids:
             self.invalidate_session(session_id)
         
-        return count
+        return len(session_ids)
     
     def _cleanup_user_sessions(self, user_id: str) -> None:
         """Cleanup old sessions cho user"""
-        user_sessions = [
-            (session_id, session) for session_id, session in self.sessions.items()
-            if session.user_id == user_id and session.is_active
-        ]
-        
-        # Sort by creation time
-        user_sessions.sort(key=lambda x: x[1].created_at)
+        user_session_ids = self.user_sessions.get(user_id, {})
         
         # Remove oldest sessions if exceeding limit
-        while len(user_sessions) >= self.max_sessions_per_user:
-            oldest_session_id = user_sessions.pop(0)[0]
-            self.invalidate_session(oldest_session_id)
+        while len(user_session_ids) >= self.max_sessions_per_user:
+            self.invalidate_session(next(iter(user_session_ids)))
+    
+    def sweep_expired(self, now: Optional[datetime] = None) -> int:
+        """Remove expired sessions; O(log n) per heap entry popped"""
+        now = now or datetime.utcnow()
+        removed = 0
+        
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, session_id = heapq.heappop(self._expiry_heap)
+            session = self.sessions.get(session_id)
+            if session is None:
+                continue  # Already invalidated
+            if session.expires_at > now:
+                # Extended by activity since this entry was pushed
+                heapq.heappush(self._expiry_heap, (session.expires_at, session_id))
+                continue
+            self.invalidate_session(session_id)
+            removed += 1
+        
+        return removed
 
 
 class AuthenticationManager:
@@ -406,8 +507,8 @@ class AuthenticationManager:
         self.jwt_manager = JWTManager()
         self.session_manager = SessionManager()
         
-        # Rate limiting
-        self.login_attempts: Dict[str, List[datetime]] = {}
+        # Rate limiting: ring of the last max_attempts failures per user
+        self.login_attempts: Dict[str, Deque[datetime]] = {}
         self.max_attempts = 5
         self.lockout_duration_minutes = 15
         
@@ -444,7 +545,7 @@ class AuthenticationManager:
                 )
             
             # Hash password
-            hashed_password = self.password_manager.hash_password(credentials.password)
+            hashed_password = await self.password_manager.hash_password_async(credentials.password)
             
             # Generate MFA secret
             mfa_secret = self.mfa_manager.generate_mfa_secret(user_id)
@@ -482,7 +583,7 @@ class AuthenticationManager:
             user_id = credentials.email or credentials.username
             
             # Check rate limiting
-            if self._is_rate_limited(user_id):
+            if await self._is_rate_limited(user_id):
                 return AuthResult(
                     success=False,
                     error_message="Too many login attempts. Please try again later."
@@ -491,19 +592,27 @@ class AuthenticationManager:
             # Get user
             user = self.users.get(user_id)
             if not user or not user['is_active']:
-                self._record_failed_attempt(user_id)
+                # Same verify cost as a real user so response timing does not reveal accounts
+                await self.password_manager.hashing_service.dummy_verify(credentials.password)
+                await self._record_failed_attempt(user_id)
                 return AuthResult(
                     success=False,
                     error_message="Invalid credentials"
                 )
             
             # Verify password
-            if not self.password_manager.verify_password(credentials.password, user['password_hash']):
-                self._record_failed_attempt(user_id)
+            is_valid, new_hash = await self.password_manager.verify_password_async(
+                credentials.password, user['password_hash']
+            )
+            if not is_valid:
+                await self._record_failed_attempt(user_id)
                 return AuthResult(
                     success=False,
                     error_message="Invalid credentials"
                 )
+            if new_hash:
+                # Hash scheme or cost changed since the password was stored
+                user['password_hash'] = new_hash
             
             # Check MFA if enabled
             if user['mfa_enabled']:
@@ -516,7 +625,7 @@ class AuthenticationManager:
                     )
                 
                 if not self.mfa_manager.verify_mfa_token(user['mfa_secret'], credentials.mfa_token):
-                    self._record_failed_attempt(user_id)
+                    await self._record_failed_attempt(user_id)
                     return AuthResult(
                         success=False,
                         error_message="Invalid MFA token"
@@ -530,7 +639,7 @@ class AuthenticationManager:
             refresh_token = self.jwt_manager.create_refresh_token(user_id)
             
             # Clear failed attempts
-            self._clear_failed_attempts(user_id)
+            await self._clear_failed_attempts(user_id)
             
             return AuthResult(
                 success=True,
@@ -549,33 +658,40 @@ class AuthenticationManager:
                 error_message=str(e)
             )
     
-    def _is_rate_limited(self, user_id: str) -> bool:
+    async def _is_rate_limited(self, user_id: str) -> bool:
         """Check if user is rate limited"""
-        now = datetime.utcnow()
-        cutoff = now - timedelta(minutes=self.lockout_duration_minutes)
+        backend = get_state_backend()
+        if backend.shared:
+            # Failures counted across workers, within a lockout window from the first one
+            failures = await backend.get(f"login_failures:{user_id}")
+            return failures is not None and failures >= self.max_attempts
         
-        attempts = self.login_attempts.get(user_id, [])
-        recent_attempts = [attempt for attempt in attempts if attempt > cutoff]
+        attempts = self.login_attempts.get(user_id)
+        if not attempts or len(attempts) < self.max_attempts:
+            return False
         
-        return len(recent_attempts) >= self.max_attempts
+        # Ring is full: limited while its oldest failure is inside the lockout window
+        cutoff = datetime.utcnow() - timedelta(minutes=self.lockout_duration_minutes)
+        return attempts[0] > cutoff
     
-    def _record_failed_attempt(self, user_id: str) -> None:
+    async def _record_failed_attempt(self, user_id: str) -> None:
         """Record failed login attempt"""
-        now = datetime.utcnow()
-        
-        if user_id not in self.login_attempts:
-            self.login_attempts[user_id] = []
+        backend = get_state_backend()
+        if backend.shared:
+            await backend.incr(f"login_failures:{user_id}", ttl=self.lockout_duration_minutes * 60)
+            return
         
-        self.login_attempts[user_id].append(now)
+        attempts = self.login_attempts.get(user_id)
+        if attempts is None or attempts.maxlen != self.max_attempts:
+            attempts = self.login_attempts[user_id] = deque(attempts or (), maxlen=self.max_attempts)
         
-        # Keep only recent attempts
-        cutoff = now - timedelta(minutes=self.lockout_duration_minutes)
-        self.login_attempts[user_id] = [
-            attempt for attempt in self.login_attempts[user_id] if attempt > cutoff
-        ]
+        attempts.append(datetime.utcnow())
     
-    def _clear_failed_attempts(self, user_id: str) -> None:
+    async def _clear_failed_attempts(self, user_id: str) -> None:
         """Clear failed login attempts"""
+        backend = get_state_backend()
+        if backend.shared:
+            await backend.delete(f"login_failures:{user_id}")
         if user_id in self.login_attempts:
             del self.login_attempts[user_id]
     
@@ -18,6 +18,8 @@ from enum import Enum
 import json
 from uuid import uuid4
 
+from trm_api.core.state_backend import get_state_backend
+
 logger = logging.getLogger(__name__)
 
 
@@ -424,6 +426,7 @@ class AuthorizationEngine:
         
         # Access history cho auditing
         self.access_history: List[AccessResult] = []
+        self.max_shared_history = 10000  # Bound of the multi-worker audit log
         
         # Initialize default policies
         self._initialize_default_policies()
@@ -504,6 +507,7 @@ class AuthorizationEngine:
             
             # Store for audit
             self.access_history.append(result)
+            await self._share_access_result(result)
             
             # Log access attempt
             self.logger.info(f"Access {'granted' if granted else 'denied'} for user {request.user_id}: "
@@ -521,6 +525,25 @@ class AuthorizationEngine:
                 reason=f"Authorization error: {e}"
             )
     
+    async def _share_access_result(self, result: AccessResult) -> None:
+        """Record the decision in the shared audit log when running several workers"""
+        backend = get_state_backend()
+        if not backend.shared:
+            return
+        try:
+            await backend.append("authorization:access_history", {
+                'granted': result.granted,
+                'user_id': result.user_id,
+                'resource_type': result.resource_type.value,
+                'action': result.action.value,
+                'reason': result.reason,
+                'matched_permissions': result.matched_permissions,
+                'policy_violations': result.policy_violations,
+                'timestamp': result.timestamp.isoformat()
+            }, max_length=self.max_shared_history)
+        except Exception as e:
+            self.logger.error(f"Failed to share access result: {e}")
+    
     def _generate_access_reason(self, granted: bool, has_rbac_permission: bool, 
                               policy_violations: List[str]) -> str:
         """Generate human-readable access reason"""
@@ -591,6 +614,24 @@ class AuthorizationEngine:
         
         return history[:limit]
     
+    async def load_access_history(self, user_id: str = None, limit: int = 100) -> List[AccessResult]:
+        """Access history of all workers (shared backend), or of this process"""
+        backend = get_state_backend()
+        if not backend.shared:
+            return self.get_access_history(user_id, limit)
+        
+        history = [
+            AccessResult(**{
+                **item,
+                'resource_type': ResourceType(item['resource_type']),
+                'action': ActionType(item['action']),
+                'timestamp': datetime.fromisoformat(item['timestamp'])
+            })
+            for item in await backend.get_list("authorization:access_history")
+            if user_id is None or item['user_id'] == user_id
+        ]
+        return list(reversed(history))[:limit]
+    
     async def cleanup_old_history(self, days: int = 30) -> int:
         """Cleanup old access history"""
         cutoff = datetime.utcnow() - timedelta(days=days)
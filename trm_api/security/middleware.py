@@ -12,7 +12,9 @@ import asyncio
 import logging
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
-import re
+
+from ..core.state_backend import RateLimiter as SharedRateLimiter, get_state_backend
+from ..middleware.request_hygiene import RequestSanitizer
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +57,12 @@ class RateLimiter:
     async def check_rate_limit(self, identifier: str) -> bool:
         """Check if request is within rate limit"""
         try:
+            if get_state_backend().shared:
+                # Counted across all workers using the backend
+                return await SharedRateLimiter(
+                    "requests", self.max_requests, self.window_minutes * 60
+                ).allow(identifier)
+            
             now = datetime.utcnow()
             window_start = now - timedelta(minutes=self.window_minutes)
             
@@ -84,8 +92,9 @@ class RateLimiter:
 class RequestValidator:
     """Request validation utilities"""
     
-    def __init__(self):
+    def __init__(self, sanitizer: Optional[RequestSanitizer] = None):
         self.logger = logging.getLogger(__name__)
+        self.sanitizer = sanitizer or RequestSanitizer()
     
     async def validate_request(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate incoming request"""
@@ -104,15 +113,6 @@ class RequestValidator:
             return {'valid': False, 'error': 'Validation error'}
     
     def _sanitize_inputs(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Sanitize input data"""
-        sanitized = {}
-        
-        for key, value in data.items():
-            if isinstance(value, str):
-                # Remove potentially dangerous characters
-                sanitized_value = re.sub(r'[<>"\']', '', value)
-                sanitized[key] = sanitized_value
-            else:
-                sanitized[key] = value
-        
-        return sanitized 
\ No newline at end of file
+        """Sanitize input data (nested values included, in one pass)"""
+        sanitized, _ = self.sanitizer.sanitize_tree(data)
+        return sanitized
@@ -0,0 +1,292 @@
+"""
+Password Hashing Service cho TRM-OS Phase 3
+
+bcrypt/argon2 cost hàng chục đến hàng trăm ms CPU mỗi lần, nên không được chạy
+trên event loop:
+- Hash và verify chạy trong thread/process pool có giới hạn
+- Concurrency cap và queue-depth metrics (login storm hiện rõ trong metrics)
+- Dummy verify cho user không tồn tại (timing giống user thật)
+- needs_rehash khi đổi scheme hoặc cost factor (rehash-on-login)
+"""
+
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import bcrypt
+
+logger = logging.getLogger(__name__)
+
+
+class HashingOverloadedError(RuntimeError):
+    """Raised when more operations are waiting than PASSWORD_HASH_MAX_QUEUE allows"""
+
+
+class PasswordHasher(ABC):
+    """One password hashing scheme (methods are blocking; run them in a pool)"""
+
+    scheme: str = ""
+
+    @abstractmethod
+    def hash(self, password: str) -> str:
+        ...
+
+    @abstractmethod
+    def verify(self, password: str, hashed_password: str) -> bool:
+        ...
+
+    @abstractmethod
+    def identifies(self, hashed_password: str) -> bool:
+        """True if the hash was produced by this scheme"""
+
+    @abstractmethod
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """True if the hash uses other parameters than the configured ones"""
+
+
+class BcryptHasher(PasswordHasher):
+    """bcrypt with a configurable cost factor (log2 rounds)"""
+
+    scheme = "bcrypt"
+
+    def __init__(self, rounds: int = 12):
+        self.rounds = rounds
+
+    def hash(self, password: str) -> str:
+        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=self.rounds)).decode('utf-8')
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        try:
+            return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+        except ValueError:
+            return False
+
+    def identifies(self, hashed_password: str) -> bool:
+        return hashed_password.startswith(("$2a$", "$2b$", "$2y$"))
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        # $2b$12$<salt+hash>
+        try:
+            return int(hashed_password.split("$")[2]) != self.rounds
+        except (IndexError, ValueError):
+            return True
+
+
+class Argon2Hasher(PasswordHasher):
+    """argon2id via argon2-cffi (optional dependency)"""
+
+    scheme = "argon2"
+
+    def __init__(self, time_cost: int = 3, memory_cost: int = 65536, parallelism: int = 4):
+        self.time_cost = time_cost
+        self.memory_cost = memory_cost
+        self.parallelism = parallelism
+        self._hasher = None
+
+    def _argon2(self):
+        if self._hasher is None:
+            try:
+                from argon2 import PasswordHasher as Argon2PasswordHasher
+            except ImportError as e:
+                raise RuntimeError("PASSWORD_HASH_SCHEME=argon2 requires the argon2-cffi package") from e
+            self._hasher = Argon2PasswordHasher(
+                time_cost=self.time_cost, memory_cost=self.memory_cost, parallelism=self.parallelism
+            )
+        return self._hasher
+
+    def __getstate__(self):
+        # Picklable for ProcessPoolExecutor; workers rebuild the argon2 hasher
+        state = self.__dict__.copy()
+        state["_hasher"] = None
+        return state
+
+    def hash(self, password: str) -> str:
+        return self._argon2().hash(password)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        from argon2.exceptions import InvalidHashError, VerificationError
+        try:
+            return self._argon2().verify(hashed_password, password)
+        except (VerificationError, InvalidHashError):
+            return False
+
+    def identifies(self, hashed_password: str) -> bool:
+        return hashed_password.startswith("$argon2")
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return self._argon2().check_needs_rehash(hashed_password)
+
+
+def create_password_hasher(scheme: str = "bcrypt", bcrypt_rounds: int = 12) -> PasswordHasher:
+    """Hasher for a PASSWORD_HASH_SCHEME value"""
+    if scheme == "bcrypt":
+        return BcryptHasher(bcrypt_rounds)
+    if scheme == "argon2":
+        return Argon2Hasher()
+    raise ValueError(f"Unsupported PASSWORD_HASH_SCHEME: {scheme}")
+
+
+class CredentialHashingService:
+    """Runs password hashing in a bounded pool instead of on the event loop"""
+
+    def __init__(self, hasher: Optional[PasswordHasher] = None,
+                 legacy_hashers: Optional[List[PasswordHasher]] = None,
+                 max_concurrency: int = 4, max_queue: Optional[int] = None,
+                 use_processes: bool = False):
+        self.logger = logging.getLogger(__name__)
+        self.hasher = hasher or BcryptHasher()
+        # Schemes that existing hashes may still use; they verify but get rehashed on login
+        if legacy_hashers is None:
+            legacy_hashers = [] if isinstance(self.hasher, BcryptHasher) else [BcryptHasher()]
+        self.legacy_hashers = legacy_hashers
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.use_processes = use_processes
+
+        self._executor: Optional[Executor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._dummy_hash: Optional[str] = None
+
+        self.metrics: Dict[str, Any] = {
+            'in_flight': 0,
+            'queue_depth': 0,
+            'peak_queue_depth': 0,
+            'completed': 0,
+            'rejected': 0,
+            'rehashed': 0,
+            'total_wait_ms': 0.0,
+            'total_run_ms': 0.0,
+        }
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.use_processes:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_concurrency)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency, thread_name_prefix="password-hash"
+                )
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # A semaphore belongs to one event loop; tests and scripts may run several
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _run(self, fn: Callable, *args) -> Any:
+        semaphore = self._get_semaphore()
+        queued_at = time.perf_counter()
+        if semaphore.locked():
+            # All workers busy: wait in the queue (or shed load when it is full)
+            if self.max_queue is not None and self.metrics['queue_depth'] >= self.max_queue:
+                self.metrics['rejected'] += 1
+                raise HashingOverloadedError("Password hashing queue is full")
+            self.metrics['queue_depth'] += 1
+            self.metrics['peak_queue_depth'] = max(self.metrics['peak_queue_depth'], self.metrics['queue_depth'])
+            try:
+                await semaphore.acquire()
+            finally:
+                self.metrics['queue_depth'] -= 1
+        else:
+            await semaphore.acquire()
+
+        started_at = time.perf_counter()
+        self.metrics['in_flight'] += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            semaphore.release()
+            finished_at = time.perf_counter()
+            self.metrics['in_flight'] -= 1
+            self.metrics['completed'] += 1
+            self.metrics['total_wait_ms'] += (started_at - queued_at) * 1000
+            self.metrics['total_run_ms'] += (finished_at - started_at) * 1000
+
+    def hasher_for(self, hashed_password: str) -> Optional[PasswordHasher]:
+        for hasher in [self.hasher, *self.legacy_hashers]:
+            if hasher.identifies(hashed_password):
+                return hasher
+        return None
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """True if the hash uses another scheme or cost than the configured hasher"""
+        if not self.hasher.identifies(hashed_password):
+            return True
+        return self.hasher.needs_rehash(hashed_password)
+
+    async def hash_password(self, password: str) -> str:
+        return await self._run(self.hasher.hash, password)
+
+    async def verify_password(self, password: str, hashed_password: str) -> bool:
+        hasher = self.hasher_for(hashed_password)
+        if hasher is None:
+            self.logger.warning("Password hash with unknown scheme")
+            await self.dummy_verify(password)
+            return False
+        return await self._run(hasher.verify, password, hashed_password)
+
+    async def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """Verify, and return a new hash when the stored one is outdated (else None)"""
+        if not await self.verify_password(password, hashed_password):
+            return False, None
+        if not self.needs_rehash(hashed_password):
+            return True, None
+        new_hash = await self.hash_password(password)
+        self.metrics['rehashed'] += 1
+        return True, new_hash
+
+    async def dummy_verify(self, password: str) -> None:
+        """Verify against a fixed hash so unknown users cost the same as real ones"""
+        if self._dummy_hash is None:
+            # Computed once per process with the configured cost
+            self._dummy_hash = await self._run(self.hasher.hash, "dummy-password-for-timing")
+        await self._run(self.hasher.verify, password, self._dummy_hash)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        completed = self.metrics['completed']
+        return {
+            **self.metrics,
+            'scheme': self.hasher.scheme,
+            'max_concurrency': self.max_concurrency,
+            'max_queue': self.max_queue,
+            'avg_wait_ms': self.metrics['total_wait_ms'] / completed if completed else 0.0,
+            'avg_run_ms': self.metrics['total_run_ms'] / completed if completed else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+_hashing_service: Optional[CredentialHashingService] = None
+
+
+def get_hashing_service() -> CredentialHashingService:
+    """Process-wide hashing service configured by the PASSWORD_HASH_* settings"""
+    global _hashing_service
+    if _hashing_service is None:
+        from ..core.config import settings
+        _hashing_service = CredentialHashingService(
+            hasher=create_password_hasher(settings.PASSWORD_HASH_SCHEME, settings.BCRYPT_ROUNDS),
+            max_concurrency=settings.PASSWORD_HASH_WORKERS,
+            max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+            use_processes=settings.PASSWORD_HASH_USE_PROCESSES
+        )
+    return _hashing_service
+
+
+def set_hashing_service(service: Optional[CredentialHashingService]) -> None:
+    """Replace the process-wide service (None re-reads settings on next use)"""
+    global _hashing_service
+    if _hashing_service is not None and _hashing_service is not service:
+        _hashing_service.shutdown()
+    _hashing_service = service
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Analytics Service - Incrementally maintained distribution counters
+
+Distributions (counts grouped by property) for Event, Tension and WIN nodes
+are computed once with Cypher aggregation, then kept current from entity
+lifecycle updates (service calls and system events) so analytics reads are O(1).
+
+Updates that cannot be applied exactly (e.g. an update for an entity whose
+previous values are unknown) mark the label stale; the next read re-aggregates.
+"""
+
+from typing import Dict, List, Any, Optional, Tuple
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+import threading
+
+from neomodel import db
+
+from trm_api.eventbus.system_event_bus import SystemEventBus, SystemEvent, EventType, system_event_bus
+from trm_api.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class DistributionSpec:
+    """Which properties of a node label are counted"""
+    label: str
+    properties: List[str]
+    # System events: event type -> (change kind, property values implied by the event
+    # unless its data carries them)
+    event_types: Dict[EventType, Tuple[str, Dict[str, Any]]] = field(default_factory=dict)
+
+
+DISTRIBUTION_SPECS: Dict[str, DistributionSpec] = {
+    "Event": DistributionSpec(
+        label="Event",
+        properties=["event_type", "status", "strategic_priority"],
+        event_types={
+            EventType.EVENT_CREATED: ("created", {}),
+            EventType.EVENT_UPDATED: ("updated", {}),
+            EventType.EVENT_DELETED: ("deleted", {}),
+        }
+    ),
+    "Tension": DistributionSpec(
+        label="Tension",
+        properties=["status", "priority", "tensionType"],
+        event_types={
+            EventType.TENSION_CREATED: ("created", {}),
+            EventType.TENSION_UPDATED: ("updated", {}),
+            EventType.TENSION_RESOLVED: ("updated", {"status": "Resolved"}),
+            EventType.TENSION_DELETED: ("deleted", {}),
+        }
+    ),
+    "WIN": DistributionSpec(
+        label="WIN",
+        properties=["status", "win_type", "impact_level"],
+        event_types={
+            EventType.WIN_CREATED: ("created", {}),
+            EventType.WIN_UPDATED: ("updated", {}),
+            EventType.WIN_DELETED: ("deleted", {}),
+        }
+    ),
+}
+
+
+class DistributionCounter:
+    """Total plus per-property value counts for one node label"""
+
+    def __init__(self, spec: DistributionSpec, max_known: int = 10000):
+        self.spec = spec
+        self.total = 0
+        self.counts: Dict[str, Counter] = {prop: Counter() for prop in spec.properties}
+        # Last known counted values of the most recently seen entities (LRU); changes to
+        # entities evicted from it need their previous values or mark the counts stale
+        self._known: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.max_known = max_known
+        self.loaded = False
+        self.stale = False
+
+    def load(self) -> None:
+        """Cold start: aggregate the distributions in the database"""
+        results, _ = db.cypher_query(f"MATCH (n:{self.spec.label}) RETURN count(n)")
+        total = results[0][0] if results else 0
+
+        counts = {}
+        for prop in self.spec.properties:
+            rows, _ = db.cypher_query(
+                f"MATCH (n:{self.spec.label}) WHERE n.{prop} IS NOT NULL "
+                f"RETURN n.{prop} AS value, count(*) AS count"
+            )
+            counts[prop] = Counter({value: count for value, count in rows})
+
+        self.total = total
+        self.counts = counts
+        self._known.clear()
+        self.loaded = True
+        self.stale = False
+
+    def _remember(self, entity_id: str, values: Dict[str, Any]) -> None:
+        self._known[entity_id] = values
+        self._known.move_to_end(entity_id)
+        while len(self._known) > self.max_known:
+            self._known.popitem(last=False)
+
+    def _values(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {prop: data[prop] for prop in self.spec.properties if prop in data}
+
+    def _apply(self, values: Dict[str, Any], delta: int) -> None:
+        for prop, value in values.items():
+            if value is None:
+                continue
+            self.counts[prop][value] += delta
+            if self.counts[prop][value] <= 0:
+                del self.counts[prop][value]
+
+    def created(self, entity_id: Optional[str], data: Dict[str, Any]) -> None:
+        if entity_id is not None and entity_id in self._known:
+            # Same creation seen twice (service call and system event): treat as update
+            self.updated(entity_id, data)
+            return
+        values = {prop: data.get(prop) for prop in self.spec.properties}
+        self.total += 1
+        self._apply(values, 1)
+        if entity_id is not None:
+            self._remember(entity_id, values)
+
+    def updated(self, entity_id: Optional[str], data: Dict[str, Any],
+                previous: Optional[Dict[str, Any]] = None) -> None:
+        changes = self._values(data)
+        if not changes:
+            return
+        known = self._known.get(entity_id) if entity_id is not None else None
+        if known is None and previous is not None:
+            known = self._values(previous)
+        if known is None or any(prop not in known for prop in changes):
+            self.stale = True
+            return
+
+        old = {prop: known[prop] for prop in changes}
+        self._apply(old, -1)
+        self._apply(changes, 1)
+        if entity_id is not None:
+            self._remember(entity_id, {**known, **changes})
+
+    def deleted(self, entity_id: Optional[str], previous: Optional[Dict[str, Any]] = None) -> None:
+        known = self._known.pop(entity_id, None) if entity_id is not None else None
+        if known is None and previous is not None:
+            known = self._values(previous)
+        if known is None or len(known) < len(self.spec.properties):
+            self.stale = True
+            return
+        self.total = max(0, self.total - 1)
+        self._apply(known, -1)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "distributions": {prop: dict(counter) for prop, counter in self.counts.items()}
+        }
+
+
+class GraphAnalyticsService:
+    """Distribution counters for all analytics-backed node labels"""
+
+    def __init__(self, specs: Optional[Dict[str, DistributionSpec]] = None):
+        self.counters: Dict[str, DistributionCounter] = {
+            label: DistributionCounter(spec) for label, spec in (specs or DISTRIBUTION_SPECS).items()
+        }
+        self._lock = threading.RLock()
+        self._event_bus: Optional[SystemEventBus] = None
+
+    def get_distributions(self, label: str) -> Dict[str, Any]:
+        """Current total and distributions for a label (aggregates on first or stale read)"""
+        counter = self.counters[label]
+        with self._lock:
+            if not counter.loaded or counter.stale:
+                counter.load()
+                logger.info(f"Analytics counters loaded for {label}: {counter.total} nodes")
+            return counter.snapshot()
+
+    def record_created(self, label: str, entity_id: Optional[str], data: Dict[str, Any]) -> None:
+        with self._lock:
+            counter = self.counters[label]
+            if counter.loaded:
+                counter.created(entity_id, data)
+
+    def record_updated(self, label: str, entity_id: Optional[str], data: Dict[str, Any],
+                       previous: Optional[Dict[str, Any]] = None) -> None:
+        with self._lock:
+            counter = self.counters[label]
+            if counter.loaded:
+                counter.updated(entity_id, data, previous)
+
+    def record_deleted(self, label: str, entity_id: Optional[str],
+                       previous: Optional[Dict[str, Any]] = None) -> None:
+        with self._lock:
+            counter = self.counters[label]
+            if counter.loaded:
+                counter.deleted(entity_id, previous)
+
+    def invalidate(self, label: Optional[str] = None) -> None:
+        """Force re-aggregation on the next read"""
+        with self._lock:
+            for name, counter in self.counters.items():
+                if label is None or name == label:
+                    counter.stale = True
+
+    def subscribe_to_event_bus(self, event_bus: Optional[SystemEventBus] = None) -> None:
+        """Keep counters current from entity lifecycle system events"""
+        self._event_bus = event_bus or system_event_bus
+        for counter in self.counters.values():
+            for event_type in counter.spec.event_types:
+                self._event_bus.subscribe(event_type, self._handle_system_event)
+
+    def unsubscribe_from_event_bus(self) -> None:
+        if self._event_bus is None:
+            return
+        for counter in self.counters.values():
+            for event_type in counter.spec.event_types:
+                self._event_bus.unsubscribe(event_type, self._handle_system_event)
+        self._event_bus = None
+
+    async def _handle_system_event(self, event: SystemEvent) -> None:
+        for label, counter in self.counters.items():
+            if event.event_type not in counter.spec.event_types:
+                continue
+            # Notifications about another kind of entity (e.g. a WIN announced for a tension)
+            if event.entity_type and event.entity_type.lower() != label.lower():
+                continue
+            kind, implied = counter.spec.event_types[event.event_type]
+            data = {**implied, **event.data}
+            previous = event.data.get("previous")
+            if kind == "created":
+                self.record_created(label, event.entity_id, data)
+            elif kind == "updated":
+                self.record_updated(label, event.entity_id, data, previous)
+            else:
+                self.record_deleted(label, event.entity_id, previous)
+
+
+_graph_analytics: Optional[GraphAnalyticsService] = None
+
+
+def get_graph_analytics() -> GraphAnalyticsService:
+    """Process-wide analytics counters"""
+    global _graph_analytics
+    if _graph_analytics is None:
+        _graph_analytics = GraphAnalyticsService()
+    return _graph_analytics
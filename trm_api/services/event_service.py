@@ -20,6 +20,7 @@ from trm_api.models.event import EventCreate, EventUpdate, Event
 # from trm_api.ontology.strategic_unit import StrategicUnit  # Future implementation
 
 from trm_api.repositories.event_repository import EventRepository
+from trm_api.services.analytics_service import GraphAnalyticsService, get_graph_analytics
 from trm_api.core.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -30,8 +31,9 @@ class EventService:
     Handles the Event phase of Recognition → Event → WIN cycle
     """
     
-    def __init__(self):
+    def __init__(self, analytics: Optional[GraphAnalyticsService] = None):
         self.repository = EventRepository()
+        self.analytics = analytics or get_graph_analytics()
     
     def create_event(self, event_data: EventCreate) -> Optional[Event]:
         """Create strategic event using AGE semantic orchestration"""
@@ -53,6 +55,11 @@ class EventService:
                     updated_at=graph_event.updated_at
                 )
                 
+                self.analytics.record_created("Event", event.uid, {
+                    "event_type": event.event_type,
+                    "status": event.status,
+                    "strategic_priority": event.strategic_priority
+                })
                 logger.info(f"AGE Strategic Event created: {event.uid}")
                 return event
             else:
@@ -89,9 +96,11 @@ class EventService:
     def update_event(self, event_id: str, update_data: EventUpdate) -> Optional[Event]:
         """Update strategic event with AGE intelligence"""
         try:
-            updated_graph = self.repository.update_event(event_id, **update_data.dict(exclude_unset=True))
+            changes = update_data.dict(exclude_unset=True)
+            updated_graph = self.repository.update_event(event_id, **changes)
             
             if updated_graph:
+                self.analytics.record_updated("Event", event_id, changes)
                 return Event(
                     uid=updated_graph.uid,
                     event_type=updated_graph.event_type,
@@ -112,7 +121,10 @@ class EventService:
     def delete_event(self, event_id: str) -> bool:
         """Delete strategic event with AGE validation"""
         try:
-            return self.repository.delete_event(event_id)
+            deleted = self.repository.delete_event(event_id)
+            if deleted:
+                self.analytics.record_deleted("Event", event_id)
+            return deleted
         except Exception as e:
             logger.error(f"AGE Event deletion error: {str(e)}")
             return False
@@ -147,13 +159,15 @@ class EventService:
     def get_strategic_events_analytics(self) -> Dict[str, Any]:
         """Get strategic event analytics using AGE intelligence"""
         try:
-            all_events = self.list_events(limit=1000)
+            snapshot = self.analytics.get_distributions("Event")
+            distributions = snapshot["distributions"]
+            total_events = snapshot["total"]
             
             analytics = {
-                "total_events": len(all_events),
-                "event_types": {},
-                "status_distribution": {},
-                "priority_distribution": {},
+                "total_events": total_events,
+                "event_types": distributions["event_type"],
+                "status_distribution": distributions["status"],
+                "priority_distribution": distributions["strategic_priority"],
                 "age_strategic_insights": {
                     "high_priority_events": 0,
                     "completion_rate": 0.0,
@@ -161,39 +175,25 @@ class EventService:
                 }
             }
             
-            completed_events = 0
-            high_priority_events = 0
-            
-            for event in all_events:
-                # Event types
-                event_type = event.event_type
-                analytics["event_types"][event_type] = analytics["event_types"].get(event_type, 0) + 1
-                
-                # Status distribution
-                status = event.status
-                analytics["status_distribution"][status] = analytics["status_distribution"].get(status, 0) + 1
-                
-                if status in ['completed', 'successful', 'achieved']:
-                    completed_events += 1
-                
-                # Priority distribution
-                if hasattr(event, 'strategic_priority') and event.strategic_priority:
-                    priority = event.strategic_priority
-                    analytics["priority_distribution"][priority] = analytics["priority_distribution"].get(priority, 0) + 1
-                    
-                    if priority in ['high', 'critical']:
-                        high_priority_events += 1
+            completed_events = sum(
+                count for status, count in distributions["status"].items()
+                if status in ['completed', 'successful', 'achieved']
+            )
+            high_priority_events = sum(
+                count for priority, count in distributions["strategic_priority"].items()
+                if priority in ['high', 'critical']
+            )
             
             # Calculate strategic insights
-            if len(all_events) > 0:
-                completion_rate = completed_events / len(all_events)
+            if total_events > 0:
+                completion_rate = completed_events / total_events
                 analytics["age_strategic_insights"]["completion_rate"] = completion_rate
                 analytics["age_strategic_insights"]["high_priority_events"] = high_priority_events
                 
                 # AGE strategic recommendation
                 if completion_rate < 0.6:
                     analytics["age_strategic_insights"]["strategic_recommendation"] = "Focus on improving event execution and completion rates"
-                elif high_priority_events > len(all_events) * 0.8:
+                elif high_priority_events > total_events * 0.8:
                     analytics["age_strategic_insights"]["strategic_recommendation"] = "Consider balancing high-priority events with strategic planning"
                 else:
                     analytics["age_strategic_insights"]["strategic_recommendation"] = "Strong strategic event execution performance"
@@ -6,6 +6,7 @@ import random
 from trm_api.repositories.tension_repository import TensionRepository
 from trm_api.models.tension import TensionCreate, TensionUpdate, Tension
 from trm_api.models.relationships import Relationship, RelationshipType, TargetEntityTypeEnum
+from trm_api.services.analytics_service import get_graph_analytics
 
 
 class TensionService:
@@ -24,6 +25,12 @@ class TensionService:
         if not tension:
             return None
         
+        get_graph_analytics().record_created("Tension", tension.uid, {
+            "status": tension.status,
+            "priority": tension.priority,
+            "tensionType": tension.tensionType
+        })
+        
         # Convert to API response format
         return {
             "uid": tension.uid,
@@ -66,13 +73,31 @@ class TensionService:
         if not updated_tension:
             return None
         
+        get_graph_analytics().record_updated("Tension", uid, tension_data.dict(exclude_unset=True))
+        
         return await self.get_tension(uid)
     
     async def delete_tension(self, uid: str) -> bool:
         """
         Deletes a tension.
         """
-        return self.repository.delete_tension(uid)
+        deleted = self.repository.delete_tension(uid)
+        if deleted:
+            get_graph_analytics().record_deleted("Tension", uid)
+        return deleted
+    
+    async def get_tension_analytics(self) -> Dict[str, Any]:
+        """
+        Tension distributions from the incrementally maintained analytics counters.
+        """
+        snapshot = get_graph_analytics().get_distributions("Tension")
+        distributions = snapshot["distributions"]
+        return {
+            "total_tensions": snapshot["total"],
+            "status_distribution": distributions["status"],
+            "priority_distribution": distributions["priority"],
+            "type_distribution": distributions["tensionType"]
+        }
     
     async def get_tension_with_relationships(self, tension_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -8,6 +8,7 @@ import asyncio
 
 from trm_api.db.session import get_driver
 from trm_api.models.win import Win, WinCreate, WinUpdate, WinInDB
+from trm_api.services.analytics_service import get_graph_analytics
 
 class WinService:
     """
@@ -89,6 +90,8 @@ class WinService:
                     if 'updated_at' in converted_data and isinstance(converted_data['updated_at'], datetime):
                         converted_data['updated_at'] = converted_data['updated_at'].isoformat()
 
+                    get_graph_analytics().record_created("WIN", converted_data.get("uid"), converted_data)
+
                     # Return as dict for API response (not Win model)
                     return converted_data
                 except Exception as e:
@@ -269,6 +272,8 @@ class WinService:
                     logging.error(f"WinService.update_win: Không tìm thấy WIN với ID {win_id}")
                     return None
                     
+                get_graph_analytics().record_updated("WIN", win_id, update_data)
+
                 # Chuyển đổi dữ liệu từ Neo4j sang Python types
                 converted_result = self._convert_neo4j_types(result)
                 
@@ -331,12 +336,25 @@ class WinService:
                     
                 # Xóa WIN và tất cả các mối quan hệ liên quan
                 result = session.write_transaction(self._delete_win_tx, win_id)
+                if result:
+                    get_graph_analytics().record_deleted("WIN", win_id, previous=win)
                 return result
         except Exception as e:
             logging.error(f"WinService.delete_win: Lỗi khi xóa WIN {win_id}: {str(e)}")
             logging.error(f"Traceback: {traceback.format_exc()}")
             return False
 
+    def get_win_analytics(self) -> Dict[str, Any]:
+        """WIN distributions from the incrementally maintained analytics counters"""
+        snapshot = get_graph_analytics().get_distributions("WIN")
+        distributions = snapshot["distributions"]
+        return {
+            "total_wins": snapshot["total"],
+            "status_distribution": distributions["status"],
+            "type_distribution": distributions["win_type"],
+            "impact_distribution": distributions["impact_level"]
+        }
+
     @staticmethod
     def _delete_win_tx(tx, win_id: str) -> bool:
         """Transaction để xóa WIN và các mối quan hệ liên quan theo Ontology V3.2."""
@@ -15,7 +15,8 @@ from datetime import datetime, timedelta
 from uuid import uuid4
 
 from trm_api.core.logging_config import get_logger
-from .nlp_processor import ParsedIntent, EntityContext, SystemAction
+from trm_api.core.state_backend import get_state_backend
+from .nlp_processor import IntentType, ParsedIntent, EntityContext, SystemAction
 
 logger = get_logger(__name__)
 
@@ -68,6 +69,68 @@ class ConversationSession:
         return self.start_time
 
 
+def _intent_to_dict(intent: Optional[ParsedIntent]) -> Optional[Dict[str, Any]]:
+    if intent is None:
+        return None
+    data = asdict(intent)
+    data['intent_type'] = intent.intent_type.value
+    return data
+
+
+def _intent_from_dict(data: Optional[Dict[str, Any]]) -> Optional[ParsedIntent]:
+    if data is None:
+        return None
+    return ParsedIntent(**{**data, 'intent_type': IntentType(data['intent_type'])})
+
+
+def session_to_dict(session: ConversationSession) -> Dict[str, Any]:
+    """JSON-compatible form of a session, for the shared state backend"""
+    context = asdict(session.context)
+    context['last_intent'] = _intent_to_dict(session.context.last_intent)
+    return {
+        'session_id': session.session_id,
+        'user_id': session.user_id,
+        'start_time': session.start_time.isoformat(),
+        'last_activity': session.last_activity.isoformat(),
+        'context': context,
+        'turns': [
+            {
+                **asdict(turn),
+                'parsed_intent': _intent_to_dict(turn.parsed_intent),
+                'timestamp': turn.timestamp.isoformat()
+            }
+            for turn in session.turns
+        ],
+        'metadata': session.metadata,
+        'status': session.status
+    }
+
+
+def session_from_dict(data: Dict[str, Any]) -> ConversationSession:
+    """Inverse of session_to_dict"""
+    context = dict(data['context'])
+    context['last_intent'] = _intent_from_dict(context['last_intent'])
+    turns = [
+        ConversationTurn(**{
+            **turn,
+            'parsed_intent': _intent_from_dict(turn['parsed_intent']),
+            'system_actions': [SystemAction(**action) for action in turn['system_actions']],
+            'timestamp': datetime.fromisoformat(turn['timestamp'])
+        })
+        for turn in data['turns']
+    ]
+    return ConversationSession(
+        session_id=data['session_id'],
+        user_id=data['user_id'],
+        start_time=datetime.fromisoformat(data['start_time']),
+        last_activity=datetime.fromisoformat(data['last_activity']),
+        context=ConversationContext(**context),
+        turns=turns,
+        metadata=data['metadata'],
+        status=data.get('status', 'active')
+    )
+
+
 class ConversationMemory:
     """
     Memory system cho conversations
@@ -186,10 +249,23 @@ class ConversationSessionManager:
     Quản lý conversation sessions, context tracking, và memory management.
     """
     
-    def __init__(self):
+    def __init__(self, state_backend=None):
         self.active_sessions: Dict[str, ConversationSession] = {}
         self.memory = ConversationMemory()
         self.session_timeout = timedelta(hours=2)  # Session expires after 2 hours
+        # Shared backend (multi-worker): sessions are read from and written back to it
+        self.state_backend = state_backend
+    
+    def _shared_backend(self):
+        backend = self.state_backend or get_state_backend()
+        return backend if backend.shared else None
+    
+    async def _save_session(self, session: ConversationSession) -> None:
+        """Write the session through to the shared backend (no-op for a single worker)"""
+        backend = self._shared_backend()
+        if backend is not None:
+            await backend.set(f"conversation:session:{session.session_id}", session_to_dict(session),
+                              ttl=self.session_timeout.total_seconds())
         
     async def create_conversation_session(self, user_id: str, metadata: Optional[Dict[str, Any]] = None) -> ConversationSession:
         """
@@ -228,6 +304,7 @@ class ConversationSessionManager:
             )
             
             self.active_sessions[session_id] = session
+            await self._save_session(session)
             
             logger.info(f"Created conversation session {session_id} for user {user_id}")
             return session
@@ -238,6 +315,15 @@ class ConversationSessionManager:
     
     async def get_session(self, session_id: str) -> Optional[ConversationSession]:
         """Get conversation session by ID"""
+        backend = self._shared_backend()
+        if backend is not None:
+            # Another worker may have created or updated it
+            data = await backend.get(f"conversation:session:{session_id}")
+            if data is not None:
+                self.active_sessions[session_id] = session_from_dict(data)
+            else:
+                self.active_sessions.pop(session_id, None)
+        
         session = self.active_sessions.get(session_id)
         
         if session:
@@ -293,6 +379,7 @@ class ConversationSessionManager:
                 'last_confidence': parsed_intent.confidence,
                 'turn_count': context.turn_count
             })
+            await self._save_session(session)
             
             logger.info(f"Updated context for session {session_id}")
             return context
@@ -370,6 +457,7 @@ class ConversationSessionManager:
             )
             
             session.turns.append(turn)
+            await self._save_session(session)
             
             # Store trong memory
             await self.memory.store_turn(session_id, turn)
@@ -503,6 +591,12 @@ class ConversationSessionManager:
             True if successful, False if session not found
         """
         try:
+            backend = self._shared_backend()
+            if backend is not None and session_id not in self.active_sessions:
+                data = await backend.get(f"conversation:session:{session_id}")
+                if data is not None:
+                    self.active_sessions[session_id] = session_from_dict(data)
+            
             if session_id in self.active_sessions:
                 session = self.active_sessions[session_id]
                 session.context.conversation_state = 'completed'
@@ -512,6 +606,9 @@ class ConversationSessionManager:
                 
                 # Remove từ active sessions
                 del self.active_sessions[session_id]
+                backend = self._shared_backend()
+                if backend is not None:
+                    await backend.delete(f"conversation:session:{session_id}")
                 
                 logger.info(f"Ended conversation session {session_id}")
                 return True
@@ -23,64 +23,26 @@ from trm_api.reasoning.reasoning_types import ReasoningContext, ReasoningType
 from trm_api.learning.adaptive_learning_system import AdaptiveLearningSystem
 from trm_api.quantum.quantum_system_manager import QuantumSystemManager
 from trm_api.reasoning.advanced_reasoning_engine import AdvancedReasoningEngine
+from trm_api.v2.realtime import ConnectionManager, RealtimeBackplane, InMemoryBackplane, RedisBackplane
+from trm_api.core.config import settings
 
 router = APIRouter(prefix="/api/v2/realtime", tags=["Real-time Communication"])
 security = HTTPBearer()
 logger = logging.getLogger(__name__)
 
 
-class ConnectionManager:
-    """Manages WebSocket connections"""
-    
-    def __init__(self):
-        self.active_connections: Dict[str, WebSocket] = {}
-        self.user_sessions: Dict[str, str] = {}  # user_id -> session_id
-        self.session_connections: Dict[str, List[str]] = {}  # session_id -> [connection_ids]
-        
-    async def connect(self, websocket: WebSocket, connection_id: str, user_id: str) -> None:
-        """Accept WebSocket connection"""
-        await websocket.accept()
-        self.active_connections[connection_id] = websocket
-        self.user_sessions[user_id] = connection_id
-        logger.info(f"WebSocket connected: {connection_id} for user {user_id}")
-        
-    def disconnect(self, connection_id: str) -> None:
-        """Remove WebSocket connection"""
-        if connection_id in self.active_connections:
-            del self.active_connections[connection_id]
-            
-        # Remove from user sessions
-        user_to_remove = None
-        for user_id, conn_id in self.user_sessions.items():
-            if conn_id == connection_id:
-                user_to_remove = user_id
-                break
-        if user_to_remove:
-            del self.user_sessions[user_to_remove]
-            
-        logger.info(f"WebSocket disconnected: {connection_id}")
-        
-    async def send_personal_message(self, message: str, connection_id: str) -> None:
-        """Send message to specific connection"""
-        if connection_id in self.active_connections:
-            websocket = self.active_connections[connection_id]
-            await websocket.send_text(message)
-            
-    async def send_json_message(self, data: Dict[str, Any], connection_id: str) -> None:
-        """Send JSON message to specific connection"""
-        if connection_id in self.active_connections:
-            websocket = self.active_connections[connection_id]
-            await websocket.send_json(data)
-            
-    async def broadcast_to_session(self, message: str, session_id: str) -> None:
-        """Broadcast message to all connections in session"""
-        if session_id in self.session_connections:
-            for connection_id in self.session_connections[session_id]:
-                await self.send_personal_message(message, connection_id)
+def _create_backplane() -> Optional[RealtimeBackplane]:
+    """Cross-worker backplane from settings (None for a single worker)"""
+    url = settings.REALTIME_BACKPLANE_URL
+    if not url:
+        return None
+    if url == "memory":
+        return InMemoryBackplane()
+    return RedisBackplane(url)
 
 
 # Global connection manager
-manager = ConnectionManager()
+manager = ConnectionManager(backplane=_create_backplane())
 
 # Global components (initialized on startup)
 nlp_processor: Optional[ConversationProcessor] = None
@@ -133,6 +95,7 @@ async def websocket_chat_endpoint(websocket: WebSocket, user_id: str):
             user_id=user_id,
             metadata={"connection_type": "websocket", "connection_id": connection_id}
         )
+        manager.join_session(connection_id, session.session_id)
         
         # Send welcome message
         welcome_message = {
@@ -323,6 +286,7 @@ async def get_connection_status():
         "active_connections": len(manager.active_connections),
         "user_sessions": len(manager.user_sessions),
         "connection_ids": list(manager.active_connections.keys()),
+        "fanout": manager.get_stats(),
         "timestamp": datetime.now().isoformat()
     }
 
@@ -331,9 +295,8 @@ async def get_connection_status():
 async def broadcast_message(session_id: str, message: Dict[str, Any]):
     """Broadcast message to all connections in a session"""
     try:
-        message_text = json.dumps(message)
-        await manager.broadcast_to_session(message_text, session_id)
-        return {"status": "broadcast_sent", "session_id": session_id}
+        delivered = await manager.broadcast_json_to_session(message, session_id)
+        return {"status": "broadcast_sent", "session_id": session_id, "local_recipients": delivered}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
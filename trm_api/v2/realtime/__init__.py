@@ -0,0 +1,27 @@
+"""
+Real-time Fan-out Package
+=========================
+
+WebSocket connection management for TRM-OS v2: per-connection send queues,
+serialize-once broadcasts and an optional cross-worker pub/sub backplane.
+"""
+
+from .fanout import (
+    SlowConsumerPolicy,
+    FanoutConfig,
+    ConnectionWriter,
+    RealtimeBackplane,
+    InMemoryBackplane,
+    RedisBackplane
+)
+from .connection_manager import ConnectionManager
+
+__all__ = [
+    "SlowConsumerPolicy",
+    "FanoutConfig",
+    "ConnectionWriter",
+    "RealtimeBackplane",
+    "InMemoryBackplane",
+    "RedisBackplane",
+    "ConnectionManager"
+]
@@ -0,0 +1,155 @@
+"""
+TRM-OS WebSocket Connection Manager
+===================================
+
+Tracks WebSocket connections, their users and session memberships, and fans
+messages out through per-connection writers so one slow client never blocks
+the others. Broadcasts are serialized once and, when a backplane is attached,
+relayed to the same sessions on other workers.
+"""
+
+from typing import Any, Dict, Optional, Set
+from uuid import uuid4
+import asyncio
+import json
+import logging
+
+from .fanout import ConnectionWriter, FanoutConfig, RealtimeBackplane, serialize_message
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionManager:
+    """Manages WebSocket connections"""
+
+    def __init__(self, config: Optional[FanoutConfig] = None, backplane: Optional[RealtimeBackplane] = None):
+        self.config = config or FanoutConfig()
+        self.backplane = backplane
+        self.worker_id = str(uuid4())
+
+        self.active_connections: Dict[str, Any] = {}  # connection_id -> WebSocket
+        self.user_sessions: Dict[str, str] = {}  # user_id -> latest connection_id
+        self.session_connections: Dict[str, Set[str]] = {}  # session_id -> {connection_ids}
+
+        # Reverse indexes so disconnect does not scan
+        self.connection_users: Dict[str, str] = {}  # connection_id -> user_id
+        self.connection_session_ids: Dict[str, Set[str]] = {}  # connection_id -> {session_ids}
+
+        self.writers: Dict[str, ConnectionWriter] = {}
+        self._backplane_started = False
+        self._backplane_lock = asyncio.Lock()
+
+    async def connect(self, websocket: Any, connection_id: str, user_id: str) -> None:
+        """Accept WebSocket connection"""
+        await websocket.accept()
+        await self._ensure_backplane()
+        self.active_connections[connection_id] = websocket
+        self.user_sessions[user_id] = connection_id
+        self.connection_users[connection_id] = user_id
+        self.writers[connection_id] = ConnectionWriter(
+            connection_id, websocket, self.config, on_close=self.disconnect
+        )
+        logger.info(f"WebSocket connected: {connection_id} for user {user_id}")
+
+    def join_session(self, connection_id: str, session_id: str) -> None:
+        """Subscribe a connection to a session's broadcasts"""
+        if connection_id not in self.active_connections:
+            return
+        self.session_connections.setdefault(session_id, set()).add(connection_id)
+        self.connection_session_ids.setdefault(connection_id, set()).add(session_id)
+
+    def leave_session(self, connection_id: str, session_id: str) -> None:
+        members = self.session_connections.get(session_id)
+        if members is not None:
+            members.discard(connection_id)
+            if not members:
+                del self.session_connections[session_id]
+        sessions = self.connection_session_ids.get(connection_id)
+        if sessions is not None:
+            sessions.discard(session_id)
+
+    def disconnect(self, connection_id: str) -> None:
+        """Remove WebSocket connection"""
+        self.active_connections.pop(connection_id, None)
+
+        user_id = self.connection_users.pop(connection_id, None)
+        if user_id is not None and self.user_sessions.get(user_id) == connection_id:
+            del self.user_sessions[user_id]
+
+        for session_id in self.connection_session_ids.pop(connection_id, set()):
+            self.leave_session(connection_id, session_id)
+
+        writer = self.writers.pop(connection_id, None)
+        if writer is not None:
+            writer.stop()
+
+        logger.info(f"WebSocket disconnected: {connection_id}")
+
+    async def send_personal_message(self, message: str, connection_id: str) -> None:
+        """Queue message for a specific connection"""
+        writer = self.writers.get(connection_id)
+        if writer is not None:
+            writer.enqueue(message)
+
+    async def send_json_message(self, data: Dict[str, Any], connection_id: str) -> None:
+        """Queue JSON message for a specific connection"""
+        await self.send_personal_message(serialize_message(data), connection_id)
+
+    async def broadcast_to_session(self, message: str, session_id: str) -> int:
+        """Broadcast message to all connections in session; returns local deliveries"""
+        delivered = self._fanout_local(message, session_id)
+        if self.backplane is not None:
+            await self.backplane.publish(
+                session_id, json.dumps({"origin": self.worker_id, "message": message})
+            )
+        return delivered
+
+    async def broadcast_json_to_session(self, data: Dict[str, Any], session_id: str) -> int:
+        """Serialize once and broadcast to all connections in session"""
+        return await self.broadcast_to_session(serialize_message(data), session_id)
+
+    def _fanout_local(self, message: str, session_id: str) -> int:
+        delivered = 0
+        for connection_id in list(self.session_connections.get(session_id, ())):
+            writer = self.writers.get(connection_id)
+            if writer is not None and writer.enqueue(message):
+                delivered += 1
+        return delivered
+
+    async def _ensure_backplane(self) -> None:
+        if self.backplane is None or self._backplane_started:
+            return
+        async with self._backplane_lock:
+            if self._backplane_started:
+                return
+            try:
+                await self.backplane.subscribe(self._handle_backplane_message)
+            except Exception as e:
+                # Serve local connections; the next connect retries the subscription
+                logger.error(f"Realtime backplane subscribe failed: {e}")
+                return
+            self._backplane_started = True
+
+    async def _handle_backplane_message(self, session_id: str, payload: str) -> None:
+        envelope = json.loads(payload)
+        if envelope.get("origin") == self.worker_id:
+            return
+        self._fanout_local(envelope["message"], session_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth and drop counters for all connections"""
+        return {
+            "active_connections": len(self.active_connections),
+            "sessions": len(self.session_connections),
+            "queued_messages": sum(writer.queue.qsize() for writer in self.writers.values()),
+            "dropped_messages": sum(writer.dropped_messages for writer in self.writers.values())
+        }
+
+    async def close(self) -> None:
+        """Stop all writers and detach from the backplane"""
+        for writer in list(self.writers.values()):
+            await writer.close()
+        self.writers.clear()
+        if self.backplane is not None and self._backplane_started:
+            await self.backplane.close()
+            self._backplane_started = False
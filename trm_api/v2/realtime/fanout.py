@@ -0,0 +1,227 @@
+"""
+TRM-OS Real-time Fan-out
+========================
+
+Building blocks for non-blocking WebSocket broadcasts:
+- ConnectionWriter: bounded outbound queue + writer task per connection,
+  with a slow-consumer policy (drop oldest, drop newest or disconnect)
+- RealtimeBackplane: cross-worker pub/sub so a broadcast reaches session
+  members connected to other workers (in-memory and Redis implementations)
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import asyncio
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Handler receiving (channel, payload) messages from a backplane
+BackplaneHandler = Callable[[str, str], Awaitable[None]]
+
+# WebSocket close code sent to a disconnected slow consumer ("Try Again Later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+class SlowConsumerPolicy(str, Enum):
+    """What to do when a connection's outbound queue is full"""
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    DISCONNECT = "disconnect"
+
+
+@dataclass
+class FanoutConfig:
+    """Per-connection send queue settings"""
+    queue_size: int = 256
+    slow_consumer_policy: SlowConsumerPolicy = SlowConsumerPolicy.DROP_OLDEST
+    send_timeout: float = 10.0  # Seconds before a stuck send closes the connection
+
+
+class ConnectionWriter:
+    """Owns one WebSocket's outbound queue and the task that drains it"""
+
+    def __init__(
+        self,
+        connection_id: str,
+        websocket: Any,
+        config: FanoutConfig,
+        on_close: Optional[Callable[[str], None]] = None
+    ):
+        self.connection_id = connection_id
+        self.websocket = websocket
+        self.config = config
+        self.on_close = on_close
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=config.queue_size)
+        self.dropped_messages = 0
+        self.sent_messages = 0
+        self.closed = False
+        self._task = asyncio.create_task(self._run())
+        self._close_task: Optional[asyncio.Task] = None
+
+    def enqueue(self, text: str) -> bool:
+        """Queue a serialized message without waiting; returns False if it was not queued"""
+        if self.closed:
+            return False
+        try:
+            self.queue.put_nowait(text)
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        policy = self.config.slow_consumer_policy
+        if policy == SlowConsumerPolicy.DROP_OLDEST:
+            self.queue.get_nowait()
+            self.queue.task_done()
+            self.queue.put_nowait(text)
+            self.dropped_messages += 1
+            return True
+        if policy == SlowConsumerPolicy.DROP_NEWEST:
+            self.dropped_messages += 1
+            return False
+
+        logger.warning(f"Slow consumer disconnected: {self.connection_id}")
+        self._close(close_code=SLOW_CONSUMER_CLOSE_CODE)
+        return False
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                text = await self.queue.get()
+                try:
+                    await asyncio.wait_for(self.websocket.send_text(text), self.config.send_timeout)
+                    self.sent_messages += 1
+                finally:
+                    self.queue.task_done()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.info(f"WebSocket writer stopped for {self.connection_id}: {e}")
+            self._close(close_code=SLOW_CONSUMER_CLOSE_CODE)
+
+    def _close(self, notify: bool = True, close_code: Optional[int] = None) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        if not self._task.done() and self._task is not asyncio.current_task():
+            self._task.cancel()
+        if close_code is not None:
+            # Close the socket too, so the client reconnects and the endpoint's receive loop ends
+            self._close_task = asyncio.create_task(self._close_websocket(close_code))
+        if notify and self.on_close:
+            self.on_close(self.connection_id)
+
+    async def _close_websocket(self, code: int) -> None:
+        try:
+            await asyncio.wait_for(self.websocket.close(code=code), self.config.send_timeout)
+        except Exception as e:
+            logger.debug(f"WebSocket close failed for {self.connection_id}: {e}")
+
+    def stop(self) -> None:
+        """Stop the writer immediately without notifying the owner"""
+        self._close(notify=False)
+
+    async def close(self, drain: bool = False) -> None:
+        """Stop the writer; optionally wait for queued messages to be sent first"""
+        if drain and not self.closed:
+            join = asyncio.create_task(self.queue.join())
+            await asyncio.wait({join, self._task}, return_when=asyncio.FIRST_COMPLETED)
+            join.cancel()
+        self._close(notify=False)
+        await asyncio.gather(self._task, return_exceptions=True)
+        if self._close_task is not None:
+            await asyncio.gather(self._close_task, return_exceptions=True)
+
+
+class RealtimeBackplane(ABC):
+    """Cross-worker pub/sub used to relay broadcasts"""
+
+    @abstractmethod
+    async def publish(self, channel: str, payload: str) -> None:
+        ...
+
+    @abstractmethod
+    async def subscribe(self, handler: BackplaneHandler) -> None:
+        ...
+
+    @abstractmethod
+    async def close(self) -> None:
+        ...
+
+
+class InMemoryBackplane(RealtimeBackplane):
+    """Backplane for a single process; instances sharing a hub relay to each other"""
+
+    def __init__(self, hub: Optional[List[BackplaneHandler]] = None):
+        self.hub: List[BackplaneHandler] = hub if hub is not None else []
+        self._handler: Optional[BackplaneHandler] = None
+
+    async def publish(self, channel: str, payload: str) -> None:
+        handlers = list(self.hub)
+        await asyncio.gather(*(handler(channel, payload) for handler in handlers), return_exceptions=True)
+
+    async def subscribe(self, handler: BackplaneHandler) -> None:
+        self._handler = handler
+        self.hub.append(handler)
+
+    async def close(self) -> None:
+        if self._handler in self.hub:
+            self.hub.remove(self._handler)
+        self._handler = None
+
+
+class RedisBackplane(RealtimeBackplane):
+    """Backplane over Redis pub/sub (any server speaking the Redis protocol)"""
+
+    def __init__(self, redis_url: str = "redis://localhost:6379", channel_prefix: str = "trm:realtime:"):
+        self.redis_url = redis_url
+        self.channel_prefix = channel_prefix
+        self._redis = None
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+
+    async def _client(self):
+        if self._redis is None:
+            import redis.asyncio as redis
+            self._redis = redis.from_url(self.redis_url, decode_responses=True)
+        return self._redis
+
+    async def publish(self, channel: str, payload: str) -> None:
+        client = await self._client()
+        await client.publish(self.channel_prefix + channel, payload)
+
+    async def subscribe(self, handler: BackplaneHandler) -> None:
+        client = await self._client()
+        self._pubsub = client.pubsub()
+        await self._pubsub.psubscribe(self.channel_prefix + "*")
+        self._listener = asyncio.create_task(self._listen(handler))
+
+    async def _listen(self, handler: BackplaneHandler) -> None:
+        async for message in self._pubsub.listen():
+            if message.get("type") != "pmessage":
+                continue
+            channel = message["channel"][len(self.channel_prefix):]
+            try:
+                await handler(channel, message["data"])
+            except Exception as e:
+                logger.error(f"Backplane handler error: {e}")
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+
+def serialize_message(data: Dict[str, Any]) -> str:
+    """Serialize a JSON message the same way Starlette's send_json does"""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)